@@ -7,6 +7,7 @@
 """Get all msgid == msgstr under a directory"""
 
 import os, sys, argparse, subprocess
+import potree
 
 class Extract_same(object):
     """Get all msgid == msgstr under a directory"""
@@ -28,75 +29,9 @@ class Extract_same(object):
         self.__pofilter_path   = opt_dict['pofilter_path']
 
 
-    def __split_all_directory(self, path):
-        dir_list = []
-        while (True):
-            (base, tail) = os.path.split(path)
-            if (base == path):   # absolute path
-                dir_list.append(base)
-                break
-            elif (tail == path): # relative path
-                dir_list.append(tail)
-                break
-            else:
-                path = base
-                dir_list.append(tail)
-
-        dir_list.reverse()
-        return dir_list
-
-
-    def __join_all_directory(self, path_list):
-        """Join all dir list. If [], ''.
-        """
-
-        if (path_list == None):
-            raise RuntimeError('path_list is None.')
-
-        if (len(path_list) == 0):
-            return ''
-
-        return os.path.join(*path_list)
-
-
-    def __remove_top_dir(self, cur_dir):
-        """Remove the top most directory
-        """
-        dir_list = self.__split_all_directory(cur_dir)
-        if (len(dir_list) > 0):
-            del dir_list[0]
-
-        top_del_dir = self.__join_all_directory(dir_list)
-
-        return top_del_dir
-
-
-    def __is_po_file(self, pofile_cand_path):
-        """check the pofile_cand_path is a po file or not."""
-
-        # Is this a regular file?
-        if (not os.path.isfile(pofile_cand_path)):
-            return False
-
-        # po file?
-        (basedir, ext) = os.path.splitext(pofile_cand_path)
-        if (ext != '.po'):
-            return False
-
-        return True
-
-
-    def __process_file(self, src_dir, src_file, dst_dir, dst_file):
+    def __process_file(self, src_fpath, dst_fpath):
         """process one file
         """
-
-        src_fpath = os.path.join(src_dir, src_file)
-        dst_fpath = os.path.join(dst_dir, dst_file)
-
-        if (not self.__is_po_file(src_fpath)):
-            print('# skip file: {0}'.format(src_fpath))
-            return
-
         try:
             com_list = [self.__pofilter_path]
             com_list.extend(self.__pofilter_option.split())
@@ -112,45 +47,23 @@ class Extract_same(object):
             print('run failed. You should not see this message.')
 
 
-    def __process_dir(self, dir):
-        """process a directory
+    def process_tree(self):
+        """apply pofilter to all the po files under src_dir.
+        src_dir can be a zip archive, compressed po files are also
+        processed (see potree). When dst_dir ends with .zip, the
+        results are written into a zip archive.
         """
-        if (os.path.isdir(dir) == False):
-            print('# makedirs {0}'.format(dir))
-            if (self.__is_dry_run == False):
-                os.makedirs(dir)
-        else:
-            print('# makedirs {0} already exists.'.format(dir))
+        file_list = potree.get_po_file_list(self.__src_dir)
+        if (self.__is_dry_run == True):
+            for (rel_path, src_fpath) in file_list:
+                self.__process_file(src_fpath, os.path.join(self.__dst_dir, rel_path))
+            return
 
-    def process_tree(self):
-        """check the line ending of each file."""
-        topdown = True
-
-        # First scan for mkdir
-        gen = os.walk(self.__src_dir, topdown)
-        for (cur_dir, dir_list, file_list) in gen:
-            # print(cur_dir, dir_list, file_list)
-            for dir in dir_list:
-                rel_dir = self.__remove_top_dir(cur_dir)
-                # print('# relative dir: {0}'.format(rel_dir))
-                dst_dir = os.path.join(*[self.__dst_dir, rel_dir, dir])
-                self.__process_dir(dst_dir)
-
-        # Second scan for process
-        gen = os.walk(self.__src_dir, topdown)
-        for (cur_dir, dir_list, file_list) in gen:
-            for f in file_list:
-                dir_list = self.__split_all_directory(cur_dir)
-                # print(dir_list)
-                assert(len(dir_list) > 0)
-                del dir_list[0]
-
-                rel_dir_path = ''
-                if (len(dir_list) > 0):
-                    rel_dir_path = os.path.join(*dir_list)
-                src_dir = os.path.join(self.__src_dir, rel_dir_path)
-                dst_dir = os.path.join(self.__dst_dir, rel_dir_path)
-                self.__process_file(src_dir, f, dst_dir, f)
+        with potree.TreeOutput(self.__dst_dir) as tree_out:
+            for (rel_path, src_fpath) in file_list:
+                dst_fpath = tree_out.get_path(rel_path)
+                self.__process_file(src_fpath, dst_fpath)
+                tree_out.add(dst_fpath)
 
 def show_example():
     """Examples"""
@@ -168,6 +81,10 @@ def show_example():
 
       apply_tree.py --pofilter_option ' --tool id_to_str' --src_dir src --dst_dir dst
 
+  - Process a Crowdin export zip without unpacking it, write a zip.
+
+      apply_tree.py --src_dir export.zip --dst_dir dst.zip
+
 """)
 
 
@@ -176,10 +93,10 @@ def main():
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--src_dir", type=str, default='',
-                        help="Source pofiles top directry")
+                        help="Source pofiles top directry, or a zip archive")
 
     parser.add_argument("--dst_dir", type=str, default='',
-                        help="Destination top directory")
+                        help="Destination top directory. A .zip name writes a zip archive.")
 
     parser.add_argument("--dry_run", choices=['on', 'off'], default="off",
                         help="when on, not process the file, but show the command.")
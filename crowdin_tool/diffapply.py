@@ -16,9 +16,9 @@
 #
 #
 import argparse, sys, re, codecs, os, difflib
-import polib
 
 import tokensplit
+import pocache
 
 class DiffApply(object):
     """Apply heuristics from the difference of sources (msgid) on to translations (msgstr)
@@ -35,6 +35,9 @@ class DiffApply(object):
         self.__po_old_in = None
         self.__po_new_in = None
 
+        # parse cache
+        self.__use_cache = not opt_dict.get('no_cache', False)
+
         # DELETEME print(self.__opt_dict)
 
         for key in ['out_new_file', 'out_old_file' ]:
@@ -74,12 +77,12 @@ class DiffApply(object):
         # load pofile
         in_old_file_name = self.__opt_dict['in_old_file']
         self.__verbose_out('# Loading {0}'.format(in_old_file_name))
-        self.__po_old_in = polib.pofile(in_old_file_name, encoding='utf-8')
+        self.__po_old_in = pocache.pofile(in_old_file_name, use_cache=self.__use_cache, encoding='utf-8')
         self.__verbose_out('# Done loading. # of entries: {0}'.format(len(self.__po_old_in)))
 
         in_new_file_name = self.__opt_dict['in_new_file']
         self.__verbose_out('# Loading {0}'.format(in_new_file_name))
-        self.__po_new_in = polib.pofile(in_new_file_name, encoding='utf-8')
+        self.__po_new_in = pocache.pofile(in_new_file_name, use_cache=self.__use_cache, encoding='utf-8')
         self.__verbose_out('# Done loading. # of entries: {0}'.format(len(self.__po_new_in)))
 
 
@@ -351,6 +354,9 @@ def main():
     parser.add_argument("-v", "--verbose", type=int, action="store", default='0',
                         help="Verbose mode (0 ... off, 1 ... on")
 
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse the input files without the parse cache (see pocache.py)")
+
     parser.add_argument("--force_override", action='store_true', default=False,
                         help="Even outfile is found, override the output file.")
 
@@ -370,6 +376,7 @@ def main():
         'out_new_file':   args.out_new_file,
         'verbose':        args.verbose,
         'force_override': args.force_override,
+        'no_cache':       args.no_cache,
     }
 
     da = DiffApply(opt_dict)
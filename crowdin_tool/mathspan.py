@@ -0,0 +1,142 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief math span ($...$) information of strings
+#
+# Description:
+#    The $...$ regions of a string are computed once by one regexp scan
+#    and kept in a MathInfo. TokenSplit.split() and the odd dollar check
+#    of image_tool/reporter.py can take it instead of rescanning the
+#    string.
+#
+#    The dollar rules are the same as the tokenizer: a '$' after a
+#    backslash pair ('\\$', ESC_DOLLAR) is escaped, other '$' are math
+#    mode in/out (MATH_INOUT).
+#
+#    get_math_info() is cached per string (the same string appears in
+#    many files).
+#
+#    This module uses only the standard library, so it can be imported
+#    from outside crowdin_tool (from crowdin_tool import mathspan).
+#
+# Example:
+#    Show the entries with an unclosed '$'
+#       ./mathspan.py sample.po
+#
+import argparse, sys, re, collections, functools
+
+# math information of a string
+#   balanced:        True when every $ is closed
+#   dollar_list:     positions of the math mode in/out '$'
+#   span_list:       (start, end) of each $...$ region, both '$' included.
+#                    The last one ends at the end of string if not closed.
+#   esc_dollar_list: positions of the '$' of the escaped dollars
+#   nb_brace_dollar: number of in/out '$' in the innermost {...}
+#                    groups, e.g., \text{$5}
+#   nb_odd_esc_dollar: number of in/out '$' after an odd run of three or
+#                    more backslashes, e.g., \\\$ (not in the innermost
+#                    {...} groups). They are escaped for the odd dollar
+#                    report of image_tool/reporter.py.
+MathInfo = collections.namedtuple('MathInfo', ['balanced', 'dollar_list', 'span_list',
+                                               'esc_dollar_list', 'nb_brace_dollar',
+                                               'nb_odd_esc_dollar'])
+
+# Same as tokenizer.RE_MATH_INOUT plus the braces.
+#   group 1: escaped '$', group 2: in/out '$', group 3: '{', group 4: '}'
+RE_MATH_SCAN = re.compile(r'(?:\\\\)+(?:(\$))?|(\$)|(\{)|(\})')
+
+# max number of the cached strings
+STR_CACHE_SIZE = 1 << 16
+
+
+def _scan(in_str):
+    """scan in_str once
+    @return MathInfo
+    """
+    dollar_list     = []
+    esc_dollar_list = []
+    nb_brace_dollar = 0
+    nb_odd_esc_dollar = 0
+    # dollars after the last '{' (not closed yet), innermost group candidates
+    open_brace_dollar = -1
+    open_brace_odd_esc = 0
+    for mo in RE_MATH_SCAN.finditer(in_str):
+        idx = mo.lastindex
+        if (idx is None):
+            continue            # TEX_SPACE
+        elif (idx == 1):
+            esc_dollar_list.append(mo.start(1))
+        elif (idx == 2):
+            dollar_list.append(mo.start())
+            # the backslash pairs before are consumed by the previous match
+            is_odd_esc = (in_str[max(mo.start() - 2, 0):mo.start()] == '\\\\')
+            if (open_brace_dollar >= 0):
+                open_brace_dollar += 1
+                if (is_odd_esc):
+                    open_brace_odd_esc += 1
+            elif (is_odd_esc):
+                nb_odd_esc_dollar += 1
+        elif (idx == 3):
+            # a new '{' makes the outer group not innermost
+            nb_odd_esc_dollar += open_brace_odd_esc
+            open_brace_dollar = 0
+            open_brace_odd_esc = 0
+        else:
+            if (open_brace_dollar > 0):
+                nb_brace_dollar += open_brace_dollar
+            open_brace_dollar = -1
+            open_brace_odd_esc = 0
+
+    span_list = []
+    for i in range(0, len(dollar_list), 2):
+        if (i + 1 < len(dollar_list)):
+            span_list.append((dollar_list[i], dollar_list[i + 1] + 1))
+        else:
+            span_list.append((dollar_list[i], len(in_str)))
+
+    if (open_brace_dollar >= 0):
+        # an unclosed group is not a group
+        nb_odd_esc_dollar += open_brace_odd_esc
+
+    return MathInfo((len(dollar_list) % 2) == 0, dollar_list, span_list,
+                    esc_dollar_list, nb_brace_dollar, nb_odd_esc_dollar)
+
+
+@functools.lru_cache(maxsize=STR_CACHE_SIZE)
+def get_math_info(in_str):
+    """get the MathInfo of in_str (cached)
+    """
+    return _scan(in_str)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("in_file", type=str,
+                        help="Input po file")
+
+    parser.add_argument("--key-type", type=str,
+                        choices=['msgid', 'msgstr'], default='msgid',
+                        help="key type to check")
+
+    args = parser.parse_args()
+
+    import pocache
+    po_in = pocache.pofile(args.in_file, encoding='utf-8')
+    info_list = [get_math_info(getattr(ent, args.key_type)) for ent in po_in]
+    unbalanced_list = [i for i in range(len(info_list)) if (info_list[i].balanced == False)]
+    print('# {0} entries, {1} math spans, {2} unbalanced'.format(
+        len(info_list), sum(len(info.span_list) for info in info_list), len(unbalanced_list)))
+    for idx in unbalanced_list:
+        print('{0}\t{1}'.format(po_in[idx].linenum, getattr(po_in[idx], args.key_type)))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+        sys.exit()
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
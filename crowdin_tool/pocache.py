@@ -0,0 +1,471 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief binary parse cache of po files for the crowdin_tool commands
+#
+# Description:
+#    pofile() has the same interface as poparser.pofile(). The parsed
+#    entries are stored in a marshal file in the cache directory, so
+#    the next command on the same po file skips the text parsing.
+#
+#    A cache file has a header (source path, size, mtime, inode,
+#    ctime, content digest, parse options) and the entries as rows of
+#    a column list. The cache is used when the size, the mtime, the
+#    inode and the ctime are the same. When only the size is the same
+#    (the file is copied, replaced or touched), the content digest is
+#    compared. The digest is also compared when the file was modified
+#    just before the cache was written: a rewrite within the timestamp
+#    granularity keeps the mtime.
+#
+#    The total size of the cache directory is capped. The least
+#    recently used cache files are removed first.
+#
+# Environment:
+#    CROWDIN_TOOL_CACHE_DIR    cache directory (default ~/.cache/crowdin_tool)
+#    CROWDIN_TOOL_CACHE_SIZE   cache size cap in MB (default 512)
+#
+# Example:
+#    Load a po file through the cache and show the status
+#       ./pocache.py sample.po
+#
+#    Benchmark: parse vs. warm cache load
+#       ./pocache.py --bench sample.po
+#
+#    Remove all the cache files
+#       ./pocache.py --clear
+#
+import argparse, sys, os, marshal, hashlib, tempfile, gc, time, struct
+import polib
+import poparser
+import poinput
+
+# cache file format version. Change this when the format changes.
+FORMAT_VERSION = 2
+
+# cache file name extension
+CACHE_EXT = '.pocache'
+
+# cache file: magic, header length, marshal header, marshal payload
+CACHE_MAGIC       = b'POCACHE\0'
+CACHE_HEADER_LEN  = struct.Struct('<I')
+CACHE_PREFIX_SIZE = len(CACHE_MAGIC) + CACHE_HEADER_LEN.size
+
+DEFAULT_CACHE_DIR     = os.path.join('~', '.cache', 'crowdin_tool')
+DEFAULT_CACHE_SIZE_MB = 512
+
+# read chunk size of the content digest
+DIGEST_CHUNK_SIZE = 1 << 20
+
+# a file modified less than this before the cache write may be
+# rewritten with the same mtime (coarse timestamps, e.g., FAT 2 sec)
+RACY_NS = 2 * 1000 * 1000 * 1000
+
+
+def get_cache_dir():
+    """get the cache directory
+    """
+    return os.path.expanduser(os.environ.get('CROWDIN_TOOL_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+
+def get_cache_size_limit():
+    """get the cache size cap in bytes
+    """
+    try:
+        size_mb = int(os.environ.get('CROWDIN_TOOL_CACHE_SIZE', DEFAULT_CACHE_SIZE_MB))
+    except ValueError:
+        size_mb = DEFAULT_CACHE_SIZE_MB
+    return size_mb * (1 << 20)
+
+
+def get_cache_file(fname):
+    """get the cache file name of a po file
+    """
+    key = hashlib.sha1(poinput.get_abspath(fname).encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir(), key + CACHE_EXT)
+
+
+def get_digest(fname):
+    """get the content digest of a file
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with poinput.open_binary(fname) as in_file:
+        while True:
+            chunk = in_file.read(DIGEST_CHUNK_SIZE)
+            if (not chunk):
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_stat(fname):
+    """get (size, mtime_ns, inode, ctime_ns) of an input file. An
+    archive member has the inode and the ctime of the archive.
+    """
+    (size, mtime_ns) = poinput.get_stat(fname)
+    (archive, member) = poinput.split_archive_path(fname)
+    st = os.stat(archive)
+    return (size, mtime_ns, st.st_ino, st.st_ctime_ns)
+
+
+def _get_option(kwargs):
+    """the parse options which change the result
+    """
+    return [kwargs.get('encoding', 'utf-8'),
+            kwargs.get('wrapwidth', 78),
+            kwargs.get('check_for_duplicates', False)]
+
+
+def _read_header(cache_file):
+    """read the header of a cache file
+    @return header dict, None when not valid
+    """
+    try:
+        with open(cache_file, mode='rb') as in_file:
+            prefix = in_file.read(CACHE_PREFIX_SIZE)
+            if ((len(prefix) != CACHE_PREFIX_SIZE) or (prefix[:len(CACHE_MAGIC)] != CACHE_MAGIC)):
+                return None
+            (header_len,) = CACHE_HEADER_LEN.unpack_from(prefix, len(CACHE_MAGIC))
+            header = marshal.loads(in_file.read(header_len))
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if ((not isinstance(header, dict)) or (header.get('version') != FORMAT_VERSION)):
+        return None
+    return header
+
+
+def _write_cache(cache_file, header, po):
+    """write po (polib.POFile) into cache_file. A row is (index of
+    the entry's key tuple in key_list, values), the entries do not
+    need the same attributes.
+    """
+    key_dict = {}
+    row_list = []
+    for ent in po:
+        keys = tuple(ent.__dict__.keys())
+        key_index = key_dict.setdefault(keys, len(key_dict))
+        row_list.append((key_index, tuple(ent.__dict__.values())))
+    key_list = list(key_dict.keys())
+    payload  = {
+        'header':            po.header,
+        'metadata':          list(po.metadata.items()),
+        'metadata_is_fuzzy': po.metadata_is_fuzzy,
+        'key_list':          key_list,
+        'row_list':          row_list,
+    }
+
+    cache_dir = os.path.dirname(cache_file)
+    os.makedirs(cache_dir, exist_ok=True)
+    (fd, tmp_file) = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        header_bytes = marshal.dumps(header)
+        with os.fdopen(fd, mode='wb') as out_file:
+            out_file.write(CACHE_MAGIC)
+            out_file.write(CACHE_HEADER_LEN.pack(len(header_bytes)))
+            out_file.write(header_bytes)
+            marshal.dump(payload, out_file)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
+
+def _load_cache(cache_file, build_func):
+    """load a cache file
+    @param[in] build_func function: payload -> result (e.g., polib.POFile)
+    @return    build_func(payload)
+    """
+    with open(cache_file, mode='rb') as in_file:
+        data = in_file.read()
+    (header_len,) = CACHE_HEADER_LEN.unpack_from(data, len(CACHE_MAGIC))
+
+    # no garbage can be created while building the rows and the
+    # entries, skip the collector (it is triggered many times by the
+    # allocations)
+    is_gc = gc.isenabled()
+    gc.disable()
+    try:
+        payload = marshal.loads(memoryview(data)[CACHE_PREFIX_SIZE + header_len:])
+        del data
+        ret = build_func(payload)
+    finally:
+        if (is_gc == True):
+            gc.enable()
+
+    return ret
+
+
+def _build_pofile(payload, fname, kwargs):
+    """build polib.POFile from a cache payload. A payload has header,
+    metadata, metadata_is_fuzzy, key_list (list of key tuples) and
+    row_list (list of (key tuple index, value tuple)).
+    """
+    (encoding, wrapwidth, check_for_duplicates) = _get_option(kwargs)
+    po = polib.POFile(pofile=fname, encoding=encoding, wrapwidth=wrapwidth,
+                      check_for_duplicates=check_for_duplicates)
+    po.header            = payload['header']
+    po.metadata_is_fuzzy = payload['metadata_is_fuzzy']
+    for (k, v) in payload['metadata']:
+        po.metadata[k] = v
+
+    key_list   = payload['key_list']
+    entry_type = polib.POEntry
+    for (key_index, values) in payload['row_list']:
+        ent = entry_type.__new__(entry_type)
+        ent.__dict__.update(zip(key_list[key_index], values))
+        po.append(ent)
+
+    return po
+
+
+def evict(limit_bytes=None):
+    """remove the least recently used cache files until the total size
+    is under the limit.
+
+    @param[in] limit_bytes size limit (default get_cache_size_limit())
+    @return    number of removed files
+    """
+    if (limit_bytes == None):
+        limit_bytes = get_cache_size_limit()
+
+    cache_dir = get_cache_dir()
+    if (os.path.isdir(cache_dir) == False):
+        return 0
+
+    stat_list = []
+    for dent in os.scandir(cache_dir):
+        if (dent.name.endswith(CACHE_EXT) and dent.is_file()):
+            st = dent.stat()
+            stat_list.append((st.st_mtime_ns, st.st_size, dent.path))
+
+    total_size = sum(s[1] for s in stat_list)
+    nb_removed = 0
+    for (mtime, size, path) in sorted(stat_list):
+        if (total_size <= limit_bytes):
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total_size -= size
+        nb_removed += 1
+
+    return nb_removed
+
+
+def lookup(fname, **kwargs):
+    """find a valid cache file of fname
+    @return cache file name, None when no valid cache
+    """
+    cache_file = get_cache_file(fname)
+    header = _read_header(cache_file)
+    if ((header == None) or (is_valid(header, fname, kwargs) == False)):
+        return None
+
+    return cache_file
+
+
+def is_valid(header, fname, kwargs):
+    """check a header (see load_pofile()) still describes fname
+    @return True when the parsed entries of the header can be used
+    """
+    (size, mtime_ns, inode, ctime_ns) = get_stat(fname)
+    if ((header['path'] != poinput.get_abspath(fname)) or
+        (header['size'] != size) or
+        (header['option'] != _get_option(kwargs))):
+        return False
+
+    is_racy = ((header['stat_ns'] - header['mtime_ns']) < RACY_NS)
+    if ((is_racy == True) or (header['mtime_ns'] != mtime_ns) or
+        (header['inode'] != inode) or (header['ctime_ns'] != ctime_ns)):
+        # touched, copied or replaced, the content may be the same
+        if (header['digest'] != get_digest(fname)):
+            return False
+
+    return True
+
+
+def copy_pofile(po):
+    """copy a polib.POFile. The entries, their lists and the metadata
+    are copied, the strings are shared.
+    """
+    new_po = polib.POFile(pofile=po.fpath, encoding=po.encoding, wrapwidth=po.wrapwidth,
+                          check_for_duplicates=po.check_for_duplicates)
+    new_po.header            = po.header
+    new_po.metadata_is_fuzzy = list(po.metadata_is_fuzzy)
+    for (k, v) in po.metadata.items():
+        new_po.metadata[k] = v
+
+    entry_type = polib.POEntry
+    is_gc      = gc.isenabled()
+    gc.disable()
+    try:
+        for ent in po:
+            new_ent = entry_type.__new__(entry_type)
+            new_ent.__dict__.update(ent.__dict__)
+            new_ent.occurrences   = list(ent.occurrences)
+            new_ent.flags         = list(ent.flags)
+            new_ent.msgstr_plural = dict(ent.msgstr_plural)
+            new_po.append(new_ent)
+    finally:
+        if (is_gc == True):
+            gc.enable()
+
+    return new_po
+
+
+# in-process store of the parsed files (see podaemon.py). When it is
+# set, pofile() gets the files from the store.
+_memory_store = None
+
+def set_memory_store(store):
+    """set the in-process store
+    @param[in] store object with get_pofile(fname, kwargs), None to unset
+    """
+    global _memory_store
+    _memory_store = store
+
+
+def get_memory_store():
+    """get the in-process store, None when not set
+    """
+    return _memory_store
+
+
+def pofile(fname, use_cache=True, **kwargs):
+    """parse a po file through the cache. Same interface as polib.pofile().
+
+    @param[in] fname     po file name
+    @param[in] use_cache when False, parse without the cache (--no-cache)
+    @param[in] kwargs    encoding, wrapwidth, check_for_duplicates (see polib)
+    @return    polib.POFile
+    """
+    if (use_cache == False):
+        return poparser.pofile(fname, **kwargs)
+
+    if (_memory_store is not None):
+        return _memory_store.get_pofile(fname, kwargs)
+
+    return disk_pofile(fname, **kwargs)
+
+
+def load_payload(fname, build_func, **kwargs):
+    """build a result from the cached payload of fname (see
+    _build_pofile()) without building the polib entries
+
+    @param[in] build_func function: payload -> result
+    @return    build_func(payload), None when no valid cache
+    """
+    cache_file = lookup(fname, **kwargs)
+    if (cache_file == None):
+        return None
+    try:
+        ret = _load_cache(cache_file, build_func)
+        os.utime(cache_file)
+        return ret
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        return None
+
+
+def disk_pofile(fname, **kwargs):
+    """parse a po file through the cache file (no in-process store)
+    """
+    return load_pofile(fname, kwargs)[1]
+
+
+def load_pofile(fname, kwargs):
+    """parse a po file through the cache file
+    @return (header, polib.POFile), the header tells when the entries
+            are out of date (see is_valid())
+    """
+    cache_file = get_cache_file(fname)
+    header = _read_header(cache_file)
+    if ((header != None) and (is_valid(header, fname, kwargs) == True)):
+        try:
+            po = _load_cache(cache_file, lambda payload: _build_pofile(payload, fname, kwargs))
+            # mark as recently used
+            os.utime(cache_file)
+            return (header, po)
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            pass
+
+    stat_ns = time.time_ns()
+    (size, mtime_ns, inode, ctime_ns) = get_stat(fname)
+    po = poparser.pofile(fname, **kwargs)
+    header = {
+        'version':  FORMAT_VERSION,
+        'path':     poinput.get_abspath(fname),
+        'size':     size,
+        'mtime_ns': mtime_ns,
+        'inode':    inode,
+        'ctime_ns': ctime_ns,
+        'stat_ns':  stat_ns,
+        'digest':   get_digest(fname),
+        'option':   _get_option(kwargs),
+    }
+    try:
+        _write_cache(get_cache_file(fname), header, po)
+        evict()
+    except (OSError, ValueError):
+        # the cache is optional (read only home, unmarshallable value, ...)
+        pass
+
+    return (header, po)
+
+
+def clear():
+    """remove all the cache files
+    @return number of removed files
+    """
+    return evict(0)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("in_file", type=str, nargs='?',
+                        help="Input po file")
+
+    parser.add_argument("--bench", action="store_true",
+                        help="benchmark: parse vs. warm cache load")
+
+    parser.add_argument("--loop", type=int, default=3,
+                        help="number of benchmark loops")
+
+    parser.add_argument("--clear", action="store_true",
+                        help="remove all the cache files")
+
+    args = parser.parse_args()
+
+    if (args.clear == True):
+        print('# removed {0} cache files in {1}'.format(clear(), get_cache_dir()))
+        return
+
+    if (args.in_file == None):
+        raise RuntimeError('No input file')
+
+    if (args.bench == True):
+        pofile(args.in_file, encoding='utf-8')      # warm up
+        for (name, use_cache) in [('parse', False), ('cache', True)]:
+            start_sec = time.perf_counter()
+            for i in range(args.loop):
+                po = pofile(args.in_file, use_cache=use_cache, encoding='utf-8')
+            elapsed_sec = (time.perf_counter() - start_sec) / args.loop
+            print('{0:6} {1:8d} entries {2:8.3f} sec'.format(name, len(po), elapsed_sec))
+        return
+
+    cache_file = lookup(args.in_file, encoding='utf-8')
+    po = pofile(args.in_file, encoding='utf-8')
+    print('# {0}: {1} entries, cache {2} [{3}]'.format(
+        args.in_file, len(po), 'hit' if (cache_file != None) else 'miss',
+        get_cache_file(args.in_file)))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+        sys.exit()
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
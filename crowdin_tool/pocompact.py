@@ -0,0 +1,245 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief field projection loading of po files into compact entries
+#
+# Description:
+#    Most tools use only one or two fields of an entry (pogrep and
+#    poline the --key-type field, diffapply msgid and msgstr), but a
+#    polib.POEntry has all the fields in a __dict__. pofile() keeps only
+#    the requested fields in a __slots__ entry class. The strings are
+#    interned, so a string repeated in many entries or files (e.g.,
+#    occurrence paths, flags, the same msgid of each language) is
+#    stored once. This makes a whole language tree fit in memory for a
+#    cross-file analysis (load_tree()).
+#
+#    A compact entry is read only in spirit: it has no str() in the po
+#    format and cannot be saved. Use poparser/pocache for that.
+#
+# Fields:
+#    msgctxt, msgid, msgstr, comment, tcomment, occurrences, flags, linenum
+#    occurrences and flags are tuples.
+#
+# Example:
+#    Load a tree with msgid only, show the number of entries and the memory
+#       ./pocompact.py --fields msgid -R po_tree_dir
+#
+#    Compare with the full polib entries
+#       ./pocompact.py --fields msgid,msgstr --compare sample.po
+#
+import argparse, sys, os, gc, tracemalloc
+import pocache
+import potree
+
+# projectable fields
+FIELD_LIST = ['msgctxt', 'msgid', 'msgstr', 'comment', 'tcomment',
+              'occurrences', 'flags', 'linenum']
+
+# string fields (interned)
+STR_FIELD_SET = set(['msgctxt', 'msgid', 'msgstr', 'comment', 'tcomment'])
+
+
+class CompactEntry(object):
+    """base class of the compact entries. The subclasses have the
+    projected fields as __slots__ (see get_entry_class()).
+    """
+    __slots__ = ()
+
+    def __init__(self, *value_list):
+        for (name, value) in zip(self.__slots__, value_list):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(name, getattr(self, name)) for name in self.__slots__))
+
+    def __eq__(self, other):
+        return ((type(self) is type(other)) and
+                all(getattr(self, name) == getattr(other, name) for name in self.__slots__))
+
+    __hash__ = None
+
+
+class CompactPoFile(list):
+    """list of compact entries with the po file information
+    """
+
+    def __init__(self, fpath, field_list, encoding, metadata):
+        list.__init__(self)
+        self.fpath      = fpath
+        self.field_list = field_list
+        self.encoding   = encoding
+        self.metadata   = metadata
+
+
+# field tuple -> entry class
+_entry_class_cache = {}
+
+def get_entry_class(field_list):
+    """get the compact entry class of the fields. The class is created
+    once per field set.
+
+    @param[in] field_list list of the field names
+    @return    subclass of CompactEntry
+    """
+    key = tuple(f for f in FIELD_LIST if (f in field_list))
+    if (key in _entry_class_cache):
+        return _entry_class_cache[key]
+
+    for f in field_list:
+        if (f not in FIELD_LIST):
+            raise RuntimeError('Unknown field [{0}]'.format(f))
+    if (len(key) == 0):
+        raise RuntimeError('No field')
+
+    entry_class = type('CompactEntry_' + '_'.join(key), (CompactEntry,), {'__slots__': key})
+    _entry_class_cache[key] = entry_class
+    return entry_class
+
+
+def _get_convert_func(field):
+    """get the function: field value of polib.POEntry -> (interned)
+    compact field value
+    """
+    intern = sys.intern
+    if (field in STR_FIELD_SET):
+        return lambda value: value if (value is None) else intern(value)
+    elif (field == 'occurrences'):
+        return lambda value: tuple((intern(f), intern(n)) for (f, n) in value)
+    elif (field == 'flags'):
+        return lambda value: tuple(intern(f) for f in value)
+    else:
+        return lambda value: value
+
+
+def project(po, field_list):
+    """project the entries of a po file to the fields
+
+    @param[in] po         polib.POFile
+    @param[in] field_list list of the field names
+    @return    CompactPoFile
+    """
+    entry_class = get_entry_class(field_list)
+    func_list   = [(f, _get_convert_func(f)) for f in entry_class.__slots__]
+
+    compact_po = CompactPoFile(po.fpath, entry_class.__slots__, po.encoding, dict(po.metadata))
+    compact_po.extend(entry_class(*[func(getattr(ent, f)) for (f, func) in func_list]) for ent in po)
+    return compact_po
+
+
+def project_payload(payload, fname, field_list, encoding):
+    """project the rows of a pocache payload to the fields. No
+    polib.POEntry is built.
+
+    @param[in] payload    pocache payload (see pocache._build_pofile())
+    @param[in] field_list list of the field names
+    @return    CompactPoFile
+    """
+    entry_class = get_entry_class(field_list)
+    func_list   = [_get_convert_func(f) for f in entry_class.__slots__]
+
+    # a row is (key tuple index, value tuple), (index of the field value, func) per key tuple
+    getter_list = [list(zip([key_tuple.index(f) for f in entry_class.__slots__], func_list))
+                   for key_tuple in payload['key_list']]
+
+    compact_po = CompactPoFile(fname, entry_class.__slots__, encoding, dict(payload['metadata']))
+    compact_po.extend(entry_class(*[func(values[i]) for (i, func) in getter_list[key_index]])
+                      for (key_index, values) in payload['row_list'])
+    return compact_po
+
+
+def pofile(fname, field_list, use_cache=True, **kwargs):
+    """load a po file with only the fields
+
+    @param[in] fname      po file name
+    @param[in] field_list list of the field names
+    @param[in] use_cache  when False, parse without the cache (see pocache)
+    @param[in] kwargs     encoding (see polib)
+    @return    CompactPoFile
+    """
+    if ((use_cache == True) and (pocache.get_memory_store() == None)):
+        # warm cache: the compact entries from the cached rows
+        compact_po = pocache.load_payload(
+            fname, lambda payload: project_payload(payload, fname, field_list, kwargs.get('encoding', 'utf-8')),
+            **kwargs)
+        if (compact_po != None):
+            return compact_po
+    return project(pocache.pofile(fname, use_cache=use_cache, **kwargs), field_list)
+
+
+def load_tree(src_dir, field_list, use_cache=True, **kwargs):
+    """load all the po files under src_dir with only the fields
+
+    @param[in] src_dir    top directory
+    @param[in] field_list list of the field names
+    @return    list of (relative path, CompactPoFile), sorted by the path
+    """
+    return [(rel_path, pofile(path, field_list, use_cache=use_cache, **kwargs))
+            for (rel_path, path) in potree.get_po_file_list(src_dir)]
+
+
+def _measure(func):
+    """call func and measure the retained memory
+    @return (result, bytes)
+    """
+    gc.collect()
+    tracemalloc.start()
+    ret = func()
+    gc.collect()
+    (cur_mem, peak_mem) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (ret, cur_mem)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("in_file", type=str, nargs='?',
+                        help="Input po file")
+
+    parser.add_argument("-R", "--recursive", type=str, default='',
+                        help="load all the po files under this directory")
+
+    parser.add_argument("--fields", type=str, default='msgid,msgstr',
+                        help="comma separated fields to keep. " + ', '.join(FIELD_LIST))
+
+    parser.add_argument("--compare", action="store_true",
+                        help="also measure the full polib entries")
+
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse without the parse cache (see pocache.py)")
+
+    args = parser.parse_args()
+
+    field_list = [f.strip() for f in args.fields.split(',') if (f.strip() != '')]
+    use_cache  = not args.no_cache
+    if (args.recursive != ''):
+        load_compact = lambda: load_tree(args.recursive, field_list, use_cache, encoding='utf-8')
+        load_full    = lambda: [(rel_path, pocache.pofile(path, use_cache=use_cache, encoding='utf-8'))
+                                for (rel_path, path) in potree.get_po_file_list(args.recursive)]
+    elif (args.in_file != None):
+        load_compact = lambda: [(args.in_file, pofile(args.in_file, field_list, use_cache, encoding='utf-8'))]
+        load_full    = lambda: [(args.in_file, pocache.pofile(args.in_file, use_cache=use_cache, encoding='utf-8'))]
+    else:
+        raise RuntimeError('No input file')
+
+    (po_list, mem) = _measure(load_compact)
+    print('# compact {0:6d} files {1:8d} entries {2:8.1f} MB [{3}]'.format(
+        len(po_list), sum(len(po) for (rel_path, po) in po_list), mem / 1e6, ','.join(field_list)))
+    del po_list
+
+    if (args.compare == True):
+        (po_list, mem) = _measure(load_full)
+        print('# full    {0:6d} files {1:8d} entries {2:8.1f} MB'.format(
+            len(po_list), sum(len(po) for (rel_path, po) in po_list), mem / 1e6))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+        sys.exit()
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
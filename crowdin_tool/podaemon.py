@@ -0,0 +1,429 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief crowdin_tool daemon: keep the parsed po files in memory
+#
+# Description:
+#    A long running server loads po files (e.g., a whole po tree) once
+#    and keeps them in memory. pogrep.py, poline.py, poresub.py and
+#    pofilter.py forward their command line to the server over a Unix
+#    socket when it is running, so hundreds of short commands on the
+#    same snapshot pay no parse.
+#
+#    The server runs the same main() of the tool in the process, in the
+#    client's working directory, and returns the stdout, stderr and the
+#    exit status. The files are served from memory while they pass the
+#    parse cache check (pocache.is_valid()); a changed file is loaded
+#    again. The requests are processed one by one.
+#
+#    The socket is in a directory only the user can write,
+#    $XDG_RUNTIME_DIR or /tmp/crowdin_tool-<uid>/ (mode 0700). A client
+#    forwards only to a socket owned by the user in such a directory.
+#
+# Protocol (one JSON line each way, then the connection is closed):
+#    request:  {"cmd": "run", "tool": "grep", "argv": [...], "cwd": "..."}
+#              {"cmd": "status"}
+#              {"cmd": "shutdown"}
+#    response: {"status": 0, "stdout": "...", "stderr": "..."}
+#
+# Environment:
+#    CROWDIN_TOOL_SOCKET      socket path (default $XDG_RUNTIME_DIR/crowdin_tool.sock,
+#                             or /tmp/crowdin_tool-<uid>/crowdin_tool.sock)
+#    CROWDIN_TOOL_NO_DAEMON   when set, the tools never forward
+#
+# Example:
+#    Start the server with a po tree
+#       ./podaemon.py serve -R po_tree_dir &
+#
+#    Then the tools forward to it
+#       ./pogrep.py -e 'slug' po_tree_dir/ja/sample.po
+#
+#    Run a tool on the server explicitly, status and stop
+#       ./podaemon.py run grep -e 'slug' po_tree_dir/ja/sample.po
+#       ./podaemon.py status
+#       ./podaemon.py stop
+#
+import argparse, sys, os, io, json, socket, stat, tempfile, traceback, collections, time
+
+# tool name -> (module, main function, exit status of RuntimeError, read only)
+# A read only tool does not change the entries, the stored entries are
+# given as is. Other tools get a copy.
+TOOL_DICT = {
+    'grep':   ('pogrep',   'pogrep_main',  2, True),
+    'line':   ('poline',   'poline_main',  2, True),
+    'resub':  ('poresub',  'poresub_main', 0, False),
+    'filter': ('pofilter', 'main',         0, False),  # -n clears the context
+}
+
+# default max number of the files in memory
+DEFAULT_MAX_FILES = 10000
+
+# receive size
+RECV_SIZE = 1 << 16
+
+# socket file name in the socket directory
+SOCKET_NAME = 'crowdin_tool.sock'
+
+# True in the server process. The tools run by the server must not forward.
+_is_server = False
+
+
+def get_socket_dir():
+    """get the default socket directory
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR', '')
+    if (runtime_dir != ''):
+        return runtime_dir
+    return os.path.join(tempfile.gettempdir(), 'crowdin_tool-{0}'.format(os.getuid()))
+
+
+def get_socket_path():
+    """get the socket path
+    """
+    path = os.environ.get('CROWDIN_TOOL_SOCKET', '')
+    if (path == ''):
+        path = os.path.join(get_socket_dir(), SOCKET_NAME)
+    return path
+
+
+def is_private_dir(dir_path):
+    """True when only this user (or root for a sticky directory such as
+    /tmp) can add, remove or rename the files of dir_path
+    """
+    try:
+        st = os.stat(dir_path)
+    except OSError:
+        return False
+    if ((st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)) == 0):
+        return (st.st_uid == os.getuid())
+    return ((st.st_mode & stat.S_ISVTX) != 0)
+
+
+def is_own_socket(path):
+    """True when path is a socket of this user in a private directory,
+    another user can not have put it there
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_ISSOCK(st.st_mode) and (st.st_uid == os.getuid()) and
+            is_private_dir(os.path.dirname(os.path.abspath(path))))
+
+
+def _request(path, request):
+    """send a request and get the response
+    @return response dict
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        sock.shutdown(socket.SHUT_WR)
+        chunk_list = []
+        while True:
+            chunk = sock.recv(RECV_SIZE)
+            if (not chunk):
+                break
+            chunk_list.append(chunk)
+    finally:
+        sock.close()
+
+    return json.loads(b''.join(chunk_list).decode('utf-8'))
+
+
+def forward(tool, argv):
+    """forward a tool command line to the server when it is running
+
+    @param[in] tool tool name (TOOL_DICT key)
+    @param[in] argv command line arguments (without the program name)
+    @return    exit status, None when no server (run the tool locally)
+    """
+    if (_is_server or (os.environ.get('CROWDIN_TOOL_NO_DAEMON', '') != '')):
+        return None
+    path = get_socket_path()
+    if (os.path.exists(path) == False):
+        return None
+    if (is_own_socket(path) == False):
+        sys.stderr.write('# podaemon: [{0}] is not a socket of this user in a private directory, '
+                         'not forwarded\n'.format(path))
+        return None
+
+    try:
+        response = _request(path, {'cmd': 'run', 'tool': tool, 'argv': argv, 'cwd': os.getcwd()})
+    except (OSError, ValueError):
+        # not running (stale socket) or broken
+        return None
+
+    # the output may not be valid UTF-8, surrogateescape gives the bytes back
+    sys.stdout.flush()
+    sys.stdout.buffer.write(response['stdout'].encode('utf-8', 'surrogateescape'))
+    sys.stdout.flush()
+    sys.stderr.flush()
+    sys.stderr.buffer.write(response['stderr'].encode('utf-8', 'surrogateescape'))
+    sys.stderr.flush()
+    return response['status']
+
+
+class PoStore(object):
+    """In-memory store of the parsed po files (pocache memory store)
+    """
+
+    def __init__(self, max_files):
+        """constructor
+        @param[in] max_files max number of the files. The least recently
+                             used file is dropped first.
+        """
+        # (abspath, options) -> (pocache header, polib.POFile)
+        self.__po_dict   = collections.OrderedDict()
+        self.__max_files = max_files
+        self.__is_copy   = True
+        self.__nb_hit    = 0
+        self.__nb_load   = 0
+
+
+    def set_copy(self, is_copy):
+        """when True, get_pofile() gives a copy (the tool changes the entries)
+        """
+        self.__is_copy = is_copy
+
+
+    def get_pofile(self, fname, kwargs):
+        """get a parsed po file, load when not in the store or changed
+        """
+        import pocache, poinput
+
+        key = (poinput.get_abspath(fname), tuple(sorted(kwargs.items())))
+        val = self.__po_dict.get(key, None)
+        if ((val != None) and (pocache.is_valid(val[0], fname, kwargs) == True)):
+            self.__po_dict.move_to_end(key)
+            self.__nb_hit += 1
+            po = val[1]
+        else:
+            (header, po) = pocache.load_pofile(fname, kwargs)
+            self.__po_dict[key] = (header, po)
+            self.__po_dict.move_to_end(key)
+            self.__nb_load += 1
+            while (len(self.__po_dict) > self.__max_files):
+                self.__po_dict.popitem(last=False)
+
+        if (self.__is_copy == True):
+            return pocache.copy_pofile(po)
+        return po
+
+
+    def get_status(self):
+        """get the status dict
+        """
+        return {
+            'files':   len(self.__po_dict),
+            'entries': sum(len(val[1]) for val in self.__po_dict.values()),
+            'hit':     self.__nb_hit,
+            'load':    self.__nb_load,
+        }
+
+
+def _get_exit_status(code):
+    """sys.exit() argument to the exit status
+    """
+    if (code is None):
+        return 0
+    if (isinstance(code, int)):
+        return code
+    sys.stderr.write('{0}\n'.format(code))
+    return 1
+
+
+def run_tool(store, tool, argv, cwd):
+    """run a tool main() in this process
+
+    @param[in] store PoStore
+    @param[in] tool  tool name (TOOL_DICT key)
+    @param[in] argv  command line arguments (without the program name)
+    @param[in] cwd   working directory of the client
+    @return    (exit status, stdout str, stderr str)
+    """
+    if (tool not in TOOL_DICT):
+        return (2, '', 'Unknown tool [{0}]\n'.format(tool))
+    (module_name, main_name, runtime_error_status, is_read_only) = TOOL_DICT[tool]
+    module = __import__(module_name)
+
+    save_argv   = sys.argv
+    save_stdout = sys.stdout
+    save_stderr = sys.stderr
+    save_cwd    = os.getcwd()
+
+    # the tools may detach sys.stdout, keep the buffers
+    out_buf = io.BytesIO()
+    err_buf = io.BytesIO()
+    sys.stdout = io.TextIOWrapper(out_buf, encoding='utf-8', errors='surrogateescape')
+    sys.stderr = io.TextIOWrapper(err_buf, encoding='utf-8', errors='surrogateescape')
+    sys.argv   = [module_name + '.py'] + argv
+    store.set_copy(not is_read_only)
+    status = 0
+    try:
+        os.chdir(cwd)
+        getattr(module, main_name)()
+    except SystemExit as err:
+        status = _get_exit_status(err.code)
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
+        status = runtime_error_status
+    except Exception:
+        traceback.print_exc()
+        status = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except ValueError:
+            pass
+        out_str = out_buf.getvalue().decode('utf-8', 'surrogateescape')
+        err_str = err_buf.getvalue().decode('utf-8', 'surrogateescape')
+        sys.argv   = save_argv
+        sys.stdout = save_stdout
+        sys.stderr = save_stderr
+        os.chdir(save_cwd)
+        store.set_copy(True)
+
+    return (status, out_str, err_str)
+
+
+def serve(socket_path, src_dir_list, max_files):
+    """run the server until a shutdown request
+    """
+    import socketserver
+    import pocache, potree
+
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    if ((os.path.isdir(socket_dir) == False) and (socket_path == os.path.join(get_socket_dir(), SOCKET_NAME))):
+        os.makedirs(socket_dir, mode=0o700)
+    if (is_private_dir(socket_dir) == False):
+        raise RuntimeError('socket directory [{0}] can be written by other users'.format(socket_dir))
+
+    global _is_server
+    _is_server = True
+
+    store = PoStore(max_files)
+    pocache.set_memory_store(store)
+
+    start_sec = time.perf_counter()
+    for src_dir in src_dir_list:
+        for (rel_path, path) in potree.get_po_file_list(src_dir):
+            store.get_pofile(path, {'encoding': 'utf-8'})
+    status = store.get_status()
+    print('# loaded {0} files, {1} entries in {2:.2f} sec'.format(
+        status['files'], status['entries'], time.perf_counter() - start_sec))
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                request = json.loads(self.rfile.readline().decode('utf-8'))
+                cmd = request.get('cmd', '')
+                if (cmd == 'run'):
+                    (status, out_str, err_str) = run_tool(store, request['tool'], request['argv'],
+                                                          request['cwd'])
+                    response = {'status': status, 'stdout': out_str, 'stderr': err_str}
+                elif (cmd == 'status'):
+                    response = {'status': 0, 'stdout': json.dumps(store.get_status()) + '\n', 'stderr': ''}
+                elif (cmd == 'shutdown'):
+                    self.server.is_stop = True
+                    response = {'status': 0, 'stdout': '', 'stderr': ''}
+                else:
+                    response = {'status': 2, 'stdout': '', 'stderr': 'Unknown cmd [{0}]\n'.format(cmd)}
+            except (ValueError, KeyError, TypeError) as err:
+                response = {'status': 2, 'stdout': '', 'stderr': 'Bad request: {0}\n'.format(err)}
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+    if (os.path.exists(socket_path)):
+        try:
+            _request(socket_path, {'cmd': 'status'})
+            raise RuntimeError('server is already running on [{0}]'.format(socket_path))
+        except OSError:
+            # stale socket
+            os.unlink(socket_path)
+
+    # only this user can connect
+    save_umask = os.umask(0o077)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, Handler)
+    finally:
+        os.umask(save_umask)
+
+    server.is_stop = False
+    print('# serving on {0}'.format(socket_path))
+    sys.stdout.flush()
+    try:
+        while (server.is_stop == False):
+            server.handle_request()
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+    print('# shutdown')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--socket", type=str, default='',
+                        help="socket path (default $CROWDIN_TOOL_SOCKET, $XDG_RUNTIME_DIR/crowdin_tool.sock "
+                        "or /tmp/crowdin_tool-<uid>/crowdin_tool.sock)")
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    serve_parser = subparsers.add_parser('serve', help="run the server")
+    serve_parser.add_argument("-R", "--recursive", type=str, action='append', default=[],
+                              help="load all the po files under this directory at start")
+    serve_parser.add_argument("--max-files", type=int, default=DEFAULT_MAX_FILES,
+                              help="max number of the files in memory")
+
+    run_parser = subparsers.add_parser('run', help="run a tool on the server")
+    run_parser.add_argument("tool", type=str, choices=sorted(TOOL_DICT),
+                            help="tool name")
+    run_parser.add_argument("tool_argv", nargs=argparse.REMAINDER,
+                            help="arguments of the tool")
+
+    subparsers.add_parser('status', help="show the server status")
+    subparsers.add_parser('stop',   help="stop the server")
+
+    args = parser.parse_args()
+
+    socket_path = args.socket if (args.socket != '') else get_socket_path()
+
+    if (args.command == None):
+        raise RuntimeError('No command. serve, run, status or stop.')
+
+    if (args.command == 'serve'):
+        serve(socket_path, args.recursive, args.max_files)
+        return
+
+    if (args.command == 'run'):
+        request = {'cmd': 'run', 'tool': args.tool, 'argv': args.tool_argv, 'cwd': os.getcwd()}
+    elif (args.command == 'status'):
+        request = {'cmd': 'status'}
+    else:
+        request = {'cmd': 'shutdown'}
+
+    if (os.path.exists(socket_path) and (is_own_socket(socket_path) == False)):
+        raise RuntimeError('[{0}] is not a socket of this user in a private directory'.format(socket_path))
+    try:
+        response = _request(socket_path, request)
+    except OSError as err:
+        raise RuntimeError('server is not running on [{0}]: {1}'.format(socket_path, err))
+
+    sys.stdout.buffer.write(response['stdout'].encode('utf-8', 'surrogateescape'))
+    sys.stdout.flush()
+    sys.stderr.buffer.write(response['stderr'].encode('utf-8', 'surrogateescape'))
+    sys.stderr.flush()
+    sys.exit(response['status'])
+
+
+if __name__ == "__main__":
+    try:
+        main()
+        sys.exit()
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
@@ -30,6 +30,9 @@
 import argparse, sys, re, codecs, os
 import polib
 
+import pocache
+import podaemon
+
 def id_to_str(entry):
     """filter() function to determine if a given entry is untranslated"""
     return (not entry.msgstr and entry.msgid)
@@ -86,23 +89,35 @@ def get_metadata_string(metadata_dict):
     return metadata_str
 
 
-def find_untranslated_entries(poentries, remove_context=False, tool="id_to_str"):
+def filter_entries(poentries, remove_context=False, tool="id_to_str"):
     """
-    Read a PO file and find all untranslated entries.
-    Note that polib's untranslated_entries() doesn't seem to work
-    for Crowdin PO files.
+    Filter (and map) the entries by the tool. Also used as an
+    in-memory stage of popipe.py.
 
-    Returns a string containing the resulting PO entries
+    Returns a generator of the resulting entries
     """
     # Find untranslated strings
     untranslated = filter(filter_tools[tool], poentries)
 
     # Replace msgstr by msgid (because it would be empty otherwise due to POLib)
-    export_entries = list(map(map_tools[tool], untranslated))
+    export_entries = map(map_tools[tool], untranslated)
 
     # Remove context if enabled
     if remove_context:
-        export_entries = list(map(remove_context_from_entry, export_entries))
+        export_entries = map(remove_context_from_entry, export_entries)
+
+    return export_entries
+
+
+def find_untranslated_entries(poentries, remove_context=False, tool="id_to_str"):
+    """
+    Read a PO file and find all untranslated entries.
+    Note that polib's untranslated_entries() doesn't seem to work
+    for Crowdin PO files.
+
+    Returns a string containing the resulting PO entries
+    """
+    export_entries = list(filter_entries(poentries, remove_context, tool))
 
     # Create a new PO with the entries
     result = polib.POFile()
@@ -141,13 +156,16 @@ def main():
     parser.add_argument("-n", "--no-context", action="store_true",
                         help="Remove context from all strings")
 
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse infile without the parse cache (see pocache.py)")
+
     parser.add_argument("--force_override", action='store_true',
                         help="Even outfile is found, override the output file.")
 
     args = parser.parse_args()
 
     # load pofile
-    poentries = polib.pofile(args.infile, encoding='utf-8')
+    poentries = pocache.pofile(args.infile, use_cache=(not args.no_cache), encoding='utf-8')
 
     body_str = find_untranslated_entries(poentries, args.no_context, args.tool)
 
@@ -177,6 +195,11 @@ def main():
             print('# empty result file, skip to output {0}'.format(args.outfile))
 
 if __name__ == "__main__":
+    # forward to the podaemon.py server when it is running
+    forward_status = podaemon.forward('filter', sys.argv[1:])
+    if (forward_status != None):
+        sys.exit(forward_status)
+
     try:
         main()
         # sys.exit()
@@ -18,9 +18,17 @@
 #    Get exercise decimals-in-words for file learn.math.cc-fourth-grade-math.exercises-ja.po
 #       ./pogrep.py --key-type tcomment -e decimals-in-words learn.math.cc-fourth-grade-math.exercises-ja.po
 #
+#    Count the entries which have 'slug' in the translator comment
+#       ./pogrep.py --key-type tcomment -e slug --format count learn.math.cc-fourth-grade-math.exercises-ja.po
+#
 import argparse, sys, re, codecs, os
 import polib
 
+import pooutput
+import pocache
+import pocompact
+import podaemon
+
 class Pogrep(object):
     """grep on pofile.
     Search depends on keytype: msgid, msgstr, comment, tcomment
@@ -69,13 +77,20 @@ class Pogrep(object):
         self.__out_file = self.__opt_dict['out_file']
         if (self.__out_file == None):
             raise RuntimeError('No output file')
-        self.__out_file_obj = None
+        self.__out_obj = None
 
         self.__verbose_out('# out_file: {0}'.format(self.__out_file))
 
+        # output format
+        self.__format = self.__opt_dict.get('format', 'po')
+        self.__verbose_out('# format:   {0}'.format(self.__format))
+
         # FIXME
         self.__force_override = False
 
+        # parse cache
+        self.__use_cache = not self.__opt_dict.get('no_cache', False)
+
 
     def __verbose_out(self, mes):
         """verbose output if self.__is_verbose is True
@@ -105,12 +120,15 @@ class Pogrep(object):
 
         return self.__match_true == is_found
 
-    def __out(self, out_str):
-        """output out_str"""
-        if (self.__out_file_obj != None):
-            self.__out_file_obj.write(out_str + '\n')
-        else:
-            print(out_str + '\n')
+
+    def filter_entries(self, ent_iter):
+        """in-memory stage (see popipe.py)
+        @param[in] ent_iter iterable of po entries
+        @return    generator of the matching entries
+        """
+        for ent in ent_iter:
+            if (self.__is_match(ent) == True):
+                yield ent
 
 
     def __process_po_obj(self, po_in):
@@ -132,7 +150,9 @@ class Pogrep(object):
         # Then, msgid, msgstr, (msgcxt)
         for ent in po_in:
             if (self.__is_match(ent) == True):
-                self.__out(str(ent))
+                self.__out_obj.write_entry(ent)
+                if (self.__out_obj.is_done() == True):
+                    break
             else:
                 # print('# no match')
                 pass
@@ -142,18 +162,24 @@ class Pogrep(object):
         """run the po file grep"""
 
         self.__verbose_out('# Loading {0}'.format(self.__in_file))
-        po_in = polib.pofile(self.__in_file, encoding='utf-8')
+        if (self.__format in ['count', 'files-with-matches']):
+            # entries are not output, only the key_type field is used
+            po_in = pocompact.pofile(self.__in_file, [self.__key_type],
+                                     use_cache=self.__use_cache, encoding='utf-8')
+        else:
+            po_in = pocache.pofile(self.__in_file, use_cache=self.__use_cache, encoding='utf-8')
         self.__verbose_out('# loading done')
 
-
-        if (self.__out_file != "-"):
-            if (os.path.isfile(self.__out_file) and (self.__force_override == False)):
-                raise RuntimeError('output file [{0}] exists.'.format(self.__out_file))
-            with open(self.__out_file, encoding='utf-8', mode='w') as out_file:
-                self.__out_file_obj = out_file
-                self.__process_po_obj(po_in)
-        else:
+        out_opt = {
+            'out_file':       self.__out_file,
+            'format':         self.__format,
+            'in_file':        self.__in_file,
+            'force_override': self.__force_override,
+        }
+        with pooutput.PoOutput(out_opt) as out_obj:
+            self.__out_obj = out_obj
             self.__process_po_obj(po_in)
+        self.__out_obj = None
 
 
     @staticmethod
@@ -161,7 +187,7 @@ class Pogrep(object):
         """get the version number list
         [major, minor, maintainance]
         """
-        return [0, 2, 0]
+        return [0, 3, 0]
 
     @staticmethod
     def get_version_string():
@@ -203,6 +229,14 @@ def pogrep_main():
                         help="Ignore the case in both the regexp match string "
                         "and the input file.")
 
+    parser.add_argument("--format", type=str,
+                        choices=pooutput.FORMAT_LIST, default='po',
+                        help="output format. po: matching entries. jsonl: one JSON object per entry. "
+                        "count: number of matching entries. files-with-matches: the input filename if any entry matches.")
+
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse in_file without the parse cache (see pocache.py)")
+
     parser.add_argument("--force_override", action='store', default='0',
                         help="Even outfile is found, override the output file.")
 
@@ -231,6 +265,8 @@ def pogrep_main():
         'regexp':         args.regexp[0],  # nargs gives a list, but we need one
         'invert_match':   args.invert_match,
         'ignore_case':    args.ignore_case,
+        'format':         args.format,
+        'no_cache':       args.no_cache,
         'force_override': args.force_override,
         'verbose':        args.verbose,
     }
@@ -240,6 +276,11 @@ def pogrep_main():
 
 
 if __name__ == "__main__":
+    # forward to the podaemon.py server when it is running
+    forward_status = podaemon.forward('grep', sys.argv[1:])
+    if (forward_status != None):
+        sys.exit(forward_status)
+
     try:
         pogrep_main()
         sys.exit(0)
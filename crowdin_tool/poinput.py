@@ -0,0 +1,154 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief compressed and zip archive input of po files
+#
+# Description:
+#    The po loaders (poparser, pocache) and the tree walker (potree)
+#    read the input through this module, so a compressed po file or a
+#    po file in a zip archive is read as is, without unpacking it on
+#    the disk.
+#
+# Input file names:
+#    sample.po                  plain file
+#    sample.po.gz               gzip, also .xz (lzma) and .bz2
+#    export.zip::ja/sample.po   a member of a zip archive (streamed)
+#
+import sys, os, io, gzip, lzma, bz2, zipfile
+
+# compressed file extension -> open function (binary)
+COMPRESS_OPEN_DICT = {
+    '.gz':  gzip.open,
+    '.xz':  lzma.open,
+    '.bz2': bz2.open,
+}
+
+# zip archive file extension
+ARCHIVE_EXT = '.zip'
+
+# separator of the archive path and the member name
+ARCHIVE_SEP = '::'
+
+
+def split_archive_path(fname):
+    """split an archive member path
+    @return (archive path, member name), member name is None when
+            fname is not an archive member
+    """
+    idx = fname.find(ARCHIVE_EXT + ARCHIVE_SEP)
+    if (idx < 0):
+        return (fname, None)
+    idx += len(ARCHIVE_EXT)
+    return (fname[:idx], fname[idx + len(ARCHIVE_SEP):])
+
+
+def join_archive_path(archive, member):
+    """get the path of an archive member
+    """
+    return archive + ARCHIVE_SEP + member
+
+
+def get_compress_ext(fname):
+    """get the compressed file extension of fname, '' when not compressed
+    """
+    ext = os.path.splitext(fname)[1]
+    if (ext in COMPRESS_OPEN_DICT):
+        return ext
+    return ''
+
+
+def strip_compress_ext(fname):
+    """remove the compressed file extension, e.g., sample.po.gz -> sample.po
+    """
+    ext = get_compress_ext(fname)
+    if (ext == ''):
+        return fname
+    return fname[:-len(ext)]
+
+
+def is_plain_file(fname):
+    """True when fname is neither compressed nor an archive member
+    """
+    return ((split_archive_path(fname)[1] is None) and (get_compress_ext(fname) == ''))
+
+
+def is_archive(fname):
+    """True when fname is a zip archive file
+    """
+    return ((os.path.splitext(fname)[1] == ARCHIVE_EXT) and os.path.isfile(fname))
+
+
+def get_archive_member_list(archive):
+    """get the file member names of a zip archive
+    """
+    with zipfile.ZipFile(archive) as zip_file:
+        return [info.filename for info in zip_file.infolist() if (not info.is_dir())]
+
+
+def open_binary(fname):
+    """open an input file in the binary mode
+    @return binary file object (decompressed)
+    """
+    (archive, member) = split_archive_path(fname)
+    if (member is None):
+        in_file = open(fname, mode='rb')
+    else:
+        try:
+            # the member keeps the archive file open after the close
+            with zipfile.ZipFile(archive) as zip_file:
+                in_file = zip_file.open(member)
+        except KeyError:
+            raise RuntimeError('[{0}] is not found in [{1}].'.format(member, archive))
+
+    ext = get_compress_ext(fname)
+    if (ext != ''):
+        in_file = COMPRESS_OPEN_DICT[ext](in_file)
+    return in_file
+
+
+def open_text(fname, encoding='utf-8', buffering=-1):
+    """open an input file in the text mode (universal newlines)
+    """
+    if (is_plain_file(fname)):
+        return open(fname, encoding=encoding, mode='r', buffering=buffering)
+
+    if (buffering <= 0):
+        buffering = io.DEFAULT_BUFFER_SIZE
+    return io.TextIOWrapper(io.BufferedReader(open_binary(fname), buffering), encoding=encoding)
+
+
+def read_text(fname, encoding='utf-8'):
+    """read the whole text of an input file
+    """
+    with open_text(fname, encoding) as in_file:
+        return in_file.read()
+
+
+def get_stat(fname):
+    """get (size, mtime_ns) of an input file. An archive member has its
+    uncompressed size and the mtime of the archive.
+    """
+    (archive, member) = split_archive_path(fname)
+    st = os.stat(archive)
+    if (member is None):
+        return (st.st_size, st.st_mtime_ns)
+
+    with zipfile.ZipFile(archive) as zip_file:
+        try:
+            info = zip_file.getinfo(member)
+        except KeyError:
+            raise RuntimeError('[{0}] is not found in [{1}].'.format(member, archive))
+    return (info.file_size, st.st_mtime_ns)
+
+
+def get_abspath(fname):
+    """get the absolute path of an input file (the archive part for a member)
+    """
+    (archive, member) = split_archive_path(fname)
+    if (member is None):
+        return os.path.abspath(fname)
+    return join_archive_path(os.path.abspath(archive), member)
@@ -15,10 +15,22 @@
 #
 #       ./poline.py --key-type msgid _other.po
 #
+#       ./poline.py --key-type msgstr --format jsonl _other.po _other.jsonl
 #
-import argparse, sys, re, codecs, os
+#    Deduplicated corpus of all the po files under src/ with 4
+#    processes. Each output line is 'count<TAB>line'.
+#       ./poline.py --key-type msgid -R src --jobs 4 corpus.txt
+#
+#    Same, but deduplicate in a disk-backed set (sqlite) for huge trees
+#       ./poline.py --key-type msgid -R src --jobs 4 --dedup-db corpus.db corpus.txt
+#
+import argparse, sys, re, codecs, os, collections, multiprocessing, sqlite3
 import tokenizer
-import polib
+
+import pooutput
+import potree
+import pocompact
+import podaemon
 
 class Poline_line_extract(object):
     """Line extractor of poline processor
@@ -109,12 +121,19 @@ class Poline(object):
         self.__out_file = self.__opt_dict['out_file']
         if (self.__out_file == None):
             raise RuntimeError('No output file')
-        self.__out_file_obj = None
+        self.__out_obj = None
 
         self.__verbose_out('# out_file: {0}'.format(self.__out_file))
 
+        # output format
+        self.__format = self.__opt_dict.get('format', 'po')
+        self.__verbose_out('# format:   {0}'.format(self.__format))
+
         self.__force_override = False
 
+        # parse cache
+        self.__use_cache = not self.__opt_dict.get('no_cache', False)
+
         # create processor
         self.__proc_obj = Poline_line_extract(opt_dict);
 
@@ -125,13 +144,6 @@ class Poline(object):
         if (self.__is_verbose == True):
             print(mes)
 
-    def __out(self, out_str):
-        """output out_str"""
-        if (self.__out_file_obj != None):
-            self.__out_file_obj.write(out_str)
-        else:
-            print(out_str)
-
     def __process_po_obj(self, po_in):
         """process one file
         """
@@ -151,24 +163,30 @@ class Poline(object):
         for ent in po_in:
             line_list = self.__proc_obj.process(ent)
             for line in line_list:
-                self.__out(line.strip() +'\n') # double newline
+                self.__out_obj.write_text(line.strip() +'\n')
+            if (self.__out_obj.is_done() == True):
+                break
 
 
     def run(self):
         """run the po file grep"""
 
         self.__verbose_out('# Loading {0}'.format(self.__in_file))
-        po_in = polib.pofile(self.__in_file, encoding='utf-8')
+        # only the key_type field is used
+        po_in = pocompact.pofile(self.__in_file, [self.__key_type],
+                                 use_cache=self.__use_cache, encoding='utf-8')
         self.__verbose_out('# loading done')
 
-        if (self.__out_file != "-"):
-            if (os.path.isfile(self.__out_file) and (self.__force_override == False)):
-                raise RuntimeError('output file [{0}] exists.'.format(self.__out_file))
-            with open(self.__out_file, encoding='utf-8', mode='w') as out_file:
-                self.__out_file_obj = out_file
-                self.__process_po_obj(po_in)
-        else:
+        out_opt = {
+            'out_file':       self.__out_file,
+            'format':         self.__format,
+            'in_file':        self.__in_file,
+            'force_override': self.__force_override,
+        }
+        with pooutput.PoOutput(out_opt) as out_obj:
+            self.__out_obj = out_obj
             self.__process_po_obj(po_in)
+        self.__out_obj = None
 
 
     @staticmethod
@@ -176,7 +194,7 @@ class Poline(object):
         """get the version number list
         [major, minor, maintainance]
         """
-        return [0, 1, 0]
+        return [0, 2, 0]
 
     @staticmethod
     def get_version_string():
@@ -190,19 +208,222 @@ Copyright (C) 2017 Hitoshi Yamauchi
 
 
 
+class Line_counter_memory(object):
+    """Deduplicated line counter on a dict (hash set).
+    The order is the first occurrence.
+    """
+
+    def __init__(self):
+        """constructor
+        """
+        self.__count_dict = {}
+
+    def add(self, line_counter):
+        """add a {line: count} dict
+        """
+        count_dict = self.__count_dict
+        for (line, count) in line_counter.items():
+            count_dict[line] = count_dict.get(line, 0) + count
+
+    def __len__(self):
+        return len(self.__count_dict)
+
+    def items(self):
+        """generate (line, count)
+        """
+        return iter(self.__count_dict.items())
+
+    def close(self):
+        """release the counter
+        """
+        self.__count_dict = {}
+
+
+class Line_counter_sqlite(object):
+    """Deduplicated line counter on a sqlite database (disk-backed set).
+    The order is the first occurrence (rowid).
+    """
+
+    def __init__(self, db_file):
+        """constructor
+        @param[in] db_file sqlite database file, must not exist.
+        """
+        if (os.path.exists(db_file)):
+            raise RuntimeError('dedup db [{0}] exists. Remove it or give another file.'.format(db_file))
+        self.__conn = sqlite3.connect(db_file)
+        self.__conn.execute('PRAGMA journal_mode = OFF')
+        self.__conn.execute('PRAGMA synchronous = OFF')
+        self.__conn.execute('CREATE TABLE corpus (line TEXT PRIMARY KEY, count INTEGER NOT NULL)')
+
+    def add(self, line_counter):
+        """add a {line: count} dict
+        """
+        with self.__conn:
+            self.__conn.executemany(
+                'INSERT INTO corpus (line, count) VALUES (?, ?) '
+                'ON CONFLICT (line) DO UPDATE SET count = count + excluded.count',
+                line_counter.items())
+
+    def __len__(self):
+        return self.__conn.execute('SELECT COUNT(*) FROM corpus').fetchone()[0]
+
+    def items(self):
+        """generate (line, count)
+        """
+        return self.__conn.execute('SELECT line, count FROM corpus ORDER BY rowid')
+
+    def close(self):
+        """close the database
+        """
+        self.__conn.close()
+
+
+# Tree worker process state. The extractor is created once per process.
+_tree_worker_proc      = None
+_tree_worker_use_cache = True
+_tree_worker_key_type  = 'msgid'
+
+def _tree_worker_init(opt_dict):
+    """initializer of a tree worker process
+    """
+    global _tree_worker_proc, _tree_worker_use_cache, _tree_worker_key_type
+    _tree_worker_proc      = Poline_line_extract(opt_dict)
+    _tree_worker_use_cache = not opt_dict.get('no_cache', False)
+    _tree_worker_key_type  = opt_dict['key_type']
+
+
+def _tree_worker_run(in_file):
+    """extract lines of one file in a tree worker process
+    @return (in_file, {line: count}) deduplicated in the file
+    """
+    po_in = pocompact.pofile(in_file, [_tree_worker_key_type],
+                             use_cache=_tree_worker_use_cache, encoding='utf-8')
+    line_counter = collections.Counter()
+    for ent in po_in:
+        for line in _tree_worker_proc.process(ent):
+            line = line.strip()
+            if (len(line) > 0):
+                line_counter[line] += 1
+    return (in_file, line_counter)
+
+
+class Poline_tree(object):
+    """Line extractor of all the po files under a directory.
+    Files are processed in parallel, the lines are deduplicated and
+    output once with the occurrence count.
+    """
+
+    def __init__(self, opt_dict):
+        """constructor
+        Options: same as Poline except in_file, and
+          src_dir:  source top directory
+          jobs:     number of processes
+          dedup_db: (optional) sqlite file for the disk-backed dedup
+        """
+        self.__opt_dict   = opt_dict
+        self.__is_verbose = opt_dict['verbose']
+        self.__src_dir    = opt_dict['src_dir']
+        if ((self.__src_dir == None) or (self.__src_dir == '')):
+            raise RuntimeError('No source directory')
+
+        self.__jobs = opt_dict.get('jobs', 1)
+        if (self.__jobs < 1):
+            raise RuntimeError('Invalid jobs {0}'.format(self.__jobs))
+
+        self.__out_file = self.__opt_dict['out_file']
+        if (self.__out_file == None):
+            raise RuntimeError('No output file')
+        self.__format = self.__opt_dict.get('format', 'po')
+        self.__force_override = False
+
+
+    def __verbose_out(self, mes):
+        """verbose output if self.__is_verbose is True
+        """
+        if (self.__is_verbose == True):
+            print(mes)
+
+
+    def __get_counter(self):
+        """get the line counter, in memory or sqlite
+        """
+        dedup_db = self.__opt_dict.get('dedup_db', '')
+        if ((dedup_db != None) and (dedup_db != '')):
+            self.__verbose_out('# dedup on disk: {0}'.format(dedup_db))
+            return Line_counter_sqlite(dedup_db)
+        return Line_counter_memory()
+
+
+    def run(self):
+        """extract, deduplicate and output the corpus"""
+        in_file_list = [path for (rel_path, path) in potree.get_po_file_list(self.__src_dir)]
+        self.__verbose_out('# {0} po files, {1} jobs'.format(len(in_file_list), self.__jobs))
+
+        counter = self.__get_counter()
+        nb_line = 0
+        try:
+            if (self.__jobs == 1):
+                _tree_worker_init(self.__opt_dict)
+                result_iter = map(_tree_worker_run, in_file_list)
+                for (in_file, line_counter) in result_iter:
+                    nb_line += sum(line_counter.values())
+                    counter.add(line_counter)
+            else:
+                with multiprocessing.Pool(self.__jobs, _tree_worker_init, (self.__opt_dict,)) as pool:
+                    # imap keeps the file order, the output is deterministic
+                    for (in_file, line_counter) in pool.imap(_tree_worker_run, in_file_list, chunksize=1):
+                        self.__verbose_out('# done {0}'.format(in_file))
+                        nb_line += sum(line_counter.values())
+                        counter.add(line_counter)
+
+            self.__verbose_out('# {0} lines, {1} unique lines'.format(nb_line, len(counter)))
+
+            out_opt = {
+                'out_file':       self.__out_file,
+                'format':         self.__format,
+                'in_file':        self.__src_dir,
+                'force_override': self.__force_override,
+            }
+            with pooutput.PoOutput(out_opt) as out_obj:
+                for (line, count) in counter.items():
+                    out_obj.write_record('{0}\t{1}\n'.format(count, line),
+                                         {'text': line, 'count': count})
+        finally:
+            counter.close()
+
+
 def poline_main():
     parser = argparse.ArgumentParser()
 
-    parser.add_argument("in_file", type=str, nargs=1,
-                        help="Input filenames.")
+    parser.add_argument("in_file", type=str, nargs='?', default=None,
+                        help="Input filenames. (not with --recursive)")
 
     parser.add_argument("out_file", type=str, default="-", nargs="?",
                         help="Output filename (- is stdout)")
 
+    parser.add_argument("-R", "--recursive", type=str, default='', metavar='SRC_DIR',
+                        help="extract a deduplicated corpus of all the po files under SRC_DIR (a directory or a zip archive). "
+                        "Each line is output once with the occurrence count.")
+
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of processes of --recursive")
+
+    parser.add_argument("--dedup-db", type=str, default='',
+                        help="deduplicate --recursive lines in this sqlite file instead of memory (huge corpus). "
+                        "The file must not exist.")
+
     parser.add_argument("--key-type", type=str,
                         choices=['msgid', 'msgstr'], default='msgid',
                         help="grep this key type in a po file")
 
+    parser.add_argument("--format", type=str,
+                        choices=pooutput.FORMAT_LIST, default='po',
+                        help="output format. po: extracted lines. jsonl: one JSON object per line. "
+                        "count: number of lines. files-with-matches: the input filename if any line is extracted.")
+
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse in_file without the parse cache (see pocache.py)")
+
     parser.add_argument("--force_override", action='store', default='0',
                         help="Even outfile is found, override the output file.")
 
@@ -221,19 +442,42 @@ def poline_main():
         sys.stderr.write(Poline.get_version_string())
         sys.exit(1)
 
+    if (args.recursive != ''):
+        # only out_file is given. argparse takes it as in_file.
+        if (args.in_file != None):
+            if (args.out_file != '-'):
+                raise RuntimeError('in_file is not used with --recursive')
+            args.out_file = args.in_file
+            args.in_file  = None
+
     opt_dict = {
-        'in_file':        args.in_file[0], # nargs gives a list, but we need one
+        'in_file':        args.in_file,
         'out_file':       args.out_file,
         'key_type':       args.key_type,
+        'format':         args.format,
+        'no_cache':       args.no_cache,
         'force_override': args.force_override,
         'verbose':        args.verbose,
     }
 
+    if (args.recursive != ''):
+        opt_dict['src_dir']  = args.recursive
+        opt_dict['jobs']     = args.jobs
+        opt_dict['dedup_db'] = args.dedup_db
+        poline_tree = Poline_tree(opt_dict)
+        poline_tree.run()
+        return
+
     poline = Poline(opt_dict)
     poline.run()
 
 
 if __name__ == "__main__":
+    # forward to the podaemon.py server when it is running
+    forward_status = podaemon.forward('line', sys.argv[1:])
+    if (forward_status != None):
+        sys.exit(forward_status)
+
     try:
         poline_main()
         sys.exit(0)
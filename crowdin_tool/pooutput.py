@@ -0,0 +1,225 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief buffered, structured output for the crowdin_tool commands
+#
+# Description:
+#    Shared output layer of pogrep.py, poline.py and popipe.py. Output is
+#    collected in a buffer and written as large UTF-8 chunks instead
+#    of one print()/write() per entry.
+#
+# Format:
+# --format po [DEFAULT]
+#        po entries (or text lines) as is. On stdout, each one is
+#        followed by an empty line as the former print() output.
+# --format jsonl
+#        one JSON object per entry (or text line)
+# --format count
+#        only the number of entries (or text lines)
+# --format files-with-matches
+#        only the input file name when anything is output
+#
+# count and files-with-matches never serialize the entries.
+#
+import sys, os, json
+import polib
+
+# valid --format choices
+FORMAT_LIST = ['po', 'jsonl', 'count', 'files-with-matches']
+
+# default buffer size in characters before a write
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+def entry_to_dict(ent):
+    """get a json serializable dict of a po entry
+    """
+    return {
+        'msgctxt':     ent.msgctxt,
+        'msgid':       ent.msgid,
+        'msgstr':      ent.msgstr,
+        'comment':     ent.comment,
+        'tcomment':    ent.tcomment,
+        'occurrences': [list(occ) for occ in ent.occurrences],
+        'flags':       ent.flags,
+        'linenum':     ent.linenum,
+    }
+
+
+class PoOutput(object):
+    """Buffered output of po entries or text lines.
+    Use as a context manager, the buffer is flushed on exit.
+    """
+
+    def __init__(self, opt_dict):
+        """constructor
+        Options:
+          out_file:       output filename (- is stdout)
+          format:         one of FORMAT_LIST
+          in_file:        input filename, for files-with-matches
+          force_override: when True, override an existing out_file
+          buffer_size:    (optional) buffer size in characters
+        """
+        self.__out_file = opt_dict['out_file']
+        if (self.__out_file == None):
+            raise RuntimeError('No output file')
+
+        self.__format = opt_dict.get('format', 'po')
+        if (self.__format not in FORMAT_LIST):
+            raise RuntimeError('Invalid format [{0}]'.format(self.__format))
+
+        self.__in_file        = opt_dict.get('in_file', '')
+        self.__force_override = opt_dict.get('force_override', False)
+        self.__buffer_size    = opt_dict.get('buffer_size', DEFAULT_BUFFER_SIZE)
+
+        # print(out_str) of the former stdout output added a line end
+        self.__po_sep = '\n' if ((self.__out_file == '-') and (self.__format == 'po')) else ''
+
+        self.__stream      = None
+        self.__is_own_file = False
+        self.__buf         = []
+        self.__buf_len     = 0
+        self.__count       = 0
+
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+    def open(self):
+        """open the output stream
+        """
+        if (self.__out_file == '-'):
+            # flush pending text (e.g., verbose output) before the binary writes
+            sys.stdout.flush()
+            if (hasattr(sys.stdout, 'buffer')):
+                self.__stream = sys.stdout.buffer
+            else:
+                # codecs writer around the detached stdout
+                self.__stream = sys.stdout.stream
+            self.__is_own_file = False
+        else:
+            if (os.path.isfile(self.__out_file) and (self.__force_override == False)):
+                raise RuntimeError('output file [{0}] exists.'.format(self.__out_file))
+            self.__stream = open(self.__out_file, mode='wb')
+            self.__is_own_file = True
+
+
+    def close(self):
+        """write the summary (if any), flush and close the output stream
+        """
+        if (self.__stream == None):
+            return
+
+        if (self.__format == 'count'):
+            self.__write('{0}\n'.format(self.__count))
+
+        self.flush()
+        if (self.__is_own_file == True):
+            self.__stream.close()
+        else:
+            self.__stream.flush()
+        self.__stream = None
+
+
+    def flush(self):
+        """write the buffer content to the stream
+        """
+        if (self.__buf_len > 0):
+            self.__stream.write(''.join(self.__buf).encode('utf-8'))
+            self.__buf     = []
+            self.__buf_len = 0
+
+
+    def __write(self, out_str):
+        """buffered write
+        """
+        self.__buf.append(out_str)
+        self.__buf_len += len(out_str)
+        if (self.__buf_len >= self.__buffer_size):
+            self.flush()
+
+
+    def __count_up(self):
+        """count an output item.
+        @return True when the item itself still needs to be written
+        """
+        self.__count += 1
+        if (self.__format == 'count'):
+            return False
+        if (self.__format == 'files-with-matches'):
+            if (self.__count == 1):
+                self.__write(self.__in_file + '\n')
+            return False
+        return True
+
+
+    def is_done(self):
+        """True when no more output changes the result.
+        The caller can stop processing (files-with-matches).
+        """
+        return ((self.__format == 'files-with-matches') and (self.__count > 0))
+
+
+    def get_count(self):
+        """get the number of output items so far
+        """
+        return self.__count
+
+
+    def write_metadata(self, metadata_dict):
+        """output the metadata entry (po format only, not counted)
+        """
+        if (self.__format != 'po'):
+            return
+
+        po = polib.POFile()
+        po.metadata = metadata_dict
+        self.__write(po.__unicode__() + '\n\n')
+
+
+    def write_entry(self, ent):
+        """output a po entry
+        """
+        if (self.__count_up() == False):
+            return
+
+        if (self.__format == 'jsonl'):
+            self.__write(json.dumps(entry_to_dict(ent), ensure_ascii=False) + '\n')
+        else:
+            self.__write(str(ent) + '\n' + self.__po_sep)
+
+
+    def write_text(self, text):
+        """output a text line. text includes the line end.
+        """
+        if (self.__count_up() == False):
+            return
+
+        if (self.__format == 'jsonl'):
+            self.__write(json.dumps({'text': text.rstrip('\n')}, ensure_ascii=False) + '\n')
+        else:
+            self.__write(text + self.__po_sep)
+
+
+    def write_record(self, text, record):
+        """output a record.
+        @param[in] text   output of the po format, includes the line end
+        @param[in] record json serializable dict of the jsonl format
+        """
+        if (self.__count_up() == False):
+            return
+
+        if (self.__format == 'jsonl'):
+            self.__write(json.dumps(record, ensure_ascii=False) + '\n')
+        else:
+            self.__write(text + self.__po_sep)
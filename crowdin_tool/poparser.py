@@ -0,0 +1,398 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief fast po file parser for the Crowdin subset of the po format
+#
+# Description:
+#    pofile() is a drop-in replacement of polib.pofile() for the
+#    crowdin_tool commands. The file is read with large buffered reads
+#    and parsed by a line oriented state machine. The result is a polib.POFile of
+#    polib.POEntry, so str(entry), save(), metadata, etc. work as
+#    before.
+#
+#    Supported: header, translator comments (#), extracted comments
+#    (#.), occurrences (#:), flags (#,), msgctxt, msgid, msgstr and
+#    continuation lines. Anything else (obsolete entries #~, previous
+#    entries #|, plural forms) falls back to polib.pofile().
+#
+#    Differences from polib: linenum of the first entry is its real
+#    line number (polib gives 0), and unescaped double quotes are not
+#    checked.
+#
+# Example:
+#    Compare the entries with polib
+#       ./poparser.py --check sample.po
+#
+#    Benchmark: throughput and peak memory against polib
+#       ./poparser.py --bench sample.po
+#
+#    Benchmark on a generated file with 200000 entries
+#       ./poparser.py --bench --generate 200000 /tmp/gen.po
+#
+import argparse, sys, os, codecs, time, tracemalloc, gc
+import polib
+import poinput
+
+# read buffer size
+READ_BUFFER_SIZE = 1 << 20
+
+BOM_STR = codecs.BOM_UTF8.decode('utf-8')
+
+
+class _Unsupported(Exception):
+    """A construct outside of the Crowdin subset. Fallback to polib.
+    """
+    pass
+
+
+def _unescape(st):
+    """polib.unescape() only when needed
+    """
+    if ('\\' in st):
+        return polib.unescape(st)
+    return st
+
+
+def _parse(line_iter, instance):
+    """parse po file lines into instance (polib.POFile)
+
+    @param[in]     line_iter iterable of the lines (universal newlines)
+    @param[in,out] instance  polib.POFile
+    """
+    POEntry  = polib.POEntry
+    unescape = _unescape
+    entry_list = []
+
+    state     = 'st'   # st, he, tc, gc, oc, fl, ct, mi, ms
+    linenum   = 0
+    msgctxt   = None
+    msgid     = ''
+    msgstr    = ''
+    comment   = ''
+    tcomment  = ''
+    occurrences = []
+    flags     = []
+    parts     = None   # string parts of the current ct/mi/ms
+    last_is_comment = False
+    header    = ''
+
+    def make_entry():
+        return POEntry(msgid=msgid, msgstr=msgstr, msgctxt=msgctxt,
+                       comment=comment, tcomment=tcomment,
+                       occurrences=occurrences, flags=flags, linenum=linenum)
+
+    lineno = 0
+    for line in line_iter:
+        lineno += 1
+        if ((lineno == 1) and line.startswith(BOM_STR)):
+            line = line[len(BOM_STR):]
+        line = line.strip()
+        if (line == ''):
+            continue
+        c0 = line[0]
+
+        # continuation line
+        if (c0 == '"'):
+            if (parts is None):
+                raise _Unsupported('continuation at line {0}'.format(lineno))
+            parts.append(unescape(line[1:-1]))
+            last_is_comment = False
+            continue
+
+        # close the current string
+        if (parts is not None):
+            if (state == 'ct'):
+                msgctxt = ''.join(parts)
+            elif (state == 'mi'):
+                msgid = ''.join(parts)
+            else:
+                msgstr = ''.join(parts)
+            parts = None
+
+        if (c0 == '#'):
+            last_is_comment = True
+            tokens = line.split(None, 2)
+            t0 = tokens[0]
+            if (t0 == '#:'):
+                if (len(tokens) <= 1):
+                    continue
+                kind = 'oc'
+            elif (t0 == '#,'):
+                if (len(tokens) <= 1):
+                    continue
+                kind = 'fl'
+            elif ((t0 == '#') or t0.startswith('##')):
+                kind = 'tc'
+            elif (t0 == '#.'):
+                if (len(tokens) <= 1):
+                    continue
+                kind = 'gc'
+            else:
+                raise _Unsupported('{0} at line {1}'.format(t0, lineno))
+
+            if ((kind == 'tc') and ((state == 'st') or (state == 'he'))):
+                # header comment
+                if (header != ''):
+                    header += '\n'
+                header += line[2:]
+                state = 'he'
+                continue
+
+            if (state == 'ms'):
+                entry_list.append(make_entry())
+                (msgctxt, msgid, msgstr) = (None, '', '')
+                (comment, tcomment, occurrences, flags) = ('', '', [], [])
+                linenum = lineno
+
+            # an empty first comment line does not make a newline (same as polib)
+            if (kind == 'tc'):
+                if (tcomment != ''):
+                    tcomment += '\n'
+                tc = line.lstrip('#')
+                tcomment += (tc[1:] if tc.startswith(' ') else tc)
+            elif (kind == 'gc'):
+                if (comment != ''):
+                    comment += '\n'
+                comment += line[3:]
+            elif (kind == 'oc'):
+                for occurrence in line[3:].split():
+                    (fil, sep, num) = occurrence.rpartition(':')
+                    if ((sep == '') or (not num.isdigit())):
+                        occurrences.append((occurrence, ''))
+                    else:
+                        occurrences.append((fil, num))
+            else:
+                flags += [c.strip() for c in line[3:].split(',')]
+            state = kind
+            continue
+
+        last_is_comment = False
+        tokens = line.split(None, 1)
+        t0 = tokens[0]
+        if (len(tokens) <= 1):
+            raise _Unsupported('{0} at line {1}'.format(t0, lineno))
+        value = line[len(t0):].lstrip()
+        if (t0 == 'msgid'):
+            if (state == 'ms'):
+                entry_list.append(make_entry())
+                (msgctxt, msgid, msgstr) = (None, '', '')
+                (comment, tcomment, occurrences, flags) = ('', '', [], [])
+                linenum = lineno
+            state = 'mi'
+        elif (t0 == 'msgstr'):
+            if ((state != 'mi') and (state != 'tc')):
+                raise _Unsupported('msgstr at line {0}'.format(lineno))
+            state = 'ms'
+        elif (t0 == 'msgctxt'):
+            if (state == 'ms'):
+                entry_list.append(make_entry())
+                (msgctxt, msgid, msgstr) = (None, '', '')
+                (comment, tcomment, occurrences, flags) = ('', '', [], [])
+                linenum = lineno
+            state = 'ct'
+        else:
+            # msgid_plural, msgstr[n], #~ ...
+            raise _Unsupported('{0} at line {1}'.format(t0, lineno))
+        parts = [unescape(value[1:-1])]
+
+    if (parts is not None):
+        if (state == 'ct'):
+            msgctxt = ''.join(parts)
+        elif (state == 'mi'):
+            msgid = ''.join(parts)
+        else:
+            msgstr = ''.join(parts)
+    # trailing comments are ignored (same as polib)
+    if ((lineno > 0) and (state not in ['st', 'he']) and (last_is_comment == False)):
+        entry_list.append(make_entry())
+
+    instance.header = header
+    list.extend(instance, entry_list)
+
+    # metadata entry
+    metadata_idx = None
+    for idx in range(len(entry_list)):
+        if ((entry_list[idx].msgid == '') and (entry_list[idx].obsolete == False)):
+            metadata_idx = idx
+            break
+    if (metadata_idx is not None):
+        metadataentry = instance[metadata_idx]
+        del instance[metadata_idx]
+        instance.metadata_is_fuzzy = metadataentry.flags
+        key = None
+        for msg in metadataentry.msgstr.splitlines():
+            try:
+                (key, val) = msg.split(':', 1)
+                instance.metadata[key] = val.strip()
+            except (ValueError, KeyError):
+                if key is not None:
+                    instance.metadata[key] += '\n' + msg.strip()
+
+
+def _polib_pofile(fname, **kwargs):
+    """polib.pofile() of a po file, compressed or archive member too (see poinput)
+    """
+    if (poinput.is_plain_file(fname)):
+        return polib.pofile(fname, **kwargs)
+
+    po = polib.pofile(poinput.read_text(fname, kwargs.get('encoding', 'utf-8')), **kwargs)
+    po.fpath = fname
+    return po
+
+
+def pofile(fname, **kwargs):
+    """parse a po file. Same interface as polib.pofile().
+
+    @param[in] fname  po file name, compressed or archive member too (see poinput)
+    @param[in] kwargs encoding, wrapwidth, check_for_duplicates (see polib)
+    @return    polib.POFile
+    """
+    encoding = kwargs.get('encoding', 'utf-8')
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return _polib_pofile(fname, **kwargs)
+
+    instance = polib.POFile(pofile=fname, encoding=encoding,
+                            wrapwidth=kwargs.get('wrapwidth', 78),
+                            check_for_duplicates=kwargs.get('check_for_duplicates', False))
+    try:
+        # large buffered reads, universal newlines (same line numbers as polib)
+        with poinput.open_text(fname, encoding, READ_BUFFER_SIZE) as in_file:
+            _parse(in_file, instance)
+    except _Unsupported:
+        return _polib_pofile(fname, **kwargs)
+
+    return instance
+
+
+#------------------------------------------------------------------------------
+# check and benchmark
+#------------------------------------------------------------------------------
+
+# compared entry attributes
+ENTRY_ATTR_LIST = ['msgctxt', 'msgid', 'msgstr', 'comment', 'tcomment',
+                   'occurrences', 'flags', 'obsolete',
+                   'previous_msgctxt', 'previous_msgid', 'previous_msgid_plural']
+
+
+def check_file(fname):
+    """compare the result with polib.pofile()
+    @return number of differences
+    """
+    po_ref = polib.pofile(fname, encoding='utf-8')
+    po_new = pofile(fname, encoding='utf-8')
+
+    nb_diff = 0
+    if (po_ref.metadata != po_new.metadata):
+        print('# metadata differs')
+        nb_diff += 1
+    if (po_ref.header != po_new.header):
+        print('# header differs')
+        nb_diff += 1
+    if (len(po_ref) != len(po_new)):
+        print('# number of entries differs: polib {0}, poparser {1}'.format(len(po_ref), len(po_new)))
+        return nb_diff + 1
+    for idx in range(len(po_ref)):
+        for attr in ENTRY_ATTR_LIST:
+            if (getattr(po_ref[idx], attr) != getattr(po_new[idx], attr)):
+                print('# entry {0} (line {1}): {2} differs'.format(idx, po_ref[idx].linenum, attr))
+                nb_diff += 1
+        # polib gives 0 to the first entry
+        if ((idx > 0) and (po_ref[idx].linenum != po_new[idx].linenum)):
+            print('# entry {0}: linenum differs {1} {2}'.format(idx, po_ref[idx].linenum, po_new[idx].linenum))
+            nb_diff += 1
+
+    return nb_diff
+
+
+def generate_file(fname, nb_entry):
+    """generate a Crowdin like po file with nb_entry entries
+    """
+    with open(fname, encoding='utf-8', mode='w') as out_file:
+        out_file.write('msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n'
+                       '"Language: ja\\n"\n\n')
+        for i in range(nb_entry):
+            out_file.write('#. Extracted comment {0}\n'.format(i))
+            out_file.write('#. slug: some-exercise-slug-{0}\n'.format(i % 97))
+            out_file.write('#: intro/article-{0}.md:{1}\n'.format(i % 53, i))
+            if (i % 7 == 0):
+                out_file.write('#, fuzzy\n')
+            out_file.write('msgid ""\n"The answer is $x = {0}$. What is \\\\$5 plus '
+                           'the value of $y$?\\n"\n"Second line of the string {0}."\n'.format(i))
+            if (i % 3 == 0):
+                out_file.write('msgstr ""\n')
+            else:
+                out_file.write('msgstr "Die Antwort ist $x = {0}$."\n'.format(i))
+            out_file.write('\n')
+
+
+def bench_one(name, parse_func, fname, nb_loop):
+    """measure throughput and peak memory of parse_func
+    """
+    fsize = os.path.getsize(fname)
+
+    gc.collect()
+    start_sec = time.perf_counter()
+    for i in range(nb_loop):
+        po = parse_func(fname, encoding='utf-8')
+        nb_entry = len(po)
+        del po
+    elapsed_sec = (time.perf_counter() - start_sec) / nb_loop
+
+    gc.collect()
+    tracemalloc.start()
+    po = parse_func(fname, encoding='utf-8')
+    (cur_mem, peak_mem) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del po
+
+    print('{0:10} {1:8d} entries {2:8.3f} sec {3:8.2f} MB/s {4:10.0f} entries/s peak {5:8.1f} MB'.format(
+        name, nb_entry, elapsed_sec, fsize / elapsed_sec / 1e6, nb_entry / elapsed_sec, peak_mem / 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("in_file", type=str,
+                        help="Input po file")
+
+    parser.add_argument("--check", action="store_true",
+                        help="compare the parsed entries with polib")
+
+    parser.add_argument("--bench", action="store_true",
+                        help="benchmark throughput and peak memory against polib")
+
+    parser.add_argument("--loop", type=int, default=3,
+                        help="number of benchmark loops")
+
+    parser.add_argument("--generate", type=int, default=0,
+                        help="generate in_file with this number of entries before check/bench")
+
+    args = parser.parse_args()
+
+    if (args.generate > 0):
+        generate_file(args.in_file, args.generate)
+        print('# generated {0} ({1} entries, {2} bytes)'.format(
+            args.in_file, args.generate, os.path.getsize(args.in_file)))
+
+    if (args.check == True):
+        nb_diff = check_file(args.in_file)
+        print('# {0} differences'.format(nb_diff))
+        if (nb_diff > 0):
+            sys.exit(1)
+
+    if (args.bench == True):
+        bench_one('polib',    polib.pofile, args.in_file, args.loop)
+        bench_one('poparser', pofile,       args.in_file, args.loop)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+        sys.exit()
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
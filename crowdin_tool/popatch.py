@@ -0,0 +1,141 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief patch only the changed entries of a po file
+#
+# Description:
+#    polib re-serializes the whole file on save. That rewrites every
+#    entry with polib's wrap width even when only a few msgstr are
+#    changed. This module finds the byte span of each entry from its
+#    linenum (the first line of the entry, see polib POEntry) and
+#    writes a new file which copies the untouched spans verbatim and
+#    only replaces the spans of the changed entries.
+#
+#    The output is written to a temporary file in the output directory
+#    and renamed atomically. The output file can be the input file.
+#
+import sys, os, mmap, tempfile
+
+# copy chunk size when os.sendfile() is not available
+COPY_CHUNK_SIZE = 1 << 22
+
+
+def get_entry_span_list(in_file, linenum_list):
+    """get the byte span of each entry.
+
+    The span of an entry starts at its first line and ends at the first
+    line of the next entry (or the end of file), i.e., it includes the
+    separating empty lines.
+
+    @param[in] in_file      po file name
+    @param[in] linenum_list entry line numbers (1 origin, ascending)
+    @return    list of (start, end) byte offsets, None when the spans
+               cannot be determined (e.g., '\\r' only line ends).
+    """
+    file_size = os.path.getsize(in_file)
+    if (len(linenum_list) == 0):
+        return []
+    if (file_size == 0):
+        return None
+
+    start_list = []
+    with open(in_file, mode='rb') as in_fobj:
+        with mmap.mmap(in_fobj.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # polib counts '\r' only line ends, this scan does not.
+            cr_pos = mm.find(b'\r')
+            while (cr_pos >= 0):
+                if ((cr_pos + 1 >= file_size) or (mm[cr_pos + 1] != ord('\n'))):
+                    return None
+                cr_pos = mm.find(b'\r', cr_pos + 1)
+
+            cur_line = 1
+            cur_pos  = 0
+            for linenum in linenum_list:
+                if ((linenum is None) or (linenum < cur_line)):
+                    return None
+                while (cur_line < linenum):
+                    nl_pos = mm.find(b'\n', cur_pos)
+                    if (nl_pos < 0):
+                        return None
+                    cur_pos   = nl_pos + 1
+                    cur_line += 1
+                start_list.append(cur_pos)
+
+    span_list = []
+    for idx in range(len(start_list)):
+        end = start_list[idx + 1] if (idx + 1 < len(start_list)) else file_size
+        span_list.append((start_list[idx], end))
+
+    return span_list
+
+
+def get_trailing_space(span_bytes):
+    """get the trailing empty lines of an entry span
+    @param[in] span_bytes bytes of an entry span
+    @return    trailing bytes after the last non empty line (includes its line end)
+    """
+    body = span_bytes.rstrip(b'\r\n \t')
+    return span_bytes[len(body):]
+
+
+def _copy_range(in_fobj, out_fobj, start, end):
+    """copy [start, end) of in_fobj to out_fobj
+    """
+    count = end - start
+    if (count <= 0):
+        return
+
+    out_fobj.flush()
+    if (hasattr(os, 'sendfile')):
+        try:
+            while (count > 0):
+                sent = os.sendfile(out_fobj.fileno(), in_fobj.fileno(), start, count)
+                if (sent == 0):
+                    break
+                start += sent
+                count -= sent
+            if (count == 0):
+                return
+        except OSError:
+            # e.g., not supported on this file system. fallback to read/write
+            pass
+
+    in_fobj.seek(start)
+    while (count > 0):
+        buf = in_fobj.read(min(count, COPY_CHUNK_SIZE))
+        if (len(buf) == 0):
+            raise RuntimeError('unexpected end of file at {0}'.format(start))
+        out_fobj.write(buf)
+        count -= len(buf)
+
+
+def write_patched(in_file, out_file, patch_list):
+    """write in_file with replaced spans to out_file atomically.
+
+    @param[in] in_file    input file name
+    @param[in] out_file   output file name (can be in_file)
+    @param[in] patch_list list of (start, end, new bytes), sorted by start,
+                          not overlapping
+    """
+    out_dir = os.path.dirname(os.path.abspath(out_file))
+    (tmp_fd, tmp_file) = tempfile.mkstemp(dir=out_dir, prefix='.popatch.', suffix='.tmp')
+    try:
+        with open(in_file, mode='rb') as in_fobj, os.fdopen(tmp_fd, mode='wb') as out_fobj:
+            cur_pos = 0
+            for (start, end, new_bytes) in patch_list:
+                assert(cur_pos <= start)
+                _copy_range(in_fobj, out_fobj, cur_pos, start)
+                out_fobj.write(new_bytes)
+                cur_pos = end
+            _copy_range(in_fobj, out_fobj, cur_pos, os.fstat(in_fobj.fileno()).st_size)
+        if (os.path.isfile(in_file)):
+            os.chmod(tmp_file, os.stat(in_file).st_mode & 0o777)
+        os.replace(tmp_file, out_file)
+    except:
+        if (os.path.isfile(tmp_file)):
+            os.remove(tmp_file)
+        raise
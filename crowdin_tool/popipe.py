@@ -0,0 +1,304 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief in-process pipeline of pogrep, poresub and pofilter
+#
+# Description:
+#    Chaining pogrep.py, poresub.py and pofilter.py by files parses and
+#    writes every intermediate file. popipe.py parses the input once,
+#    runs the stages as entry stream transforms in the process, and
+#    writes the result once.
+#
+#    The stages are separated by '|' as in a shell (a quoted or escaped
+#    '|' is a part of an argument). Each stage uses the same logic as
+#    the tool.
+#
+# Stages:
+#    grep   [--key-type KEY] -e REGEXP [-v] [-i]        (pogrep.py)
+#    resub  [-k KEY] -p PATTERN -r REPLACE [--pattern-list-file FILE]
+#                                                       (poresub.py)
+#    filter [--tool TOOL] [-n]                          (pofilter.py)
+#
+# Example:
+#    ./popipe.py in.po 'grep --key-type tcomment -e slug | resub -p X -r Y | filter --tool differ' out.po
+#
+import argparse, sys, os, codecs, shlex
+
+import pocache
+import pooutput
+import pogrep
+import poresub
+import pofilter
+
+
+def _grep_stage(argv, opt_dict):
+    """grep stage, see pogrep.py
+    """
+    parser = argparse.ArgumentParser(prog='grep')
+    parser.add_argument("--key-type", type=str,
+                        choices=['msgid', 'msgstr', 'comment', 'tcomment'], default='msgid')
+    parser.add_argument("-e", "--regexp", type=str, nargs=1)
+    parser.add_argument("-v", "--invert-match", action="store_true")
+    parser.add_argument("-i", "--ignore-case", action="store_true")
+    args = parser.parse_args(argv)
+
+    if (args.regexp == None):
+        raise RuntimeError('grep: -e/--regexp option was not specified.')
+
+    pogrep_obj = pogrep.Pogrep({
+        'in_file':      opt_dict['in_file'],
+        'out_file':     opt_dict['out_file'],
+        'key_type':     args.key_type,
+        'regexp':       args.regexp[0],  # nargs gives a list, but we need one
+        'invert_match': args.invert_match,
+        'ignore_case':  args.ignore_case,
+        'verbose':      opt_dict['verbose'],
+    })
+    return pogrep_obj.filter_entries
+
+
+def _resub_stage(argv, opt_dict):
+    """resub stage, see poresub.py
+    """
+    parser = argparse.ArgumentParser(prog='resub')
+    parser.add_argument("-k", "--key-type", choices=['msgid', 'msgstr'], default='msgstr')
+    parser.add_argument("-p", "--pattern", type=str, default='')
+    parser.add_argument("-r", "--replace", type=str, default='')
+    parser.add_argument("--pattern-list-file", type=str, default='')
+    args = parser.parse_args(argv)
+
+    pattern_list = []
+    if (args.pattern_list_file != ''):
+        pattern_list = poresub.load_pattern_list_file(args.pattern_list_file)
+    if ((args.pattern != '') and (args.replace != '')):
+        poresub.add_pattern(pattern_list, args.pattern, args.replace)
+
+    poresub_obj = poresub.Poresub({
+        'in_file':      opt_dict['in_file'],
+        'out_file':     opt_dict['out_file'],
+        'key_type':     args.key_type,
+        'pattern_list': pattern_list,
+        'verbose':      opt_dict['verbose'],
+    })
+    return poresub_obj.sub_entries
+
+
+def _filter_stage(argv, opt_dict):
+    """filter stage, see pofilter.py
+    """
+    parser = argparse.ArgumentParser(prog='filter')
+    parser.add_argument("--tool", choices=['id_to_str', 'same', 'differ', 'none'], default="id_to_str")
+    parser.add_argument("-n", "--no-context", action="store_true")
+    args = parser.parse_args(argv)
+
+    return lambda ent_iter: pofilter.filter_entries(ent_iter, args.no_context, args.tool)
+
+
+# stage name -> stage constructor
+STAGE_DICT = {
+    'grep':   _grep_stage,
+    'resub':  _resub_stage,
+    'filter': _filter_stage,
+}
+
+
+def split_stage_str(pipeline_str):
+    """split a pipeline string at the unquoted, unescaped '|'. shlex.split()
+    removes the quotes, a quoted '|' could not be told from a separator
+    after it.
+    @return list of the stage strings
+    """
+    stage_str_list = []
+    start = 0
+    quote = None
+    idx   = 0
+    while (idx < len(pipeline_str)):
+        c = pipeline_str[idx]
+        if ((c == '\\') and (quote != "'")):
+            idx += 1            # the next character is escaped
+        elif (quote != None):
+            if (c == quote):
+                quote = None
+        elif (c in '\'"'):
+            quote = c
+        elif (c == '|'):
+            stage_str_list.append(pipeline_str[start:idx])
+            start = idx + 1
+        idx += 1
+    stage_str_list.append(pipeline_str[start:])
+    return stage_str_list
+
+
+def parse_pipeline(pipeline_str):
+    """split a pipeline string into the stages
+    @return list of (stage name, argv)
+
+    A quoted '|' is an argument (python -m doctest popipe.py):
+    >>> parse_pipeline('grep -e "|" | resub -p "a|b" -r x|filter -n')
+    [('grep', ['-e', '|']), ('resub', ['-p', 'a|b', '-r', 'x']), ('filter', ['-n'])]
+    """
+    stage_list = []
+    for stage_str in split_stage_str(pipeline_str):
+        try:
+            argv = shlex.split(stage_str)
+        except ValueError as err:
+            raise RuntimeError('{0} in [{1}]'.format(err, pipeline_str))
+        if (len(argv) == 0):
+            raise RuntimeError('empty stage in [{0}]'.format(pipeline_str))
+        if (argv[0] not in STAGE_DICT):
+            raise RuntimeError('unknown stage [{0}], one of {1}'.format(argv[0], sorted(STAGE_DICT)))
+        stage_list.append((argv[0], argv[1:]))
+
+    return stage_list
+
+
+class Popipe(object):
+    """in-process pipeline of the po entry stream transforms
+    """
+
+    def __init__(self, opt_dict):
+        """constructor
+        """
+        self.__opt_dict   = opt_dict
+        self.__is_verbose = opt_dict['verbose']
+
+        self.__in_file = opt_dict['in_file']
+        if (self.__in_file == None):
+            raise RuntimeError('No input file')
+
+        self.__out_file = opt_dict['out_file']
+        if (self.__out_file == None):
+            raise RuntimeError('No output file')
+
+        # build the stages
+        self.__stage_func_list = []
+        for (stage_name, argv) in parse_pipeline(opt_dict['pipeline']):
+            self.__verbose_out('# stage: {0} {1}'.format(stage_name, argv))
+            self.__stage_func_list.append(STAGE_DICT[stage_name](argv, opt_dict))
+
+
+    def __verbose_out(self, mes):
+        """verbose output if self.__is_verbose is True
+        """
+        if (self.__is_verbose == True):
+            print(mes)
+
+
+    def run(self):
+        """parse once, run the stages, write once
+        """
+        self.__verbose_out('# Loading {0}'.format(self.__in_file))
+        po_in = pocache.pofile(self.__in_file, use_cache=(not self.__opt_dict.get('no_cache', False)),
+                               encoding='utf-8')
+        self.__verbose_out('# loading done')
+
+        ent_iter = iter(po_in)
+        for stage_func in self.__stage_func_list:
+            ent_iter = stage_func(ent_iter)
+
+        out_opt = {
+            'out_file':       self.__out_file,
+            'format':         self.__opt_dict.get('format', 'po'),
+            'in_file':        self.__in_file,
+            'force_override': self.__opt_dict.get('force_override', False),
+        }
+        with pooutput.PoOutput(out_opt) as out_obj:
+            if (self.__opt_dict.get('metadata', True) == True):
+                out_obj.write_metadata(po_in.metadata)
+            for ent in ent_iter:
+                out_obj.write_entry(ent)
+                if (out_obj.is_done() == True):
+                    break
+            self.__verbose_out('# {0} entries'.format(out_obj.get_count()))
+
+
+    @staticmethod
+    def get_version_number():
+        """get the version number list
+        [major, minor, maintainance]
+        """
+        return [0, 1, 0]
+
+    @staticmethod
+    def get_version_string():
+        """get version information as a string"""
+        vl = Popipe.get_version_number()
+
+        return '''popipe.py {0}.{1}.{2}
+New BSD License.
+Copyright (C) 2018 Hitoshi Yamauchi
+'''.format(vl[0], vl[1], vl[2])
+
+
+def popipe_main():
+    parser = argparse.ArgumentParser(epilog="stages: grep [--key-type KEY] -e REGEXP [-v] [-i], "
+                                     "resub [-k KEY] -p PATTERN -r REPLACE [--pattern-list-file FILE], "
+                                     "filter [--tool TOOL] [-n]")
+    parser.add_argument("in_file", type=str, nargs='?',
+                        help="Input PO/POT file")
+
+    parser.add_argument("pipeline", type=str, nargs='?',
+                        help="stages separated by ' | ', "
+                        "e.g., 'grep --key-type tcomment -e slug | resub -p X -r Y | filter --tool differ'")
+
+    parser.add_argument("out_file", type=str, default="-", nargs="?",
+                        help="Output filename (- is stdout)")
+
+    parser.add_argument("--format", type=str,
+                        choices=pooutput.FORMAT_LIST, default='po',
+                        help="output format. po: result entries. jsonl: one JSON object per entry. "
+                        "count: number of result entries. files-with-matches: the input filename if any entry results.")
+
+    parser.add_argument("--no-metadata", action="store_true",
+                        help="do not output the metadata entry")
+
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse in_file without the parse cache (see pocache.py)")
+
+    parser.add_argument("--force_override", action='store_true',
+                        help="Even outfile is found, override the output file.")
+
+    parser.add_argument("--verbose", action="store_true",
+                        help="increase output verbosity")
+
+    parser.add_argument("-V", "--version", action="store_true",
+                        help="output the version number of popipe.py")
+
+    args = parser.parse_args()
+
+    if (args.version == True):
+        sys.stderr.write(Popipe.get_version_string())
+        sys.exit(1)
+
+    if (args.pipeline == None):
+        raise RuntimeError('No pipeline')
+
+    # Switch stdout codecs to utf-8
+    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
+
+    opt_dict = {
+        'in_file':        args.in_file,
+        'out_file':       args.out_file,
+        'pipeline':       args.pipeline,
+        'format':         args.format,
+        'metadata':       not args.no_metadata,
+        'no_cache':       args.no_cache,
+        'force_override': args.force_override,
+        'verbose':        args.verbose,
+    }
+
+    popipe = Popipe(opt_dict)
+    popipe.run()
+
+
+if __name__ == "__main__":
+    try:
+        popipe_main()
+        sys.exit(0)
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
+        sys.exit(2)
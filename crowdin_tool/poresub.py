@@ -13,10 +13,32 @@
 # Example:
 #       ./poresub.py --key-type msgstr --pattern 'The answer' --replace 'Die Antwort' sample_in.po [sample_out.po]
 #
+#    Apply a pattern list file to all the po files under src/ with 4
+#    processes, write them under dst/, and report the hits per pattern.
+#       ./poresub.py --pattern-list-file patterns.json -R src --out-dir dst --jobs 4
 #
-import argparse, sys, re, codecs, os
+# Pattern list file:
+#    JSON list of [pattern, replace] pairs, e.g.,
+#       [["The answer", "Die Antwort"], ["(\\d+)\\.(\\d+)", "\\1,\\2"]]
+#    A Python list literal is also accepted (read by ast.literal_eval).
+#
+#    Rewrite only the changed entries of sample.po in place. The other
+#    entries are copied byte by byte (no re-wrapping by polib).
+#       ./poresub.py --pattern-list-file patterns.json --in-place sample.po
+#
+#    Apply to a Crowdin export zip without unpacking, write a zip.
+#       ./poresub.py --pattern-list-file patterns.json -R export.zip --out-dir dst.zip
+#
+import argparse, sys, re, codecs, os, json, ast, multiprocessing
 import polib
 
+import subprogram
+import popatch
+import poinput
+import potree
+import pocache
+import podaemon
+
 class Poresub(object):
     """re.sub() on pofile.
     """
@@ -45,6 +67,14 @@ class Poresub(object):
             assert(len(i) == 2) # must have two strings
             self.__verbose_out('# ' + i[0] + ": " + i[1])
 
+        # compile once. Literal patterns are merged into one step.
+        # A precompiled program can be given (e.g., by a tree worker).
+        self.__sub_prog = self.__opt_dict.get('sub_prog', None)
+        if (self.__sub_prog is None):
+            self.__sub_prog = subprogram.SubProgram(self.__pattern_list, re.MULTILINE)
+        self.__verbose_out('# {0} patterns compiled into {1} steps'.format(
+            len(self.__pattern_list), self.__sub_prog.get_step_count()))
+
         # in_file
         self.__in_file = self.__opt_dict['in_file']
         if (self.__in_file == None):
@@ -59,6 +89,25 @@ class Poresub(object):
 
         self.__force_override = False
 
+        # patch mode: rewrite only the changed entries
+        self.__is_patch    = self.__opt_dict.get('patch', False)
+        self.__is_in_place = self.__opt_dict.get('in_place', False)
+        if (self.__is_in_place == True):
+            if (poinput.is_plain_file(self.__in_file) == False):
+                raise RuntimeError('--in-place needs a plain po file [{0}]'.format(self.__in_file))
+            self.__is_patch       = True
+            self.__out_file       = self.__in_file
+            self.__force_override = True
+        if ((self.__is_patch == True) and (self.__out_file == '-')):
+            raise RuntimeError('--patch needs an output file')
+        self.__changed_idx_list = []
+
+        # parse cache
+        self.__use_cache = not self.__opt_dict.get('no_cache', False)
+
+        # per pattern number of the changed entries
+        self.__hit_count_list = [0] * len(self.__pattern_list)
+
 
     def __verbose_out(self, mes):
         """verbose output if self.__is_verbose is True
@@ -76,17 +125,12 @@ class Poresub(object):
         return metadata_str
 
     def __apply_sub(self, str_content):
-        """apply re.sub() to str_content"""
-
-        for i in self.__pattern_list:
-            # print('# in: {0}'.format(str_content))
-            # instr = str_content
-            assert(len(i) == 2)
-            str_content = re.sub(i[0], i[1], str_content, re.MULTILINE)
-            # if (instr != str_content):
-            #    print('# (pat,repl) = ({0},{1}), result: {2})'.format(i[0], i[1], str_content))
-
-        return str_content
+        """apply re.sub() of all the patterns to str_content"""
+        hit_set = set()
+        res = self.__sub_prog.apply(str_content, hit_set)
+        for pat_idx in hit_set:
+            self.__hit_count_list[pat_idx] += 1
+        return res
 
 
     def __process_po_in(self, po_in):
@@ -106,15 +150,64 @@ class Poresub(object):
         #  linenum:               integer, the line number of the entry
         #
         # Then, msgid, msgstr, (msgcxt)
-        for ent in po_in:
-            if (self.__key_type == 'msgid'):
-                res = self.__apply_sub(ent.megid)
-                ent.megid = res
-            elif (self.__key_type == 'msgstr'):
-                res = self.__apply_sub(ent.msgstr)
-                ent.msgstr = res
-            else:
-                raise RuntimeError('Unknown key_type.')
+        self.__changed_idx_list = []
+        for (idx, ent) in enumerate(po_in):
+            if (self.__sub_entry(ent) == True):
+                self.__changed_idx_list.append(idx)
+
+
+    def __sub_entry(self, ent):
+        """apply the patterns to the key_type string of an entry
+        @return True when the entry is changed
+        """
+        if (self.__key_type == 'msgid'):
+            res = self.__apply_sub(ent.msgid)
+            is_changed = (res != ent.msgid)
+            ent.msgid = res
+        elif (self.__key_type == 'msgstr'):
+            res = self.__apply_sub(ent.msgstr)
+            is_changed = (res != ent.msgstr)
+            ent.msgstr = res
+        else:
+            raise RuntimeError('Unknown key_type.')
+        return is_changed
+
+
+    def sub_entries(self, ent_iter):
+        """in-memory stage (see popipe.py)
+        @param[in] ent_iter iterable of po entries
+        @return    generator of the entries after the substitution
+        """
+        for ent in ent_iter:
+            self.__sub_entry(ent)
+            yield ent
+
+
+    def __write_patch(self, po_in):
+        """write only the changed entries, copy the others verbatim.
+        @return False when the entry spans are unknown (caller writes all)
+        """
+        if (poinput.is_plain_file(self.__in_file) == False):
+            return False        # compressed or in an archive
+        span_list = popatch.get_entry_span_list(self.__in_file, [ent.linenum for ent in po_in])
+        if (span_list is None):
+            return False
+
+        self.__verbose_out('# patch {0} of {1} entries'.format(len(self.__changed_idx_list), len(po_in)))
+        if ((len(self.__changed_idx_list) == 0) and (self.__out_file == self.__in_file)):
+            return True         # nothing to do
+
+        patch_list = []
+        with open(self.__in_file, mode='rb') as in_fobj:
+            for idx in self.__changed_idx_list:
+                (start, end) = span_list[idx]
+                in_fobj.seek(start)
+                trailing = popatch.get_trailing_space(in_fobj.read(end - start))
+                new_bytes = str(po_in[idx]).rstrip('\n').encode('utf-8') + trailing
+                patch_list.append((start, end, new_bytes))
+
+        popatch.write_patched(self.__in_file, self.__out_file, patch_list)
+        return True
 
 
     def run(self):
@@ -122,19 +215,30 @@ class Poresub(object):
 
         # open po file
         self.__verbose_out('# Loading {0}'.format(self.__in_file))
-        po_in = polib.pofile(self.__in_file, encoding='utf-8')
+        po_in = pocache.pofile(self.__in_file, use_cache=self.__use_cache, encoding='utf-8')
         self.__verbose_out('# loading done')
 
         # process po object
         self.__process_po_in(po_in)
 
-        po_out = ''
-
-        # Add metadata header
-        po_out = self.__get_metadata_string(po_in.metadata)
-
+        if (self.__is_patch == True):
+            if (os.path.isfile(self.__out_file) and (self.__force_override == False)):
+                raise RuntimeError('output file [{0}] exists.'.format(self.__out_file))
+            if (self.__write_patch(po_in) == True):
+                return
+            self.__verbose_out('# cannot find the entry spans, write the whole file')
+            if (self.__is_in_place == True):
+                # do not leave the input file half written: one patch of the
+                # whole file, written in a temporary file and renamed
+                popatch.write_patched(self.__in_file, self.__in_file,
+                                      [(0, os.path.getsize(self.__in_file), str(po_in).encode('utf-8'))])
+                return
+
+        # Add metadata header, then the entries
+        po_out_list = [self.__get_metadata_string(po_in.metadata)]
         for ent in po_in:
-            po_out += (str(ent) + '\n')
+            po_out_list.append(str(ent) + '\n')
+        po_out = ''.join(po_out_list)
 
         # Write to file/stdout
         if (self.__out_file == "-"):
@@ -151,13 +255,19 @@ class Poresub(object):
                 print('# empty result file, skip to output {0}'.format(self.__out_file))
 
 
+    def get_hit_count_list(self):
+        """get the number of changed entries per pattern (index of pattern_list)
+        """
+        return self.__hit_count_list
+
+
 
     @staticmethod
     def get_version_number():
         """get the version number list
         [major, minor, maintainance]
         """
-        return [0, 2, 0]
+        return [0, 3, 0]
 
     @staticmethod
     def get_version_string():
@@ -170,9 +280,183 @@ Copyright (C) 2017 Hitoshi Yamauchi
 '''.format(vl[0], vl[1], vl[2])
 
 
+def load_pattern_list_file(fname):
+    """load a pattern list file.
+    JSON list of [pattern, replace], or a Python list literal.
+    """
+    with open(fname, encoding='utf-8', mode='r') as list_file:
+        list_file_str = list_file.read()
+
+    try:
+        pattern_list = json.loads(list_file_str)
+    except ValueError:
+        try:
+            pattern_list = ast.literal_eval(list_file_str)
+        except (ValueError, SyntaxError) as err:
+            raise RuntimeError('cannot read pattern list file [{0}]: {1}'.format(fname, err))
+
+    if (not isinstance(pattern_list, (list, tuple))):
+        raise RuntimeError('pattern list file [{0}] is not a list.'.format(fname))
+    for i in pattern_list:
+        if ((not isinstance(i, (list, tuple))) or (len(i) != 2) or
+            (not isinstance(i[0], str)) or (not isinstance(i[1], str))):
+            raise RuntimeError('invalid [pattern, replace] pair {0} in [{1}]'.format(i, fname))
+
+    return [list(i) for i in pattern_list]
+
+
+# Tree worker process state. The pattern list is compiled once per process.
+_tree_worker_opt  = None
+_tree_worker_prog = None
+
+def _tree_worker_init(opt_dict):
+    """initializer of a tree worker process
+    """
+    global _tree_worker_opt, _tree_worker_prog
+    _tree_worker_opt  = opt_dict
+    _tree_worker_prog = subprogram.SubProgram(opt_dict['pattern_list'], re.MULTILINE)
+
+
+def _tree_worker_run(file_pair):
+    """process one (in_file, out_file) in a tree worker process
+    @return (in_file, hit count list)
+    """
+    opt_dict = dict(_tree_worker_opt)
+    opt_dict['in_file']  = file_pair[0]
+    opt_dict['out_file'] = file_pair[1]
+    opt_dict['sub_prog'] = _tree_worker_prog
+    poresub = Poresub(opt_dict)
+    poresub.run()
+    return (file_pair[0], poresub.get_hit_count_list())
+
+
+class Poresub_tree(object):
+    """re.sub() on all the po files under a directory.
+    Files are processed in parallel and the hits per pattern are reported.
+    """
+
+    def __init__(self, opt_dict):
+        """constructor
+        Options: same as Poresub except in_file/out_file, and
+          src_dir:   source top directory
+          dst_dir:   destination top directory
+          jobs:      number of processes
+          stat_file: (optional) per pattern statistics JSON output file
+        """
+        self.__opt_dict   = opt_dict
+        self.__is_verbose = opt_dict['verbose']
+        self.__src_dir    = opt_dict['src_dir']
+        self.__dst_dir    = opt_dict['dst_dir']
+        if ((self.__src_dir == None) or (self.__src_dir == '')):
+            raise RuntimeError('No source directory')
+        if ((self.__dst_dir == None) or (self.__dst_dir == '')):
+            raise RuntimeError('No output directory (--out-dir)')
+        if (potree.is_source_tree(self.__src_dir) == False):
+            raise RuntimeError('source directory [{0}] not found.'.format(self.__src_dir))
+
+        self.__jobs = opt_dict.get('jobs', 1)
+        if (self.__jobs < 1):
+            raise RuntimeError('Invalid jobs {0}'.format(self.__jobs))
+
+        self.__pattern_list = opt_dict['pattern_list']
+
+
+    def __verbose_out(self, mes):
+        """verbose output if self.__is_verbose is True
+        """
+        if (self.__is_verbose == True):
+            print(mes)
+
+
+    def __get_file_pair_list(self, tree_out):
+        """get (in_file, out_file) of all the po files. Create the output directories.
+        """
+        file_pair_list = []
+        for (rel_path, in_path) in potree.get_po_file_list(self.__src_dir):
+            file_pair_list.append((in_path, tree_out.get_path(rel_path)))
+
+        return file_pair_list
+
+
+    def __report(self, result_list):
+        """report the per pattern statistics
+        @param[in] result_list list of (in_file, hit count list)
+        """
+        nb_pattern = len(self.__pattern_list)
+        entry_count_list = [0] * nb_pattern
+        file_count_list  = [0] * nb_pattern
+        for (in_file, hit_count_list) in result_list:
+            for pat_idx in range(nb_pattern):
+                if (hit_count_list[pat_idx] > 0):
+                    entry_count_list[pat_idx] += hit_count_list[pat_idx]
+                    file_count_list[pat_idx]  += 1
+
+        stat_list = []
+        print('# {0} files, {1} patterns'.format(len(result_list), nb_pattern))
+        print('# index\tentries\tfiles\tpattern\treplace')
+        for pat_idx in range(nb_pattern):
+            (pattern, replace) = self.__pattern_list[pat_idx]
+            print('{0}\t{1}\t{2}\t{3}\t{4}'.format(pat_idx, entry_count_list[pat_idx],
+                                                  file_count_list[pat_idx], pattern, replace))
+            stat_list.append({
+                'pattern': pattern,
+                'replace': replace,
+                'entries': entry_count_list[pat_idx],
+                'files':   file_count_list[pat_idx],
+            })
+
+        never_list = [i for i in range(nb_pattern) if (entry_count_list[i] == 0)]
+        print('# {0} patterns never changed any entry: {1}'.format(len(never_list), never_list))
+
+        stat_file = self.__opt_dict.get('stat_file', '')
+        if ((stat_file != None) and (stat_file != '')):
+            with open(stat_file, encoding='utf-8', mode='w') as out_file:
+                json.dump(stat_list, out_file, ensure_ascii=False, indent=1)
+
+
+    def run(self):
+        """run re.sub() on the tree"""
+        with potree.TreeOutput(self.__dst_dir) as tree_out:
+            file_pair_list = self.__get_file_pair_list(tree_out)
+            self.__verbose_out('# {0} po files, {1} jobs'.format(len(file_pair_list), self.__jobs))
+
+            worker_opt = dict(self.__opt_dict)
+            worker_opt['verbose'] = False
+
+            result_list = []
+            if (self.__jobs == 1):
+                _tree_worker_init(worker_opt)
+                for pair in file_pair_list:
+                    result_list.append(_tree_worker_run(pair))
+                    tree_out.add(pair[1])
+            else:
+                with multiprocessing.Pool(self.__jobs, _tree_worker_init, (worker_opt,)) as pool:
+                    # imap keeps the file order, each finished file goes into the zip output
+                    for (pair, result) in zip(file_pair_list,
+                                              pool.imap(_tree_worker_run, file_pair_list, chunksize=1)):
+                        result_list.append(result)
+                        tree_out.add(pair[1])
+
+        self.__report(result_list)
+
+
+def add_pattern(pattern_list, pattern, replace):
+    """add a [pattern, replace] pair. When the pattern is in the list,
+    override its replace.
+    """
+    # Find the pattern and replace, add when not found
+    for i in range(0, len(pattern_list)):
+        if (pattern_list[i][0] == pattern):
+            print('# Override [{0}, {1}]'.format(pattern_list[i][0], pattern_list[i][1]))
+            pattern_list[i][1] = replace
+            print('# Override [{0}, {1}]'.format(pattern_list[i][0], pattern_list[i][1]))
+            return
+    pattern_list.append([pattern, replace])
+
+
 def poresub_main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("in_file", type=str, nargs=1,
+    parser.add_argument("in_file", type=str, nargs='?', default=None,
                         help="Input PO/POT file")
 
     parser.add_argument("out_file", type=str, default="-", nargs="?",
@@ -188,9 +472,31 @@ def poresub_main():
                         help="replace of re.sub(pattern, replace, string).")
 
     parser.add_argument("--pattern-list-file", type=str, default='',
-                        help="pattern list file {pattern, replace} of re.sub(pattern, replace, string) dict file. "
+                        help="pattern list file, JSON list of [pattern, replace] of re.sub(pattern, replace, string). "
                         "When --pattern and --replace are specified, added (override) that pair.")
 
+    parser.add_argument("-R", "--recursive", type=str, default='', metavar='SRC_DIR',
+                        help="apply to all the po files under SRC_DIR (a directory or a zip archive). "
+                        "Needs --out-dir. (-r is --replace.)")
+
+    parser.add_argument("--out-dir", type=str, default='',
+                        help="output top directory of --recursive. A .zip name writes a zip archive.")
+
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of processes of --recursive")
+
+    parser.add_argument("--stat-file", type=str, default='',
+                        help="write the per pattern statistics of --recursive to this JSON file")
+
+    parser.add_argument("--patch", action="store_true",
+                        help="rewrite only the changed entries, copy the other bytes of in_file as is.")
+
+    parser.add_argument("--in-place", action="store_true",
+                        help="patch in_file itself (implies --patch). The file is replaced atomically.")
+
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse in_file without the parse cache (see pocache.py)")
+
     parser.add_argument("-w", "--wrapwidth", type=int, default=78,
                         help="text wrap width to the polib.")
 
@@ -211,36 +517,43 @@ def poresub_main():
 
     pattern_list = []
     if (args.pattern_list_file != ''):
-        with open(args.pattern_list_file, encoding='utf-8', mode='r') as list_file:
-            list_file_str = list_file.read()
-            # print(list_file_str)
-            pattern_list = eval(list_file_str)
+        pattern_list = load_pattern_list_file(args.pattern_list_file)
 
     if ((args.pattern != '') and (args.replace != '')):
-        # FIXME Find the pattern and replace
-        for i in range(0, len(pattern_list) - 1):
-            if (pattern_list[i][0] == args.pattern):
-                print('# Override [{0}, {1}]'.format(pattern_list[i][0], pattern_list[i][1]))
-                pattern_list[i][1] = args.replace
-                print('# Override [{0}, {1}]'.format(pattern_list[i][0], pattern_list[i][1]))
-                break
+        add_pattern(pattern_list, args.pattern, args.replace)
 
     opt_dict = {
-        'in_file':        args.in_file[0],  # nargs gives a list, but we need only one
+        'in_file':        args.in_file,
         'out_file':       args.out_file,
         'key_type':       args.key_type,
         'pattern_list':   pattern_list,
         'wrapwidth':      args.wrapwidth,
+        'patch':          args.patch,
+        'in_place':       args.in_place,
+        'no_cache':       args.no_cache,
         # 'force_override': args.force_override,
         'verbose':        args.verbose,
     }
 
+    if (args.recursive != ''):
+        opt_dict['src_dir']   = args.recursive
+        opt_dict['dst_dir']   = args.out_dir
+        opt_dict['jobs']      = args.jobs
+        opt_dict['stat_file'] = args.stat_file
+        poresub_tree = Poresub_tree(opt_dict)
+        poresub_tree.run()
+        return
 
     poresub = Poresub(opt_dict)
     poresub.run()
 
 
 if __name__ == "__main__":
+    # forward to the podaemon.py server when it is running
+    forward_status = podaemon.forward('resub', sys.argv[1:])
+    if (forward_status != None):
+        sys.exit(forward_status)
+
     try:
         poresub_main()
         # sys.exit()
@@ -0,0 +1,193 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief po file tree walker shared by the tree modes of crowdin_tool
+#
+# Description:
+#    List the po files under a directory in a deterministic (sorted)
+#    order, with the path relative to the top directory.
+#
+#    The top directory can be a zip archive (e.g., a Crowdin export).
+#    Compressed po files (sample.po.gz, .xz, .bz2) are listed too. The
+#    relative path has no compressed file extension, so the output tree
+#    has plain po files. See poinput for the input path names.
+#
+#    TreeOutput is the output top directory of a tree mode. It can be a
+#    zip archive.
+#
+import sys, os, tempfile, shutil, zipfile
+import poinput
+
+# file extensions of po files
+PO_EXT_LIST = ['.po']
+
+
+def is_po_file(fname):
+    """check the fname has a po file extension (compressed too)
+    """
+    return (os.path.splitext(poinput.strip_compress_ext(fname))[1] in PO_EXT_LIST)
+
+
+def check_rel_path(rel_path):
+    """check rel_path stays under the top directory: not absolute, no
+    drive letter, no '..' component. An archive member can be any of
+    them (zip slip).
+    @return rel_path
+    """
+    part_list = rel_path.replace('\\', '/').split('/')
+    if ((rel_path == '') or rel_path.startswith(('/', '\\')) or
+        (os.path.splitdrive(rel_path)[0] != '') or (':' in part_list[0]) or ('..' in part_list)):
+        raise RuntimeError('[{0}] is not a relative path under the top directory.'.format(rel_path))
+    return rel_path
+
+
+def get_po_file_list(src_dir):
+    """get all the po files under src_dir
+
+    @param[in] src_dir top directory or zip archive
+    @return    sorted list of (relative path, path)
+    """
+    if (poinput.is_archive(src_dir)):
+        return sorted((os.path.normpath(check_rel_path(poinput.strip_compress_ext(member))),
+                       poinput.join_archive_path(src_dir, member))
+                      for member in poinput.get_archive_member_list(src_dir) if is_po_file(member))
+
+    if (os.path.isdir(src_dir) == False):
+        raise RuntimeError('source directory [{0}] not found.'.format(src_dir))
+
+    po_file_list = []
+    for (cur_dir, dir_list, file_list) in os.walk(src_dir):
+        dir_list.sort()
+        rel_dir = os.path.relpath(cur_dir, src_dir)
+        for f in sorted(file_list):
+            if (is_po_file(f) == False):
+                continue
+            rel_path = os.path.normpath(os.path.join(rel_dir, poinput.strip_compress_ext(f)))
+            po_file_list.append((rel_path, os.path.join(cur_dir, f)))
+
+    return po_file_list
+
+
+def is_source_tree(src_dir):
+    """True when src_dir is a directory or a zip archive
+    """
+    return (os.path.isdir(src_dir) or poinput.is_archive(src_dir))
+
+
+class TreeOutput(object):
+    """Output top directory of a tree mode. When the name ends with
+    .zip (must not exist), each file is written in a temporary directory, then moved
+    into the open zip archive by add(). The archive replaces the zip
+    file at close(). Use as a context manager.
+    """
+
+    def __init__(self, dst_dir):
+        """constructor
+        @param[in] dst_dir output top directory or zip archive name
+        """
+        self.__dst_dir  = dst_dir
+        self.__is_zip   = (os.path.splitext(dst_dir)[1] == poinput.ARCHIVE_EXT)
+        self.__top_dir  = dst_dir
+        self.__zip_file = None
+        self.__tmp_file = None
+        # out_path -> rel_path of the files not in the zip archive yet
+        self.__pending_dict = {}
+        if (self.__is_zip == True):
+            if (os.path.exists(dst_dir)):
+                raise RuntimeError('output file [{0}] exists.'.format(dst_dir))
+            out_dir = os.path.dirname(os.path.abspath(dst_dir))
+            (fd, self.__tmp_file) = tempfile.mkstemp(dir=out_dir, suffix='.tmp')
+            os.close(fd)
+            self.__zip_file = zipfile.ZipFile(self.__tmp_file, mode='w', compression=zipfile.ZIP_DEFLATED)
+            self.__top_dir  = tempfile.mkdtemp(prefix='potree_')
+
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if (exc_type is None):
+            self.close()
+        else:
+            self.discard()
+        return False
+
+
+    def is_zip(self):
+        """True when the output is a zip archive
+        """
+        return self.__is_zip
+
+
+    def get_top_dir(self):
+        """get the directory where the files are written
+        """
+        return self.__top_dir
+
+
+    def get_path(self, rel_path):
+        """get the output path of rel_path, create its directory
+        """
+        out_path = os.path.join(self.__top_dir, check_rel_path(rel_path))
+        out_dir  = os.path.dirname(out_path)
+        if ((out_dir != '') and (os.path.isdir(out_dir) == False)):
+            os.makedirs(out_dir)
+        if (self.__is_zip == True):
+            self.__pending_dict[out_path] = rel_path
+        return out_path
+
+
+    def add(self, out_path):
+        """the file of out_path (see get_path()) is finished. Zip output:
+        write it into the zip archive and remove it.
+        """
+        if (self.__is_zip == False):
+            return
+        rel_path = self.__pending_dict.pop(out_path)
+        if (os.path.isfile(out_path) == False):
+            # not written (e.g., a failed file)
+            return
+        self.__zip_file.write(out_path, rel_path)
+        os.unlink(out_path)
+
+
+    def close(self):
+        """add the remaining files and replace the zip archive (zip output)
+        """
+        if (self.__is_zip == False):
+            return
+
+        try:
+            for out_path in sorted(self.__pending_dict):
+                self.add(out_path)
+            self.__close_zip()
+            os.replace(self.__tmp_file, self.__dst_dir)
+            self.__tmp_file = None
+        finally:
+            self.discard()
+
+
+    def __close_zip(self):
+        """close the zip archive
+        """
+        if (self.__zip_file != None):
+            zip_file = self.__zip_file
+            self.__zip_file = None
+            zip_file.close()
+
+
+    def discard(self):
+        """remove the temporary directory and archive (zip output)
+        """
+        if (self.__is_zip == False):
+            return
+        self.__close_zip()
+        if (self.__tmp_file != None):
+            os.unlink(self.__tmp_file)
+            self.__tmp_file = None
+        if os.path.isdir(self.__top_dir):
+            shutil.rmtree(self.__top_dir)
@@ -0,0 +1,202 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief compiled re.sub() program of a (pattern, replace) list
+#
+# Description:
+#    The (pattern, replace) list of poresub.py is compiled once into an
+#    ordered list of substitution steps.
+#
+#    - A regexp pattern becomes one precompiled re.sub() step.
+#    - Consecutive pure literal patterns are merged into one
+#      alternation step. The replace string is looked up by a dict.
+#
+#    Literal patterns are merged only when the one pass result is the
+#    same as applying them one by one, i.e., no pattern overlaps with
+#    another and no replace string can form a later pattern.
+#
+#    apply() can record which patterns changed the string (hit) for
+#    the per pattern statistics.
+#
+# Example:
+#       ./subprogram.py
+#
+import argparse, sys, re
+
+# regexp special characters. A pattern without them is a literal.
+RE_SPECIAL_CHARS = set('.^$*+?{}[]\\|()')
+
+# step kinds
+STEP_REGEXP  = 'regexp'
+STEP_LITERAL = 'literal'
+
+
+def is_literal_pattern(pattern, replace):
+    """check the (pattern, replace) pair is a pure literal substitution.
+    The replace must not have a backslash (group reference or escape).
+    """
+    if (len(pattern) == 0):
+        return False
+    if (any((c in RE_SPECIAL_CHARS) for c in pattern)):
+        return False
+    if ('\\' in replace):
+        return False
+    return True
+
+
+def is_overlap(str_a, str_b):
+    """check str_a and str_b can overlap in a text.
+    True when one includes the other or a suffix of one is a prefix
+    of the other.
+    """
+    if ((str_a in str_b) or (str_b in str_a)):
+        return True
+    for i in range(1, len(str_a)):
+        if (str_b.startswith(str_a[i:])):
+            return True
+    for i in range(1, len(str_b)):
+        if (str_a.startswith(str_b[i:])):
+            return True
+    return False
+
+
+class SubProgram(object):
+    """Ordered substitution program compiled from a (pattern, replace) list.
+    """
+
+    def __init__(self, pattern_list, flags=re.MULTILINE):
+        """constructor
+        @param[in] pattern_list list of (pattern, replace)
+        @param[in] flags        re flags for the regexp patterns
+        """
+        self.__flags     = flags
+        self.__step_list = []
+        self.__compile(pattern_list)
+
+
+    def __can_merge(self, literal_list, pattern, replace):
+        """check (pattern, replace) can be merged into the literal_list
+        @param[in] literal_list earlier (pattern_index, pattern, replace) list of the step
+        """
+        for (lit_idx, lit_pat, lit_rep) in literal_list:
+            if (is_overlap(lit_pat, pattern)):
+                return False
+            # an earlier replace result must not form this pattern
+            if ((len(lit_rep) == 0) or is_overlap(lit_rep, pattern)):
+                return False
+        return True
+
+
+    def __add_literal_step(self, literal_list):
+        """add one alternation step of literal_list
+        literal_list: list of (pattern_index, pattern, replace)
+        """
+        if (len(literal_list) == 0):
+            return
+        # pattern -> (replace, pattern_index)
+        table = {}
+        for (pat_idx, pattern, replace) in literal_list:
+            table[pattern] = (replace, pat_idx)
+        # longest first, though merged patterns never overlap
+        alt_list = sorted(table.keys(), key=len, reverse=True)
+        re_comp  = re.compile('|'.join(re.escape(pat) for pat in alt_list))
+        self.__step_list.append((STEP_LITERAL, re_comp, table, None))
+
+
+    def __compile(self, pattern_list):
+        """compile the pattern list into the step list
+        """
+        literal_list = []
+        for (pat_idx, i) in enumerate(pattern_list):
+            assert(len(i) == 2) # must have two strings
+            (pattern, replace) = (i[0], i[1])
+            if (is_literal_pattern(pattern, replace)):
+                if (self.__can_merge(literal_list, pattern, replace) == False):
+                    self.__add_literal_step(literal_list)
+                    literal_list = []
+                literal_list.append((pat_idx, pattern, replace))
+            else:
+                self.__add_literal_step(literal_list)
+                literal_list = []
+                self.__step_list.append((STEP_REGEXP, re.compile(pattern, self.__flags), replace, pat_idx))
+        self.__add_literal_step(literal_list)
+        self.__pattern_count = len(pattern_list)
+
+
+    def get_pattern_count(self):
+        """get the number of source patterns
+        """
+        return self.__pattern_count
+
+
+    def get_step_count(self):
+        """get the number of compiled steps
+        """
+        return len(self.__step_list)
+
+
+    def apply(self, str_content, hit_set=None):
+        """apply all the substitutions to str_content
+        @param[in]     str_content input string
+        @param[in,out] hit_set     when not None, the pattern indices
+                                   which changed the string are added
+        @return substituted string
+        """
+        for (kind, re_comp, repl, pat_idx) in self.__step_list:
+            if (kind == STEP_LITERAL):
+                if (hit_set is None):
+                    str_content = re_comp.sub(lambda mo: repl[mo.group(0)][0], str_content)
+                else:
+                    str_content = re_comp.sub(lambda mo: self.__literal_hit(repl, mo, hit_set),
+                                              str_content)
+            else:
+                res = re_comp.sub(repl, str_content)
+                if ((hit_set is not None) and (res != str_content)):
+                    hit_set.add(pat_idx)
+                str_content = res
+
+        return str_content
+
+
+    def __literal_hit(self, table, mo, hit_set):
+        """replace function of a literal step with recording the hit
+        """
+        matched = mo.group(0)
+        (replace, pat_idx) = table[matched]
+        if (replace != matched):
+            hit_set.add(pat_idx)
+        return replace
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="increase output verbosity")
+    args = parser.parse_args()
+
+    pattern_list = [
+        ['The answer', 'Die Antwort'],
+        ['is',         'ist'],
+        [r'(\d+)\.(\d+)', r'\1,\2'],
+        ['apple',      'Apfel'],
+        ['pear',       'Birne'],
+    ]
+    prog = SubProgram(pattern_list)
+    print('# {0} patterns, {1} steps'.format(len(pattern_list), prog.get_step_count()))
+    for src_str in ['The answer is 3.5 apple and 1.25 pear.']:
+        print('# in  [{0}]'.format(src_str))
+        hit_set = set()
+        print('# out [{0}]'.format(prog.apply(src_str, hit_set)))
+        print('# hit {0}'.format(sorted(hit_set)))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+        sys.exit()
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
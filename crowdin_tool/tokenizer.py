@@ -0,0 +1,159 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#******************************************************************************
+# Copyright (C) 2017-2018 Hitoshi Yamauchi
+# New BSD License.
+#******************************************************************************
+# \file
+# \brief tokenizer of Crowdin strings. Math, white spaces, newline strings.
+#
+# Description:
+#    The token specification is compiled once when this module is
+#    loaded and shared by all the Tokenizer objects (poline.py,
+#    tokensplit.py, diffapply.py).
+#
+# Token types:
+#    ISO_NUMBER   ISO integer or decimal number
+#    ESC_DOLLAR   escaped dollar sign '\\$'
+#    TEX_SPACE    '\\'
+#    WHITESPACE   white space
+#    MATH_INOUT   math mode in/out '$'
+#    NEWLINE_STR  line endings string '\n'
+#    WORD         word like string
+#    NOTSPACIAL   any other character
+#
+# Example:
+#    Tokenize sample strings
+#       ./tokenizer.py
+#
+#    Microbenchmark (tokens per second)
+#       ./tokenizer.py --bench 20000
+#
+import argparse, sys, re, collections, time
+
+# token: type and value
+Token = collections.namedtuple('Token', ['type', 'value'])
+
+# Order matters: the first matching alternative wins. ESC_DOLLAR must
+# be before TEX_SPACE, so '\\$' is one token instead of '\\' and '$'.
+TOKEN_SPECIFICATION = [
+    ('ISO_NUMBER',     r'\d+(?:\.\d*)?'), # ISO integer or decimal number
+    ('ESC_DOLLAR',     r'\\\\\$'),        # '\\$'
+    ('TEX_SPACE',      r'\\\\'),          # '\\'
+    ('WHITESPACE',     r'[ \t\n]'),       # white space (\S might be better?)
+    ('MATH_INOUT',     r'\$'),            # math mode in/out '$'
+    ('NEWLINE_STR',    r'\\n'),           # line endings string '\n'
+    ('WORD',           r'[A-Za-z]+'),     # word like string
+    ('NOTSPACIAL',     r'.'),             # Any other character
+]
+
+# token type list, the index is the token type code.
+# No capturing group inside a specification, so match.lastindex - 1 is
+# the token type code.
+TOKEN_TYPE_LIST = [pair[0] for pair in TOKEN_SPECIFICATION]
+TOKEN_TYPE_CODE = dict((TOKEN_TYPE_LIST[i], i) for i in range(len(TOKEN_TYPE_LIST)))
+
+# compiled once
+TOKEN_REGEX = '|'.join('(?P<%s>%s)' % pair for pair in TOKEN_SPECIFICATION)
+RE_TOKEN    = re.compile(TOKEN_REGEX)
+
+# MATH_INOUT only scanner, same result as the tokenizer. Backslash pairs
+# (TEX_SPACE) are consumed with a following '$' (ESC_DOLLAR), so only
+# an unescaped '$' matches the group 1.
+RE_MATH_INOUT = re.compile(r'(?:\\\\)+\$?|(\$)')
+
+
+class Tokenizer(object):
+    """Tokenizer of Crowdin strings
+    """
+
+    def __init__(self, opt_dict):
+        """constructor
+        """
+        self.__opt_dict = opt_dict
+
+
+    def tokenize(self, in_str):
+        """tokenize a string
+        @param[in] in_str input string
+        @return    generator of Token
+        """
+        for mo in RE_TOKEN.finditer(in_str):
+            kind = mo.lastgroup
+            yield Token(kind, mo.group(kind))
+
+
+    @staticmethod
+    def get_version_number():
+        """get the version number list
+        [major, minor, maintainance]
+        """
+        return [0, 1, 0]
+
+    @staticmethod
+    def get_version_string():
+        """get version information as a string"""
+        vl = Tokenizer.get_version_number()
+
+        return '''Tokenizer {0}.{1}.{2}
+New BSD License.
+Copyright (C) 2017-2018 Hitoshi Yamauchi
+'''.format(vl[0], vl[1], vl[2])
+
+
+# sample strings, also used by the benchmark
+SAMPLE_STR_LIST = [
+    r'Two math expressions $\\sqrt{2}$\\\\\\\n\n\nand the other is $how is daller sign\\$?$. Also \\$. That is all.',
+    r'$\\sqrt{2} \\\\\n\n \\frac{1}{2}$ \\\\\\\n\n\n $foo$ \\$\n\n',
+]
+
+
+def run_bench(nb_loop):
+    """microbenchmark: tokens per second
+    """
+    tkn = Tokenizer({})
+    nb_token  = 0
+    start_sec = time.perf_counter()
+    for i in range(nb_loop):
+        for src_str in SAMPLE_STR_LIST:
+            for t in tkn.tokenize(src_str):
+                nb_token += 1
+    elapsed_sec = time.perf_counter() - start_sec
+
+    print('# {0} tokens in {1:.3f} sec, {2:.0f} tokens/sec'.format(
+        nb_token, elapsed_sec, nb_token / elapsed_sec if (elapsed_sec > 0) else 0))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("--bench", type=int, action="store", default=0,
+                        help="run the microbenchmark with this number of loops")
+
+    parser.add_argument("-V", "--version", action="store_true",
+                        help="output the version number of tokenizer.py")
+
+    args = parser.parse_args()
+
+    if (args.version == True):
+        sys.stderr.write(Tokenizer.get_version_string())
+        sys.exit(1)
+
+    if (args.bench > 0):
+        run_bench(args.bench)
+        return
+
+    tkn = Tokenizer({})
+    for src_str in SAMPLE_STR_LIST:
+        print('# in [{0}]'.format(src_str))
+        for t in tkn.tokenize(src_str):
+            print('#   {0:12} [{1}]'.format(t.type, t.value))
+
+
+
+if __name__ == "__main__":
+    try:
+        main()
+        sys.exit()
+    except RuntimeError as err:
+        print('Runtime Error: {0}'.format(err))
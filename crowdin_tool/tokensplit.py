@@ -15,7 +15,15 @@
 #       ./tokensplit.py
 #
 #
-import argparse, sys, re, codecs, os, collections
+import argparse, sys, re, codecs, os, array, collections
+
+import tokenizer
+
+# tokens of many strings as parallel arrays (array('I')).
+#   str_idx:   index of the string in the input list
+#   type_code: token type code, index of tokenizer.TOKEN_TYPE_LIST
+#   start/end: token span in the string, string[start:end]
+TokenArray = collections.namedtuple('TokenArray', ['str_idx', 'type_code', 'start', 'end'])
 
 
 class TokenSplit(object):
@@ -26,104 +34,77 @@ class TokenSplit(object):
         """constructor
         """
         self.__opt = opt;
-        self.__token = collections.namedtuple('Token', ['type', 'value'])
-
-        self.__keywords = [
-            'ISO_NUMBER', 'TEX_SPACE', 'WHITESPACE', 'MATH_INOUT', 'NEWLINE_STR',
-            'WORD', 'NOTSPACIAL', 'ESC_DOLLAR',
-        ]
-        self.__token_specification = [
-            ('ISO_NUMBER',     r'\d+(\.\d*)?'), # ISO integer or decimal number
-            ('TEX_SPACE',      r'\\\\'),        # '\\'
-            ('WHITESPACE',     r'[ \t\n]'),     # white space (\S might be better?)
-            ('MATH_INOUT',     r'\$'),          # math mode in/out '$'
-            ('NEWLINE_STR',    r'\\n'),         # line endings string '\n'
-            ('WORD',           r'[A-Za-z]+'),   # word like string
-            ('NOTSPACIAL',     r'.'),           # Any other character
-        ]
-        self.__tok_regex = '|'.join('(?P<%s>%s)' % pair for pair in self.__token_specification)
-        # print('# token regexp: 'self.__tok_regex)
-        self.__re_comp   = re.compile(self.__tok_regex)
-
-
-    def __tokenize(self, str):
-        """tokenize string
-        Assumption: Crowdin string is relatively short.
-        Othewise this should be a generator.
-        """
-        ret_str_list  = []
-        cur_str       = ''
-        last_keyword  = 'NOTSPACIAL'
-
-        token_list = []
-        for mo in self.__re_comp.finditer(str):
-            kind  = mo.lastgroup
-            value = mo.group(kind)
-            token_list.append(self.__token(kind, value))
-
-        # merge \\$
-        merged_token_list = []
-        nb_token = len(token_list)
-        idx = 0
-        while (idx < nb_token):
-            if ((token_list[idx].type == 'TEX_SPACE') and
-                (idx + 1 < nb_token)                  and
-                (token_list[idx + 1].type == 'MATH_INOUT')):
-                # \\$ found
-                merged_token_list.append(self.__token('ESC_DOLLAR',
-                                                      token_list[idx].value + token_list[idx + 1].value))
-                idx += 1
-            else:
-                merged_token_list.append(token_list[idx])
-
-            idx += 1
-
-        return merged_token_list
-
-
-    def split(self, str):
-        """get splitted string in an array
 
-        @param[in] str_list string list
-        @return    splitted new list
+
+    def split_span(self, str, math_info=None):
+        """generate the (start, end) offsets of the split segments.
+        The math mode in/out '$' positions are taken from math_info
+        (mathspan.MathInfo) when given, otherwise from one regexp scan
+        (tokenizer.RE_MATH_INOUT). An escaped '\\\\$' is not a split point.
+
+        @param[in] str       input string
+        @param[in] math_info (optional) mathspan.MathInfo of str
+        @return    generator of (start, end), str[start:end] is a segment
         """
-        token_list = self.__tokenize(str)
+        if (math_info is not None):
+            dollar_list = math_info.dollar_list
+        else:
+            dollar_list = [mo.start() for mo in tokenizer.RE_MATH_INOUT.finditer(str)
+                           if (mo.lastindex is not None)]
 
-        nb_token = len(token_list)
-        idx = 0
-        split_str = []
-        cur_line  = ''
+        seg_start       = 0
         is_math_mode_in = False
-        while (idx < nb_token):
-            # print('### ' + token_list[idx].__str__())
-            if (token_list[idx].type == 'MATH_INOUT'):
-                if (idx == 0):
-                    cur_line += token_list[idx].value
+        for pos in dollar_list:
+            if (pos != 0):
+                if (is_math_mode_in == False):
+                    # out -> in, first output the last, then the new line starts with $
+                    yield (seg_start, pos)
+                    seg_start = pos
                 else:
-                    if (is_math_mode_in == False):
-                        # out -> in, first output the last, then the new line starts with $
-                        split_str.append(cur_line)
-                        cur_line = token_list[idx].value
-                    else:
-                        # in -> out, first close the $, then make an empty new line
-                        cur_line += token_list[idx].value
-                        split_str.append(cur_line)
-                        cur_line = ''
-                # update in/out
-                is_math_mode_in = not is_math_mode_in
-            else:
-                cur_line += token_list[idx].value
-            # update the index
-            idx += 1
-            # print('{0}:{1}'.format(idx, cur_line))
+                    # in -> out, first close the $, then make an empty new line
+                    yield (seg_start, pos + 1)
+                    seg_start = pos + 1
+            # update in/out
+            is_math_mode_in = not is_math_mode_in
 
         if (is_math_mode_in == True):
             print('# Could not find closing $')
 
-        split_str.append(cur_line)
-        cur_line = ''
+        yield (seg_start, len(str))
+
 
-        return split_str
+    def tokenize_many(self, str_list):
+        """tokenize many strings (e.g., all msgid of a po file) into
+        compact parallel arrays instead of a token object per token.
+
+        @param[in] str_list iterable of strings
+        @return    TokenArray of array('I')
+        """
+        str_idx_arr   = array.array('I')
+        type_code_arr = array.array('I')
+        start_arr     = array.array('I')
+        end_arr       = array.array('I')
+
+        re_finditer = tokenizer.RE_TOKEN.finditer
+        for (str_idx, in_str) in enumerate(str_list):
+            nb_before = len(type_code_arr)
+            for mo in re_finditer(in_str):
+                type_code_arr.append(mo.lastindex - 1)
+                start_arr.append(mo.start())
+                end_arr.append(mo.end())
+            str_idx_arr.extend([str_idx] * (len(type_code_arr) - nb_before))
+
+        return TokenArray(str_idx_arr, type_code_arr, start_arr, end_arr)
+
+
+    def split(self, str, math_info=None):
+        """get splitted string in an array
+
+        @param[in] str_list string list
+        @param[in] math_info (optional) mathspan.MathInfo of str
+        @return    splitted new list
+        """
+        return [str[start:end] for (start, end) in self.split_span(str, math_info)]
 
 
 
@@ -177,6 +158,11 @@ def main():
         for split_str in split_list:
             print('#[{0}]'.format(split_str))
 
+    # batch tokenize: count the words of all the strings
+    tkn_arr   = ts.tokenize_many(src_list)
+    word_code = tokenizer.TOKEN_TYPE_CODE['WORD']
+    print('# {0} tokens, {1} words'.format(len(tkn_arr.type_code), tkn_arr.type_code.count(word_code)))
+
 
 
 if __name__ == "__main__":
@@ -1,10 +1,17 @@
 import os
 import re
+import gzip
 import json
+import argparse
 import threading
+import contextlib
 import urllib.request
 import multiprocessing.pool
 
+import pack
+import fetcher
+import download_db
+
 
 lock = threading.Lock()
 folder = 'C:\\Workspace\\Khan\\Images\\'
@@ -14,22 +21,328 @@ script_template = 'https://ka-perseus-graphie.s3.amazonaws.com/{}.js'
 json_template = 'https://ka-perseus-graphie.s3.amazonaws.com/{}-data.json'
 image_template = 'https://ka-perseus-images.s3.amazonaws.com/{}'
 
+# hash lists of the files to download, one hash per line
+manifest_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manifests')
+scripts_manifest = os.path.join(manifest_folder, 'scripts.txt')
+images_manifest = os.path.join(manifest_folder, 'images.txt')
 
-def labeler(image_hash):
-    """ Download a label JSON data file for a given image hash.
-    """
-    link = json_template.format(image_hash)
-    path = folder + "json\\" + image_hash[0] + "\\"
-    filename = path + image_hash + '-data.json'
 
+# work -> (sub folder, link template, file name format, kind)
+works = {
+    'labels': ("json", json_template, '{}-data.json', "JSON"),
+    'scripts': ("js", script_template, '{}.js', "JavaScript"),
+    'images': ("image", image_template, '{}', "Image"),
+}
+
+# works whose files are named by the sha1 of their content
+hashed_works = {'images'}
+
+# works whose files go into the pack of the download folder with --pack (see pack.py)
+packed_works = {'scripts', 'labels'}
+use_pack = False
+
+# number of threads of the verify pass
+verify_threads = 8
+
+# max requests per second (None: no limit) and seconds between throughput lines
+rate_limit = None
+progress_interval = 10
+
+
+def make_folder(path):
+    """ Create a download folder once.
+    """
     if not os.path.exists(path):
         with lock:
             if not os.path.exists(path):
-                os.mkdir(path)
+                os.makedirs(path)
+
+
+def shard_folder(work, image_hash):
+    """ Get the download folder of a hash: one shard per first hash character.
+    """
+    return os.path.join(folder, works[work][0], image_hash[0], '')
+
+
+def job(work, image_hash):
+    """ Get (link, filename) of a file to download. The folder is not created.
+    """
+    (sub, template, name, kind) = works[work]
+    return (template.format(image_hash), shard_folder(work, image_hash) + name.format(image_hash))
+
+
+def label_job(image_hash):
+    """ Get (link, filename) of a label JSON data file.
+    """
+    make_folder(shard_folder('labels', image_hash))
+    return job('labels', image_hash)
+
+
+def script_job(image_hash):
+    """ Get (link, filename) of an image generation JavaScript file.
+    """
+    make_folder(shard_folder('scripts', image_hash))
+    return job('scripts', image_hash)
+
+
+def image_job(image_hash):
+    """ Get (link, filename) of an image.
+    """
+    make_folder(shard_folder('images', image_hash))
+    return job('images', image_hash)
+
+
+def unique(hashes):
+    """ Skip repeated hashes, keep the order.
+    """
+    seen = set()
+    for image_hash in hashes:
+        if image_hash not in seen:
+            seen.add(image_hash)
+            yield image_hash
+
+
+def list_shard(path):
+    """ Get the set of file names in a shard folder, None when it does not exist.
+    One directory listing instead of a stat call per file.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return None
+
+
+def plan(hashes, work, recorded=None, packed=None):
+    """ Find the hashes which are not downloaded yet.
+    Each shard folder is listed once, the manifest is checked against the listings.
+    With recorded, the set of file names recorded as ok, a file without an ok record
+    (bad, interrupted or not recorded) is missing even if it is there.
+    With packed, the set of packed file names is checked instead. The downloads
+    still go through the shard folder, so the folder is checked too.
+    Returns {shard: (present hashes, missing hashes, folder exists)}, sorted by shard.
+    """
+    name = works[work][2]
+    listings = {}
+    folders = {}
+    shards = {}
+    for image_hash in unique(hashes):
+        shard = image_hash[0]
+        if shard not in listings:
+            path = shard_folder(work, image_hash)
+            listings[shard] = packed if packed is not None else list_shard(path)
+            folders[shard] = os.path.isdir(path) if packed is not None else listings[shard] is not None
+            shards[shard] = ([], [])
+        names = listings[shard]
+        if (names is not None and name.format(image_hash) in names and
+                (packed is not None or recorded is None or job(work, image_hash)[1] in recorded)):
+            shards[shard][0].append(image_hash)
+        else:
+            shards[shard][1].append(image_hash)
+
+    return {shard: (shards[shard][0], shards[shard][1], folders[shard]) for shard in sorted(shards)}
+
+
+def print_plan(hashes, work):
+    """ Print the number of present and missing files per shard, download nothing.
+    """
+    with open_db() as db, open_pack(work, readonly=True) as work_pack:
+        shards = plan(hashes, work, db.filenames(download_db.OK), work_pack.names() if work_pack else None)
+    print("shard  present  missing")
+    for (shard, (present, missing, exists)) in shards.items():
+        print("{:5}  {:7}  {:7}{}".format(shard, len(present), len(missing), "" if exists else "  (no folder)"))
+    print("total  {:7}  {:7}".format(sum(len(present) for (present, missing, exists) in shards.values()),
+                                     sum(len(missing) for (present, missing, exists) in shards.values())))
+
+
+def open_db():
+    """ Open the download records of the download folder (see download_db.py).
+    """
+    make_folder(folder)
+    return download_db.DownloadDB(folder + download_db.DB_NAME)
+
+
+def open_pack(work, readonly=False):
+    """ Open the pack of the download folder when the files of work are packed,
+    else a context with None.
+    """
+    path = folder + pack.PACK_NAME
+    if not use_pack or work not in packed_works or (readonly and not os.path.isfile(path)):
+        return contextlib.nullcontext()
+    make_folder(folder)
+    return pack.Pack(path, readonly)
+
+
+def packer(work_pack, is_packed):
+    """ Get a store callback of recorder: move a downloaded file into the pack
+    when is_packed(filename).
+    """
+    def store(filename):
+        if is_packed(filename):
+            with open(filename, 'rb') as infile:
+                work_pack.put(os.path.basename(filename), infile.read())
+            os.remove(filename)
+
+    return store
+
+
+def recorder(db, check_hash, bad, store=None):
+    """ Get the done callback of fetcher.download_all: record each download.
+    A file failing its check is removed, recorded as bad and added to bad.
+    check_hash(filename) tells if the file is named by its content hash.
+    A good file is passed to store, e.g. a packer.
+    """
+    def done(link, filename, status, size, etag):
+        if status == 304:
+            return
+        reason = download_db.check_file(filename, size, check_hash(filename))
+        if reason is not None:
+            os.remove(filename)
+            db.record(filename, link, download_db.BAD, size, etag, reason)
+            bad.append((link, filename, reason))
+            return
+        db.record(filename, link, download_db.OK, size, etag)
+        if store is not None:
+            store(filename)
+
+    return done
+
+
+def report(db, stat, bad, kind, refreshed=()):
+    """ Record the failed downloads (except refreshed files, still there), print the errors
+    and the summary.
+    """
+    for (link, filename, reason) in stat['failed']:
+        if filename not in refreshed:
+            db.record(filename, link, download_db.FAILED, reason=str(reason))
+    for (link, filename, reason) in stat['failed'] + bad:
+        print("\tERROR: " + kind + " file for " + os.path.basename(filename) +
+              " could not be downloaded from: " + link + " (" + str(reason) + ")")
+    print("Downloaded {} files, {} not modified, {} failed, {} bad, {} connections".format(
+        stat['ok'] - len(bad), stat['not_modified'], len(stat['failed']), len(bad), stat['connections']))
+    print("Status counts: {}, {} retries".format(
+        ", ".join("{}: {}".format(status, count) for (status, count) in sorted(stat['status'].items(), key=str)),
+        stat['retries']))
+
+
+def download(hashes, work, refresh=False):
+    """ Download the files of all hashes which are not downloaded yet (see plan):
+    the files without an ok record are downloaded again, see adopt.
+    One asyncio engine with keep-alive connections (see fetcher.py).
+    Each download is recorded, an image not matching its hash is removed.
+    With refresh, the present files with an ETag are fetched again if changed.
+    With use_pack, the scripts and labels are moved into the pack.
+    """
+    check_hash = work in hashed_works
+    with open_db() as db, open_pack(work) as work_pack:
+        etags = db.etags() if refresh else {}
+        packed = work_pack.names() if work_pack else None
+        store = packer(work_pack, lambda filename: True) if work_pack else None
+        jobs = []
+        for (shard, (present, missing, exists)) in plan(hashes, work, db.filenames(download_db.OK), packed).items():
+            if missing and not exists:
+                os.makedirs(shard_folder(work, shard))
+            jobs.extend(job(work, image_hash) for image_hash in missing)
+            for (link, filename) in (job(work, image_hash) for image_hash in present):
+                if filename in etags:
+                    jobs.append((link, filename, etags[filename]))
+
+        bad = []
+        stat = fetcher.download_all(jobs, done=recorder(db, lambda filename: check_hash, bad, store),
+                                    rate=rate_limit, progress=progress_interval)
+        report(db, stat, bad, works[work][3], etags)
+    return stat
+
+
+def check_files(files, sizes, check_hash, threads):
+    """ Check (link, filename) files in parallel (see download_db.check_file).
+    Returns the list of reasons, None for a fine file.
+    """
+    def check(file_job):
+        (link, filename) = file_job
+        return download_db.check_file(filename, sizes.get(filename), check_hash)
+
+    pool = multiprocessing.pool.ThreadPool(threads)
+    reasons = pool.map(check, files, chunksize=64)
+    pool.close()
+    return reasons
+
+
+def verify(hashes, work, threads=verify_threads):
+    """ Check the present files recorded as ok against their recorded size and
+    content hash in parallel. A bad file is removed and recorded, the next download
+    gets it again. The present files without an ok record are only counted, the
+    next download gets them again (see adopt). Packed files are not verified.
+    """
+    kind = works[work][3]
+    check_hash = work in hashed_works
+    with open_db() as db:
+        sizes = db.sizes()
+        on_disk = [job(work, image_hash)
+                   for (present, missing, exists) in plan(hashes, work).values() for image_hash in present]
+        recorded = db.filenames(download_db.OK)
+        files = [file_job for file_job in on_disk if file_job[1] in recorded]
+        reasons = check_files(files, sizes, check_hash, threads)
+
+        nb_bad = 0
+        for ((link, filename), reason) in zip(files, reasons):
+            if reason is None:
+                continue
+            nb_bad += 1
+            print("\tBAD: " + kind + " file " + os.path.basename(filename) + " (" + reason + ")")
+            os.remove(filename)
+            db.record(filename, link, download_db.BAD, reason=reason)
+    print("Verified {} files, {} bad, {} not recorded (see --adopt)".format(
+        len(files), nb_bad, len(on_disk) - len(files)))
+    return nb_bad
+
+
+def adopt(hashes, work, threads=verify_threads):
+    """ Record the present files without an ok record (e.g. downloaded before the
+    records) as ok when they are not empty and, for the files named by their
+    content hash, match it. Only their presence can be checked for the others.
+    The files not adopted are downloaded again by the next download.
+    """
+    kind = works[work][3]
+    check_hash = work in hashed_works
+    with open_db() as db:
+        recorded = db.filenames(download_db.OK)
+        files = [file_job
+                 for (present, missing, exists) in plan(hashes, work).values()
+                 for file_job in (job(work, image_hash) for image_hash in present) if file_job[1] not in recorded]
+        reasons = check_files(files, {}, check_hash, threads)
+
+        nb_adopted = 0
+        for ((link, filename), reason) in zip(files, reasons):
+            if reason is not None:
+                print("\tNOT ADOPTED: " + kind + " file " + os.path.basename(filename) + " (" + reason + ")")
+                continue
+            nb_adopted += 1
+            db.record(filename, link, download_db.OK, os.path.getsize(filename))
+    print("Adopted {} files, {} not adopted".format(nb_adopted, len(files) - nb_adopted))
+    return nb_adopted
+
+
+def retrieve(link, filename):
+    """ Download one file into a temporary file, renamed when complete.
+    """
+    part = filename + '.part'
+    try:
+        urllib.request.urlretrieve(link, part)
+        os.replace(part, filename)
+    finally:
+        if os.path.isfile(part):
+            os.remove(part)
+
+
+def labeler(image_hash):
+    """ Download a label JSON data file for a given image hash.
+    """
+    (link, filename) = label_job(image_hash)
 
     if not os.path.isfile(filename):
         try:
-            urllib.request.urlretrieve(link, filename)
+            retrieve(link, filename)
         except urllib.error.HTTPError:
             print("\tERROR: JavaScript file for " + image_hash + " could not be downloaded from: " + link)
             return
@@ -38,18 +351,11 @@ def labeler(image_hash):
 def scripter(image_hash):
     """ Download an image geeration JavaScript file for a given image hash.
     """
-    link = script_template.format(image_hash)
-    path = folder + "js\\" + image_hash[0] + "\\"
-    filename = path + image_hash + '.js'
-
-    if not os.path.exists(path):
-        with lock:
-            if not os.path.exists(path):
-                os.mkdir(path)
+    (link, filename) = script_job(image_hash)
 
     if not os.path.isfile(filename):
         try:
-            urllib.request.urlretrieve(link, filename)
+            retrieve(link, filename)
         except urllib.error.HTTPError:
             print("\tERROR: JavaScript file for " + image_hash + " could not be downloaded from: " + link)
             return
@@ -58,18 +364,11 @@ def scripter(image_hash):
 def imager(image_hash):
     """ Download an image for a given image hash.
     """
-    link = image_template.format(image_hash)
-    path = folder + "image\\" + image_hash[0] + "\\"
-    filename = path + image_hash
-
-    if not os.path.exists(path):
-        with lock:
-            if not os.path.exists(path):
-                os.mkdir(path)
+    (link, filename) = image_job(image_hash)
 
     if not os.path.isfile(filename):
         try:
-            urllib.request.urlretrieve(link, filename)
+            retrieve(link, filename)
         except urllib.error.HTTPError:
             print("\tERROR: Image file for " + image_hash + " could not be downloaded from: " + link)
             return
@@ -78,7 +377,7 @@ def imager(image_hash):
 def get_script_files():
     """ Get a list of all image generation JavaScript files.
     """
-    path = folder + "all\\"
+    path = os.path.join(folder, 'all', '')
     files = []
     for root, dirnames, filenames in os.walk(path):
         for filename in filenames:
@@ -88,8 +387,8 @@ def get_script_files():
     return files
 
 
-def work_labels():
-    """ Download all label JSON data files.
+def label_hashes():
+    """ Get the hashes of all downloaded image generation JavaScript files.
     """
     hashes = []
     hashex = re.compile(r'.*\\(.*)\.js')
@@ -99,24 +398,96 @@ def work_labels():
         hash = match.group(1)
         hashes.append(hash)
 
-    pool = multiprocessing.pool.ThreadPool(50)
-    pool.map(labeler, hashes)
+    with open_pack('scripts', readonly=True) as work_pack:
+        if work_pack:
+            hashes.extend(name[:-len('.js')] for name in sorted(work_pack.names('.js')))
+    return hashes
 
 
-def work_scripts():
+def work_labels():
+    """ Download all label JSON data files.
+    """
+    download(label_hashes(), 'labels')
+
+
+def read_manifest(filename):
+    """ Read hashes of a manifest file lazily, one per line.
+    A line is a hash or a JSON object with a "hash" key (JSONL).
+    Empty lines and # comments are skipped, .gz files are decompressed.
+    """
+    opener = gzip.open if filename.endswith('.gz') else open
+    with opener(filename, 'rt', encoding='utf-8') as infile:
+        for line in infile:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('{'):
+                yield json.loads(line)['hash']
+            else:
+                yield line
+
+
+def work_scripts(manifest=scripts_manifest):
     """ Download all JavaScript image generation files.
     """
-    hashes = ['2641276407b03d153dee073f217d75df9f1a5bb6', '3bc402e299f21a8d1abaeb5acc6df9ae8d0ca177', '71f3e10898782478ee797b6ba35b76cf4105530f', 'd8d73688cc52196a9a5b78659230c3665824e215', '48b07c83ff4432ca131bfa58bb116bc29e9551dc', 'fa6d60bfead324c50d734ff175a7f4ec9e1c9c4a', '85a1b9cdcd30973766466389fa7f9e054c165892', 'af021eed2ea5aa94d6c6b4cacaf864606e09f04b', 'beb3e89fad683e09751fcd59ddce4fde11e0df52', 'be75119c9ec750491ada6dd94f5083c448ab9aad', '5505e58c694464279f963187f09c2f77d54a9a63', 'd934158b0de403afd9fa9eac48f65f934a86771d', '202723033e2b08f57452ecf133127bc47af9e7ec', '0cb2bae7dea4ea822f7e63859e2dccd1ac029d35', '01ed46b5a00e542451816ed7e1263dffe6b0d19e', '02bf34dcb827b6ab86cf2b4caf1715fa863158fe', 'c03493a770a6f16dbaec1ce45fb764334bdb2684', '92278b1feb8dc4bbb0351dfc21095c05d1a71052', 'e52aab2eaa0b9b4f24c9fd94abe20702a70423a4', 'b921eef27f835da5fdf92310de485444e9cf0bb2', '701fcd0259441be0aefb51d1682350030e62582f', 'ca2e789259f27837489ad76fd403f676b31b1271', '691ec885aadb83d180e572416f286e034dd12f3b', '977e057a6479bc1f11b0936c9c6f63609ab98431', '2178e9da4c0e6123d196bcb1e4e1e4a825d46c3e', 'be1a3099f5cc5da49a979f6a2f6346c496050321', '69a91f36451bf3ded5030ccb6513ea6d1288430a', '4ae82ddc92044e233c79617bc52798d0b411a2e4', 'd18d22c01fc1488fbbdb34d77e8a0f185dee9cc3', 'c101834361ea7cf468c43fd96ca7983e9c42a708', '044b39d689e664edf9a947c1fdf60fb686b18b08', '25d11a06183603b986401b5a0232d57ced3d65e0', '38a0d67fc3ca80111652708ddd1ed7c10bbd9964', '3a2236497630755a22affd1011e526c0ea5d3c7c', '3ead826357579484f36264027620193cd436f590', '4fb0dfcded1492ce8795babc72e698d5dc38492d', '6be0904b51cba69ed85be094c7921a4c8003e74c', '8b5bcedf943846063a20a51eb25b7efaf7be4a6f', 'a92e90d56da4c45788186c901fd6758428b5929a', 'b13fb7c52ddff50bdb9b53570840ce93c4b40eea', 'ba3f62cd05d00ca345c80c51ae94ace14497d21f', 'bcce8b58c1d1b60364143436bacd687abd765870', 'e3e4bbba487b7eb4665a55cf0cc924dc4720a077', 'f925b5dab510ca50056ab28c3286e48aac0403a4', 'fd1e13cd1cf9e3e19065471c70f44ce34020fca3', '38a0d67fc3ca80111652708ddd1ed7c10bbd9964', '4fb0dfcded1492ce8795babc72e698d5dc38492d', '25d11a06183603b986401b5a0232d57ced3d65e0', '8b5bcedf943846063a20a51eb25b7efaf7be4a6f', '29a61f5b588248a32d1a63555df788e26a37a70c', 'ee7f2dfc06a194a37be66d4b822aa3095f52eef7', 'bcce8b58c1d1b60364143436bacd687abd765870', '6f93139b9cf1e06770cdd39c372708d33fada199', 'f322a33a0a19a5f16a4eb47095fead0e1f1511ad', '2366bc29a0f0b646b06662e75964dec045f3400f', '27b3c81f50f9233bb513b19037682489d5559e3f', 'd94546966318975e8551546127a206acde8538b3', 'eefc62ed47a5832234daae1dcb45e8385c6a342c', 'ea4bba469dbb30314736dee6239f7d47550127ed', 'abd3b0e641f89b3fa80fe69801d5dc111e0ce246', 'f8c591ae9ff900284b3ff289a3e4618e93393742', 'bad67ee3e5d287d190d98a64c98dbcd1c2a95aa6', '522a8fdf5e05bbe38aa7522faf8d142971edabff', '98bc0f16014ad554c2c7ed172a1875d857afa5ef', '800caf3a87e89dd36319a2b7ff985d0584fe6658', 'c4db00a45ed300a65005f9a49ebc9a35f003d977', 'ce3121e5a055a2393e47c3b1e81eb411ffb5b7b5', '2ad5e497e749da7f60116ac920b01864abf2a930', 'a976eb66cb768d6aa0d923cf863dcc7b9ea59cad', 'b0216381822fdf828c9b1c0c60a3da3a18cdb9da', 'eb8635a8059b2c69ad19bf8d44f5a7a7885cf622', 'eb8635a8059b2c69ad19bf8d44f5a7a7885cf622', 'b0216381822fdf828c9b1c0c60a3da3a18cdb9da', 'b66bcdfe2cfc99b4d8a7f65ea39b0beed4fba69f', '548cc5efb60f82ca6a80e92af0fa6d4aae2572cc', '5e1b96fadae499ba2afc53ed62bd241605db2e0f', '32bd9771d7e20bf1d3ad1552a9f39bfeea82d2ac', 'fc7e9f73f7655f5a907370cf8d8b7a74be5d6b56', '016eb38387c9d8aca24ccfbb6462446da7b00352', '333b06f6d658c349663413f67435ea2d2bb5895a', '4dca991398791176acef23ae38c7c644fd139db0', '6724c1b6110de6b30b63f274cd95c7aaefb2085a', '9d1ede42dce7c0b3f84523526087ec30298fe812', '1d4532a54af0b066bc8f6e5db773ec3240a4bc37', '7dd2712d1667ff1793cd42bc4c839fddeb644f69', 'a8c130993e86a3c62b1750b577ea6ac05e0f7117', '32e4fc3cc3c37cfa6f08b1802946fad5ca0e3640', 'daa277b1659938b6153d096724f987f0b0d63bd3', 'b923e7cabe5daf01e30186bfe85a1de0b31d3f50', '901d7c98e89d9ef666ce418077b2c66611f3853c', 'dd6fc2eb4c728f737e6bc43a01e747d9d0ee2936', '25493eab2ff9894eda82111afe78a0d9a9fd59fa', 'de6d10aeeb92494e3101e3443d1377b5bfa97d37', '630035b4b25b66853a7473dacfb35ab92ee4102f', '5ecaae8fa8659a2df0c4f76c481e6f9384aeb270', '78ed96f709c00b39a6702aceebba03b280b6b0b1', '55ef849f007dfde019714d89189f34bf145513ad', 'b8c2283046c745fe10df6384cfb8e8d2e976286e', 'cd5b11757904097ee58116239d8ae6db6cd5d2e3', '97834f8aaeaaaa1d0a393d4cd8b2740abc7c28f1', '363b05ea07842ad58fa6f176da7fe15f11377d79', 'b469e762ae1d921d400738ecf25026e587cbacff', 'b053e1c89e1eece5f3572f377edc71d4d1eba550', 'c279b3c9206dadb98016321bc04447c98d78aef1', 'dda66a8a374b94c3632cfcfca5eb5db83ef980fb', 'fc589083a8b9f3ca37a7178799d3e15de51b11f6', '9101c575b92a0fab89b058137f10ba69ffc74c29', '9a532443d4a9fff9ce9d696d00a72637b64c9be3', 'e4ca04bdfc5cf76799e85d65c3f5eced66082506']
-    for hash in hashes:
-        scripter(hash)
+    download(read_manifest(manifest), 'scripts')
 
 
-def work_images():
+def work_images(manifest=images_manifest):
     """ Download all images.
     """
-    hashes = ['7268fc25bab456c41e8006dcc4d895d504654992.jpeg', '19861fc8cbbc5da70e7ae92af7c703433ad9e733.jpeg', 'e669f10948864eb8225e855169da6c4416d214ec.svg', '1b01709845920ddbdfc7c3f2503761d3dbbdd35c.svg', '749ae157852e5cdae786d7909754b5a8cb3a6251.svg', 'd7c48078d188db3053fc5fb34289cb963c5cfc44.svg', '022d7a10a117d063048bd253fe25195bf2cea255.svg', '32070dccb16d88d3de48518d96043bc7def408ae.svg', '447a8dca1e53c3eb3c02d4786b9ebfdf8c83cc35.svg', '7607a303ccd9687b49e9b17af46314f0c593a572.svg', '7c7faeb173d95a624b65d34d8bb2d510031ad20e.svg', '7c7faeb173d95a624b65d34d8bb2d510031ad20e.svg', '80ed2ea5ba937c3f83b0125b77808633a9959f40.svg', 'a5a4299d2a238071950497234ab8957d08496c14.svg', 'a5a4299d2a238071950497234ab8957d08496c14.svg', 'c704771522c72376a73676eb01a937a2e45ab527.svg', 'd7c48078d188db3053fc5fb34289cb963c5cfc44.svg', 'e8404e1acbb149d4eabeddf6a88f6feaa58df949.svg', 'f01c5017f2de18d821f6fe7641394b75d51e12e8.svg', 'f521b5da982f902428d65116554372a8af1f6f79.svg', 'fb9cd5696ce5ebd01f8ea7f85a0dcf9696509da4.svg', 'fb9cd5696ce5ebd01f8ea7f85a0dcf9696509da4.svg', '06eca4a9a0134f71925a08f81878f4d194a2b16e.png', '04eee8b36826c26b55ceb69ce454d87e59fb2448.svg', '4736df7e52ef14587ab0535233435c3ecf9cd957.svg', '5c052bee7489cc98c7ffc0767674b818cc4568d1.svg', '7607a303ccd9687b49e9b17af46314f0c593a572.svg', '80ed2ea5ba937c3f83b0125b77808633a9959f40.svg', '9f4de5acb9b5f5d40a391d8af667d16e415110ce.svg', 'a9cf3cff3b0b81b80da1d084e2912636cfa3f4cc.svg', 'a9cf3cff3b0b81b80da1d084e2912636cfa3f4cc.svg', 'af47b1ea28f013b204e9625dececb3984efb5769.svg', 'af47b1ea28f013b204e9625dececb3984efb5769.svg', 'f85e6f1f282c6674e7a02eec63462c8e7d601808.svg', 'bca940aee0aae74fe3cefc25d8bf2e4d66b1c2b2.svg', 'a9cf3cff3b0b81b80da1d084e2912636cfa3f4cc.svg', '8fa46c185be9c1d54f5ebca3f4182d87690466ac.png', '7a48b4c7e46224d72a1b99c474db983362883051.png', 'ccc1e61110eb0c3548af8dcce83df154e530e386.png', 'd2a329932160e2373f65cc1c3007cc151b571d8e.png', '68b8503acdc10f616a3645487012fe7784fea403.png', '115172f1734fa0c29c955cde880af39af3e0a94f.png', 'f4dd0d64cbabd1dfc53f591df05f3d626b5cc248.png', '1f4db590f5d31d1cacc06a37d2fe7d8def02878a.png', '43002aaa789cfa3e88ec6d0bc40f1a7147c4a74b.png', 'c24d212a56aa5e89a9ae7c6cb138558d57ef84fe.png', 'c6a41f6683991df2deb9ba6e05e096eff5eb9a53.png', '7755e03668d8a204a5a1f0847a82489cd0c693e2.png', '88585fe72a36ba312d33870db94fe12d756e0663.png', '0d7dbfc5df3589f0321339c3aff4fc26ec7dee8f.png', '21c243be055789bb63860c46e4bd91836fce41ef.png', '4071068a644c898cf207569bb428e7b929921628.png', '47976e9823a5b741548871fb933c1f8c0b8c6d07.png', '4d482153a510e763b660bae7a66d12c29b529e00.png', 'c6a41f6683991df2deb9ba6e05e096eff5eb9a53.png', 'c6a41f6683991df2deb9ba6e05e096eff5eb9a53.png', 'ce2255d83adb45da2ba670657d01b1da334dc7f3.png', '1bfee509069b206ec20537e8b7f6d7cdbe1bcb20.png', 'c941e96a306e025aa38fa3efe2e6d7117f7cee20.png', '3370a2149b7af08a747d6953b0f58f7de76603a5.png', '7225b1f9048d6efffec6ccc9d003f34e1bee1425.png', 'ca61c10afb7a78ffdbd42db720b9b835b21463e5.png', 'b7319e5ce18fc8baef8ceffcc00a194fc1a51dac.png', '0d7dbfc5df3589f0321339c3aff4fc26ec7dee8f.png', '2980dca1ab6dd563393ab78a516a82ede91b6dc3.png', '573abee9c83d8bfdcdc8927b6560d2524cd09093.png', '893dd9ea4a93af828b503babfca53f8224db45b6.png', 'f2631ea1efd68d77c1eda4ab06a850ae453f92d1.png', '5d29362072ed2ff3f209a358164dc9a00a73fcd1.png', '061e42f1cf1e5a0e2127b9bf2e54ddc6cb34d097.png', 'b7319e5ce18fc8baef8ceffcc00a194fc1a51dac.png', '0d7dbfc5df3589f0321339c3aff4fc26ec7dee8f.png', '6d3e9f9976d11ed6fa2fbde3ebbc23dfda5d0a9e.png', '23bacecd2231345e5773358d138b486ec4285ca7.png', '3baed38cf4e3c802c4d5adcf5257bd1412b4962b.png', '6d3e9f9976d11ed6fa2fbde3ebbc23dfda5d0a9e.png', '3baed38cf4e3c802c4d5adcf5257bd1412b4962b.png', '5009dbc26e95522eff4502477f117b7d8aaf0c00.png', 'b85d2c098ae4ee46434a909bd5271c32ae298b8c.png', '983d893e8e0c4029529b69ed7067a9d95c1799e1.png', 'dd08026ce7c6a59d1b21ac8e8e25fdac5e5d7f29.png', '3370a2149b7af08a747d6953b0f58f7de76603a5.png', '7225b1f9048d6efffec6ccc9d003f34e1bee1425.png', '2a42a85931e3aa9da9b694bf7802bec2deba2442.png', '2980dca1ab6dd563393ab78a516a82ede91b6dc3.png', '573abee9c83d8bfdcdc8927b6560d2524cd09093.png', '893dd9ea4a93af828b503babfca53f8224db45b6.png', 'f2631ea1efd68d77c1eda4ab06a850ae453f92d1.png', '5d29362072ed2ff3f209a358164dc9a00a73fcd1.png', '061e42f1cf1e5a0e2127b9bf2e54ddc6cb34d097.png', 'b0dd330f42e27cfb7067597de1f1a4cb77e829d9.png', '661eb5ee75fddd0daee31c3ccd37710158040888.png', 'a1cc96b4a79198bf61b4a5158eed84b6936fa9d7.png', '0e62c49e0ca03ff1d63477cf06a46a3642f158c9.png', '78580bfc642a00dd1110e79584b77faba490c6ee.png', 'a1cc96b4a79198bf61b4a5158eed84b6936fa9d7.png', '78580bfc642a00dd1110e79584b77faba490c6ee.png', '1bfee509069b206ec20537e8b7f6d7cdbe1bcb20.png', 'c941e96a306e025aa38fa3efe2e6d7117f7cee20.png', '4be31aea816319bce9a3c6c1158ca8824c031ebb.png', 'b0dd330f42e27cfb7067597de1f1a4cb77e829d9.png', '5e6e098e7acb457f32077b7ca65052cebe4d3393.png', '061e42f1cf1e5a0e2127b9bf2e54ddc6cb34d097.png', 'b85d2c098ae4ee46434a909bd5271c32ae298b8c.png', '5e6e098e7acb457f32077b7ca65052cebe4d3393.png', 'b85d2c098ae4ee46434a909bd5271c32ae298b8c.png', '3c1abf2ef8b641d4b7f3c460cd5b08d64e3e395a.png', 'dd08026ce7c6a59d1b21ac8e8e25fdac5e5d7f29.png', '5009dbc26e95522eff4502477f117b7d8aaf0c00.png', '6d3e9f9976d11ed6fa2fbde3ebbc23dfda5d0a9e.png', '23bacecd2231345e5773358d138b486ec4285ca7.png', '3baed38cf4e3c802c4d5adcf5257bd1412b4962b.png', '88585fe72a36ba312d33870db94fe12d756e0663.png', 'e215db04a6d8374fce64366f2bc236c1d2891a7d.png', 'a9bd4bb751725bb282e98a3290924d32b66d786c.png', '76e4e95fe2a8d1a72d235b54972c228fbe0c753b.png', 'fba75f8d66385fdfbd53197576951f4e85d6fa78.png', '90e1c17b5da14d80defceece3a0a92532079272c.png', '5e6e098e7acb457f32077b7ca65052cebe4d3393.png', 'bb8bc049b320dd2d9c17ad9e34f0d528952e1e31.png', '5e6e098e7acb457f32077b7ca65052cebe4d3393.png', 'bb8bc049b320dd2d9c17ad9e34f0d528952e1e31.png', '5e6e098e7acb457f32077b7ca65052cebe4d3393.png', 'bb8bc049b320dd2d9c17ad9e34f0d528952e1e31.png', 'f5521a581e60d1f9b04ea03c6fd5a00933b490d5.png', 'e906773187240a1d7ac8edb7438281a91c85fcbb.png', '2cd1512e74cc3cec4dc71f5bc879ed5ced39a4ef.png', 'd4c0848669e6e1232c22aecb0d668f40b84be6ff.png', '78ce51c66e7ed3bef345c60c113b8e2f8a6cb265.png', 'b495bd7199b9fbdaf9066e01ce6020ddddb93ca0.png', '9b5c6dffd9519560cb9f0e06d0a610e25db79f19.png', '6cf0d9f007084e9d06e3ce0e241416dde920ec9c.png', 'c3eb34f17f23c0bffa95d36c085822d0bc092986.png', '54d04bd92ab598c2885fbb6a5829ba3bfea5547c.png', 'e265e17726f1ed651c9388c6ee7017be0a5e7f3c.png', '62ca668a9d28914e5d9dd0662f6a930066991659.png', 'a26e1f8796a70d90dfd39f103f2da4d7ff6c7bb5.png', '92b99a6cbec57ef7e004420736a9353d07be9709.png', '2efe384215f4cc805491163bdd4f0b74d1851721.png', '61795756f59543f9a449bc0295c9674d73cfa93f.png', '061e42f1cf1e5a0e2127b9bf2e54ddc6cb34d097.png', '661eb5ee75fddd0daee31c3ccd37710158040888.png', '5e6e098e7acb457f32077b7ca65052cebe4d3393.png', 'bb8bc049b320dd2d9c17ad9e34f0d528952e1e31.png', '857d442359448bc2a5e1483b7db049a45513d24f.png', '7755e03668d8a204a5a1f0847a82489cd0c693e2.png', 'e3c91ae20a1d60e3a8944bc4b07104ba7dfe51a7.jpeg', 'e3c91ae20a1d60e3a8944bc4b07104ba7dfe51a7.jpeg', 'e3c91ae20a1d60e3a8944bc4b07104ba7dfe51a7.jpeg', '4ae200f267099b8f1480b1fc9825d7e1829722ca.jpeg', '4ae200f267099b8f1480b1fc9825d7e1829722ca.jpeg', '4ae200f267099b8f1480b1fc9825d7e1829722ca.jpeg', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', '67ed09d55850173a86549bbe2c8b8e432170cc0a.png', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', '2761fc4308ab5ca429bce7ad6ef6ba3c764f521a.png', '72061eed98e9669925c8f154fc8953d2b1edcff5.png', '3a5fcbcfc9b536eecc52c855e30c644bfec9add9.png', 'b1cdba7fba57f79ad86ab47c00b4b0bdf892246d.png', 'd15e45d16b9efe01fa6d9baa7d610f268db66530.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', 'b07ce8a81911cf88334209afded36d008d7304ec.png', '0b015332ba9bbdedfbb4afe51506ded6dcc4ca40.png', '7a19077f8cbb9bb475a8e57f36fba83a3bf3450a.png', 'a1b65b115223ce63806bc50ddf275d468a1a3dcb.png', 'f9ab7a0f02ded34c9b4d0ca3d09fc6c6f2217ea8.png', '2d7362596392a5ca1b48dfd756c29768fb580367.png', '9cad06a4679fe0102c1c5405d032bf1fb1dc0b87.png', '3f7f411033702c306b7192128c37e5fef8eb7169.png', '8eb37d4b96768493920856877bfa52660f4ca8f5.png', '9cad06a4679fe0102c1c5405d032bf1fb1dc0b87.png', '3314de04098563a5f04004fb478e738d84b075f4.png', '3f7f411033702c306b7192128c37e5fef8eb7169.png', '624b2f6647af6bd392823d51a2136fb409dd718a.png', '8b50c077f8984e1ee835d26ddbad6160750b92b1.png', 'ebcb2d0426b9a43f384f87b39432c0754a8135ba.png', 'f440bcbf5346dc6cfbe969db1de059b2c0e36107.png', '8eb37d4b96768493920856877bfa52660f4ca8f5.png', '3314de04098563a5f04004fb478e738d84b075f4.png', '9cad06a4679fe0102c1c5405d032bf1fb1dc0b87.png', '3f7f411033702c306b7192128c37e5fef8eb7169.png', 'd5eee16915591c66dc4e17d2c7bfbc7782a3c49a.jpeg', '206490f02a1df019b222fca6e9641b1d6a42069f.jpeg', 'b140e059b1c3277a3f4e7390392a91095535d429.png', '0b65b7a6c72b17f91e8fbdc6167538ad9f67df11.png', '5f7794d9b1d6f588caa77ceca219516d1073840e.png', 'b1cdba7fba57f79ad86ab47c00b4b0bdf892246d.png', '2a23f1e0f30ecdfdf908ba1464fe36c187a23f6b.png', '1f0118c5c2ef702326db19fee6f49e0ac1d2437c.png', '3f44e7c69a3a289ab139fefb7ef70224dfc1f9a1.png', 'f0d9ffed75400310d83eac686d9b73a15114fa83.png', '1b2c39aff7b42e0ebd603db77a6a9a7e1ede7b91.jpeg', '2719ab95bb89ad145efb241cade4ffd7479b70f9.jpeg', '3620fe3d5161d1f405804c1d16e22adabe8f50ed.jpeg', '3ed438927bb879db9bc91171cde7535b667c16da.jpeg', '4cffd6386bae872b7a63d2110e858938810211a2.jpeg', '52b4907b763103d61fc01ed0aa19eb1f88edd033.jpeg', '858081bd06e8aa875f68ddbeb08b386c45471473.jpeg', 'c1b3a387fd3a23b46894f001b32aa25c2a1edfc4.jpeg', 'e20eec88b7a111ee5edf3bf14eeb37cc075a2ba0.jpeg', 'fb51843248af48fe6e94f5fb1b359ae9883e024c.jpeg', 'a1b65b115223ce63806bc50ddf275d468a1a3dcb.png', '80c6800e3d90a158e762ff60d837bbe3f389fa9a.png', '13f4fa95d8af3d0fc2afdc81169008473ca4fc6b.png', '4a5b364ae7b8a4e9c0b3c76ed03ae81486afbfea.png', '7c285fdca01b0175ace8e329de4db5e5c3b4e497.png', '2665cb6edde020fcbcd5b249218e96722a6f8624.png', '492bc04de59c4d44e13955a2a895228196c533c0.png', 'cf2b8c8b8d09aedc457e02dd4391b1db3f225ace.png', 'a192a898a1898d3c2699e8bb788b951af86cad05.png', 'd2707e34d49a281e8cff6d6b38e53de9b96c60d5.png', '3a5fcbcfc9b536eecc52c855e30c644bfec9add9.png', '1f1b40533992d49fe420dd10e1cdf5cc4e0376bc.png', 'fa7c0feaf234e640b03d45bb6ac383b94e8250d8.png', '36831991bd162fd7bae21ffa117f4438f0f725d3.png', '8ed402eef1432e7ba4751841ec052d815666f786.png', '6b131871c1ffb1082ddaa57326252c3beee95501.png', '3a21c6a2181fb8a09bb6fc2df771824f89d72a26.png', 'ae92b69960fc77ab8aea8413a4504f36867e8675.png', '67ed09d55850173a86549bbe2c8b8e432170cc0a.png', '67ed09d55850173a86549bbe2c8b8e432170cc0a.png', '89e041e7992011e8533170a33c6679a95ff022d2.png', 'd54741d31c88174a31a0f99c701f5869c398372a.png', '19d360f74bf6eb9672c9503d7c5a666516e7bc90.png', 'd7ff802369bf64319b9ceef0b150bcc69a8aeb39.png', 'c8ced0b4ae062050ef40007debff51b19c744f33.png', 'b140e059b1c3277a3f4e7390392a91095535d429.png', '01d41ebe448463a14d8fb9628beaf7f847831c09.png', '259cd1d124fa0c3a01c5ea889655c339143f9d68.png', '279c3dc460cd592e199e994510a5f0b5442944a4.png', '4e814f9ca2ca0397ace4569aa152d6da29d1e4bd.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'a1b65b115223ce63806bc50ddf275d468a1a3dcb.png', 'b4979f44f2b078ca27a4d993be2d9a4b89cac54e.png', '8eb37d4b96768493920856877bfa52660f4ca8f5.png', '3314de04098563a5f04004fb478e738d84b075f4.png', '2761fc4308ab5ca429bce7ad6ef6ba3c764f521a.png', 'd4ad7e3185dd9ba242e8b935d12886ff1c5d1e38.png', 'd5eee16915591c66dc4e17d2c7bfbc7782a3c49a.jpeg', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', '195d3b8638a4d397af3a1e1494c3f2fd09ca29ae.jpg', '028813e9c1d7e7119b9792e539953fba4c8f892a.jpg', '1a14e59da6934548605cb000c55ad93e7bbfe3f7.jpg', '1c91f2ddc725a546e9674e07f8fb5a7121fa4156.jpg', '1fed592df72639618554cde47295aba0abd25f4b.jpg', '39ca4fbf099f0a9c9912081561e4e794ae3138ac.jpg', '751d09f63e92783641321597f305b27fb4f95f82.jpg', '77fcf37234992c53258d243b83ca51c375d328c5.jpg', '7c6737783b61cddf02dadf0834e34853a2e95929.jpg', '7cbb133178d267e530e358234dadf0646c0bda3b.jpg', 'dd2f41ad6da1be8ad7af2e548795c4210140bb66.jpg', 'df4cc8a7b4ee0d4f629f3e08030715ca01f6d57a.jpg', 'fb1114cec33e53c30c47a610b8120e8a2ec6e9a8.jpg', '4952ae214b72d02c10596a6f0a417dc26d724a62.png', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', '0148d81756e6ebd61f1b60b1affb4678ff8b994e.png', '0dde3c948b721b540c79f319e5673f70fa648cb9.png', '5399b4ad34cd8f37a7b4107502198f5985367b75.png', '5e663c987f06328082974dd3f09442ad98df96c8.png', '69725247306353568f6ce92324840f2c4df6b1b7.png', '83491518e4e4fd0367c63b00a0aa48faf3b0fa9a.png', '8bb31068ff270163e5c14585b2f8cd01e17cfb50.png', '9d9c10df97b6d5b484c222c5a049a3f2879317d0.png', 'a6b2e128ab448a4574c51270675418a74662acaa.png', 'b7e77ea11c33f325805b7223499531fcbbda1355.png', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', '1989fe4904e6aa11f0361e3b7dc07493d6c133b1.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'ffb74e5ce59e4318688b2f41930820da89e8cff7.png', 'fe77c84019133ab9c7638d7b18467baa0de2de37.png', 'c83fa0ec6e383bcdaf9376a143bb7238e55eaefb.png', 'b87733849f4d27feedc43786a5e57dcb617b69bb.png', '07ba065b583ddeccc04346abe930177b467951cd.png', 'ae011d737f9d4c5ac5c061d6c92906d3fcf199ae.png', 'fe77c84019133ab9c7638d7b18467baa0de2de37.png', '6fdfff0796aa735e7dc518480b603ab8f31e448c.png', '6fdfff0796aa735e7dc518480b603ab8f31e448c.png', '4a6d2cef3c5eaf81889fcfdba8e86e1b01cb8169.png', '4a6d2cef3c5eaf81889fcfdba8e86e1b01cb8169.png', '90b1a27d1ad99f0da5f047f3c316881adfe0e46f.png', 'e53e6029c8e8461b81db0e7beb33def54138dcb1.png', '53f80020b9ad092df7f0fc0f672ef7cf3238d46d.png', '07ba065b583ddeccc04346abe930177b467951cd.png', '9e62e2aa11c55abae021f2ec87cca007857ca8c3.png', 'e7456d1a5c75722990e04cb3062c2bc89d71ab3b.png', '17ac5efd538c3ae4908b3e8aafcfb6f443652f75.png', 'c810e346260981acbfd798538b42e657dd099c2d.jpeg', '332c3e33cfaa688d3e7502ab9ff653472d08b22b.png', '05f5863960e0d50de3e685efdbac6c7895fcd145.svg', 'de828e123b2345b0a3cf85c3474dfbad9438f9ac.svg', '217a2a776a2b295317caf82eaf6b0fdb7c56cc78.svg', '5ac4c719fa2d7e4ba0d94784dcc1675790d4f4f3.svg', '7caa6ad5695521be1e1b70fbea2155f44c3f43f2.svg', '834cc31540e16ba8904ac2c472e476f012c939ed.svg', '915691106a6b1e81602ab4b1b81f65ee720032b4.svg', '945f67f66be299f300560cd9107649dc2de32153.svg', 'a5a4299d2a238071950497234ab8957d08496c14.svg', 'de828e123b2345b0a3cf85c3474dfbad9438f9ac.svg', '80c6800e3d90a158e762ff60d837bbe3f389fa9a.png', 'b319bd9ac21e97119157dc7e204b06e2dbed0365.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'ab951b983dc457c60f099dd6ee230112adb454cf.png', 'b7e77ea11c33f325805b7223499531fcbbda1355.png', '0a4f66a1927abefc12a0256c9ff8e79d76102248.png', '0a4f66a1927abefc12a0256c9ff8e79d76102248.png', '1957cdcb2aaff66fe7d84ad20a09a911a48d0381.png', 'bf421de1987af28444b23884562f32cad35582a1.png', '7111288b32212e17645079f395e98e590b4504f6.png', '3063f793aef73ef6f1b7f19d0cee1496081ffda5.png', 'bb79ac71be284659cd9aa209cf2ccf26b5826096.png', '3d1c4c9c07faf954a1739806124621aae446dc47.png', '4da859fd31bdbe63a63ef17da7982b39b18a9b6a.png', '61dff3504a137bb936584d0e34f3482c3634a8fe.png', '6db4870ccf383633fd0ec233492ad88653c255fd.png', '478aeb0c941ca6c2deff4383cc7dab9be51e5ceb.png', 'cf83f723e64a06dfd7d22f5b8733778fc5cc5f51.png', '98184aac21c2fdf3a21a9865cf146fad97309fc7.png', '214a2834ece7a2052c15cb82c8da60286ebf80cf.png', '93a18d5bd6725c68ae6719b74dc144d4277dfab8.png', 'a0978055414ef8a13fc5b22a76e83614cf19381f.png', 'e06103f19a0a4526495cf02ee2c4216c91c57f78.png', 'e5b403fb5e57b69cb05371dce708156c60a2a13f.png', '02564832cdaa56aa507437df41dd13e1fefbe595.png', '7f12d9ea864c176f2f5dcf0548f5192e86c79e67.png', 'd275297712ac868c7225c59423aec7bbac76a8ed.png', '656c5abffb6803e773f7f4166174e8f2f0a0646c.png', '4a59745f780899028ed8278385c0903147b88f65.png', 'c4b4b90fd9b8e1e1315d13449693401f84041240.png', '87426fa1310546bc52661f6949f357d4d8528de3.png', '3dbc073f56dcf29a3c74adc52c3c9e0863423173.png', 'a372d3de759fba9fea0aa42651b90cd3367ec0e2.png', '8ba9a1c7fe79fdc1624d2769481c3ff6ad505501.png', '004d5d51e040e2c4a11f270c84c52565546ed40a.png', 'b20a059f8f157f0e48bfe7ecaee5d40a38822976.png', '6a9d47bff1d091f5641829ef730c752e47cb1fa5.png', 'f71fe296cc2df5d63d0f15a62bf5144ec0a46ecf.png', '923974534426742fb561e87626d244f8d102a46d.png', '676a5fb254816665fe3cc73f46af8a10085cc533.png', '70b0081f0f36a7de3f2362b0b0aca17c4a17cb2f.png', '0faeb26c6f907159fcdd7be63671c3a8794e9715.png', '010bd9a1372067e0ba8f221d96970a5e7d20601a.png', '534c542b655115da6ac73ac7602e42411cd9dce0.png', 'a5af5a0c454c8d80a346aaa6a2624a2528106fdc.png', '42406d699a143b9c6ad9e7da3035bcc6ff8b0e6d.png', 'cbe0b2104fbd393fd2e4f8e941109a1299dc05f9.png', '187e403b057d06ed5994eb427f7a6ed140bf76f2.png', 'b8e98317cea8ac18bc6cca11269c083e81b7086d.png', '489d2f6dcbd3c6752a8a0460a1d0f51657ec11e2.png', '36556ac30ed00e053410c3a75f6c42314f4f348c.png', '3612148aef6e164000279caffcc323d506c6c8a1.png', '37521922ea42bbbf67622075e1ea51e095f37479.png', '7611383fc5b1e00cf8203424ace9721fd3e123f4.png', '67f2001c4bf9d0a1e30de31bbfdc1e440266d4f5.png', '409f02001597fa0fca625e5b2944191a36ac04bf.png', '54ef5c58e63810b1ae446d7eb4c0a712a619cd97.png', '4178d779a83109cc2809bb0c0bf7edf16e7b33b6.png', 'b803267f608748cfceebd8c59173383510a737b1.png', '20648859dea7f322fa8c346ff4d890247516beac.png', 'a284d5c891f26819b83eb5dc7cf2e4918c8d5f49.png', '98184aac21c2fdf3a21a9865cf146fad97309fc7.png', '1e10c080541ebc2aec4b2e8dc055d66b3468d783.png', '0c5cb6794a494c00353580d505daea2b306880e9.png', '9b8635d5383360d94418c0785ecac627bf2690b1.png', '5051a3681fa62ab6306c0042d753173603ce37f1.png', '23df4f87482e2f5db242cc1ac76660e7b75d0e10.png', '6731ea2cba299721285a1824357747498d08c733.png', 'b7bd7f5d99fdf5cf89ec4cd4478a76814c0f6b27.png', '5b573582c133c63d725827e4420cd59e53ec9e48.png', '70b8d3bdaa05df7352113009f888df338afd38fe.png', 'f553c121920ab21939847db6f513c6a8f87f04e7.png', '1f96a53ec7c930afff82f468b6a0b0bbcc57f708.png', '6995f140756ad6a6bd1095124acebb894678dce5.png', '9b909f5ba085dd5832cada37c515600960dda988.png', '60b8fea2f9c36cc28d4b71f39ada0d288c40e11e.png', '7c7e99c94227fbcfd603eb4fb624acc5b81858d2.png', '96a53c475a1b95beab863d751cb92d11a8895c1b.png', '02c3df3604179073940dd319e1a34914c2e9f262.png', 'ff03e855cab5196ed4da9716a7f7c81eb2154421.png', 'b97b781c22027e0a981d358eac77e5cee63dff1f.svg', 'a7f2ca6ab964e10ef4f2e0255956b89cb8c8b91a.png', 'a9226e3e340383881d01ee280deb0800b4b62f08.svg', '367aa870c45f34cb7a88c9f55f1bc9a7763a931f.png', '5fbe957f36937f6776fb565ea8bae7bdc65a6aa9.svg', 'e8e2be21bb817cde015906a84e95a868d678c1bf.png', '6e97b6fb3b6e4db8bd10c2bad63a40d7ba4b8d05.svg', 'a9cf3cff3b0b81b80da1d084e2912636cfa3f4cc.svg', '465ec3136803b9601d08bd048c42e52e4b2d84fc.svg', '019426ff3be64b230e4a34e20da80ee6bcd4be8e.png', 'dc2d850a1e3c9468b9e7fe4667634e5cf5d9a28e.png', '0ccd323ed80217f092a969b5e09810f9388e35c9.png', 'edeaaacdddbf35bbb472ea7bbea9d4bcfb00fda9.svg', '35874d45b778ecae4d6013a00b068d8ba42c89bb.svg', '89298ea27c13ef8b60ad5e7e283b18f18bbb98f0.svg', '4386ecf4b39630995ebce6c66b6a7194ff7de759.svg', '11e5fa071c2d682bf4d5064bf2c8093c7321505f.svg', '094e62a62ecf6765182797be93c1b5333230e546.svg', 'f7f1cdb6c842a73a4aa3ad357cd62585ba5c851d.svg', '6edba02a209c16820f0f72220e4bb1f30e766b22.svg', '8c841ffd498ecc1421f418837cbee1243233f177.svg', '1abaaf88354b5988e6ddebc1f4bd11554e8aa1dd.svg', 'af47b1ea28f013b204e9625dececb3984efb5769.svg', 'd77c4294cf97100f0646949af7390a18f5b11bba.svg', '4386ecf4b39630995ebce6c66b6a7194ff7de759.svg', '9d31eefbd1a2704cd4a216568500ba92aa7a4eb6.svg', '5c052bee7489cc98c7ffc0767674b818cc4568d1.svg', 'f650a6be96d141fe1826ebb155d22392dfb83cbc.svg', '62755fc4aaa3fb2b2398b27d3656e44266cc36dd.svg', '7d6fb27f44794377a0e65d6e0dbd554f125ee5b2.svg', 'f6e1ae1e94c1a1ddf6f8cfe7b7dd960179fd7e51.svg', 'bd4c836e2437ef889d809d564ddb4e8ac4451f5a.png', 'bd4c836e2437ef889d809d564ddb4e8ac4451f5a.png', '059666ce6faa95cb1482c7d55c6d4e4e5694db48.svg', 'bd4c836e2437ef889d809d564ddb4e8ac4451f5a.png', '059666ce6faa95cb1482c7d55c6d4e4e5694db48.svg', '059666ce6faa95cb1482c7d55c6d4e4e5694db48.svg', 'cda2b905b342a5e5b2ffa0f4ced085273da6a455.png', 'a71832730608000497fb20cebdbe922645c087ba.png', '5344bd592b78972d234c8decee078fbcdbf5a0b6.png', '0345ffba01eae320e6002ae45fa4459d04e81723.png', 'e559cdc261a9cf82d0c4c71e2d1be22a77d625d3.png', '15fcb30b71ae73260231d7bea8f6e8942c3ecbf6.png', '6085dc53ecc5907afdef00b79f6c4bf4bc877bee.png', '3b36ed6068642b61381297ca650e01c4baef6a89.png', '392eccfd0fcfb66bc2e0757c6c7be3d146015107.png', 'ffdecc8207f5c4a28070aeb93eae11991b590f57.png', '445ce981a547d5f226c0f8f1d7ef5ac51331da15.jpg', 'ca887b4106bdc22af1a5f9742e7987f6e17c574d.jpg', '60b152f9bbb5ffdb7fd9fb4fd493ee26085658c2.jpg', '051ac8c00642765f77fb3ce1c07739357c373859.jpg', 'e99cb7bb3e2b8103f22ac54ff58e1a0961f1590d.png', '4ccd83985a015c4ea17f87625bf855eeb82b032d.png', 'a71832730608000497fb20cebdbe922645c087ba.png', '6085dc53ecc5907afdef00b79f6c4bf4bc877bee.png', '5344bd592b78972d234c8decee078fbcdbf5a0b6.png', '15fcb30b71ae73260231d7bea8f6e8942c3ecbf6.png', '0e02da1f42f9c371591bc7596dc40c1d08fdc3f8.png', '0e02da1f42f9c371591bc7596dc40c1d08fdc3f8.png', '2be953066e7a23f8a81b60fe33ab80db49d46aa6.jpg', '61af07e1479ead1b03229a24d514609a29a13f4a.jpg', 'e559cdc261a9cf82d0c4c71e2d1be22a77d625d3.png', '7ac4f118a5885555cea32f355cac1fef564e721c.png', '1b04c0e9287705316258d42c28105f9d68e6284b.png', '31346decb3e41675230bd35543974dd897c3b7ee.jpg', '222c85835c3f703e4597bad8dff27dbe9c90c57a.jpg', 'ccdf73857a819123e7150fd9c889687d4da0ff6c.jpg', 'ba9dfa0592adf60e1733eeef078bfc5088a0eb93.png', '45886b30c9af0ba003403ce41ae5c316cfb58912.jpg', '0345ffba01eae320e6002ae45fa4459d04e81723.png', '23e035bc86f5210f1ff30e61ee8cd59e7f694fa6.svg', '863b26f7d7dd9dd735afd2ee83e0474d6e382519.svg', '6ed832e3e6e1ae8f08e7e885df09c8b724859039.svg', '0a5aff59309c3fcf391162bf5f62a1e1d01f6855.svg', '9ce4215641df48879f2118d47d9aa26ee7fe6791.svg', '950ce86e5df2bd58d397b56bbd48011ad6de6584.svg', '32181279449b522e7e05382d19cea25a34a6afe1.svg', 'cae9110d3919b8d8d581d87a64e4f0f71d9dea0e.svg', '42ecbc460cc662443e9f42e65f16001714d0e200.svg', '48470267881caee392b951da51a5d23d391270eb.svg', '542d195243b83ece91382ef69e77d4e9b1ce5020.svg', '55e972acb807cf22b10f9893dc8508ff4fa4cbf8.svg', '8fb13e04c8f4725eb5caac3fa6a6cdd9a58bd5d2.svg', '170a2405d54e350fa277846a9b521235d6c68bf3.svg', '9622cf29d45bfcb9d2d9610470e5d23d71a644f9.svg', '57c48142e366b84c0e269d7566334cbe257192bb.svg', 'f25258a7c8628a190e1f94298cad5fab7c3aca3c.svg', 'd33183b4562e435608396e52102df04df3738c4e.svg', 'fb1995937c09e2cd8d54ec9ebb7e14ec7a30c65e.svg', 'e9e1ce53060c8b329af54746307ddf11cbfbd0a3.svg', '4830ec9cf793bd1a4ef1ca078290e89ab08ad969.svg', '2339924707a53b605dd24cd7ca1a669b65511051.svg', '40f680b23703f325ec03ea204e0247ce4c5822c1.svg', '4c1208c74a13f9b943a146f00c806964a22d8b27.svg', '544355975cdff20c7f49a1a1cd48ab584bd2535a.svg', '5f4e7712a4d507df355b3a6dac808cf8dd3963c2.svg', '870bffb5fffe80a4e5164e4e489d694ffa7275ad.svg', 'a13a47b45278c3465852e6ba4122f32884cfbe8b.svg', 'f813424f850481f69bd2d885ffba51c1a30fb96e.svg', 'ff8bb4731146ccebb2f74dab4b2d2f0369f9309d.svg', 'af9872bb9d4c0f484da8323148f221e91548e8fb.svg', '0f95829e85f32a90dc05423318715021d093b63a.svg', '48442e12ccc6a20ea37172de6bd5790c5eed6e6c.svg', '61ff585b6c434d44d61352b35d60c6746ca0d3c0.svg', 'a26d63071177601bc9fdb8a0bdf7ab1799fbce3b.svg', 'a60731a7782afd65b66c6876b9df708cd99811fa.svg', 'd016d9e50bc584eee5bd33a95d187ccbb89618df.svg', 'd7b25f7c586e9e88fe9de9da3265af1a1843fad3.svg', 'f3f76e68a101fe46c34aa5e6a953a36844cb8e48.svg', 'fc2706b732b72fa784d3275a1548f7b6cfebcf31.svg', 'b55777ca6f2834db0a7f475f42368e6ab246024b.png', '576df28c1f5f1c0f7ceb6fbb80170bcf1e2ab77f.png', 'f87ad3798388cfb349814e7a9e22a9830ee67bd8.png', 'fd329d520e9903ddb0f949489ed82df60ed416f8.png', '30a64da3109cc6fec226041bb47baa645a307d92.png', 'b55777ca6f2834db0a7f475f42368e6ab246024b.png', '1caafefe839284e4a8c1e7f1d83903e45aca426c.png', '70bd604b59aedda4920d6c73c4b4f73e0ba76aa0.png', 'f51720e7ad6cb83c939af1a3c92ea2de75129648.png', '92fa5293f0471a5f0f04c12d52ab93b3c829752f.png', 'fac8d3fa286ab6fbe6efeaed0765def8a25d6613.png', '726c41d73655beee22c79ddced4617066d9f20a9.png', 'e4da0d482db7cc19dd15dac1c86bf4a9667b01ad.png', 'f8d6c32a7c5fc4baeeaa151a3ea7d55fa7c9d21f.png', '2cf72a5933c2b5611ceb8dbc1e35f08ab5f51ead.png', 'b77a077791facf6a155c829d61b62c98dee07855.png', '30aaca3fea42b65d6fc9a0684a819d8aaf652b89.png', '0d4a539954ce683b7606d5a9a127813d4421dadf.png', '5d97e1688c31118396947cbc0cc47ba47b473731.jpeg', '089ef20019871272988b06ceb51dc6ec41fbd894.png', '15e71fce3dbf6e880e64c96f2bc9c4b09b24628a.jpeg', '8c25576ee9bf5c90a18830cbb1c2c96838763429.png', 'a42446e3269fbb33b19ecf27dd23503fd70bea70.png', '089ef20019871272988b06ceb51dc6ec41fbd894.png', '15e71fce3dbf6e880e64c96f2bc9c4b09b24628a.jpeg', '5d97e1688c31118396947cbc0cc47ba47b473731.jpeg', '8c25576ee9bf5c90a18830cbb1c2c96838763429.png', '5d97e1688c31118396947cbc0cc47ba47b473731.jpeg', '8c25576ee9bf5c90a18830cbb1c2c96838763429.png', '089ef20019871272988b06ceb51dc6ec41fbd894.png', 'a42446e3269fbb33b19ecf27dd23503fd70bea70.png', '8c25576ee9bf5c90a18830cbb1c2c96838763429.png', '8c25576ee9bf5c90a18830cbb1c2c96838763429.png', 'bc987ee14aba34676729861ac23698357386088f.gif', '4b3e02dd5ed5ead14fc22ea3b90cd2e971e08c77.gif', '553db91b3283d399f2e6a1b5914922d5e0e94e8c.gif', '665dd143b353489eb42b57027958616745a7a103.gif', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'bc987ee14aba34676729861ac23698357386088f.gif', 'd0ebfdedde1460fd11305e0eee09796c4bb76431.gif', 'd2ff840c841383c6053779ed5ffa3c925fd2ea5e.gif', '553db91b3283d399f2e6a1b5914922d5e0e94e8c.gif', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'b4e8a6263e99d2d5ef01b7efbb0024a82adc1669.gif', 'b4e8a6263e99d2d5ef01b7efbb0024a82adc1669.gif', 'bfdaee6d238d16cd313ddb646bf5ef642aeed906.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', 'b4e8a6263e99d2d5ef01b7efbb0024a82adc1669.gif', '15e71fce3dbf6e880e64c96f2bc9c4b09b24628a.jpeg', 'b4e8a6263e99d2d5ef01b7efbb0024a82adc1669.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', '553db91b3283d399f2e6a1b5914922d5e0e94e8c.gif', '5d97e1688c31118396947cbc0cc47ba47b473731.jpeg', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'bfdaee6d238d16cd313ddb646bf5ef642aeed906.gif', 'd0ebfdedde1460fd11305e0eee09796c4bb76431.gif', 'd2ff840c841383c6053779ed5ffa3c925fd2ea5e.gif', '553db91b3283d399f2e6a1b5914922d5e0e94e8c.gif', '4b3e02dd5ed5ead14fc22ea3b90cd2e971e08c77.gif', '15e71fce3dbf6e880e64c96f2bc9c4b09b24628a.jpeg', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', '665dd143b353489eb42b57027958616745a7a103.gif', '5d97e1688c31118396947cbc0cc47ba47b473731.jpeg', 'd2ff840c841383c6053779ed5ffa3c925fd2ea5e.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', 'bc987ee14aba34676729861ac23698357386088f.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', '665dd143b353489eb42b57027958616745a7a103.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', 'bc987ee14aba34676729861ac23698357386088f.gif', '553db91b3283d399f2e6a1b5914922d5e0e94e8c.gif', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'bc987ee14aba34676729861ac23698357386088f.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', '553db91b3283d399f2e6a1b5914922d5e0e94e8c.gif', 'bc987ee14aba34676729861ac23698357386088f.gif', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', 'b4e8a6263e99d2d5ef01b7efbb0024a82adc1669.gif', 'bfdaee6d238d16cd313ddb646bf5ef642aeed906.gif', '15e71fce3dbf6e880e64c96f2bc9c4b09b24628a.jpeg', '5d97e1688c31118396947cbc0cc47ba47b473731.jpeg', '089ef20019871272988b06ceb51dc6ec41fbd894.png', '8c25576ee9bf5c90a18830cbb1c2c96838763429.png', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', 'd0ebfdedde1460fd11305e0eee09796c4bb76431.gif', '7402e8fa7fa3d7d6c0807c8867fc63a58a5198c6.png', '15e71fce3dbf6e880e64c96f2bc9c4b09b24628a.jpeg', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', '0268793c08f70960a947db4938064ee500fd2713.png', '2140066e6b77fd5b5fe295f990fb7b5e6dca9d46.png', '26124411d16289bd1e71507ec46a985eac9a6292.png', '2863c9839a9cc3a169998ad5590a5f7d480161c3.png', '3165f0f6808149bb8952e6504a000db245a07cc6.png', '36741168bd21d5d18fe3f4f504437ba5c283b38e.png', '4ebdff9c3159ca41e4a3eaa9c83d313843bc91ad.png', '5c7c9112db7e59de3b912bd32a59a4cf4c1b4fac.png', '629ffee271e992f3368d0e77c7e0f1342008f66b.png', '7b8ea8d6a9fc66d167c51d05e1fc14769cf0d8e5.png', '7da7eb84f2d2c5e59566629d07af7ff7130801c0.png', '859b699c5ac6a142b7d17c16ea00d9c03eb01e2b.png', '9e4d7f30894621c2153ae4b74dfd0a1180df4d9b.png', 'a1801677067c0d19b78141c73ca6e3f726909179.png', 'b3634ad8585898f9affce9c1d13e38ae40aabc2d.png', 'c8d3cb4b91a50742882e762ef66b82c08e23997f.png', 'd550d7c38541cc6f250658d1cbde6b4f70a290ef.png', 'e16d6f66c7ba5918125872fd32dbd78cd298e40d.png', 'ebc65cab833a821bce9fd2a882acc4cb364fe6a9.png', 'ec2fa45762c5482b4f8d779ccb789db05d897948.png', '0a54c523c05b0d8ce3ff1e9a6ea03756b9b3e711.png', '1906928c70f0606c99e4a3ff2f1c7bc067b696c7.png', '21a5dbf0b76e53f1b4099881764584b79fc72af6.png', '39906df8e87dc828f9f4b1f62f76f1f5ec141201.png', '69e2de2ec7418e29b6581771b2562ceb0fc57b40.png', '7052632393790eec27a335d6f1e4b6137267dc39.png', '81ba0cd809b3b4eead16c147700619fb289ed1d1.png', '8e90c40d939420a387dda6e860ff0e6cc1b85fdf.png', 'e0e5ce602f3b87f6b6ecb86beb84852bfb1d06e6.png', 'f324c87ca23fdee77861c6dd60ed53526a220aeb.png', '8bcc182c6a10c4513a1cbb69459bbf26e1671610.png', 'd4f5b5e6fca40f549bc04ae8688d21283a38276e.png', '202873a6ae9911e6ceff2e0b4828bae734fccccb.png', '7b2c173911262768941763334504704fa0ec47ab.png', 'acf234bcd71ff09b6cf24176c5e739e76b2a17e4.png', 'bf4358b88e4676810ec6f7c1a5692ac66049d811.png', 'd2542b945d94c3260c2b768c0eae1711c6059b9a.png', '4d405986bb19887bc375d626f602e05daf3528ea.png', '0b72a2ca0b17df4a65c310acdf8360e0e2aa5cd1.png', '11ef983afadd6303d5927deef4d8fe856070b33e.png', '195c8a9c5db31bb11543581439d74ff7c080613f.png', '6bef6289f6e63310a509f492929e326ab46c4fc7.png', '7901bb6e796008e5e47103e8f3fab20b5fede9bf.png', 'f705a8081a7d35d324c8beae8f0153c2870dc9ef.png', '08843b5a05c78caf675f28446965f9305be2fcce.png', '2c619518d355041744929f0a9add0836fe79d609.png', '383a310a870772ea4d648b3a6bf3d863d6ee8d87.png', '8c0660b83c6c9d3dfbfdf1910909ec188c5e91f9.png', 'a5b68232872a3e078a942f9c298e815b2a92f4e9.png', '059666ce6faa95cb1482c7d55c6d4e4e5694db48.svg', '059666ce6faa95cb1482c7d55c6d4e4e5694db48.svg', '059666ce6faa95cb1482c7d55c6d4e4e5694db48.svg', '059666ce6faa95cb1482c7d55c6d4e4e5694db48.svg', '08c5c88f40b6c79e67f1f2979a0f9cebd3ede982.svg', '08c5c88f40b6c79e67f1f2979a0f9cebd3ede982.svg', '4be661b0443965aa876ece15976f35ed36532bf5.svg', '4be661b0443965aa876ece15976f35ed36532bf5.svg', '5fbe957f36937f6776fb565ea8bae7bdc65a6aa9.svg', '5fbe957f36937f6776fb565ea8bae7bdc65a6aa9.svg', '5fbe957f36937f6776fb565ea8bae7bdc65a6aa9.svg', '98698869886e6884fd8d4dde4530f3bfa5fd0993.svg', '9b36676a4b2f706d941d89b97b34f074522183a4.svg', '9b36676a4b2f706d941d89b97b34f074522183a4.svg', 'c674ef59b19a70f885929caa7b536335bbdbf7fe.svg', 'c674ef59b19a70f885929caa7b536335bbdbf7fe.svg', 'c674ef59b19a70f885929caa7b536335bbdbf7fe.svg', 'c674ef59b19a70f885929caa7b536335bbdbf7fe.svg', 'f01c5017f2de18d821f6fe7641394b75d51e12e8.svg', 'f01c5017f2de18d821f6fe7641394b75d51e12e8.svg', 'f01c5017f2de18d821f6fe7641394b75d51e12e8.svg', 'fa94986ae229fbb56a9cb55a494c069ecf62b194.svg', 'fa94986ae229fbb56a9cb55a494c069ecf62b194.svg', 'fa94986ae229fbb56a9cb55a494c069ecf62b194.svg', '94349aa1c459de9fd3225341e139769950233637.png', '1f2e785eebd6bccf93edcf81e5640d0202ec366a.png', '53cd76d1fb5f4ff26b2404ea0c7b60e00e1449f0.png', '612f7668b16d40503c9a3d6104144bb015b089cc.png', 'aaffc7d959c5dbe424edcc0a7cbd9c8508c5dc63.png', 'c5ef47038edc65bae419fd456c293d8090057d84.png', 'f7342c897ae953130b4f727944e341fb314887e0.png', 'fa6a13aa00e3176bb2f1858c3eca892c4a5ae576.png', '9eae85329c171477d5b0ad9f6714cf0849000f1d.png', 'd0bcecacf39d7e46591796565b72cbe14b0fd6d4.png', 'eef437455bd847dc9b956765ab1144c8d81a0a27.png', 'e925cff008b31cb2e5117dc379c4b77c047a0957.png', '2de963796eba40db39a025268eb6cfdb8dabfd16.png', '715805e02f45991a77b8a382442375d23b3f898e.png', '4f0bdd59e65c207b4e12603e74fb806d74be3605.png', '473713b681dd18a14f6d4894909159c9cd7fe560.png', '8bcc60fa0b64caa6e6ff597a4573827d51130632.png', '192766f156cd7c83a7d99c85d2fc010521c93e1d.png', '13a693514cb391456210a2e0bde110cd62592433.png', '862ae1db846a074150006b89453acb76dfcd76e4.png', '95e149c0a02bae0efa75818e3ce2bf41af00b5ea.png', 'bcbad87960d7cbf27a558dee0a90224c158c2ffc.png', 'fe6aa4e51f6254ba427161b49c8e6286c9529798.png', '2145a50f03ebb9547f20b80d82083eb2cf2c32ad.png', '31a1cd77a69b23c2ac95e7dc336a3353944ce914.png', '755240b8081ba7b168fefd01be7162691f0e0c1d.png', '7ddc2fe8e86428c48360f77440c37c24cd6874af.png', '7ec488691bea069996b91b68301e3feecd3ca08a.png', '8fd6ae032184fb88aecf2751073f51f2fd1ced0b.png', '40952f0f1efdb106116a7a84089529dc4aa4b049.png', '088ae3a3c0efe6024be6238f517ecc6ea94cf04e.png', '38e5e847b7a96e6c6e8e6edcd70989b552eedd95.png', 'f8a905cf91c1ff0bc86a7b37679dd4ea184cce81.png', 'cfa1af96b07aa1a83e46097f7f4552e75a61c363.png', '7606239a774f33fc6d9f2042b9a601496cb79d39.png', '9a5cc59509ee7b1c1c1ffa89bad041e4d83d741b.png', '6ba22e69bb6b094be474209865208f90493a4af5.png', '1425d7264630248aca4ba3c14d4e21e30112a02c.png', '1db72a6decd8c6dd7fd8e9460f4e4c0e4460e8ff.png', '5046532cd0e8b07446c3e1e6ef2600a224e7a8ca.png', '26e902bbc16a1e7b34361d6315ab9e14c0d6ea82.png', 'fbe28dc8041df6e5994371f8bacb43a047fd7bdf.png', '3c0d0975389b5436ca6b738034aac0feb64f158e.png', '7fd907ef5905ac4ff676c1d0e723de02ee14605f.png', '4aef7aab7f5aed0324547104bbd5a573d6b069d2.png', 'a31d5819c9ada7313f59f3487c7032c240384cce.png', '67a7cec311e1b82a64ed0eb981adf7f0fa643b17.png', 'e0631ad25d385b2e6481f29ea0075f5550996c2e.png', 'fe462d2368bd5fb5a44331f6bf1f95e44175515a.png', 'e7228312f9bff8e726fea47b068f1172785c979c.png', 'da9729d81bbbfb51eef5a2c903384cbf2c000d36.png', 'cfb7883359db05939cb18c85fa874c33e03af7c4.png', 'fc1537d66f83e9ba0dd4ed7d71602f783c796d7c.png', '20252e603f772b4f746d87e85a7c5b846eacc608.png', '09aa7e938acb92f7d5b514de26c1c7804bfbe0ba.png', '1d0d982fcc329dc1ed42aaf1b9372a7a856ef701.png', 'af0113da2b330aa245c860eb55fc7e039f903b69.png', 'b9103ee74a6d1594bb80a8cc339eb355ff39a8f3.png', 'b5293e2e9f6c605e37aa8794d09dee0c5ce3ebfd.png', 'aced4ab1cb8ee7b78915b6f759078ffeec7fa881.png', 'f53042fe2face358313d61d26e27243419e7cf74.png', '62ba156cd2b442b191747bfaeb385b17404d64da.png', 'd54fc759bd7a1d82ff23a2e0bf000160e1844d08.png', 'b44cf85daa05db48fc94810ab8f1562c3d4139a3.png', '986ba97bd9606f9a2b556b13c45836c3304bf052.png', '5c40d31ea7b76c9a85197492cc497176ee74cce2.svg', 'ba69784da603e78eede7b8f2d8f6f75fbc93af77.svg', '2b38d9afce5d61ece28d3e1cd3a5077a223abb49.svg', '31cd5b3e672b347b6c6f6510f84ad4c1a53d33ea.svg', '5c093a4685ed3307045cabc81d4246f2dc5aba58.svg', '799b323054340c25e3a4b655b16b3e749867f20c.svg', 'cd7cca704820f792aa02b31d60c8a396c7a7a8ff.svg', 'd966173089848b5a3e5d04ab2d41d80d50ab5b39.svg', 'c75014c3f97791f189eed2ccc0230e175b69def0.svg', 'f95948b073e5b71ecaced19c089b4a5a3d5a074e.svg', '79bfd46b548a0a079295a2ed6e4f8833269795d5.svg', 'fcc9f05756b1fb5b1c72dcab704729531c7aacbb.svg', '467ad5aa8668ba20dbfe0b8e4211669037eb8de6.svg', 'a028ad50cd79e0cd66cbcd716e081b179a83638a.svg', '14ef86d12a0ca6e7142c9f1773bde3e659747faa.svg', 'cba392ab32efa57c68ad294a00707b5b5503301d.svg', 'b324b028e3f2a6d1e421153dd26b7a0404e654b8.svg', 'de3736c4bce4c78969079f7b8054f5ea97f51e55.svg', '4922ec25639c741f54e17b92ffd7cfc11da0fe58.svg', '2aeaa8315bce97ff350447b6f5115ddcda5da2fb.svg', '277a70d6a6f33a9e4f25d1a7ed5fae8440a44507.svg', '3b3b937a65846aa0295ff2010d30f2500bdd8153.svg', '5d1c934693d52d379938cd7eaa43f11155088404.svg', '6896a4206ededf1b0459ec70a162fc4758b54eba.svg', '72f707f2ac2d774a113456d09475d8377410f99b.svg', '04bfaacd1c8ecb719bc28269ba2595f58ecb7cb4.svg', '0a07d192d73b608cd0753e35c5876e9a09537970.svg', '180e6e7efc6a88204471ad672e7ce9684e469d88.svg', '41dbe22e2d8aa0eb4356195d634c3219dc7142c9.svg', '46345bcef16886d90a92580242d82f720259c70c.svg', '5fc4dbab31ae77cc3dc9c5d072c7714ec16a1d6e.svg', '77b17847e77ecc93304775cc3c33b6e4e9386a34.svg', 'cb4bef81ba4ba26f4bf52ac3a459ab3c174e135c.svg', 'dd297442d780a33c366f9912fc5e075f6c9b9e3a.svg', '273718e54cb56d9faa05b477df3e4672a9b35712.png', '5ac4c719fa2d7e4ba0d94784dcc1675790d4f4f3.svg', '962bfc1a7f47bbd0cc868b63e92675cf54c04111.svg', '9b36676a4b2f706d941d89b97b34f074522183a4.svg', 'b1a77ad9a376b3ac0dc47de9b7b326c5ea91b916.png', 'edef84619ef0db1724be6003d0b845b12a7a5740.svg', 'f01c5017f2de18d821f6fe7641394b75d51e12e8.svg', '4a9a6a5c42e8c20b62085a3e754ba334d07e69b1.svg', '0d57b22df595dddc83a38119dcb4faf32076f43b.svg', '8c496303a26802a41336ddb733acdb74aa3e943e.svg', '08c5c88f40b6c79e67f1f2979a0f9cebd3ede982.svg', '08c5c88f40b6c79e67f1f2979a0f9cebd3ede982.svg', '51d0456c64cbf524266c58362f44b91aaf49a2cf.svg', '51d0456c64cbf524266c58362f44b91aaf49a2cf.svg', '51d0456c64cbf524266c58362f44b91aaf49a2cf.svg', '71b5d8a1f9604adab2cd9676043821c4f84fd10e.svg', '777ee838120c479da55cf280f15145e722577e95.svg', '80ed2ea5ba937c3f83b0125b77808633a9959f40.svg', '80ed2ea5ba937c3f83b0125b77808633a9959f40.svg', '962bfc1a7f47bbd0cc868b63e92675cf54c04111.svg', 'ab2f1606e019b85d0e49e8fa50ab747b0bc8bd51.svg', 'b97b781c22027e0a981d358eac77e5cee63dff1f.svg', 'd7c48078d188db3053fc5fb34289cb963c5cfc44.svg', 'd7c48078d188db3053fc5fb34289cb963c5cfc44.svg', 'd7c48078d188db3053fc5fb34289cb963c5cfc44.svg', 'ee017ba64a0b99ee96d135354ac13847922933cb.png', '5dfc8439d69dd77389a177fa2ad3b15f7dd7d2c3.svg', 'f521b5da982f902428d65116554372a8af1f6f79.svg', '6edba02a209c16820f0f72220e4bb1f30e766b22.svg', '6edba02a209c16820f0f72220e4bb1f30e766b22.svg', '86743f1d572742b0146ee97764b425462b3678bd.svg', '80ed2ea5ba937c3f83b0125b77808633a9959f40.svg', '11a8ad21f24cdc9cf5c8d981efca67da1bea49ea.svg', '34a448332ebd1515364999919ae1b646aaebba0f.svg', 'adf68f0e86870213c0cef8f0daa249874db6a1bf.svg', '04bfaacd1c8ecb719bc28269ba2595f58ecb7cb4.svg', '5fc4dbab31ae77cc3dc9c5d072c7714ec16a1d6e.svg', '1def4cb25785611adfdd59f8f1d19c65fa1447f6.svg', 'be2328adf371678676053c10ef79407eb60c98f4.svg', '974c0022d66a765692c30661a30119b6524b9b69.svg', '06c22df85ded377c9ed3e7c8660e9dd376878395.svg', '41dbe22e2d8aa0eb4356195d634c3219dc7142c9.svg', 'f9bf12ff860610b1fd432781c23d4a60e3ce2db5.png', '0ea03d8875ff4005b943c8b9f72c864deff598bb.png', 'c5be1c62031630efa7a9cbb61e30b23118321f9c.png', 'a421c5a61fa9808fdf9fa49fbdec365b8860fd80.png', 'b696c0a528c84f3356369856bffbda9c693f914c.png', '9f4de5acb9b5f5d40a391d8af667d16e415110ce.svg', 'e93a211a5ceca49062c96d9d6ef598fb8c263d21.jpg', '73c125294b1ca98ea39ee0bec73c267986bf00d0.jpg', '4ec61df789430f02118e0d3c5f72cbe00468e09f.jpg', '3b6a8ae26e543d24b4cb417c1ea3ec040601b6fb.jpg', '97c7374d88088db4c578b0dcda229c740d4618e4.jpg', '5364dbb0470b4475fade72d3264b911f2e4baaa4.jpg', '972cedd03548f1a3487c7790b869e9f3704fd7bd.jpg', '33c14605af39b0ab97b26418ea40fb08f2d42b8b.jpg', 'bfe75572496a31a84adffb8e0807626cee5a4f09.jpg', '2d7fd0eb7a5a44473cad2079808358ded0426566.jpg', '61f8d2590d39f446c50055bd1b7a6c85b573c7ec.jpg', '1a3cb0183191e68cb0b466e948930783bfde4f46.jpg', '94ccb855a5e2e97e8252ca1f997e63be8b570fe5.jpg', 'df52e2717e71fb1de97b7f75032817ba8e23c740.jpg', 'dde493b78b9cc43ff8e74812fee4a813865737dc.jpg', '8a5eff014dd18daa44fc7169a696e3fbb0ae4530.jpg', '65ad26f6e1ffbe18cb2f8af541350bf0f54f81ee.jpg', 'c9c7c8ca4f7cacc8e9953145de6061b841fcde12.jpg', 'ac7851d264fbd84416143636ee470a03b87ea831.jpg', '459add50193a3c073f85dbbd02e796d809bd953d.jpg', 'd139bc8e13b6d4b51ecb5417f73437bcf6c85046.jpg', '37a58922d96fbbc343a9e5e5ac49bb23f8f705b0.jpg', '678e50d43659e2e5c91b284ad7bbe070bc70916e.jpg', '57896df7bbca837ed865db5dd37c9f66b03c4ecc.jpg', '5348196597678f46bba96c8d4788c8997387d827.jpg', '06a7674d6c395f47951f8e54b9708c31042eae43.jpg', 'e649627296ec96c6d3dcc372fb7383ad5a12ad4d.jpg', 'd19a93a579c6fb8eaf317221e9e46c65f6a8128c.jpg', 'a69f3e23fbccdef405936e3f4c80f70939a82872.jpg', '84cdfd28ca487a5a47b7fd1175e2a96216922307.jpg', '047dbe33cc2338c088b7b9786b9680f5c35c0f72.jpg', '15be61f20b4ade2f5324c6d670ab7c32fd7a11ef.jpg', '48eb123460572e24cb13d48eb46cd3c8978ce17f.jpg', '22d6a1dfa862a501a05975f67a312d7a1a93528a.jpg', 'c201872ce16d4bbac56c6977c955432ec8e7a460.jpg', '27c03a7f79451293c47fd0ffd37dd06c187f7b37.jpg', '8ff1faeb56ebdf96793f504a2914f24520429ac4.jpg', '1b56478ff0ad9c1a3318a34502d6083ef80eca98.jpg', '4ee4ffaabf687db9e13480ea8c7a13d34641e78c.jpg', '1f30107eb3124ce9102258a049b7bc489c1eb7cf.jpg', 'a4cac271bb638144f613e884e0c7fd79d72a95cd.png', 'fdb02d1b2f336c890789e3c7d4c2e7ff4fcadac9.png', '1c0ee705d5c3476958daef9078742aeb2bad515d.png', '2e316330a574994a95633569c59541340cb5dc70.png', '32b89ddde64088d834ea034efbaa6680f70399b7.png', '5682afccc9afb2c6fe29b215e704c3867837cbe3.png', '79e8f473d6ccc6cd204a7750e189d72d9c168418.png', '9aac1cbc1e5a33c3f30b3639b9b9e1cb68ac9dce.png', 'a11d4a68e32da8c697d34f5d90985daa69e7792b.png', 'b9e8bbb879f06208934e493bcccf825b2e29dda1.png', 'bcd190643c3618a7ecf3577963bb5785a069dc25.png', 'cc4c84272475d54a069e0ce68085ed997ff1ce2e.png', '14f5a3897ccb0625dbcc1df8bc3b34e28e3ef0e7.png', '492f57d50d19f2d3646870b068b98890d5011bf5.png', '5b0a442cd5f441188c53a5d15117ba1225b88043.png', '9de47377bfa014eb4c357d535bb4a87600b62758.png', 'a8822efa4225799374fb1b2e6e30e050b131db0a.png', 'afe80afa0cad04a81e45b86989b403cb05681531.png', 'dab4bdebc084e4e482dd35dec6029307f7e6fef0.png', 'e29f7ce52c85328991f99fe5b8a11224254d1f04.png', '430de70ba513bbd45fbdabc3e09fccb772293229.png', 'bc6f41b6af9177a70fe0f5d6d67ed1ed24f7d9ef.png', 'f7b3275b49319417527a09f9fabc36b15474108f.png', '5e258c6075d2354bd0a62eeaec514764a8a13f6c.png', '5e258c6075d2354bd0a62eeaec514764a8a13f6c.png', '048500617594b1b28a4ee0b531b6a788a0b6ecc2.png', '048500617594b1b28a4ee0b531b6a788a0b6ecc2.png', '716a91ca45913f98059420fce419dbf15e7363b4.png', '981c26c8ace4b1f9116bfcfea50d2d48fd58ba6a.png', 'e2ac5bed6b7cc09b9aa1719db22e78e2e23851d6.png', 'ac3b313a333df554d8803b00b8446adaf7f7bc7e.png', 'e266b3e01cd2a635c8152f4f39edf538d7dbcd6d.png', '75c77ad94de4ebe92e216fe6a395e3b0b9562cd5.png', '019e98334fc79de8252dde1a0e3c92c8a0062e20.png', '1086f8a3ba62a0c708a5d7beee944d7da79bb168.png', '236b0414ed41e372efdf068cf3df3e8dba901c65.png', '2387d9de01ed4a70f1a527eb7bd58843e2da33c3.png', '25a9b4f27101d5cd2ddace31a48fa70265295db7.png', 'aedc564d38f21720ba6fc8f8d9c2bf722601a431.png', '129151fa16ef51dadbf4da97f1dfb13891863277.png', '8ab1572a24d4bce645a26af500b5a86687d2a2ca.png', '195dc148a1a810ea5aabd82c761506137902688c.png', 'a41f20666062887c57ba6cf6a23a953469d90276.png', '83e9b2ad253bbb170da4f2e29ba902317f93e591.png', 'fb46f651e778cde8ef65a8c7e8608f7d12038471.png', '113743e1c6708a1f4dd64da1aac28fff985e8c89.png', '6953ab5ade1c7086cb52455bde18e00f31abd596.png', 'a231a7a9a758c2f9d9814b17fe2b8f77cb6e9dd1.png', 'fcbf0d43889f8373f2d1fd20c2ff6f996b4f246b.png', '77924bc2dbc286e87e81ee35d2cc0f85c488f395.png', '0f0021a22072f393e42c8fabb7c0f7431161047b.png', 'ccdfa266d186ae9a09628f6d77d0c71360bb482f.png', '275678978891d8b6d8e07d19b0d3e7e0579d733d.jpg', 'fe2348220abbf7109fc773cfa054bf678c1714f2.png', '3a49a113b7141bec63321d055771ccd78ff29f9e.png', 'f3722a8acab395e5b10a8abd100b2bd4d9c54e23.png', '81c3dc338856c0ac1fffdd778a11815cf0371bc2.png', 'a0ece17e47b9bbcc8ff5a1c99d3a121f2a15a3dd.png', 'f5200544e40656606f25141973492082de42c628.png', '46e37098d1424b9fb94ea84e8f630fe75ee41a6b.png', 'def0554bde57e24a669dad762e26b66cfef4c3c5.png', '04b1ca8fc94ed6703bb6b5aa7e84b4eaed89023d.png', 'd80a9dcba0075f5e2513fb2c4fcee9f9d32a1e6a.png', 'c1a8ab751c65533b36ec262b26df7357d253b486.png', '6a786a1c51e5564969c3a4723d7d4b2a220016a0.png', 'aa24419ffe772b2f575a5d07cf1fad51726a6c57.png', '03586014c9e24fc07f806591991262871b20fe6f.png', 'ab018e9e09a46960747a3038ded850c3f0ba9483.png', 'f3e0d2d49e30064a4d1c734554d60449904ae31d.png', 'd6ca8af795484707ac448d33eeabb6255dc8150e.png', 'c71357453e1d6575a69d8ff42ad1e15eb6cf91bf.svg', 'a7f2ca6ab964e10ef4f2e0255956b89cb8c8b91a.png', '3f94d3e28ddf2f1cb4308fc529e2680f0da72d69.svg', 'cda2b905b342a5e5b2ffa0f4ced085273da6a455.png', '0ccd323ed80217f092a969b5e09810f9388e35c9.png', '34fb162801da3d9944bb6d1a922c56b835ddeea7.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', '9d31eefbd1a2704cd4a216568500ba92aa7a4eb6.svg', '8f565efa7638f37ef680ffc2cb1803bfaca6004c.svg', '4736df7e52ef14587ab0535233435c3ecf9cd957.svg', '367aa870c45f34cb7a88c9f55f1bc9a7763a931f.png', '6e97b6fb3b6e4db8bd10c2bad63a40d7ba4b8d05.svg', 'f9298f05194a2624ac972dd399351b50a09ac6e7.svg', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'b295f279a4a36716d3fa3ccab3597978eab9c773.png', 'e2f2a2e295b7784c54e4aa33290883b8fa9d5890.png', 'b88701b858d093261a223356b7a8f978bd7a1a56.png', '541e3fb688d9e1fdec9318c87eda9de936a2681b.png', '67e73c973a21347a67513169dd3e5cf8c41ddd5b.png', 'e0751f682f32afe0d2d84c2a9f149c789c858d95.jpeg', 'e0751f682f32afe0d2d84c2a9f149c789c858d95.jpeg', '6efc324af318b2797a60e7d39a57e592bebc0687.png', '6efc324af318b2797a60e7d39a57e592bebc0687.png', '2fa9d47d6fd69fd9fa97f500676feb06e0398071.gif', 'f952a907df5337a131bfb15a31b2fed80036951e.jpeg', 'd3265cbd45753d559cef9210bd55af270c973496.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', '67ecfe3b414a62fc89fbc78ea08d41a0db3cca3a.png', '6eb6ae8a550a486d7bc54467d61a3ef8f2bf1ae3.png', '67ecfe3b414a62fc89fbc78ea08d41a0db3cca3a.png', '6eb6ae8a550a486d7bc54467d61a3ef8f2bf1ae3.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', '7fb2b7707231a7e6c19b6a1670fbfa4d99d4a4ec.png', 'd3265cbd45753d559cef9210bd55af270c973496.png', '6f8c0ed0fee1a3783854e58abaaa8badf3437707.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', '6f8c0ed0fee1a3783854e58abaaa8badf3437707.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', 'c81063afd9359ada5068b3fb3971accedc367b6a.png', 'c81063afd9359ada5068b3fb3971accedc367b6a.png', '6f8c0ed0fee1a3783854e58abaaa8badf3437707.png', '6f8c0ed0fee1a3783854e58abaaa8badf3437707.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', 'd3265cbd45753d559cef9210bd55af270c973496.png', 'bff5671d6cf4b58ef2aba73963542c9aa6e8481b.png', 'bff5671d6cf4b58ef2aba73963542c9aa6e8481b.png', '6eb6ae8a550a486d7bc54467d61a3ef8f2bf1ae3.png', '6eb6ae8a550a486d7bc54467d61a3ef8f2bf1ae3.png', 'd3265cbd45753d559cef9210bd55af270c973496.png', '16ee48f78ee6eb323814b65d993bedaebda840de.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', '6efc324af318b2797a60e7d39a57e592bebc0687.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', '286a1d18cd5d130ed1875b1f6f0f69e488475224.png', '7a390ead1587295415da1970fa2e6a1c4349f622.png', '2df9f849f49d837e5b92a4cb6c16744d4def56c5.png', '67ecfe3b414a62fc89fbc78ea08d41a0db3cca3a.png', '67ecfe3b414a62fc89fbc78ea08d41a0db3cca3a.png', 'd3265cbd45753d559cef9210bd55af270c973496.png', '67ecfe3b414a62fc89fbc78ea08d41a0db3cca3a.png', '67ecfe3b414a62fc89fbc78ea08d41a0db3cca3a.png', 'd3265cbd45753d559cef9210bd55af270c973496.png', 'd3265cbd45753d559cef9210bd55af270c973496.png', '67ecfe3b414a62fc89fbc78ea08d41a0db3cca3a.png', '6eb6ae8a550a486d7bc54467d61a3ef8f2bf1ae3.png', '6eb6ae8a550a486d7bc54467d61a3ef8f2bf1ae3.png', '6f8c0ed0fee1a3783854e58abaaa8badf3437707.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', 'c236496922dcad6d3dbc9c7966451a122232f942.png', 'a9fc4d886be79b0fc2ab6ff95e10d28899c089ad.png', '6f8c0ed0fee1a3783854e58abaaa8badf3437707.png', '6eb6ae8a550a486d7bc54467d61a3ef8f2bf1ae3.png', 'a87ace7ab5466ca781c73c6949411f19c03d9309.png', '0c2fa61532c26b2c9607ff2b9149ff228c1bb3eb.png', '4f2ab762706e0ec58f2b7be91deb471e869ddeea.png', '49a9d047d65baabef7454716bd574304958d7f5a.png', '2ebb644ad87481fc40403f95a8b34e3863d1f694.png', '9e0b9024dbe86500e51a14dcbd04c7097c8eefbb.png', '38c7b0e94c063a507bcd35c8529761d0bb668966.png', 'a93a28ac1bb01dbe96354bbee6d1cb40e0082c23.png', '18f9a5363dbe67d324af64ca3a488a078a269103.png', 'bc1c8c484bcb62d917f9f217ad0bbf10fcd20257.png', '31c1ed6d85c95cf907a6d74c8aba14fc1b6605c9.png', '5c473da53d0d8f02fc44637456f29b7ed0227aec.png', '2a06ed69245d196990ddb7c9e0f3c96aecaac77d.png', '909d5192e7d0c409453a15566c019b33501cf041.png', '052f8635f50828f3517090c5f1ae158d1d8c228c.png', '90b532f1b04e00601a6381650746f6d963d9c1c8.png', 'ab53a8ffc88d4adb41649573c86855571be6c7d3.png', 'e9ccc466312ca69b86f6bc03eb8afb52584ae160.png', '4fdcacf7997885cdcdde5f17dea6ba8c9b9e24e7.png', '55748d301e674498ccff32df7cae46ab6da4c944.png', '75553e35a11421e349c70dec141f56da5255e2d1.png', '47d8abf9f39d6281f18d4e8c044f61d40623122b.png', '58b208476fedd14d8e4f003cec3431894ef4817f.png', '9c494be3f11753a7073e4d29688a634e3ef8faef.png', '3563b98b6f89bbd5ecf674af6293775728bb0b4c.png', '0b23be6610bc3d9fcf9ec19eabefdbe668c2e3f4.png', 'a4fee2390a706dfab1cd1d2d5d7cea14e5dbe9bb.png', '2875f6cdd7dea3db2fef714b1225366c7250c49d.png', '4d00d80cf57c56424fc58ae03ccb6860866b5dd3.png', '39e716fc225d268001cbad780fb4dfd4344b2487.png', '122fcb0ea525668f4dc7be36236f67e3377edc5c.png', 'c8206e51a61e1a1a6b0161a0eb16d2b9db3ddcdf.jpg', '00ada6e845ae581f1e460571255f547b029ecb2d.jpg', '01529d710019963a40ed366cf66875bb2ad3e957.png', '01529d710019963a40ed366cf66875bb2ad3e957.png', '05af2674617433533638c129464f256045114ab2.png', '05af2674617433533638c129464f256045114ab2.png', '0654619984860c721c0f4534b5536177cef044af.png', '0ecc013f55caf98a8dbde4a0e8b754c3aef02c21.png', '0fbcf9a1711ea3cff1bf60c75e9c79cb4f7ebfba.png', '0fbcf9a1711ea3cff1bf60c75e9c79cb4f7ebfba.png', '122fcb0ea525668f4dc7be36236f67e3377edc5c.png', '183877d9b68b9ea42c1eb13fd02301aabadaabf2.png', '183877d9b68b9ea42c1eb13fd02301aabadaabf2.png', '287ed463aa329d693514b23f2d5a997f30c716b5.png', '48ab85ca2ca27606a42ee51ffdfb3f267d003d7c.png', '48ab85ca2ca27606a42ee51ffdfb3f267d003d7c.png', '544109191654b3294bfa152be1e2a087a92d7bea.png', '56978a5bce77e6c22e7a4ec4622069e1058acfb6.png', '61b8108ae85692ef1d67763b9116464ebfd6bd21.png', '6bf0b1459577ce6f00546f30d38aa2eb59a62831.png', '6bf0b1459577ce6f00546f30d38aa2eb59a62831.png', '6f5def6d4b8c72f7ddbbfa5b386a23ead4d35265.jpeg', '6f5def6d4b8c72f7ddbbfa5b386a23ead4d35265.jpeg', '73b1413f23bf48aa9b5bd65d6cbf86336d4bb0f5.png', '73b1413f23bf48aa9b5bd65d6cbf86336d4bb0f5.png', '831b9c6242eaac679b0c17230dffa9bd6d444cd0.png', '831b9c6242eaac679b0c17230dffa9bd6d444cd0.png', '9231d5292c9437a7711960a2caa0a9ebaa0df922.png', '9834e0c46e1b1a501704dadd996dd2fddfc81594.png', 'aa91c7d40dfa28b9c55e7343160312577f6faa83.png', 'aa91c7d40dfa28b9c55e7343160312577f6faa83.png', 'aa91c7d40dfa28b9c55e7343160312577f6faa83.png', 'abe852368510c7d02280569a29f39baf46134850.png', 'abe852368510c7d02280569a29f39baf46134850.png', 'cdfedce2072f01d34135be13f0349bde67809300.png', 'cdfedce2072f01d34135be13f0349bde67809300.png', 'd799e4bb3344bdfeea49f19940ebf7ceb3b01871.png', 'dfb18bfa2467ed5e1ffe1a64d335ba7341812fbd.png', 'dfb18bfa2467ed5e1ffe1a64d335ba7341812fbd.png', 'fb85d32ca1cda4dfe5a826bec0a57f513be693c1.png', 'a46939f75555ec95235f021cea960e40bff2cbf5.jpg', '6ab83b412c51a95a8013f4c1bf10d4f10e44ab9e.jpg', '6975797360e6343da91af9a1e968a456bf07dd0a.jpg', '0c2e32611b52f6d27537819b683db07b2f8da607.jpg', '0a578732078ad32fb0666c8e9a1213622fcb82fc.png', '1a5c8e423f4d7c27c289e6e5d72f830850ad70d9.png', '1d158f2a6006a67698fb39e95d707f7ab7f35f96.png', '2e2b5d0f40041d1d6afa07bfe7e1a55e9b25292c.png', '33278793fb2ea5ba25bf062fb356d821e4473d07.png', '394e02b451fb89257fb20c9df573462abe21da4d.png', '61b0b68d9d6295ba88c6eccf590aaae2c1ea90f9.png', '92b70af0be6b20dd2c4f0eba6c498fd29a486a96.png', '9afc8ba694a93708e237a860cfc0afd70af54eed.png', 'c209d95ccbdc2530380b9d0948babb2be0f36ef7.png', 'c23f9743a9d5aa1d4d30af1b429da826c069ed75.png', 'cd72d3d2b8a32b5e8a8973395da1ae61fb52ac8f.png', 'd46a43de8e3570821f6fa0da47beb56f4cad83d1.png', 'd5df30504a57ef7ff2aa3b69b49cd89c7134e2b8.png', 'd788cb299c77cb876f17c8301a6648ff6149cb45.png', 'eeecfa1a026ec6d904a218260d6ab029941eb99e.png', 'fd43dee1a4e62f43abe63f05b15a33d43c7d8254.png', 'ffde5a9e4d29d2549c61dd39d83c0e3d58a9e856.png', '4c3a0c191a3490f5be2a6b51cf47758b1a323479.png', 'e8920c0dd1d3586c325ac8ae6203fe52a57dc220.png', 'cf9074a3cc20878b321927227f787b24a7751c70.png', '7ef359f9e4306067557a24e8962b07b819ec6368.png', 'ea197315518375b093c24a445331174d7a064cbe.png', 'e86161ab3daebc7a43beeb91f475f7380636fe16.png', '7a3fffc767cb155705886fa111c0b03080eb2c4d.png', 'e63104d0bd8f61ac4c22ff6246ae740cd1ddb713.png', '371649e62981c8ca68ca052c08701d59222c1a73.png', '586b8044bb3f41d83df8ce49f883c9c03bbc628c.png', '7d2ca2b712778020dea73bb4c6f72d337ae8fec2.png', 'a0a3f4bd2d9aff08fea1324f0d77118a2aca9e4f.png', '503bc2e35d184b9cdb128edaa7c7746d49934a00.png', '0b755c6d6d5e42df168bc23082b94eb4f636e80b.png', 'b329dfb3183093700a208edd4e7d8eca9d45c129.png', '3c8fbef9732e0319c310a5299f9b575152fb010c.png', 'e40d32a1f0a778e6e2f2be703ff498374900139c.png', 'bcb81452785064ac33f22d1daf6a92f58a4cc76b.png', '4b6835a6ed9f4aca76aa3fe23730da038b4b85e3.png', 'a5b68232872a3e078a942f9c298e815b2a92f4e9.png', 'fd3a41b48c7a6607436c6b668868c5d3fc37531f.jpg', '634bece014baeaf8e59a08b5ede89945dbe52f0e.jpg', 'f7ee2b71e450c5867e6721d1e1a2f2301eaa4f46.jpg', '9a2c72ddca544e3ab1d936674e0906fa4e4ff694.jpg', '988f590804e32851bda0593549f2407f2a2baf5c.jpg', '02859f6e70a0b38334a191d03e43f53dc7125075.jpg', 'b298b235a7ff7d73220e5259495effeacd9901f3.jpg', '8da38095d0e03dfc2523a4eaf6bba520bc384815.jpg', 'a18b98f5c6fc9d4904554446b2355ea36c0e811b.jpg', 'a954c79065fd4da67603802925a7245f19f044a9.jpg', '15b5b03a2314c203cb776b8347b9861ed9af73dc.jpg', 'a738adbd53a68b80c6b8eab9cfb18ec1bc67835a.jpg', '46827da1f9d55cd8087b6f55eee14e71dc4a2409.jpg', '1effad4eb9ad902fcc653cb9005296c4cc05d95e.jpg', '76120ae9e53eb2f894f554550feae0ea453f527f.jpg', 'c02cd5cb6b19dccd325a129b9eb7d43970c81032.jpg', '183877d9b68b9ea42c1eb13fd02301aabadaabf2.png', '01529d710019963a40ed366cf66875bb2ad3e957.png', '0654619984860c721c0f4534b5536177cef044af.png', '831b9c6242eaac679b0c17230dffa9bd6d444cd0.png', 'aa91c7d40dfa28b9c55e7343160312577f6faa83.png', 'fb85d32ca1cda4dfe5a826bec0a57f513be693c1.png', '00ada6e845ae581f1e460571255f547b029ecb2d.jpg', '05af2674617433533638c129464f256045114ab2.png', '56978a5bce77e6c22e7a4ec4622069e1058acfb6.png', '61b8108ae85692ef1d67763b9116464ebfd6bd21.png', '6f5def6d4b8c72f7ddbbfa5b386a23ead4d35265.jpeg', '48ab85ca2ca27606a42ee51ffdfb3f267d003d7c.png', 'c8206e51a61e1a1a6b0161a0eb16d2b9db3ddcdf.jpg', 'cdfedce2072f01d34135be13f0349bde67809300.png', 'd799e4bb3344bdfeea49f19940ebf7ceb3b01871.png', '0ecc013f55caf98a8dbde4a0e8b754c3aef02c21.png', '0fbcf9a1711ea3cff1bf60c75e9c79cb4f7ebfba.png', '287ed463aa329d693514b23f2d5a997f30c716b5.png', '6bf0b1459577ce6f00546f30d38aa2eb59a62831.png', '224e55c4ad2c50559c76233597dc75db02b4bda3.jpg', '048e1b61c4cc140bc053ed32976f1f72cc9fb4b1.jpg', 'c7053d6b0b5fc984df61ef8270f1e0befdec5529.jpg', 'c79d7139a7c92f4f72389f8eec9aaa5b8460f305.jpg', 'f390f4f16d529a6b824713326b5d1aa97308b8fa.jpg', '5084054fec1b6b07c504cf0fa5459a47d484ad2b.jpg', '65e6c897d38b9f3ecd981e6033866f0f20bc73c4.jpg', '0fb790cd5a6d03777d24578686e67294ec5c77d9.jpg', '67d0029c28b561b4e63795b9d6a4fc07365b7b35.jpg', 'a0bae916ad6763870f70572d2bdde3b51c8bc82e.jpg', 'afddcc0c96c14fac85e452c033416b214dba1820.jpg', '4274904de95ef02f54ed6f8d7bc5feb7fdfdb136.jpg', 'a6de29149759aded092c32dc798b704e45143830.jpg', '717ea9dac27150e887bfabf882a713926c95b8d4.jpg', '36b8f20cbc7c29c46125bb59e7a8f61deb392722.jpg', '4e490756f5743d694b680b4961629e298d8b4357.jpg', '527eabda363546ece9aeefdbcb77b6ab9f9e5516.jpg', '48ab85ca2ca27606a42ee51ffdfb3f267d003d7c.png', 'd799e4bb3344bdfeea49f19940ebf7ceb3b01871.png', '89b44d9cef2fdc41a0439e7ce829f0872efa80ca.png', '335cbeaf2267fb37b10ca9804d573159f44f4d10.png', '01529d710019963a40ed366cf66875bb2ad3e957.png', '335cbeaf2267fb37b10ca9804d573159f44f4d10.png', '89b44d9cef2fdc41a0439e7ce829f0872efa80ca.png', '48ab85ca2ca27606a42ee51ffdfb3f267d003d7c.png', 'd799e4bb3344bdfeea49f19940ebf7ceb3b01871.png', '01529d710019963a40ed366cf66875bb2ad3e957.png', '4f2ab762706e0ec58f2b7be91deb471e869ddeea.png', '0c2fa61532c26b2c9607ff2b9149ff228c1bb3eb.png', 'e0c5463932184804b2dd82fab8cdd253d3ea7843.png', '43e70b4f1fa1135270ad9e7db0018af881e788b2.png', '9a21ee42826d3b2020522fbbf65cc4d47b951c60.png', '619f35c5ed2151b589203c05c027203ccb1ca79e.png', '680eb2efb86cf7e2641c05da65a64b9a45b5cc0f.png', '91319889690632d02490f789ec8af5741ebce099.png', '048d3cf7fa7690b1a6bbd08102b79025ed1dfa91.png', 'ab8edd20ac39ba03f928a488717205764a0c6bf7.png', 'c67ed8861c3cb72b86985c277feb118f5dfdad8e.png', '47817f8930b2eb9fd0ec82d972de87666e38a3a8.jpeg', 'e14326ccd5e1d70a897e1fdc54f6caa887127699.jpg', 'e6d100408c92662730a002d41ef85142616f440d.jpeg', 'c6b931675b17ab72f791505656e74fa0e9a32099.jpeg', 'a48ea44dc7ec3d02b9b0f0d7efe3b3107b2ba111.jpeg', 'c79d7139a7c92f4f72389f8eec9aaa5b8460f305.jpg', '8e9cf046d8c575aab4bca3dfd9feb6acdbc35ad0.jpg', '7c998e008273c2f13315f3703084cfec0a007a5f.jpeg', '6fc2716be94b973a307850311025cdab86466ced.jpeg', '26eabc5af61c03ee7d7724d7c0f9525e723865c4.jpeg', '9fbbbfaf00b63e6aa6e5e32e44950c8ba107eba5.jpeg', 'a45fdc3719cfe6895e5fbbfc21c16d84506900cf.jpeg', '294f7614977de8511d6c41ddf8f9ec535e8fa9f7.jpeg', '450c467561b8288dbaba05123b29ab5c19da0087.jpeg', 'c6b931675b17ab72f791505656e74fa0e9a32099.jpeg', 'a61e0d256123ce3b73f5b36dbb6fedaae2080744.png', 'dd130bb7d682d24bb0099ed0053eb576b6d8f6cb.jpg', '8e9cf046d8c575aab4bca3dfd9feb6acdbc35ad0.jpg', '749ffb8867884b4c1d6230c66adab6a5936c4fe7.jpeg', '0e033192b931ea3736cf832e7bd6f3cd72826ce1.jpeg', 'f8c09766337173d5a22f0a259809ac398150c23d.png', '0b23be6610bc3d9fcf9ec19eabefdbe668c2e3f4.png', '7eb6c113a9aa879de0f19b6659b09ddda05b4caf.png', '3eeb9af53b6d7ae240667403d17836b48a454357.png', '7ee9f0e494e28b238f67498dcb15c9c16a60784a.png', 'c93b51602488eae550a455f5f6215a9afe57ea76.png', 'eac8d4080372059b2eb52a9208d8ac3d5d919d75.png', '69b699b9c15bec0ba097b3cc29d25f9792a38a4e.png', '72de591ad1c19c040f17622b61c0d0f1ef5786f3.png', 'f4efdc0699b926a880348c60ca809d8a17a030c9.png', 'c84023f7ef694557567d9b6bc5b3c8f6e2c1d44b.png', '940f5509954af2e6706a800d46a6a68961308a37.png', 'f91f4d19e4c124987f600395c0cad2dc411e8d2d.png', 'f3f0a470394c89cc0b75f0bfe1a7114737435171.png', '1315886b574d24306c10eed37ab461ac42491b03.png', '65cd9e56e1cbafeb4359d51510dd2e8d9daffd2a.png', '67ec169848edb876d14f65ef9658bd9e069c6607.png', '927517e2b3a4e288a4716c01aa1deba22f57b858.png', 'b96376f37fa2cf7d8551acb627aba5ada30f9c3f.png', '954bf40bfd53fcfb5cdeb0587a3de576d1c53acf.png', 'd06991240c6e1af3fff6a04c0775751242fccf25.png', '4368daab28dd15901f19639106646bc60ab3c1e0.png', 'f8a4fe64f3b48d673a2ec798c7071e1c0915f357.png', 'b7418a90323cf00aa11f482305d8bd5e3d070161.png', '88f737476cf0bae1be9d270796aab5a810c4b49b.png', 'a033f33a508c6a07976d5d6c5ea36fa8fcd89d20.png', 'dac0ef18aaf263b121e50c0a47f2ecf51b7aa5f9.png', 'dac0ef18aaf263b121e50c0a47f2ecf51b7aa5f9.png', 'dac0ef18aaf263b121e50c0a47f2ecf51b7aa5f9.png', 'dac0ef18aaf263b121e50c0a47f2ecf51b7aa5f9.png', 'c2347b534facf784601f3c56fb5655d03ae555b3.png', 'c2347b534facf784601f3c56fb5655d03ae555b3.png', 'dac0ef18aaf263b121e50c0a47f2ecf51b7aa5f9.png', 'dac0ef18aaf263b121e50c0a47f2ecf51b7aa5f9.png', 'a071b141e6426bd8addea462583d546b9c08464b.png', 'a071b141e6426bd8addea462583d546b9c08464b.png', '99a1e49cdc91e4b09947757bcb559405ac31bc05.png', 'c3ae22f7ac5552069ce95710a0b2efc1dae80ce1.png', 'c3ae22f7ac5552069ce95710a0b2efc1dae80ce1.png', '99a1e49cdc91e4b09947757bcb559405ac31bc05.png', '99a1e49cdc91e4b09947757bcb559405ac31bc05.png', 'a071b141e6426bd8addea462583d546b9c08464b.png', 'c3ae22f7ac5552069ce95710a0b2efc1dae80ce1.png', 'c3ae22f7ac5552069ce95710a0b2efc1dae80ce1.png', '18d80b305e07c2069e9ce6da748294f0a269f794.png', '8ce99627594fa96ebdbe222a3e87fd04ea872418.png', 'e573b8a631782078518effe52f6ac982fac8618e.png', 'aacffc71bedd42c27880543b6ab3faab13775e17.png', 'ae198229b885308f04c834cbcdfb10544f8f84ac.png', 'c4559bb9060ae154f28c437340bef054953a2be8.png', 'cccb472b247e04db52b034ecb9ad933bee0d52d8.png', 'cf6ae2224fe305f22f6d0ee6f541f4eb645a6d9f.png', 'd0d7ff3240c6b9e37cbe62973ac4c4575271bf22.png', 'ea489f4e65dd68097a17758af4a88878f12120a2.png', '2cb9a718bf4ee71f6f3454c3acc396190cdcfeb6.png', '132ad4d83d4943b880f0afb4798c528c8382d712.png', '4b56082fa274b6712962f0c2a9e9cf5586648949.png', '4b78ae4175a76cffa5f8730f7e05035c56c6a98b.png', '89a43a1338ca249632261d81690cb3e349596c29.png', '688ddc30855b5f951f81bce0616e702c55964eab.png', 'a97b5e37272222e60851158b4ecc205796e455a3.png', 'c2c134e0689b3a561e0215fb614870b26989fe7c.png', '7cdef0d6814bf08202bdb33fe10c9e8c73b95689.png', '0cbde63580f4958410ed415b4989a372f31127cb.png', '0d09cff998af1effb5dc83f6b5fb6940f473c5f5.png', '16619c2d034c1963ab62918cef40e8de7f9a4bad.png', '1e3cda4a201023e0436649fa603813972bfb01a1.png', '23f6bbd08a0b550d62eac01682863ad48982c26c.png', '2e01a00b7b118bdeecad24dc25f8f034365f38ff.png', '41367a991f2e58d6a0c16922f3b384970bfbf5e4.png', '4c16949954971d67de768e67d2db886e4e70af72.png', '4f26300b2e89de268b8e75960aecdbd9ab2e5ed6.png', '60b1c20ffaa13be3c32027298478902fcaed4ef9.png', '646ffac6ec18091a88713d13933e8a3d9fdfde19.png', '6798bc359fef0bf996629d72ec0c1d8baf730a39.png', 'a82bea0ec2aff06b526dc2fb87047201bf0e2e04.png', 'b2d26adc8d1a55bece42ef054a634e4659a79711.png', 'c21fd24c79b875ff862afe970c29f291a0dd7a19.png', 'ce073ed864211ee957287c00464c1ea048597e52.png', 'd1adaf8b3bcb505c329375413456b319f3a8bcaa.png', 'dc2bb7f4a3b35419b029d1de3c7a492d3f8c9e33.png', 'f63cd24c7baa264398e5965bc8cb76c52dc7cc1f.png', 'f873d686a1ec4569ba1bafa1eddd8117cb5afd9b.png', '0d09cff998af1effb5dc83f6b5fb6940f473c5f5.png', '23f6bbd08a0b550d62eac01682863ad48982c26c.png', '2e01a00b7b118bdeecad24dc25f8f034365f38ff.png', '4c16949954971d67de768e67d2db886e4e70af72.png', '4f26300b2e89de268b8e75960aecdbd9ab2e5ed6.png', '6798bc359fef0bf996629d72ec0c1d8baf730a39.png', 'b2d26adc8d1a55bece42ef054a634e4659a79711.png', '99a1e49cdc91e4b09947757bcb559405ac31bc05.png', 'a071b141e6426bd8addea462583d546b9c08464b.png', '498a2d3f3e4e892a2547d960d956cd8b2426d054.png', '498a2d3f3e4e892a2547d960d956cd8b2426d054.png', 'd70177a9d635bda434b899605df27d0f67d75bbb.png', 'd70177a9d635bda434b899605df27d0f67d75bbb.png', '7d6fb27f44794377a0e65d6e0dbd554f125ee5b2.svg', 'b02003f661310990384c7df1818e5d145f4d25a4.svg', 'f6120c7083748cfc6015b097fe88349d5fd052b6.svg', '02e6fd575b03a8915814ffcca988dd64139a1cf8.svg', '08c5c88f40b6c79e67f1f2979a0f9cebd3ede982.svg', '11e5fa071c2d682bf4d5064bf2c8093c7321505f.svg', '3b7b22f3caa2c16a2ea5a300d2cf723bd0468a09.svg', '4ee9320fe5400560a77911138c82cc52d13e7749.svg', '5d0f148142887ef46cfe8d0e744bc18a048b6439.svg', '749ae157852e5cdae786d7909754b5a8cb3a6251.svg', 'c42ada537a0b082e098195e838e5788c1e76b337.svg', 'c46428914a1413ff7a193a826b1efb60e5f48d77.svg', 'c4af8bc5395640a1a2d709c791e282c21fa0f748.svg', 'f01c5017f2de18d821f6fe7641394b75d51e12e8.svg', 'f5db44510470f50372a76d84fe5a0f7c639f227d.svg', 'fb9cd5696ce5ebd01f8ea7f85a0dcf9696509da4.svg', 'fb9cd5696ce5ebd01f8ea7f85a0dcf9696509da4.svg', '3b7b22f3caa2c16a2ea5a300d2cf723bd0468a09.svg', 'cc430de449616236f887ce0050048fd3d461cc72.png', '8e718c7262de2698572d7d090f71927b224ec06e.png', '8b3b1b80f689cedd5d7525f58c5c2831240e165d.svg', 'c3cb8718587a2945e523b075926f2498dff6086a.png', '2dd311239a674ca7076a0aa4ae544edd5344cf31.png', '2208bbdf0c59e31e3ba20be9628ef71cd1c9e5ef.png', '2de9f4773579fcf5f55041ea8bcccd5bf7c290db.png', '37f5df48d286fa20ff7f3c35b4eabb74778416d6.png', '5209a88b4a02089ba9bdced38f4d8aef5b89fba7.png', '8405bea5f10ff0a9e29718b8bbff754657330de6.png', '8c9d238695c85199b4d1018c858759ec74eca6cf.png', 'a1dd914bb5a4d6c46827c945f3047f5b5853bf5c.png', '4f7c25aa2d2c5c45db9883d4202a437001edca0b.png', '2b3be37c5a86ffbd0e09979e92fb171674b263c4.png', '7afadc85a1425ef006b44bee99ce609498547555.png', 'ade44500011601403e63448efd974a28cde58346.png', 'b90358e9dfeab1de7b4edb1fa9af4c9a68fad2fa.png', 'c7dc76e2fcc9912b326cf4b69e31db3802371e2f.png', '83ba3c86a80fed285d8632bc2f466f1263386065.png', 'bfdaee6d238d16cd313ddb646bf5ef642aeed906.gif', '41d2b5e1b33230e7731bcc1aa0a4fc50a633c5d2.gif', '7908c96fa95fa048f1f3b953ccc74ab32afdb205.jpeg', 'a9c115b31dbce5040649f5a9cea693e955fed033.gif', 'd0ebfdedde1460fd11305e0eee09796c4bb76431.gif', 'd1afecbe8f446cd9f4124197c0fce0a7451c64a1.gif', '7ac4f118a5885555cea32f355cac1fef564e721c.png', 'cdd4d326ae7b9fb6e40f03a930a53afe3bcfe21d.jpeg', 'b13ca0ce2e95cd21069652083e018a8c654aafe8.png', '5ac1d9f5c91daf1f9f7c2bcb006c279c70abc72a.png', '1592fae72c6f23e39f9c56e66f1b69afc6ee7b38.jpeg', '64cefc3f6b5daf96934686cbb41ef63b62f74864.jpeg', '64cefc3f6b5daf96934686cbb41ef63b62f74864.jpeg', 'cc68cc7e15f58e2b45917660748665f7337df47a.png', '2dba859d19453e9ed8735bcfd2410abb3d11748f.jpeg', '2022eb7da32159385ddc7f9a1fb9cddd7f2656bf.svg', '2022eb7da32159385ddc7f9a1fb9cddd7f2656bf.svg', '4a7a29fcb6dfbfd4c2d22ac8e3e40d81eec21f21.png', '6a170f3839757fae9ea33580d7e13567cc0e63e8.png', '5f38d5460b81036876dd3b0ea534d8420417ca1b.png', '1abaaf88354b5988e6ddebc1f4bd11554e8aa1dd.svg', '1abaaf88354b5988e6ddebc1f4bd11554e8aa1dd.svg', '601ef126d4a1f108fbbff8a032dd92152ecf4547.png', 'be66ce6eb13ddb7deac0f0c6bf74711e5db9ead5.png', '73061dce1a077a6033bc720cbb1268e31fb0909c.png', '6ad61cd8976a6cca551b0e2575a5cf41c0d64593.png', '522b436a2ac1e8b97827b47b00fdb6214ead86ef.png', 'c5414655b4c5aea2f4cf3f28ddc35a1f0305f8fd.png', 'b7feb1648a28bb4c45cdab1b36bca6a31638ca89.png', '46184153a705cadcf5261014e74659b9217d1bd9.png', 'c3a89ba9b7ba25fca716b109750f7a1be65ee100.jpg', '72b242dd756dc594e30fb4b75f2ee9741411745d.jpg', '35d41e66d26851653ccd89b2520f93751734e104.jpg', '374cd5e1252b6511fb08fd1e23112085d7506070.png', '3a4a3d95704b36ecb51044705184bc9225a37518.png', '75d940090cacd60d811572c9440515897afc0035.png', '92304d666cbcd0327b33d4bc537f0d4d3476cbb2.png', 'b7fd95ac957f099db11c23adbac63b80514174d1.png', 'd139eaa93d75d2c25fbf882c9a21d353cf404091.png', '67bd5acaaacbebe5572a2feca87947ecaa9c9042.jpg', 'fd5564d15336d32c859beaaf08bdbd426ff7dc76.jpg', '222971e3193ded2936f8993a12e3e99fcea24be0.png', '73655b4bf54b50191f2d50046bb1b59436e51fee.png', '752011fb95810593fc6330887066304fca1b2ed4.png', 'b6fa3b92a8d1663df65f6c1af2f566ef58678fac.png', 'bcac1ed9f78ce393a1c5d3a5d0cadc2132a8ad34.png', '8386d0cc0f4851dd8091ba0d497824fd08eba5e5.gif', 'd7a42a40ac8305e9d791aa817f72a75f1b8e5818.gif', '640aa30720444e705fa541a7b2688a850b48b185.gif', '47dcde4e90ea6e8709091876dffb6cda8e03b1af.gif', '87973ad9759dbba8024b05ba28408cb12f3be1e0.gif', 'a063d5b46834b4004e5d757cfc3186007a8bccb4.gif', '8e275ec8b813162427cf94d29ad22e7b3775a61d.gif', '399bc973773bd55518c0cbab94b9c31bf5597cd3.gif', '7943c345d04934236844782ecaa5d2090e22dc58.gif', '02e6fd575b03a8915814ffcca988dd64139a1cf8.svg', '32070dccb16d88d3de48518d96043bc7def408ae.svg', '3ee9f359d3aa36bbb301a5515f2f44fdb481614d.png', '4efc9c0224759ed9bbff0c32db0b77f3f1247393.svg', '5c052bee7489cc98c7ffc0767674b818cc4568d1.svg', '6e97b6fb3b6e4db8bd10c2bad63a40d7ba4b8d05.svg', '7c831e9706fbcec10db2b8dfe8d0583baed6eeb6.svg', '8b3c9e1ceaa30035d5cd82ef4079bd5f7a400f62.svg', 'a2a8b277e1f433ec9bd0eb0c57b3ee271ab738e6.png', 'a5dc82c0add59c59fddfe7c40d9a27f405980e4c.svg', 'af47b1ea28f013b204e9625dececb3984efb5769.svg', 'af47b1ea28f013b204e9625dececb3984efb5769.svg', 'af47b1ea28f013b204e9625dececb3984efb5769.svg', 'af47b1ea28f013b204e9625dececb3984efb5769.svg', 'bca940aee0aae74fe3cefc25d8bf2e4d66b1c2b2.svg', 'f85e6f1f282c6674e7a02eec63462c8e7d601808.svg', 'd49bd49fd73587797d2ade0e55f6156e000286d5.svg', 'd7c48078d188db3053fc5fb34289cb963c5cfc44.svg', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '5e893cf59960ce23c8030df9419c109de45b558b.png', '895c494cc4520ecbdca32e680df0f97ee54f4320.png', '2b333b07849fcb1449e26ff0a75536d853b0d0de.png', '456c0d8c713dc0b44193a84414f8ebee62d38fcf.svg', '6edba02a209c16820f0f72220e4bb1f30e766b22.svg', '52ac0cdbfbd04764b5bf204e8dd3cf2193db2bf8.png', 'd18a8edb994108d82b594d8414072e9ac8e475b2.png', '6d58d1ecf89168f7e1c4ec101ca305b06ed3ba3c.png', '0e13e60232f6c926e8be593a29988d7ecfceede6.png', '1c9d231b9c8311bcea6ee37ad2c3463900e60efd.png', '247055e743a185857ead55773e6e123630b61eca.png', '33e6734c80432747c597dfd90f2f4cce97110d8d.png', '7f5ce9c9acc0e23e27a8a4cb8cf2273fb324fe0c.png', '011de977997ce8215b1d4628bf70f45c279f5ad3.png', '07da778d14e0fa4094e3605e4a088220a5b2c456.png', '32e6fc636ffb008ab42bd367679d9a15432b442b.png', '558ac498f38e4dbaccb1bd7919e5daa19f877b7d.png', '6e125c3c075b982ad9f4d40d7d8bf86c99af88b4.png', '94385703124e96bf9efcc3b2c7a9087b6858b5cd.png', 'a55ecb0359c41b0fd344427a185a331220e807e7.png', 'f2b92c24d2f153e44aa17fe8c5a5fd52c9baed15.png', 'f4f79a239d7ca573b54bbf0cfff7955af3fbeb4f.png', 'f7c0da5bdf00eed37b7a7b5361bff338092d90a4.png', 'abca95624cbae3dd402e342ff6556e463c8ce458.png', 'd95c878c986e9b27e89b505e04dd202f3e60f90d.png', 'a2f096d0ed3161e3c485ca492e035971fc7a9e03.png', 'bfbaa2013153ee7a900f6ad0dc62c4037aa508fa.png', '1fd5969095306eec42f4b551688524bdf8020058.png', '80da62917db9b697a4107ced706ecd30277ba2fb.png', '90109d1d53d0e7a5975cf2783d77f8e56b613ce0.png', '9994a01c225b8ef46137584b91b13141c9b29996.png', 'ad6324d95e1d7edde5829854ab26a1beac336f2b.png', 'c0dd7c6318470f9f3cd77df1786b31ff4802d53a.png', 'd880c26db31a2981c16a809a6a325d75c7fd7c2b.png', 'e199496d0fc980f85ccd571479001041adbaeb5e.png', '5e2c8bdc02b7997a9bf874c73ecdf3d8e2523fdc.png', '6cafca9e78c43eb5b41cc2bf22ffebc9df9de3d6.png', '713665ed72b90d41eac08996f798db24300b8988.png', '83c05df5e16f8d76a94c5226f3b50454b0af72fc.png', 'b98237244b94059b6a8304cd308bc15bc56bfc7c.png', 'e1b732610ef8fcb95b6a4a682da05b24d9b249ad.png', 'fa12f7042ba24380db680d6bfe64aa3a577bdbd1.png', '4e353a4d6bc08d2c31b662ee8125d41f6c0188f6.png', '6f2c4c5460075595c684eb50df6890997d00d771.png', '0eb848b54d38ba9c3043a89d1841493cc1df4001.png', '3475e65c90d094faa055e39fad06d09d9b88bc40.png', '68945a239fcc0ea252a6b72bf7407302ba3d16c6.png', '2fce4f93f1448921d7615de1874f063ddc2112ed.png', 'b75dca3d3cb3899cd40b783dd0c95f673a90b751.png', 'fbd35d9e6afa3aa812d71502546ae8b2edb0692f.png', '7be50c57e1dbbd0d8b8fe444e130a591d21a9187.png', '40709476aa27235aa9b8b1925c9a80de10b5e443.png', '01e769641cfffd84eb2df74a6afc37ba0e26be96.png', 'cb704526e6aab32d01651bba14b2c81bd3bad49c.png', '7b81c172786b020d0499bdb5165c418bdfc8b88e.png', '49fb7be91a7ddea9096c284fa1b6adb3d4914c08.png', 'b2eddd52b6d6818e5cf679b21ce20843f1c5c5d6.png', '30bf429cf088fbf57a5393852ac1a9adb2a13295.png', '608ad72c8339b1e36b80f1bebac8e9a782d6f386.png', 'dc02043f87b3bd3dfaf146034a70ff918e1f22ca.png', 'c7a7188a8362f61165680ca73941b990983f4d10.png', 'cc1904505ee535084339a944841afb107d3c9360.png', '1ecda16254f8a73b10b73e4012c9cf256652bd45.png', 'a55b9a85de2a7ca106239a0eef39a4a8377a3f62.png', '1dc1f56004d0aeccf61ea675f3c13885db2a4d9e.png', 'cbbd0f4febb230306ef119a9459363028e8b05b1.png', '18c8910dfc1894989c9d6b99c6fde26d8ee8e61d.png', '4a3e6644b0f04e614b9bb60dd8891acb6059be9b.png', 'b457e136576dffd76a8e78e569f3750c2c1a13bf.png', 'ad52af8e005497bfd9c6de56a4480b1e15a12094.png', 'f6fc8e5b2de17aea788bcf38efbc6c32fc58af97.png', '04242a6664aaf8dd9086ca88061e16ddb96b9d8b.png', 'dfc000e52bb2171048d6ca8aa2f96eccc886a5d5.png', '0812c7f01f636903cfa2d34cf89f0bdf5f548a61.png', 'e80ba4e575b8542de23236b62a0d01d6f73f59e5.png', '5b5e67f62784deb35ea9e3a46bc03d093ced2ff5.png', 'd8626d72b4d5d4da039af54d29f1499f32d92fd1.png', '250417deaf1bb89f8460d65ef6ae62afe90f5e7a.png', '231c3425c42f017e76c9a985d3a5775621be9d01.png', 'aeda52ae9a340de09e8333f342001befad00ac46.png', '5e41c9d9c4a7e5e1161cdc74e7f4b13138242279.png', '7c037d4dcda6a7960d8d473c13324c5ace217063.png', '28d34cd3838a6d3c4e89226b1ff667aeba6f2563.png', '0fe5e92ac1e9bb33cd328df5c2e9d3d189bc2e54.png', 'dc1a5ecc7737041d0874bb2a89971fad722fafa7.png', '391c3b9a2ab8b58b12e3986b74591e9c5f3e9eb1.png', '6bbc365c78ed6777770d256020f329d9dbf8707f.png', 'b7fc6916c18a2524057500ff86a1813a477f9ee3.png', '54509d7b17576a46ced6784d2188bc1432a8fd6e.png', '95adfee88b8450af3b192ce1dfe3b6a33961360f.png', 'a1d364f73ecd47931b85a4ad17192a85c239ab29.png', '3010c2485af9cf326495870ce3a7a826e6a90531.png', '34935d39cedbd455ff6981c479f8f3df45103c8a.jpg', 'a907d35db7bec4fca60b1f3ca1f688d63dbbe42d.svg', '8ea5d9b1b4a14e18ebdc6d8abeb67d5046ba94f7.svg', '14018bae44283c91d65636c55dac664cb73c8831.svg', '70d49541b902179331a958cf6bf2fca3dc84cd10.svg', '3cb32234ab48c848fe086dff9517ff638e4fc13a.svg', '6cbebd96dd51fa7750b60330abf06fafed98ad6d.svg', '429aed1460cade726fbcada5bbdd8d183a14b968.svg', '67cbb33c85d84c8bbca543803ea5c5ec8a2d5ea5.svg', '474884db6bc5d410481072b103866ee0b17ab5ad.svg', 'b4724df7dc20dd52fcdadcf462fdc8026517365a.svg', '48c40a25c797fddc8fbd96cba7fd29b073f82662.svg', '61ba86ec625d43b52d6b7d036bfb82e0ef7b34ce.svg', '5e31687e546d8c97dd5bccdd9e1d5cbb5e135db7.svg', '9ab56053c2e02d0f8b21e377c2a89e6a9dfa06d5.svg', 'a64949b4404629651cb7731adf5961f63fce9bad.svg', 'e96e6de767a5bf7759c048bae2579ada81b0f36d.svg', 'd966173089848b5a3e5d04ab2d41d80d50ab5b39.svg', 'c75014c3f97791f189eed2ccc0230e175b69def0.svg', 'f840b3e3b37eed56cf143bc1ff91783cdbe0675d.svg', 'ba5a14438b2651040ad6791d1ddf583f83d425b5.svg', 'a907d35db7bec4fca60b1f3ca1f688d63dbbe42d.svg', '8ea5d9b1b4a14e18ebdc6d8abeb67d5046ba94f7.svg', '14018bae44283c91d65636c55dac664cb73c8831.svg', '70d49541b902179331a958cf6bf2fca3dc84cd10.svg', '3cb32234ab48c848fe086dff9517ff638e4fc13a.svg', '6cbebd96dd51fa7750b60330abf06fafed98ad6d.svg', '429aed1460cade726fbcada5bbdd8d183a14b968.svg', '67cbb33c85d84c8bbca543803ea5c5ec8a2d5ea5.svg', '474884db6bc5d410481072b103866ee0b17ab5ad.svg', 'b4724df7dc20dd52fcdadcf462fdc8026517365a.svg', '48c40a25c797fddc8fbd96cba7fd29b073f82662.svg', '61ba86ec625d43b52d6b7d036bfb82e0ef7b34ce.svg', '5e31687e546d8c97dd5bccdd9e1d5cbb5e135db7.svg', '9ab56053c2e02d0f8b21e377c2a89e6a9dfa06d5.svg', 'a64949b4404629651cb7731adf5961f63fce9bad.svg', 'e96e6de767a5bf7759c048bae2579ada81b0f36d.svg', 'd966173089848b5a3e5d04ab2d41d80d50ab5b39.svg', 'c75014c3f97791f189eed2ccc0230e175b69def0.svg', 'f840b3e3b37eed56cf143bc1ff91783cdbe0675d.svg', 'ba5a14438b2651040ad6791d1ddf583f83d425b5.svg', '6589938d21875dc14a1151c2d6ddbf4c80925107.png', 'b9e5a75174413bca908aeb886f683f9e2eb27b16.png', 'b2766f4837c5ddfa3999bcddb2f97671704d0979.png', 'cd6628d9596ac8cfeae95e4d893cafd15007ce24.png', '772a24fa75ab08521a51be630ca3858e7b4faab4.png', '5a80d706ad960e1cadb4027e9c2207708b3cc0a4.png', '6500cf8eeae343c7600f65853c60b299d3c55472.png', 'd9ded9b1eb56edb463bdd6ff673b2b6328cc5909.png', '603c4b22f3253b9cca3d379ecda54dd698ecd953.png', 'bd5e0a3e3302630caa6d17a01cefb3ebb21d2971.png', '049118a386d876dd1be35b395c083fec48ec3621.png', '758a143b62628aee1b4d862b8285394595e4b836.png', '8fc2efe3465c283cdf25691d006610b7fa4b1758.png', '91ed46b0e2c167940441bbd42edb8e49bf12deda.png', 'e7e8bbc26b53d92b27cd1abf5ece23874ea02d55.png', '79f60e0ff2411b29dab3e60d186bd32e15b52084.png', 'ffad99d0f6dc89f9b9c384524ea80f1b164a235c.png', '259d2e4dfbc8e16507ec992df2f2f2468ebf6dd4.png', '82de91cdd336d47f65866976a17cd17e672f388e.png', '168709477082c56d53edab10e424ccee790e2f5f.png', 'da402f10047d961564480ddd5969552908574bd1.png', '9fd3b4cc77e686730d4d99bc9695bf6b3eee5409.png', 'c43d8ee1c13ac78181b9f8990ce6cee9376823b7.gif', '594d11428321e30533731abcd97897083ae5e3d3.jpeg', '3058a8fc1ba3845bd10eb417dcd1cb0f2f71c42e.jpeg', '3058a8fc1ba3845bd10eb417dcd1cb0f2f71c42e.jpeg', 'd19937ed7e5f5084c2a7628e401d86966e104ca3.jpeg', 'a0b928749fe4ae09b218e5cf6f655e2fc17cc24f.jpeg', 'a0b928749fe4ae09b218e5cf6f655e2fc17cc24f.jpeg', 'c43d8ee1c13ac78181b9f8990ce6cee9376823b7.gif', '7a5b7489a32dd233a3b61f8462482a1f8b52a17d.gif', 'c43d8ee1c13ac78181b9f8990ce6cee9376823b7.gif', '6589938d21875dc14a1151c2d6ddbf4c80925107.png', '6589938d21875dc14a1151c2d6ddbf4c80925107.png', '6589938d21875dc14a1151c2d6ddbf4c80925107.png', '6589938d21875dc14a1151c2d6ddbf4c80925107.png', '15357e33e6d8f98123090fe134126bb46ae6c16a.gif', '15357e33e6d8f98123090fe134126bb46ae6c16a.gif', '1e75de7019c78d418914fea5ef618ecbe47f59aa.gif', '15357e33e6d8f98123090fe134126bb46ae6c16a.gif', '15357e33e6d8f98123090fe134126bb46ae6c16a.gif', '15357e33e6d8f98123090fe134126bb46ae6c16a.gif', 'a6a7c68edd059ecce7832308981ca99528996945.png', '93d5eafb36e08da6e64d7a4f3271aafc90bd7ea4.png', 'e62d790a49a6078f5110e57217fdf74ccb4566d8.png', 'c0e58c70800900595d2cf856106e10265365e171.png', 'e051a051a2c5fe6fad9174ab8ca3a000504e8563.png', 'a21914b6ec0499ee27b4fbabed60f45fad0f91d0.png', '9f4e90d6f453c04c5b1ec403c13ecf1283d86a69.png', '43eec4558a6b68a3720918bf86bab60d9cbfc05f.png', 'f905245509da650f2134c3e9b69acab654dca5cb.png', 'f6458b1bd3a6c8760bf5d06988e2eb1a5d52acf4.png', '8df11b9aae2790cb2ade8ae56757dfe717890c49.png', 'aad5cad4450143734002b4facb9c64bcbad3925d.png', '5961ec685c748d8fa8c802530e5a6b205b5544a4.png', '663a439743026a8170a096faa0874330ee2256c7.png', '663a439743026a8170a096faa0874330ee2256c7.png', '663a439743026a8170a096faa0874330ee2256c7.png', '8d78ae3a9b56ec3089b26aaaf88b8e2e71d98d4e.png', '8d78ae3a9b56ec3089b26aaaf88b8e2e71d98d4e.png', '43eec4558a6b68a3720918bf86bab60d9cbfc05f.png', '6ef9e53e2035819da0c460f9f11e1d3d097133b4.png', 'ac9dfbfbb756eafcae7ef92c4d6cd18ddcbbb758.svg', 'b85a8eac2081ec19bcf6dcdb59e1a724890192c1.svg', '1189afb2f161f4a38990365b57bda7ed965e414c.svg', '2d790fcb106dfe4995eff9006c75b3c4b3b5658e.svg', '03babbc64f6ba37cce9e542522e86a77920290e1.svg', '5385348681de8b93ce0bf1d6358ded83239f3aa1.svg', 'a4e6b09c0f232566a76e7349c5b3f8ec40666f3f.svg', '0c3f13d0b6c944d9cc0e7642276ac3120f4135dc.svg', 'c7bf000dd4916e12effe3412b1a52f3f490d3a40.svg', '2009511a398995a5f64d3ec7552bb4ab2369b6b3.svg', 'cd303919fdaf02cae242c0d0c14caa87b973442b.svg', 'd2dac3cf7ac1a4ae75da1dd570edd8fd857f2bd4.svg', '8425e788038a0b12e75aceb8de6dd5bb976eae5e.svg', 'c42e0549d8a3b934c70be1301ddaedd93bb19d47.svg', '45a272ebcff91f29ca173b1264a2bc163a2f254a.svg', '823fa3482c5c4fdc87c7eb9545475ee77efab112.svg', '942c15f8dec24b960578f6f910ca5891db2fb934.svg', 'b03a324567a8bb4846ce7349eba943bb5b57e4fa.svg', '613228d723e74c202b0f67bef06cc59a1bc7d369.svg', 'e2e080b81512aabb03420d6f0d8ecbc96852bb30.svg', '9c6345f62e77d8dbce40afcecf041b4fa0053760.svg', '1bd7819a3e6e2382e6b6c055ecbdf738eacd14d3.svg', '522e4a131c0298b413a18431fda491b9c47929fe.png', 'beea026f3835726214bb10750baceb616259c1a3.svg', '4e4f5bd9ddd3fb1287725ec5567b119ee46c5bbf.svg', '541c221b1f1a8d62726a3533e28b1f599d2c25b7.svg', '7b02d79e950613acffbe00fec44fd1bf3f993006.svg', 'd71ffb4cec8b53c8510fdc5e0d2955bf1743989b.svg', '97c2b8acd28fbc35d5b9df0f1283e1c7072c7c7a.svg', '8381a5d50463c18d603e4d7c070aaca70d36785a.svg', '9011667adeeb83fa22467de0c585cef1d1866701.svg', '443da25502cec2109e9e905d87e0c3a23bd04a35.svg', 'bb527250804418860630125358f5b485d01c0ab6.svg', '3f2523e67368b358b5495477e69ca9f53f09e09a.svg', 'fb3fecb7ba3aca5e4e67d1be726c38ebc9951159.svg', 'cfc769e471a07c53c81891a7dd96f50d7138a6e6.svg', '2ce9f47c6327d4dff79895019157a6e372f5408f.svg', '675da446907031e5ffe162a97b88fc2bda52e5e7.svg', 'a35c3699ec3b1eb053acb96ddf35eec9c54dd19b.svg', 'a35c3699ec3b1eb053acb96ddf35eec9c54dd19b.svg', '2c553bf44f6ac21cec1b693b45ec0acde392103b.svg', 'e22dc9ab9efc0ba7ad4a3efaee1b8cf9a615d7a8.gif', 'f609093d6982edc3e47d1a8c27e75bd978d23470.gif', 'decdbf94ddd4ceb4029c56c70a9ceb8c359cad2a.gif', 'e22dc9ab9efc0ba7ad4a3efaee1b8cf9a615d7a8.gif', 'e22dc9ab9efc0ba7ad4a3efaee1b8cf9a615d7a8.gif', 'e22dc9ab9efc0ba7ad4a3efaee1b8cf9a615d7a8.gif', 'f609093d6982edc3e47d1a8c27e75bd978d23470.gif', 'f609093d6982edc3e47d1a8c27e75bd978d23470.gif', '41a34798a2156e66318d847ccc1d79cc6c229b5a.jpeg', 'e71ecd9f548a5e28cc1663b0c971138a2ac7b695.jpeg', '9b1748f673aa619666f834ec597c72cc130a646f.jpeg', '91677bf2452614e00d296f89e2d90b3aa8df3a83.jpeg', '8abacb947317ce7c9a5f238e7df02aa5b044ead3.jpeg', 'fd4039cb4f08a5bf28606bcff055c5197d6c6d85.jpeg', 'cbf0d9c9fadd66c815c10eab98496aa432065832.jpeg', '04e73bc2fd01c7cc29a815e3dfda64b5b12e0922.jpeg', 'bf6e43b0141452d082c5ca1f0d1f7adc4ca52bc8.jpeg', 'd70b2eb820d498bc7c345fea4916af89db366a40.jpeg', '26435401c4b733a6916a8c3b19a093b7761f78cc.jpeg', '874fc701b465674a25993e1f13508596cf59bd3e.jpeg', 'b6b9fc1f81a50a90c583ad550a5b6a3aca081d9c.jpeg', 'edeb1bbff5c70c826a28e798e404faf88fc0ee7b.jpeg', 'f94e24c098fdf35da71a1200a2a7ed510e5d9424.jpeg', 'fafac1efb26455e04af17c6c4d1fbac61a198414.jpeg', '3ef98145787c7851a98a2cdda0e59f1c1726c60f.jpeg', 'cb4aff14f58cc72e8526f721036687cd2c138c70.jpeg', '037d9a9aa7e98629144c032417a98133e34d0d9b.jpeg', 'e421c5c33bb361ba96025cf7f725fe5fa2cc873e.jpeg', 'ca7c3d6747a498ecab8c9fd3aa6a6dfc1f376957.jpeg', 'bedb64770a258ae31f4b7b56016ea652d80e7ca7.jpg', 'be8928c8620673f719de03c6d46b6ccd33ecde0f.jpg', 'e74ebe9fcb89d53759756d616bd92a1eb08f0bc5.jpg', '0358faf9c7b2c970927ad4098a4b16e6a2ea0970.jpg', '2a1baccb77169a9e3d1418d013fc09b2bc629b9b.jpg', 'f4180d671d34c8b471e13775b79cb9b11e4f9f7f.jpg', 'e74ebe9fcb89d53759756d616bd92a1eb08f0bc5.jpg', '9e69de6c7736baaf6bf94ee933ee5c09f0e8f560.jpg', '804977a8097ccda20bda54acbc7761f6349ab6c8.jpg', 'af5d8cb675a95fbb333a84bf62d82781e2d8eb5b.jpg', 'baa40e4ec6158d270472c8fe9844475d12b6f420.jpg', 'db9e79332fff1f74bd1843f7708f6bfb86f01230.jpg', '4505e52104970463107283722e6de1ba30144d55.png', '5d8f0d56f6d74fb8e8e45de29163675b455bce04.png', 'e610d07170bf3f32ac0881aef44bfa30fc709db6.png', 'd4b6bc4a7174f4c525956451c61e68315c011fd2.png', 'e6ec7f9569f3fa289df2a926d0a05aa66f11b0aa.png', 'f033c9c9a558ab76329475f305a5f78e6e4cde17.png', '1fffa829e724bdf2a91baab935c96fea99423178.png', '82eef3a4c22427ce087ac52de2da96e7670efca3.png', 'cf2f595114418d3c893e5e88acaf3f5975e478a4.png', '9659b9da791911eba68fde903fef751b927abe52.png', '41acd4550b63bb8966bf82bb53a2a6e26f13b4d2.png', '2c82675e2dc051cd82761e3a64f2868058b91179.png', '5a683062a112a7bb573297c8cd9bed8bec39629e.png', '825a9f6ca4274883d7548dd2bb5ddb10d1fb7b49.png', 'c89a5dbab7cc7dbae5d14b4575a9b8daf4acc91d.png', 'f02384fde51643644d806e5763aa226aa17b4d63.png', 'd55ee296bae6e784d30966b82296aaf2f39f48cc.png', 'ff0502fe6b07ceaf9076474a8afaa7d5dc8f38a3.png', 'd8ccd74f1496754c7fce7ee13c79b8afc0df1ce3.png', 'ac60ab6a30deb24dcf3cae61a1eba41c697a13bd.jpeg', '5dfa32b47d450c80dca0a9e5488a96f21e53e00b.jpeg', 'fffbe2b821097db2a64042550317c593dee27c3b.jpeg', '82fd4ab5e1e5000a22d768c8aa0f945e2edb3e6f.png', '3151e714f81f16b85612569b45083b8a4766a532.png', 'd6f05b641e325a2bdd0c960d2608b16f3e2c728f.jpeg', 'b0ab9adf2f85923fd243ce0ada001c2437adf0b6.png', 'b0ab9adf2f85923fd243ce0ada001c2437adf0b6.png', 'edc45f3ba02a6efb592def3175c313eda23f7b19.jpeg', 'a606d5f30ef43abba7f60102323db70fbe7b3af8.jpeg', 'b7b6694de7b8b2feb93d58d2e9124a315ea6ae9f.jpeg', 'b7b6694de7b8b2feb93d58d2e9124a315ea6ae9f.jpeg', '05142829203e3c2f6ff3eb542bd17dfa6a569e16.jpeg', 'a606d5f30ef43abba7f60102323db70fbe7b3af8.jpeg', '3046dd688d1a37f4e69b54fc42f36490c802e9ef.jpeg', '850898ff40bb87484b66b6b1dd1a669c6af0ea05.jpeg', '35cbe0d515644126c9adbab9c0b95ed8f4f91dd2.jpeg', '6bac867831517474ff10e5ed2988c95e93388d24.jpeg', '2c72b34c414b8132f43ceff1a632c69caec104fc.jpeg', '5773421a30458c4216f77744bfc147c71e661914.jpeg', '0e5e1556a8e5fd79791741618d1cef912d57706c.jpeg', 'fe5d8da91cfd0df3f1e47c2edf692d1ed0152c21.jpeg', '11df95bf45bdc3f320cb7316156dcfce82f847f5.jpeg', 'e44ca88d47003acfa92433c0e1ee197052a7b2f8.jpeg', 'a0de5336c01c00d4073dd53260ef3fb1c11fd1d8.jpeg', 'a6c041fdbdb4011a1a2fba395bfa0eb1d710a900.png', '13866fe4a7e007f1559b6d6aaa0ec4323f0ee93a.png', 'a04f399119bee082330f4fde8a8a6f635cafa954.png', 'a6c041fdbdb4011a1a2fba395bfa0eb1d710a900.png', '13866fe4a7e007f1559b6d6aaa0ec4323f0ee93a.png', '33017ce34e8bdb64ad29ef9a0ebfbe3d78c007ce.jpeg', '208643cd506cb4136e1c28f8cf48db6e3e7b2730.jpeg', 'e99ff72dbc7d25cb7ddac0ead67a7baccbf2fedb.jpeg', 'd3df19223e71fc62e9cc89c53712517a2975c2ee.png', 'd3df19223e71fc62e9cc89c53712517a2975c2ee.png', '116de59f4dc5270b2672270921ec245e866e17a5.jpeg', '460eac62eb4cb42b97a0d5ce7c5e9994a8eb92fc.jpeg', '74042575608bab2df9de856695b0784b683b911d.jpeg', 'fda1a6b3be1f3151909d02f7b64e85ff63282345.png', 'e9238ba4d578bb2e916e95ce7dad67cfaa4533b0.jpeg', 'ea67b018fee5fdc8cd236bd5104ef77c9d3caa91.jpeg', 'ea67b018fee5fdc8cd236bd5104ef77c9d3caa91.jpeg', '3592df532e12bddf74a36dc773819aadea711adf.jpeg', '0f0e93b8c4653d1064b75ddb9c474871b525ef47.jpeg', '0f0e93b8c4653d1064b75ddb9c474871b525ef47.jpeg', '0f0e93b8c4653d1064b75ddb9c474871b525ef47.jpeg', '62f25ce3b5020506792fc5491ff70a7d923925b1.jpeg', '0f0e93b8c4653d1064b75ddb9c474871b525ef47.jpeg', 'c60d31b018efd92c625eb480725243316d82863e.jpeg', '31eeeebe94d423d4e620514716f612a1060b8634.jpeg', '809d58a3b0cd18398b3725a34bce77047463388f.jpeg', 'e12e14569639f4bfd4c186c976e1d095113d3c2b.jpeg', 'c01ff1cc5c594cc1a7150d875936417006709409.gif', 'c6a8d55846897718fab911f5833358d26b3c907a.gif', 'c2a43f5de58ab1a6b986aa3b57faad57a23f44dd.jpeg', 'fb46cf9e51ba8ca97d9d932592038a9eb826dcf5.gif', 'fffbe2b821097db2a64042550317c593dee27c3b.jpeg', 'dd4ab5469278ad50418f1d72e75baee84779b472.gif', '27ec631d567f6a59ea0fa24f877943a0a6dfc131.jpeg', '460eac62eb4cb42b97a0d5ce7c5e9994a8eb92fc.jpeg', '813600ea7c198fec9ba11382bd89f06e1ea41765.jpeg', '5e3348e23956f84e5c0ec506f8c9e5522d872544.png', '48dee9c48d220404e7a20d725c6f421d3d1604ce.png', 'c7eec41843ede234ef03005d8a172025fe515e89.jpeg', 'd90aee0997fabf8982b5fb2a11d3e1f314d3f7fc.jpeg', 'b3f10e624810a18f8ff10631b0e7648206d96e8c.jpeg', '05142829203e3c2f6ff3eb542bd17dfa6a569e16.jpeg', '2633edf8f9c52fef4be2eb1bc5ef99d73257e16f.jpeg', 'f134c74f8a069571e7d284d431dcc1477a095998.jpeg', '11a0be78b14b68e5204faf848894f92dcb0e82a4.jpeg', '3046dd688d1a37f4e69b54fc42f36490c802e9ef.jpeg', 'b3f10e624810a18f8ff10631b0e7648206d96e8c.jpeg', '05142829203e3c2f6ff3eb542bd17dfa6a569e16.jpeg', '2633edf8f9c52fef4be2eb1bc5ef99d73257e16f.jpeg', 'f134c74f8a069571e7d284d431dcc1477a095998.jpeg', '11a0be78b14b68e5204faf848894f92dcb0e82a4.jpeg', '3046dd688d1a37f4e69b54fc42f36490c802e9ef.jpeg', '78a13678a6102b30e84c4209a4c69b4547f96acb.png', 'c2d8fb4691126c105cc63f8eb8b2233482ab07f5.jpeg', '2f4ecbeb8cb3e5f5f6da5e2d4c1b90c63c8379bd.jpeg', '87702baa57d459e886fa4203dfd73b9c43d986d0.jpeg', 'a7774ded7821517c91fd514e51d47ac5992b1c30.jpeg', 'ab27618c146ca566218412d377e0ef6b2537feae.jpeg', 'e40795f0e22e16744cf9dee4c41ae56f2bcffce6.jpeg', 'e566a359cd78cd2981a4bba99eea08f50929bd26.jpeg', 'bd3d8b32e732a9eaa5be5f337ddb3ea4778c8612.jpeg', 'd99afa70fa63f365095a87df47bf35aed03f8aaa.gif', '7670e0c3e690fa9337967d2ebcdea303508864cb.jpeg', '5444ae5936961d569e7ba6ca59ed9a0b24e2752b.png', '955e3339d66d05122c20f636e44041214dda0dd8.jpeg', '00c9b26572ece3788b2f940382a394eab80da789.jpeg', '0521694895a4db4adad7d55efe3e62a093318485.jpeg', '463853174b739a1806a76fa5fb344fe6b15923e8.jpeg', '0be454e171b7ff6ae1f55a296e241883fedb0a68.jpeg', '4ceeb0dbc3d393e3bdb9b0aaae768ed4202efc36.jpeg', 'd87abedef11e8c951f260a47e82221631d381632.jpeg', 'b993506e7e531d236a712d8b44a046f894e02854.png', '20d54a97a24cf85afe99dcefc91c8a48a88a48d2.jpeg', '8472fbb1dc6641268c20c31e1714f4f39b9e34c7.png', '00e62c57c3a81cfaf77ec694dd1efa83d6a1222f.jpeg', '52385534a7f5438c9f3d5bf4be7b49c0f134b0b5.jpeg', '66eab5b60126877893a2bde1efe921dca0d67d2f.jpeg', 'aa20678ee522b353bcb747f00725f9b7594efc5c.jpeg', 'f10ab47779db0172ad3bfaf27d65842f166a2891.png', '611236719c0f82ec5d6d4bbca7e0aad72766ee94.jpeg', '058b176d159badb9518d55c6ca8831980e39cc48.jpeg', '4c1e5ef69e80fd77a64f5ebcd10c5729460f69e4.jpeg', '6772cb7f7abd8a0e27b8b6e1438df5d32d613c3d.jpeg', 'cbf4536cd0c62cded53119c71f58c993f9e557ce.gif', '49f60c46fc02e63755d733abd2f332dd1ce52455.jpg', 'f462541172f1d49d8fc3580e57bd39f84c91014f.png', 'ce03eb7be98c86ecc852addf1c9809ddcd2b7171.png', '5d406a3850100a869212b43b8e40b5c00f41123a.png', '9ebb1b65bf3bc5719cb5224dc619cd3284c15342.jpg', '7baa032115b2e0b10baece61b0270abdc5bad148.jpg', '025e87ed17cd28d20dd05417fabc15b232516a37.jpg', 'e9b6fe2fcb7adf5c4b0d13e24627f54f334a7b8f.jpg', '9b1e479e7e13ba39bdd195116de90ffc957c9097.jpg', '04ff1a960c9aafe55d011bec22c13d60f9df3d55.jpg', 'dc57f933a1fe94737076b8b9610ca3a24968e7b1.jpg', '68d9a0ae7798f9a1813d22520ab37867fa0c5da6.jpg', 'ec42fb2a1fdc6e2c48489ee52bdea900960ece7f.jpg', '8ca3523bafb2219fbfdc739367c78a2189528bcb.jpg', 'a0ca83e9bca8a83a5cd16fde4201279fb7cf0fbd.jpg', 'f0a5216990dd59f22d52c7e252bcd3d062650fdf.jpg', '305929bdd9389ac8a8b5a0cdb747ac7539524b22.jpg', 'a35ae469c3d5424a2eeb900d622080d4cf8d2c7f.jpg', 'cfeb423997b5dcc84076b22da5b02b88986aa3f8.jpg', '62887787ff4344c78f9b1a3c2c3f5cbc1ab8acc6.jpg', '8a444254ca71fb17e71e1bda318becb98d6a8155.jpg', 'a562cd8ac5dcb4ea91feba60a1e5b20a448cbb0f.jpg', 'b1cb3340efcc9205b9b5e111f2194ee7a1f6c9ea.jpg', 'c0c3437f5f3d0a6fe2d160aed91fb71b9ba5b409.jpg', '29d86bf5c524f0ae7684c3fe59e59b5583310c0d.jpg', '5719016a99ea4098c5e06d9fef17e08176a884e2.jpg', 'e3d4f1f62c8138c9db6f4bbf9c1084058ba49c81.jpg', 'b27e0f14929cb2362ee1ada539d812a396fdc1d9.jpg', 'd234affc0e7d9ebf686570784d40544ac94c0aac.jpg', 'beb41e62e94f0c56c02b52a89a8a306cdeab3f9d.jpg', '1d53fe95e5ddf09ea7bbc3e7b730984f51418a6e.jpg', '2b0e0d285497f0af19a8b48495b23e3fe2ea2632.jpg', '36978689d957bc61d8d17b3cd4db282ca68f2315.jpg', '637af2452c93a59a5f1105419560a97fb47c191d.jpg', '78faf5f5d251ccbf347df871eb2d1abfcb20c945.jpg', 'dc0556be7dca18043b77eb956a916c2f91ae8282.jpg', '799aac62ef56622b250b00b5f107abbd4100d281.jpg', '25a52df368d2ba07f250a4883924977b75f7f70c.jpg', 'fac08851490332bd9fdb7f3bcbeff35177730beb.jpg', 'e4b19720ffe216491a78b365df974b9af7f753e7.jpg', 'abb39d31710be53f700fa87ecf602a2775866c1b.jpg', '29c2df9204aa73f8936ac72c3416b6f9511c7b93.jpg', '4b400673b8d695c229e262884b124641cc639c7b.jpg', '548f52adbdde29ae84428701567ab8b8e51ae209.jpg', '652f32fcdb534262a0d5bdf4f6aaca87655b3d0c.jpg', '6e57abbd3be16cf73b2a5d19696fd051f45a24df.jpg', 'c5ea27b0d1d4b64579d1e44e8c1a051f8d6ad0dc.jpg', 'dd6115b0a4f73731d280d85526c6364b55c1ce7b.jpg', 'c69e1f02156c174e940957774e207c7fe8b4736d.jpg', '2485344ce49ac6722461451739f4d6290867cf7f.jpg', '903d2badf52df4909bebe5e09bee90afed02acb2.jpg', '1013f0769a30958b751ae53835f0442e2e42d551.jpg', '32efb96d96852ad9234e09426e24531b822061a8.jpg', '73da4a0b59b752b4ec2ab10f7cb74989aa136893.jpg', 'bef1de990064d82d1f90f95765dffc7a6d84042c.jpg', '9bc2f2d5661fa338140193796a1ae6338085cfb3.jpeg', '9bc2f2d5661fa338140193796a1ae6338085cfb3.jpeg', '9bc2f2d5661fa338140193796a1ae6338085cfb3.jpeg', '9bc2f2d5661fa338140193796a1ae6338085cfb3.jpeg', 'a0199c88ac7bda0635c2b70ba3780c9ec8ff0f11.png', '8a975ef1c6cc64a3e9e957e5b7bd730ce0f59433.png', '1106fb2ba089a2b25e41bdf350ff438369819f1e.png', 'cf6f71c3b2fc279bb74605cc3dbf6783904a2e40.png', '517e44ae1ded1a895f2ab9c06011b96a59d57dd3.jpg', '517e44ae1ded1a895f2ab9c06011b96a59d57dd3.jpg', 'ce8d0a34b47e3dddff39655b62fd7a48618fafa1.jpg', 'ce8d0a34b47e3dddff39655b62fd7a48618fafa1.jpg', 'ce8d0a34b47e3dddff39655b62fd7a48618fafa1.jpg', '517e44ae1ded1a895f2ab9c06011b96a59d57dd3.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', 'ff86ab4edb44fd0c121cc0674ac0baca9f24f15c.jpg', '1119b4bb5cf67fa0d5744774964dd8d282694669.png', 'dd42bc16376c02a00d0e945f3ae895e01ac6c431.png', 'fb6d19dfe3d33c286bf8844cbb56d7350989b80a.png', 'fb7bdd9f90cac1594d9b59813dfded03cdfbae7e.png', '285771b42a5fdc9445607fb04b377bbb7b74b05f.png', '33cbdf2ff0533abe7de2f9f4d24c65b22ce9954f.png', '73c65a68135db9f22e4d1377981f8348df3bdb24.png', 'f70b3bb1be7cfc4c7abd40f3aa1c8fc5dbc1ca5d.png', 'f9ddb831edb39403e0fedaff4d9c67a9ffbd7380.png', '98a244c00ec82ac6ec568a257817fd4797cb925d.png', '98a244c00ec82ac6ec568a257817fd4797cb925d.png', 'b5f39884a1af8d57dcb51b0b1b91c4fae7c0054f.png', 'b5f39884a1af8d57dcb51b0b1b91c4fae7c0054f.png', 'b5f39884a1af8d57dcb51b0b1b91c4fae7c0054f.png', 'b5f39884a1af8d57dcb51b0b1b91c4fae7c0054f.png', 'b5f39884a1af8d57dcb51b0b1b91c4fae7c0054f.png', 'bcf05c24882387b9fef25c788cc93ee5dfcd4abf.png', 'fff654ad3fd5418f0cd56623a9cf0d122288af39.png', 'bcf05c24882387b9fef25c788cc93ee5dfcd4abf.png', 'fff654ad3fd5418f0cd56623a9cf0d122288af39.png', 'bcf05c24882387b9fef25c788cc93ee5dfcd4abf.png', 'fff654ad3fd5418f0cd56623a9cf0d122288af39.png', 'bcf05c24882387b9fef25c788cc93ee5dfcd4abf.png', 'fff654ad3fd5418f0cd56623a9cf0d122288af39.png', '25fa864f0108a545cb14e84907d82c2ba0f8f881.png', '8363fd804fa9c6e11716d1d6915d61ac2e2af56c.png', '25fa864f0108a545cb14e84907d82c2ba0f8f881.png', '8363fd804fa9c6e11716d1d6915d61ac2e2af56c.png', '87f6c99b3faa6a944ec4085688378a9242bdfe2f.png', '70f90a951bc8bce39f64a9840eaf4a26e14c07d9.png', '87f6c99b3faa6a944ec4085688378a9242bdfe2f.png', '70f90a951bc8bce39f64a9840eaf4a26e14c07d9.png', '87f6c99b3faa6a944ec4085688378a9242bdfe2f.png', '70f90a951bc8bce39f64a9840eaf4a26e14c07d9.png', 'f248384902069a7b683a273e3b125742399e5d76.png', '87f6c99b3faa6a944ec4085688378a9242bdfe2f.png', '70f90a951bc8bce39f64a9840eaf4a26e14c07d9.png', '87f6c99b3faa6a944ec4085688378a9242bdfe2f.png', '70f90a951bc8bce39f64a9840eaf4a26e14c07d9.png', '98a244c00ec82ac6ec568a257817fd4797cb925d.png', 'bcf05c24882387b9fef25c788cc93ee5dfcd4abf.png', 'fff654ad3fd5418f0cd56623a9cf0d122288af39.png', '717aba33de48ace3c482509d5c86d3e6bf26ea2a.png', '717aba33de48ace3c482509d5c86d3e6bf26ea2a.png', '717aba33de48ace3c482509d5c86d3e6bf26ea2a.png', '717aba33de48ace3c482509d5c86d3e6bf26ea2a.png', '285771b42a5fdc9445607fb04b377bbb7b74b05f.png', '285771b42a5fdc9445607fb04b377bbb7b74b05f.png', '285771b42a5fdc9445607fb04b377bbb7b74b05f.png', '285771b42a5fdc9445607fb04b377bbb7b74b05f.png', '99838d88b35d727dd61a5350ff1ed4353c11d178.png', '479f97491f06d717e061aad987678829bef5fb58.png', '99838d88b35d727dd61a5350ff1ed4353c11d178.png', '479f97491f06d717e061aad987678829bef5fb58.png', '99838d88b35d727dd61a5350ff1ed4353c11d178.png', '479f97491f06d717e061aad987678829bef5fb58.png', '99838d88b35d727dd61a5350ff1ed4353c11d178.png', '479f97491f06d717e061aad987678829bef5fb58.png', '99838d88b35d727dd61a5350ff1ed4353c11d178.png', '479f97491f06d717e061aad987678829bef5fb58.png', '93626938488096b66d6504978a6ab1aab2b8e6a3.png', '2455b014bc6897cd1220bdff573fd62902b0a87c.png', 'c998376d0d6d26828ec2a0b01db16f904b7d605b.png', 'c998376d0d6d26828ec2a0b01db16f904b7d605b.png', 'c998376d0d6d26828ec2a0b01db16f904b7d605b.png', 'c998376d0d6d26828ec2a0b01db16f904b7d605b.png', 'c998376d0d6d26828ec2a0b01db16f904b7d605b.png', '164ee555539156487d559179797970fce98cb0ed.png', '2f149ddfd7f206bd4997ca59cabc3f9582850422.png', '164ee555539156487d559179797970fce98cb0ed.png', '2f149ddfd7f206bd4997ca59cabc3f9582850422.png', '164ee555539156487d559179797970fce98cb0ed.png', '2f149ddfd7f206bd4997ca59cabc3f9582850422.png', '164ee555539156487d559179797970fce98cb0ed.png', '2f149ddfd7f206bd4997ca59cabc3f9582850422.png', 'bbe137ae0fe801053513abce549cec1c21974e99.png', 'bbe137ae0fe801053513abce549cec1c21974e99.png', 'bbe137ae0fe801053513abce549cec1c21974e99.png', '93626938488096b66d6504978a6ab1aab2b8e6a3.png', '2455b014bc6897cd1220bdff573fd62902b0a87c.png', '9c4bd335b86b2df589bd081c62ed14f76af9fbf1.png', '9c4bd335b86b2df589bd081c62ed14f76af9fbf1.png', '9c4bd335b86b2df589bd081c62ed14f76af9fbf1.png', '392fe53fa38d885c7ab90017cfa6a89b135a6bd8.png', '435222b44d6ea28b688145eda84795096d404eb1.png', '6994157b4f430e482caa18d737db9ccb435596f6.png', 'c2cb641afc9e9859ec889c3c084a2586749acc4c.png', 'd96be32813d0b72519a8f5622331e3a5b4635c27.png', 'a82e67e3c31acd9a5481c2197f7412efc97425ce.png', 'd96be32813d0b72519a8f5622331e3a5b4635c27.png', 'a82e67e3c31acd9a5481c2197f7412efc97425ce.png', 'd96be32813d0b72519a8f5622331e3a5b4635c27.png', 'a82e67e3c31acd9a5481c2197f7412efc97425ce.png', '7739af925e19903bd69f7731a3aaf81d859fbc2f.png', '7c24a6cee0426c1b25b2c9a836825b190bee9d0f.png', 'f92ccccfe54c9fa08e5142a638305dfd813cf473.png', 'd96be32813d0b72519a8f5622331e3a5b4635c27.png', 'a82e67e3c31acd9a5481c2197f7412efc97425ce.png', '5f48ffcbbaf04aa8ae50f364ce612a437e0c7456.png', '5f48ffcbbaf04aa8ae50f364ce612a437e0c7456.png', '5cca99939aacd18c368c6fd828bb97680219c0ba.png', '40d1fe17cf8861fa15c174317eaf06c1c7f367ac.png', 'a2403b7fc8edae8681d1152e690ac26c86a360a8.png', 'fe68e9b5a0cc0a9725995ccc1d7425d026bd77ed.png', 'fe9335891ae119b1567f06c47b77c9c31b4d4478.png', '4198bc4eabd6f3d4a8ce77edb246c7d8eea432f2.png', '5f3bfc8ab136d8c532ecc02b5df0b1b8029b3a3d.png', 'ffffbd42466bc0e18c070fc701c08a69ddaed0a8.png', '4198bc4eabd6f3d4a8ce77edb246c7d8eea432f2.png', '5f3bfc8ab136d8c532ecc02b5df0b1b8029b3a3d.png', 'ffffbd42466bc0e18c070fc701c08a69ddaed0a8.png', '4198bc4eabd6f3d4a8ce77edb246c7d8eea432f2.png', '5f3bfc8ab136d8c532ecc02b5df0b1b8029b3a3d.png', 'ffffbd42466bc0e18c070fc701c08a69ddaed0a8.png', '4198bc4eabd6f3d4a8ce77edb246c7d8eea432f2.png', '5f3bfc8ab136d8c532ecc02b5df0b1b8029b3a3d.png', 'ffffbd42466bc0e18c070fc701c08a69ddaed0a8.png', '4198bc4eabd6f3d4a8ce77edb246c7d8eea432f2.png', '5f3bfc8ab136d8c532ecc02b5df0b1b8029b3a3d.png', 'ffffbd42466bc0e18c070fc701c08a69ddaed0a8.png', 'e08a6cfe902d917140d0a52178849480525ac88a.png', '5b554eae73cc1899ae72ef88eb093fd260eb2dd4.png', 'e08a6cfe902d917140d0a52178849480525ac88a.png', '5b554eae73cc1899ae72ef88eb093fd260eb2dd4.png', 'e08a6cfe902d917140d0a52178849480525ac88a.png', '5b554eae73cc1899ae72ef88eb093fd260eb2dd4.png', 'e08a6cfe902d917140d0a52178849480525ac88a.png', '5b554eae73cc1899ae72ef88eb093fd260eb2dd4.png', 'e08a6cfe902d917140d0a52178849480525ac88a.png', '5b554eae73cc1899ae72ef88eb093fd260eb2dd4.png', '6ec7a3d930365178439d34b8e181bdf1a1a83f2f.png', '6ec7a3d930365178439d34b8e181bdf1a1a83f2f.png', '6ec7a3d930365178439d34b8e181bdf1a1a83f2f.png', '6ec7a3d930365178439d34b8e181bdf1a1a83f2f.png', '118064ba6986b20c7f1b601aacf768c2c691c38f.png', '9e912efa527f2f85ac96ba1aa05703dfda4f05c5.png', '69a432d4f4761cd8b52b86a9745151f217bed4a8.png', 'a8e22c2e9085bb6f879123dfc058e10e7119a274.png', 'b100635a8e3b89a24f0030098866e2c809f0e370.png', '118064ba6986b20c7f1b601aacf768c2c691c38f.png', '118064ba6986b20c7f1b601aacf768c2c691c38f.png', '1a95b0437015640def48557c02f8fab7139a4bab.png', '6f78199ac080c8f75ab4d5a50bbd934aa53bfa04.png', '1a95b0437015640def48557c02f8fab7139a4bab.png', '6f78199ac080c8f75ab4d5a50bbd934aa53bfa04.png', '1a95b0437015640def48557c02f8fab7139a4bab.png', '6f78199ac080c8f75ab4d5a50bbd934aa53bfa04.png', '1a95b0437015640def48557c02f8fab7139a4bab.png', '6f78199ac080c8f75ab4d5a50bbd934aa53bfa04.png', '1a95b0437015640def48557c02f8fab7139a4bab.png', '6f78199ac080c8f75ab4d5a50bbd934aa53bfa04.png', '9d945bd97d25c7b0b15515bcc3d0f88825c521f5.png', '9d945bd97d25c7b0b15515bcc3d0f88825c521f5.png', '9d945bd97d25c7b0b15515bcc3d0f88825c521f5.png', '9d945bd97d25c7b0b15515bcc3d0f88825c521f5.png', '9d945bd97d25c7b0b15515bcc3d0f88825c521f5.png', '5b4bb93b6326b902d9cf61a59fe6902be40f637d.png', '6994157b4f430e482caa18d737db9ccb435596f6.png', 'a00d4d502a84997731dd07976e1c42dec34d07ff.png', '00331926225b9f958dc2bd40e26fc317a5410490.png', 'a00d4d502a84997731dd07976e1c42dec34d07ff.png', '00331926225b9f958dc2bd40e26fc317a5410490.png', 'a00d4d502a84997731dd07976e1c42dec34d07ff.png', '00331926225b9f958dc2bd40e26fc317a5410490.png', 'a00d4d502a84997731dd07976e1c42dec34d07ff.png', '00331926225b9f958dc2bd40e26fc317a5410490.png', 'a00d4d502a84997731dd07976e1c42dec34d07ff.png', '00331926225b9f958dc2bd40e26fc317a5410490.png', 'f8838d1baed14dcfa7b91892f884352dff3d3bcc.png', 'f8838d1baed14dcfa7b91892f884352dff3d3bcc.png', 'f8838d1baed14dcfa7b91892f884352dff3d3bcc.png', 'f8838d1baed14dcfa7b91892f884352dff3d3bcc.png', 'f8838d1baed14dcfa7b91892f884352dff3d3bcc.png', 'd43ceef74dd0188934b354e7b697165ba360c0fa.png', '5680cb9404e2091dd1e75948023f7890ff52e7bd.png', 'd43ceef74dd0188934b354e7b697165ba360c0fa.png', '5680cb9404e2091dd1e75948023f7890ff52e7bd.png', 'd43ceef74dd0188934b354e7b697165ba360c0fa.png', '5680cb9404e2091dd1e75948023f7890ff52e7bd.png', 'd43ceef74dd0188934b354e7b697165ba360c0fa.png', '5680cb9404e2091dd1e75948023f7890ff52e7bd.png', 'd43ceef74dd0188934b354e7b697165ba360c0fa.png', '5680cb9404e2091dd1e75948023f7890ff52e7bd.png', '0c17c56e22dd47458d194700e5041d4a442498a7.jpg', '0c17c56e22dd47458d194700e5041d4a442498a7.jpg', '0c17c56e22dd47458d194700e5041d4a442498a7.jpg', '0c17c56e22dd47458d194700e5041d4a442498a7.jpg', '0c17c56e22dd47458d194700e5041d4a442498a7.jpg', 'a9177725dba21dfa31ee913a1dff6f248a870c21.png', 'a9177725dba21dfa31ee913a1dff6f248a870c21.png', 'a9177725dba21dfa31ee913a1dff6f248a870c21.png', 'a9177725dba21dfa31ee913a1dff6f248a870c21.png', '7ed37ca406886dc36ac7528d0dbc314f8131fc93.png', 'a9292509dedf7d1f4444fb605bcaa5fdd824025c.png', '7ed37ca406886dc36ac7528d0dbc314f8131fc93.png', 'a9292509dedf7d1f4444fb605bcaa5fdd824025c.png', '7ed37ca406886dc36ac7528d0dbc314f8131fc93.png', 'a9292509dedf7d1f4444fb605bcaa5fdd824025c.png', '7ed37ca406886dc36ac7528d0dbc314f8131fc93.png', 'a9292509dedf7d1f4444fb605bcaa5fdd824025c.png', '7ed37ca406886dc36ac7528d0dbc314f8131fc93.png', 'a9292509dedf7d1f4444fb605bcaa5fdd824025c.png', 'a7d4238a28e6eef5321d3f6278fb17ce5a9461cf.png', 'a7d4238a28e6eef5321d3f6278fb17ce5a9461cf.png', 'a7d4238a28e6eef5321d3f6278fb17ce5a9461cf.png', 'a7d4238a28e6eef5321d3f6278fb17ce5a9461cf.png', '9c4bd335b86b2df589bd081c62ed14f76af9fbf1.png', '2ea6aaf265c7867e810962778e47206572ad6645.png', '2ea6aaf265c7867e810962778e47206572ad6645.png', '2ea6aaf265c7867e810962778e47206572ad6645.png', '2ea6aaf265c7867e810962778e47206572ad6645.png', '2ea6aaf265c7867e810962778e47206572ad6645.png', 'f604b8a3885059f6f7dcaa9e810b5e0ee85feffc.jpg', 'f604b8a3885059f6f7dcaa9e810b5e0ee85feffc.jpg', 'a66acefa7ba5dd3b8c8b373a5a5e2f40cda75949.gif', 'a66acefa7ba5dd3b8c8b373a5a5e2f40cda75949.gif', 'a66acefa7ba5dd3b8c8b373a5a5e2f40cda75949.gif', '70b2307949b45ec23422feeb970841e97cf6699e.png', '70b2307949b45ec23422feeb970841e97cf6699e.png', '70b2307949b45ec23422feeb970841e97cf6699e.png', '70b2307949b45ec23422feeb970841e97cf6699e.png', '07805f0161b86435e44b3f5dbaed40a65aad30a3.jpeg', '07805f0161b86435e44b3f5dbaed40a65aad30a3.jpeg', '07805f0161b86435e44b3f5dbaed40a65aad30a3.jpeg', '07805f0161b86435e44b3f5dbaed40a65aad30a3.jpeg', '07805f0161b86435e44b3f5dbaed40a65aad30a3.jpeg', 'fac9914362a90f55b7ebff2f84b0c6519cecbde8.png', 'fac9914362a90f55b7ebff2f84b0c6519cecbde8.png', 'fac9914362a90f55b7ebff2f84b0c6519cecbde8.png', 'fac9914362a90f55b7ebff2f84b0c6519cecbde8.png', 'fac9914362a90f55b7ebff2f84b0c6519cecbde8.png', 'ced0bfd6aa6528cd5a37f110ed20a1fa533c08d1.png', 'ced0bfd6aa6528cd5a37f110ed20a1fa533c08d1.png', 'ced0bfd6aa6528cd5a37f110ed20a1fa533c08d1.png', 'ced0bfd6aa6528cd5a37f110ed20a1fa533c08d1.png', '44386e7365b30ec322515048ad5ccd753cf8ca91.png', '44386e7365b30ec322515048ad5ccd753cf8ca91.png', '44386e7365b30ec322515048ad5ccd753cf8ca91.png', '44386e7365b30ec322515048ad5ccd753cf8ca91.png', '44386e7365b30ec322515048ad5ccd753cf8ca91.png', '8a91e02bb2ab6d378952f8b2447a485f2d5566fb.png', '677ca11ffd95f60fc43659596f8869eb8767a422.png', '8a91e02bb2ab6d378952f8b2447a485f2d5566fb.png', '677ca11ffd95f60fc43659596f8869eb8767a422.png', '8a91e02bb2ab6d378952f8b2447a485f2d5566fb.png', '677ca11ffd95f60fc43659596f8869eb8767a422.png', '8a91e02bb2ab6d378952f8b2447a485f2d5566fb.png', '677ca11ffd95f60fc43659596f8869eb8767a422.png', '8a91e02bb2ab6d378952f8b2447a485f2d5566fb.png', '677ca11ffd95f60fc43659596f8869eb8767a422.png', '7a8414c254f82660ebe4b30477e5e447898e70cd.png', 'c12e59df4eb21c00cb0b9efe78f61ebd67970549.png', 'a4060ea1144766a2c9ba22431c0efa9a3534b317.png', 'd1c5a3b39f29a88279a3577dffe1ae484168b0fb.png', 'd1c5a3b39f29a88279a3577dffe1ae484168b0fb.png', 'd1c5a3b39f29a88279a3577dffe1ae484168b0fb.png', 'd1c5a3b39f29a88279a3577dffe1ae484168b0fb.png', 'd1c5a3b39f29a88279a3577dffe1ae484168b0fb.png', '42ad3c7fc7b095b0cf2c58714a79c2ef61aad91a.png', 'c6076437032a0a7e8c8257f9838397c2c0e8c62b.png', '42ad3c7fc7b095b0cf2c58714a79c2ef61aad91a.png', 'c6076437032a0a7e8c8257f9838397c2c0e8c62b.png', '42ad3c7fc7b095b0cf2c58714a79c2ef61aad91a.png', 'c6076437032a0a7e8c8257f9838397c2c0e8c62b.png', '42ad3c7fc7b095b0cf2c58714a79c2ef61aad91a.png', 'c6076437032a0a7e8c8257f9838397c2c0e8c62b.png', 'b6e2b6019f55be78cc121c6a39268c3cc480ddec.png', 'b6e2b6019f55be78cc121c6a39268c3cc480ddec.png', 'b6e2b6019f55be78cc121c6a39268c3cc480ddec.png', 'b6e2b6019f55be78cc121c6a39268c3cc480ddec.png', 'b6e2b6019f55be78cc121c6a39268c3cc480ddec.png', '471fe147f52e6a76ee471fa3f2073e752c13c38c.png', 'cc409761a6352b7b904e22de82388647391b5255.png', '471fe147f52e6a76ee471fa3f2073e752c13c38c.png', 'cc409761a6352b7b904e22de82388647391b5255.png', '471fe147f52e6a76ee471fa3f2073e752c13c38c.png', 'cc409761a6352b7b904e22de82388647391b5255.png', '471fe147f52e6a76ee471fa3f2073e752c13c38c.png', 'cc409761a6352b7b904e22de82388647391b5255.png', '471fe147f52e6a76ee471fa3f2073e752c13c38c.png', 'cc409761a6352b7b904e22de82388647391b5255.png', '4e6d35f1647f4494b9b87fc897a147b000bde385.png', '813ff0b72eb262f1242b248a05043bf597e057bc.png', '4e6d35f1647f4494b9b87fc897a147b000bde385.png', '813ff0b72eb262f1242b248a05043bf597e057bc.png', '4e6d35f1647f4494b9b87fc897a147b000bde385.png', '813ff0b72eb262f1242b248a05043bf597e057bc.png', '4e6d35f1647f4494b9b87fc897a147b000bde385.png', '813ff0b72eb262f1242b248a05043bf597e057bc.png', '4e6d35f1647f4494b9b87fc897a147b000bde385.png', '813ff0b72eb262f1242b248a05043bf597e057bc.png', '0ff2785e2fb7f05636346e9ab0eed87ba4f5bcfe.png', 'dfb06347cab8e99aad3247123054119221ffc5ea.png', '0ff2785e2fb7f05636346e9ab0eed87ba4f5bcfe.png', 'dfb06347cab8e99aad3247123054119221ffc5ea.png', '0ff2785e2fb7f05636346e9ab0eed87ba4f5bcfe.png', 'dfb06347cab8e99aad3247123054119221ffc5ea.png', '0ff2785e2fb7f05636346e9ab0eed87ba4f5bcfe.png', 'dfb06347cab8e99aad3247123054119221ffc5ea.png', '0ff2785e2fb7f05636346e9ab0eed87ba4f5bcfe.png', 'dfb06347cab8e99aad3247123054119221ffc5ea.png', '97b65eb4a4df523614e13512a3cb4ac30e2ce524.png', '97b65eb4a4df523614e13512a3cb4ac30e2ce524.png', '97b65eb4a4df523614e13512a3cb4ac30e2ce524.png', '97b65eb4a4df523614e13512a3cb4ac30e2ce524.png', '97b65eb4a4df523614e13512a3cb4ac30e2ce524.png', 'f444d43548f39a7be4ef3d4f1a08f67109cc4c1f.png', '4c3609b14c711238cb249d6581b1edaa5864baed.png', '4e7b1ecfe76eac4d8d1e462361727bacc3ec4bb2.png', '86cad3192a288fe989294711bf345a8a11110786.png', '2fbbe0e6846f89dd5ffe630aad6c817db51127c5.png', '2fbbe0e6846f89dd5ffe630aad6c817db51127c5.png', '2fbbe0e6846f89dd5ffe630aad6c817db51127c5.png', '2fbbe0e6846f89dd5ffe630aad6c817db51127c5.png', '2fbbe0e6846f89dd5ffe630aad6c817db51127c5.png', 'c32446eefd5ab97ffd3df978cdb77014cd00c0c2.png', 'c32446eefd5ab97ffd3df978cdb77014cd00c0c2.png', 'c32446eefd5ab97ffd3df978cdb77014cd00c0c2.png', 'c32446eefd5ab97ffd3df978cdb77014cd00c0c2.png', 'c32446eefd5ab97ffd3df978cdb77014cd00c0c2.png', '913ad84d2559ba15b114b3a05d09cb1e062ab14a.jpg', '07f25c9b4fabe76db646a5ba209865b16bc94f36.png', '913ad84d2559ba15b114b3a05d09cb1e062ab14a.jpg', '07f25c9b4fabe76db646a5ba209865b16bc94f36.png', '913ad84d2559ba15b114b3a05d09cb1e062ab14a.jpg', '07f25c9b4fabe76db646a5ba209865b16bc94f36.png', '913ad84d2559ba15b114b3a05d09cb1e062ab14a.jpg', '07f25c9b4fabe76db646a5ba209865b16bc94f36.png', '913ad84d2559ba15b114b3a05d09cb1e062ab14a.jpg', '07f25c9b4fabe76db646a5ba209865b16bc94f36.png', 'e6ffa6fe87ba688afcfeb83bff79f5b7ec197c1f.png', 'e6ffa6fe87ba688afcfeb83bff79f5b7ec197c1f.png', 'e6ffa6fe87ba688afcfeb83bff79f5b7ec197c1f.png', 'e6ffa6fe87ba688afcfeb83bff79f5b7ec197c1f.png', '5ff2f597f87ac79baed3375203b3779c72edf5c4.png', 'bf87812071ab113669a8d9d10f51e2724596fe77.png', 'e7d9e911df384534874df2d1127a78782a8f240d.png', 'e6ffa6fe87ba688afcfeb83bff79f5b7ec197c1f.png', 'fdaadfb4f44ac360fcbe2966b08f03c723b8cfb8.png', 'fdaadfb4f44ac360fcbe2966b08f03c723b8cfb8.png', 'fdaadfb4f44ac360fcbe2966b08f03c723b8cfb8.png', 'fdaadfb4f44ac360fcbe2966b08f03c723b8cfb8.png', 'fdaadfb4f44ac360fcbe2966b08f03c723b8cfb8.png', '3fd5a2a3e5df7248aa27d01e101d12af1b07d768.png', '33864c3f0f2474a0336d3c1c8e37d400456b9d44.png', '85f102bf11f98f15b4afb8e45f1c7d82d96dfd7d.png', '03236ebd3be6de36af5b386f6e647644bc3839c5.png', 'dbe135898e23bb8302dc401619b500ef45991519.png', '15e10f2fde8ddf525e837980abf19a95acbafa69.png', 'e645e305addd14c26245fffd99878856bf1fa697.png', '80e3299ac61047be8c59d46e95e50807b296c607.png', 'fb32a1c3e00e8491e4986b2503fd9e33a8786f80.png', '670e8c73dce86308d71b202dd18404effecb7efe.png', '03236ebd3be6de36af5b386f6e647644bc3839c5.png', 'fb32a1c3e00e8491e4986b2503fd9e33a8786f80.png', 'e645e305addd14c26245fffd99878856bf1fa697.png', '80e3299ac61047be8c59d46e95e50807b296c607.png', '670e8c73dce86308d71b202dd18404effecb7efe.png', 'dbe135898e23bb8302dc401619b500ef45991519.png', 'a4f0083a1222a8a5d2ad4146badfa39d7b2095e2.png', 'a4f0083a1222a8a5d2ad4146badfa39d7b2095e2.png', 'a4f0083a1222a8a5d2ad4146badfa39d7b2095e2.png', 'a4f0083a1222a8a5d2ad4146badfa39d7b2095e2.png', 'a4f0083a1222a8a5d2ad4146badfa39d7b2095e2.png', '57875574d13e8253beb19218e5060b2236556666.png', '933894cdc71f0b170c04e7a3aad328086f680b9c.png', '57875574d13e8253beb19218e5060b2236556666.png', '933894cdc71f0b170c04e7a3aad328086f680b9c.png', '57875574d13e8253beb19218e5060b2236556666.png', '933894cdc71f0b170c04e7a3aad328086f680b9c.png', '57875574d13e8253beb19218e5060b2236556666.png', '933894cdc71f0b170c04e7a3aad328086f680b9c.png', '57875574d13e8253beb19218e5060b2236556666.png', '933894cdc71f0b170c04e7a3aad328086f680b9c.png', '6899456e3eb919b864642d43c5b562d4cb9b4de9.png', '6899456e3eb919b864642d43c5b562d4cb9b4de9.png', '6899456e3eb919b864642d43c5b562d4cb9b4de9.png', '6899456e3eb919b864642d43c5b562d4cb9b4de9.png', 'f7ad16e16ac0ad89b6d14091f755bbacb1be7ea7.png', 'f7ad16e16ac0ad89b6d14091f755bbacb1be7ea7.png', 'f7ad16e16ac0ad89b6d14091f755bbacb1be7ea7.png', 'f7ad16e16ac0ad89b6d14091f755bbacb1be7ea7.png', 'f7ad16e16ac0ad89b6d14091f755bbacb1be7ea7.png', '2dfa007d612b438730267381a9c61025304b4fcf.png', '2dfa007d612b438730267381a9c61025304b4fcf.png', '2dfa007d612b438730267381a9c61025304b4fcf.png', '2dfa007d612b438730267381a9c61025304b4fcf.png', '8882946b4cf6dde9c4f6b5ae960fc72f3a082c36.png', '8882946b4cf6dde9c4f6b5ae960fc72f3a082c36.png', '8882946b4cf6dde9c4f6b5ae960fc72f3a082c36.png', '8882946b4cf6dde9c4f6b5ae960fc72f3a082c36.png', '8882946b4cf6dde9c4f6b5ae960fc72f3a082c36.png', '930de7e71d38dd50116bff16c5ef248d5360ba85.png', '930de7e71d38dd50116bff16c5ef248d5360ba85.png', '930de7e71d38dd50116bff16c5ef248d5360ba85.png', '930de7e71d38dd50116bff16c5ef248d5360ba85.png', '930de7e71d38dd50116bff16c5ef248d5360ba85.png', '938cbbf1f49c2b0e9b7ecdef7b6de0fabf073e17.png', '9a202faef9397d801cf02b1e4f76e2437549e17e.png', '938cbbf1f49c2b0e9b7ecdef7b6de0fabf073e17.png', '9a202faef9397d801cf02b1e4f76e2437549e17e.png', '07ecf627611b067f272b475819d1b3f8600c6b17.png', '34249e3f706dcd592c787177fe70b4aff085f48a.png', '7f3433741a9176d4bb009ebb20fd1e8f646a5cfe.png', 'c1663cd44b4f7ccb0271b395e5b5e5e067d6aa42.png', '938cbbf1f49c2b0e9b7ecdef7b6de0fabf073e17.png', '9a202faef9397d801cf02b1e4f76e2437549e17e.png', '938cbbf1f49c2b0e9b7ecdef7b6de0fabf073e17.png', '9a202faef9397d801cf02b1e4f76e2437549e17e.png', 'cc70108c997e780616d52b3498fa609a744f0ae8.png', '5ef05447a211e6717f7434fbce8722c8fbde6249.png', 'cc70108c997e780616d52b3498fa609a744f0ae8.png', '5ef05447a211e6717f7434fbce8722c8fbde6249.png', 'cc70108c997e780616d52b3498fa609a744f0ae8.png', '5ef05447a211e6717f7434fbce8722c8fbde6249.png', 'cc70108c997e780616d52b3498fa609a744f0ae8.png', '5ef05447a211e6717f7434fbce8722c8fbde6249.png', 'cc70108c997e780616d52b3498fa609a744f0ae8.png', '5ef05447a211e6717f7434fbce8722c8fbde6249.png', 'd071b29936ca3a4683b6be411f3d9727ae525f0e.png', '59de981838675752e9713db0cb988afd8ce4cdf4.png', 'd071b29936ca3a4683b6be411f3d9727ae525f0e.png', '59de981838675752e9713db0cb988afd8ce4cdf4.png', 'd071b29936ca3a4683b6be411f3d9727ae525f0e.png', '59de981838675752e9713db0cb988afd8ce4cdf4.png', 'd071b29936ca3a4683b6be411f3d9727ae525f0e.png', '59de981838675752e9713db0cb988afd8ce4cdf4.png', 'd071b29936ca3a4683b6be411f3d9727ae525f0e.png', '59de981838675752e9713db0cb988afd8ce4cdf4.png', '02d7225cdb984001182a71860de7de8fdb615ac9.png', 'c52b50b4e211ed8a1b63e63b1601d6002cba60c7.png', '02d7225cdb984001182a71860de7de8fdb615ac9.png', '02d7225cdb984001182a71860de7de8fdb615ac9.png', '02d7225cdb984001182a71860de7de8fdb615ac9.png', '3822cd6755d9e90d5abb895e50c1eacde003b663.png', 'ff1f17d1617d6b56e821c316c91dfa942c3c736f.png', '02d7225cdb984001182a71860de7de8fdb615ac9.png', '5f459d3dfec7cf31eba002ba7be828be9e3a0938.png', '5f459d3dfec7cf31eba002ba7be828be9e3a0938.png', '5f459d3dfec7cf31eba002ba7be828be9e3a0938.png', '5f459d3dfec7cf31eba002ba7be828be9e3a0938.png', '5f459d3dfec7cf31eba002ba7be828be9e3a0938.png', '0835d2031e50636ba02d79d6a1b5800fe5cecd10.png', '8f572b9d71df0a665c1ec039a5760638d5017370.png', '0835d2031e50636ba02d79d6a1b5800fe5cecd10.png', '8f572b9d71df0a665c1ec039a5760638d5017370.png', '0835d2031e50636ba02d79d6a1b5800fe5cecd10.png', '8f572b9d71df0a665c1ec039a5760638d5017370.png', '0835d2031e50636ba02d79d6a1b5800fe5cecd10.png', '8f572b9d71df0a665c1ec039a5760638d5017370.png', '0835d2031e50636ba02d79d6a1b5800fe5cecd10.png', '8f572b9d71df0a665c1ec039a5760638d5017370.png', 'b81952c2f7c4e1ab1e088fc8600deedacbcbe21b.png', 'ada2e51bb436511c7d8c084bd511d81e3d09f499.png', 'b1c1068e047980095cc9608b622b48b014634b14.png', 'b81952c2f7c4e1ab1e088fc8600deedacbcbe21b.png', 'ada2e51bb436511c7d8c084bd511d81e3d09f499.png', 'b1c1068e047980095cc9608b622b48b014634b14.png', 'b81952c2f7c4e1ab1e088fc8600deedacbcbe21b.png', 'ada2e51bb436511c7d8c084bd511d81e3d09f499.png', 'b1c1068e047980095cc9608b622b48b014634b14.png', 'b81952c2f7c4e1ab1e088fc8600deedacbcbe21b.png', 'ada2e51bb436511c7d8c084bd511d81e3d09f499.png', 'b1c1068e047980095cc9608b622b48b014634b14.png', 'b81952c2f7c4e1ab1e088fc8600deedacbcbe21b.png', 'ada2e51bb436511c7d8c084bd511d81e3d09f499.png', 'b1c1068e047980095cc9608b622b48b014634b14.png', 'd5816bd0ad5213ccec24451689f79e91870abcc7.png', '1d2392d10f6ec380e6f6cbc908afff016b181f4e.png', 'd5816bd0ad5213ccec24451689f79e91870abcc7.png', '1d2392d10f6ec380e6f6cbc908afff016b181f4e.png', 'd5816bd0ad5213ccec24451689f79e91870abcc7.png', '1d2392d10f6ec380e6f6cbc908afff016b181f4e.png', 'd5816bd0ad5213ccec24451689f79e91870abcc7.png', '1d2392d10f6ec380e6f6cbc908afff016b181f4e.png', 'd5816bd0ad5213ccec24451689f79e91870abcc7.png', '1d2392d10f6ec380e6f6cbc908afff016b181f4e.png', 'fa1a12bcf4210ddd58a3b70babc94a522192a5cb.png', 'fa1a12bcf4210ddd58a3b70babc94a522192a5cb.png', 'fa1a12bcf4210ddd58a3b70babc94a522192a5cb.png', 'fa1a12bcf4210ddd58a3b70babc94a522192a5cb.png', 'fa1a12bcf4210ddd58a3b70babc94a522192a5cb.png', '2b31126a201dc012f97778fe94f84042cc5f0197.png', '2b31126a201dc012f97778fe94f84042cc5f0197.png', '2b31126a201dc012f97778fe94f84042cc5f0197.png', '2b31126a201dc012f97778fe94f84042cc5f0197.png', '2b31126a201dc012f97778fe94f84042cc5f0197.png', '44f2116898e9ff4379d3f353d54678ff3bc7304b.png', '44f2116898e9ff4379d3f353d54678ff3bc7304b.png', '44f2116898e9ff4379d3f353d54678ff3bc7304b.png', '44f2116898e9ff4379d3f353d54678ff3bc7304b.png', '888c69b0ff5a1f23f8e1bc17eda92b791c906080.png', '888c69b0ff5a1f23f8e1bc17eda92b791c906080.png', '888c69b0ff5a1f23f8e1bc17eda92b791c906080.png', '888c69b0ff5a1f23f8e1bc17eda92b791c906080.png', 'cda304d5e117055303d71112f1d964faefb0a744.png', '888c69b0ff5a1f23f8e1bc17eda92b791c906080.png', 'e5c9c823953990eef4ac742136f1e95222a3a28e.png', 'accecf2e8d82a9122d68a8843b496019aa548e97.png', '1f9b42467afb920cfb0beb0fa9261b7db88cedb1.png', 'accecf2e8d82a9122d68a8843b496019aa548e97.png', '1f9b42467afb920cfb0beb0fa9261b7db88cedb1.png', 'accecf2e8d82a9122d68a8843b496019aa548e97.png', '1f9b42467afb920cfb0beb0fa9261b7db88cedb1.png', 'accecf2e8d82a9122d68a8843b496019aa548e97.png', '1f9b42467afb920cfb0beb0fa9261b7db88cedb1.png', 'accecf2e8d82a9122d68a8843b496019aa548e97.png', '1f9b42467afb920cfb0beb0fa9261b7db88cedb1.png', '87ee418470a8c71b36bc0c58b53d8ce797e5ddea.png', '87ee418470a8c71b36bc0c58b53d8ce797e5ddea.png', '87ee418470a8c71b36bc0c58b53d8ce797e5ddea.png', '87ee418470a8c71b36bc0c58b53d8ce797e5ddea.png', '87ee418470a8c71b36bc0c58b53d8ce797e5ddea.png', '04ca34dfe2a3c8a4d5a6da40a6a02481054de26b.png', '15b9640f374e1e2bbe1f9fd9577201c93fb8221b.png', '61daaf54fc7bf5a31840a9625c8a340497cbb827.png', 'e35419e7736d8b3015de573462b0cb9ad34fe5a2.png', 'c0518fd9139a37028fac1dc9a5ef96b562eadd72.png', 'd60a25d9798e14d8d2a58bc42e32ba2097d08b2e.png', 'c0518fd9139a37028fac1dc9a5ef96b562eadd72.png', 'd60a25d9798e14d8d2a58bc42e32ba2097d08b2e.png', 'c0518fd9139a37028fac1dc9a5ef96b562eadd72.png', 'd60a25d9798e14d8d2a58bc42e32ba2097d08b2e.png', 'c0518fd9139a37028fac1dc9a5ef96b562eadd72.png', 'd60a25d9798e14d8d2a58bc42e32ba2097d08b2e.png', 'c0518fd9139a37028fac1dc9a5ef96b562eadd72.png', 'd60a25d9798e14d8d2a58bc42e32ba2097d08b2e.png', '891656c4ddf2093e287babf910a621f802d0998e.png', '891656c4ddf2093e287babf910a621f802d0998e.png', '891656c4ddf2093e287babf910a621f802d0998e.png', '891656c4ddf2093e287babf910a621f802d0998e.png', '891656c4ddf2093e287babf910a621f802d0998e.png', '07a4fe150cd566b260e646735bf148578ff16641.png', '07a4fe150cd566b260e646735bf148578ff16641.png', '07a4fe150cd566b260e646735bf148578ff16641.png', '07a4fe150cd566b260e646735bf148578ff16641.png', '07a4fe150cd566b260e646735bf148578ff16641.png', 'f028a78f72fb97293b08a1154fd7cc2b9dcec7f6.jpg', 'f29ff5cde6952859a11034b927c0b7c476e95a61.png', 'f028a78f72fb97293b08a1154fd7cc2b9dcec7f6.jpg', 'f29ff5cde6952859a11034b927c0b7c476e95a61.png', 'f028a78f72fb97293b08a1154fd7cc2b9dcec7f6.jpg', 'f29ff5cde6952859a11034b927c0b7c476e95a61.png', 'f028a78f72fb97293b08a1154fd7cc2b9dcec7f6.jpg', 'f29ff5cde6952859a11034b927c0b7c476e95a61.png', 'f028a78f72fb97293b08a1154fd7cc2b9dcec7f6.jpg', 'f29ff5cde6952859a11034b927c0b7c476e95a61.png', 'f604b8a3885059f6f7dcaa9e810b5e0ee85feffc.jpg', 'f604b8a3885059f6f7dcaa9e810b5e0ee85feffc.jpg', 'f604b8a3885059f6f7dcaa9e810b5e0ee85feffc.jpg', 'a66acefa7ba5dd3b8c8b373a5a5e2f40cda75949.gif', 'a66acefa7ba5dd3b8c8b373a5a5e2f40cda75949.gif', '70b2307949b45ec23422feeb970841e97cf6699e.png', 'b528237ae43660ade8582a506c8db0577923f3d7.png', 'b528237ae43660ade8582a506c8db0577923f3d7.png', 'b528237ae43660ade8582a506c8db0577923f3d7.png', 'b528237ae43660ade8582a506c8db0577923f3d7.png', '9794bf1f9ecad80ef95b8b4eca5790cfc239a638.png', '655010063d3b2f4b6998b55de0efec13dab26c8f.png', '9794bf1f9ecad80ef95b8b4eca5790cfc239a638.png', '655010063d3b2f4b6998b55de0efec13dab26c8f.png', '9794bf1f9ecad80ef95b8b4eca5790cfc239a638.png', '655010063d3b2f4b6998b55de0efec13dab26c8f.png', '9794bf1f9ecad80ef95b8b4eca5790cfc239a638.png', '655010063d3b2f4b6998b55de0efec13dab26c8f.png', '9794bf1f9ecad80ef95b8b4eca5790cfc239a638.png', '655010063d3b2f4b6998b55de0efec13dab26c8f.png', '4d9988ab077027ef19c5c3326ba5a0594dbe371d.png', '4d9988ab077027ef19c5c3326ba5a0594dbe371d.png', '4d9988ab077027ef19c5c3326ba5a0594dbe371d.png', '4d9988ab077027ef19c5c3326ba5a0594dbe371d.png', 'a42b16fb4014b7379dfed31eed3f3db0f824c0d4.png', 'a42b16fb4014b7379dfed31eed3f3db0f824c0d4.png', 'a42b16fb4014b7379dfed31eed3f3db0f824c0d4.png', 'a42b16fb4014b7379dfed31eed3f3db0f824c0d4.png', 'a42b16fb4014b7379dfed31eed3f3db0f824c0d4.png', '35b10867a4f38030c9354d1a828b62e5e589f34a.png', '35b10867a4f38030c9354d1a828b62e5e589f34a.png', '35b10867a4f38030c9354d1a828b62e5e589f34a.png', '35b10867a4f38030c9354d1a828b62e5e589f34a.png', '35b10867a4f38030c9354d1a828b62e5e589f34a.png', '870f615150eef1867de72f1a3aff91552840587d.png', '870f615150eef1867de72f1a3aff91552840587d.png', '870f615150eef1867de72f1a3aff91552840587d.png', '870f615150eef1867de72f1a3aff91552840587d.png', '870f615150eef1867de72f1a3aff91552840587d.png', '9fb497b6daac8812b52ce33c4f6aef830b50d593.png', '982cb7c35c0112b5016075143e6f764718539e24.png', '9fb497b6daac8812b52ce33c4f6aef830b50d593.png', '982cb7c35c0112b5016075143e6f764718539e24.png', '9fb497b6daac8812b52ce33c4f6aef830b50d593.png', '982cb7c35c0112b5016075143e6f764718539e24.png', '9fb497b6daac8812b52ce33c4f6aef830b50d593.png', '982cb7c35c0112b5016075143e6f764718539e24.png', '93626938488096b66d6504978a6ab1aab2b8e6a3.png', '2455b014bc6897cd1220bdff573fd62902b0a87c.png', '93626938488096b66d6504978a6ab1aab2b8e6a3.png', '2455b014bc6897cd1220bdff573fd62902b0a87c.png', '2a3b1bcb8736dacb24ba511aa577a3529e6c3714.png', '590110f4134d8d3118e0d4365c0640b18939686d.png', '590110f4134d8d3118e0d4365c0640b18939686d.png', '590110f4134d8d3118e0d4365c0640b18939686d.png', '590110f4134d8d3118e0d4365c0640b18939686d.png', '590110f4134d8d3118e0d4365c0640b18939686d.png', 'b528237ae43660ade8582a506c8db0577923f3d7.png', 'd2f614d9c8a0e5a45c63026e2f2ed88aa15bc993.png', 'd2f614d9c8a0e5a45c63026e2f2ed88aa15bc993.png', 'd2f614d9c8a0e5a45c63026e2f2ed88aa15bc993.png', 'd2f614d9c8a0e5a45c63026e2f2ed88aa15bc993.png', 'd2f614d9c8a0e5a45c63026e2f2ed88aa15bc993.png', '3e71aa42ca4faebf807a540d2f14a0babe777bbe.png', '3e71aa42ca4faebf807a540d2f14a0babe777bbe.png', '3e71aa42ca4faebf807a540d2f14a0babe777bbe.png', '3e71aa42ca4faebf807a540d2f14a0babe777bbe.png', '3e71aa42ca4faebf807a540d2f14a0babe777bbe.png', '6899456e3eb919b864642d43c5b562d4cb9b4de9.png', '938cbbf1f49c2b0e9b7ecdef7b6de0fabf073e17.png', '9a202faef9397d801cf02b1e4f76e2437549e17e.png', '9c4bd335b86b2df589bd081c62ed14f76af9fbf1.png', '118064ba6986b20c7f1b601aacf768c2c691c38f.png', 'bb11ff337c89f6ff33b845da4a956defa43a389b.png', 'bb11ff337c89f6ff33b845da4a956defa43a389b.png', 'bb11ff337c89f6ff33b845da4a956defa43a389b.png', 'bb11ff337c89f6ff33b845da4a956defa43a389b.png', 'bb11ff337c89f6ff33b845da4a956defa43a389b.png', 'ce0d08d50a4129f9f4a9a7bb6ffc9407cbbe5fed.png', 'cd6e11a78fb097eae27f446623c66412779b77d9.png', 'f3cbf3b8375c736432b951089fbb5bdf1c9af583.png', 'd7128d7739544e5a2f4b0cf20f59fc87eb79731a.png', 'ce0d08d50a4129f9f4a9a7bb6ffc9407cbbe5fed.png', 'cd6e11a78fb097eae27f446623c66412779b77d9.png', 'f3cbf3b8375c736432b951089fbb5bdf1c9af583.png', 'd7128d7739544e5a2f4b0cf20f59fc87eb79731a.png', 'ce0d08d50a4129f9f4a9a7bb6ffc9407cbbe5fed.png', 'cd6e11a78fb097eae27f446623c66412779b77d9.png', 'f3cbf3b8375c736432b951089fbb5bdf1c9af583.png', 'd7128d7739544e5a2f4b0cf20f59fc87eb79731a.png', 'ce0d08d50a4129f9f4a9a7bb6ffc9407cbbe5fed.png', 'cd6e11a78fb097eae27f446623c66412779b77d9.png', 'f3cbf3b8375c736432b951089fbb5bdf1c9af583.png', 'd7128d7739544e5a2f4b0cf20f59fc87eb79731a.png', 'ce0d08d50a4129f9f4a9a7bb6ffc9407cbbe5fed.png', 'cd6e11a78fb097eae27f446623c66412779b77d9.png', 'f3cbf3b8375c736432b951089fbb5bdf1c9af583.png', 'd7128d7739544e5a2f4b0cf20f59fc87eb79731a.png', '2e8aee6dc5ef4ae886b3c26d099610c0fb618534.png', '2e8aee6dc5ef4ae886b3c26d099610c0fb618534.png', '2e8aee6dc5ef4ae886b3c26d099610c0fb618534.png', '2e8aee6dc5ef4ae886b3c26d099610c0fb618534.png', '2e8aee6dc5ef4ae886b3c26d099610c0fb618534.png', 'ee98593c2ca2110238c7af58473f2fa2e178500f.png', 'ee98593c2ca2110238c7af58473f2fa2e178500f.png', 'ee98593c2ca2110238c7af58473f2fa2e178500f.png', 'ee98593c2ca2110238c7af58473f2fa2e178500f.png', 'dedca18993fb2e898c7377aee69c71e8e6646183.png', '7138f019e03b3d3847af0443a8eb3dfa2caa4317.png', 'dedca18993fb2e898c7377aee69c71e8e6646183.png', '7138f019e03b3d3847af0443a8eb3dfa2caa4317.png', 'dedca18993fb2e898c7377aee69c71e8e6646183.png', '7138f019e03b3d3847af0443a8eb3dfa2caa4317.png', 'dedca18993fb2e898c7377aee69c71e8e6646183.png', '7138f019e03b3d3847af0443a8eb3dfa2caa4317.png', 'dedca18993fb2e898c7377aee69c71e8e6646183.png', '7138f019e03b3d3847af0443a8eb3dfa2caa4317.png', 'a98f5c935da32bdf5628e69a3bce6c04072d1010.png', '827a45097f7754a3563fdd5b6e968e967dd7af6d.png', 'a98f5c935da32bdf5628e69a3bce6c04072d1010.png', '827a45097f7754a3563fdd5b6e968e967dd7af6d.png', 'a98f5c935da32bdf5628e69a3bce6c04072d1010.png', '827a45097f7754a3563fdd5b6e968e967dd7af6d.png', 'a98f5c935da32bdf5628e69a3bce6c04072d1010.png', '827a45097f7754a3563fdd5b6e968e967dd7af6d.png', 'a98f5c935da32bdf5628e69a3bce6c04072d1010.png', '827a45097f7754a3563fdd5b6e968e967dd7af6d.png', '8a3d77a4b9a000c4c1d2924ff7c8da23fe8c3316.png', '8a3d77a4b9a000c4c1d2924ff7c8da23fe8c3316.png', '8a3d77a4b9a000c4c1d2924ff7c8da23fe8c3316.png', '8a3d77a4b9a000c4c1d2924ff7c8da23fe8c3316.png', '8a3d77a4b9a000c4c1d2924ff7c8da23fe8c3316.png', '1c5dba856375fe819295305bc72ce0f452c5b59b.jpg', 'a92d97f3f1a6f2be09a4c08fbf00a5e95f8d6cb8.png', '1c5dba856375fe819295305bc72ce0f452c5b59b.jpg', 'a92d97f3f1a6f2be09a4c08fbf00a5e95f8d6cb8.png', '1c5dba856375fe819295305bc72ce0f452c5b59b.jpg', 'a92d97f3f1a6f2be09a4c08fbf00a5e95f8d6cb8.png', '1c5dba856375fe819295305bc72ce0f452c5b59b.jpg', 'a92d97f3f1a6f2be09a4c08fbf00a5e95f8d6cb8.png', '1c5dba856375fe819295305bc72ce0f452c5b59b.jpg', 'a92d97f3f1a6f2be09a4c08fbf00a5e95f8d6cb8.png', 'd56f45dd89bed9ac9bedaf38fa08dac462902b6d.png', 'd56f45dd89bed9ac9bedaf38fa08dac462902b6d.png', 'd56f45dd89bed9ac9bedaf38fa08dac462902b6d.png', 'd56f45dd89bed9ac9bedaf38fa08dac462902b6d.png', 'd56f45dd89bed9ac9bedaf38fa08dac462902b6d.png', 'ef032da28efb344efea32e4945d5e2c57e6cc02d.png', 'ef032da28efb344efea32e4945d5e2c57e6cc02d.png', 'ef032da28efb344efea32e4945d5e2c57e6cc02d.png', 'ef032da28efb344efea32e4945d5e2c57e6cc02d.png', 'ef032da28efb344efea32e4945d5e2c57e6cc02d.png', '88a5a09c70ff4e1036d015e758a600412429d66b.png', '88a5a09c70ff4e1036d015e758a600412429d66b.png', '88a5a09c70ff4e1036d015e758a600412429d66b.png', 'f74838725edea3f00b4f21cef5a12777114ba08c.png', '88a5a09c70ff4e1036d015e758a600412429d66b.png', '88a5a09c70ff4e1036d015e758a600412429d66b.png', 'ad9288ac000ee547cefa3f818c2410be67c79f24.png', 'b33b98be8be30e92352931acda2f07e1956e584e.png', '87436d5a7443d59f290365785fbd84072f8fbcdc.png', 'b33b98be8be30e92352931acda2f07e1956e584e.png', '87436d5a7443d59f290365785fbd84072f8fbcdc.png', 'b33b98be8be30e92352931acda2f07e1956e584e.png', '87436d5a7443d59f290365785fbd84072f8fbcdc.png', 'b33b98be8be30e92352931acda2f07e1956e584e.png', '87436d5a7443d59f290365785fbd84072f8fbcdc.png', 'b33b98be8be30e92352931acda2f07e1956e584e.png', '87436d5a7443d59f290365785fbd84072f8fbcdc.png', 'f2aa74c022a7bf858cfb17595fd864e2045d247d.png', 'eebb900c4c29102e57df2cd5a17f8a2e3fd27845.png', '3da44817edf357e404d77baecee25d1bcc37abbd.png', '39196c60605d0cc60d7a4eb14244f2c4fa6fe889.png', '30dffbcc50e4a6c0803dd78c339c79bc396e8a33.png', '3d038f60d8616f358e007881b71c84a5411ee01f.png', '3d038f60d8616f358e007881b71c84a5411ee01f.png', '3d038f60d8616f358e007881b71c84a5411ee01f.png', '3d038f60d8616f358e007881b71c84a5411ee01f.png', '0791016233e59f3b68f183ab4a77744cb192c144.png', '0791016233e59f3b68f183ab4a77744cb192c144.png', '0791016233e59f3b68f183ab4a77744cb192c144.png', '0791016233e59f3b68f183ab4a77744cb192c144.png', '0791016233e59f3b68f183ab4a77744cb192c144.png', '9170663ece3df4522bf8db9614a9348d48c89064.png', '9170663ece3df4522bf8db9614a9348d48c89064.png', '9170663ece3df4522bf8db9614a9348d48c89064.png', '9170663ece3df4522bf8db9614a9348d48c89064.png', '9170663ece3df4522bf8db9614a9348d48c89064.png', '4bf918d49616879d1eff6d7cb6018e914948c674.png', '4ec28be05b7504d8ef6224be9ec3cda2758e1166.png', 'dc7c198948c544feca816ad25210a7e7858f7a03.png', 'de6f81bf53df66b0cae1a35353bae359b5059622.png', 'ede197425b25c93bd7e16eaaa46fa136be0da553.png', '1811f9636af2d66423b941ee705976e7674c4088.png', '37903aad170dd1b74bba0601977ec6b3c82b7a05.png', '1811f9636af2d66423b941ee705976e7674c4088.png', '37903aad170dd1b74bba0601977ec6b3c82b7a05.png', '1811f9636af2d66423b941ee705976e7674c4088.png', '37903aad170dd1b74bba0601977ec6b3c82b7a05.png', '1811f9636af2d66423b941ee705976e7674c4088.png', '37903aad170dd1b74bba0601977ec6b3c82b7a05.png', '430fea5cded969db380fac4c5528d35e4e61bc96.png', '430fea5cded969db380fac4c5528d35e4e61bc96.png', '430fea5cded969db380fac4c5528d35e4e61bc96.png', '430fea5cded969db380fac4c5528d35e4e61bc96.png', '430fea5cded969db380fac4c5528d35e4e61bc96.png', '460bd06f028d26d7dac86026ae413091ced1df49.png', '74e92913c7023c0ad5eaa030cb5e0b60cdec0e48.png', 'dcbbba93b44e1c4e82aa7f25864b86544d5b6121.png', 'fc6d2646ef92961d4f07899abfa283ff15abaf5f.png', '42ac189e91f3d91145e3c71945af77e06dacdc64.png', 'ea4247e8a0faffa1630911c990313fc61bcc2b14.png', '42ac189e91f3d91145e3c71945af77e06dacdc64.png', 'ea4247e8a0faffa1630911c990313fc61bcc2b14.png', '42ac189e91f3d91145e3c71945af77e06dacdc64.png', 'ea4247e8a0faffa1630911c990313fc61bcc2b14.png', '42ac189e91f3d91145e3c71945af77e06dacdc64.png', 'ea4247e8a0faffa1630911c990313fc61bcc2b14.png', '42ac189e91f3d91145e3c71945af77e06dacdc64.png', 'ea4247e8a0faffa1630911c990313fc61bcc2b14.png', '8b904683f24362c509d13c3643d801cc78670e85.png', '8b904683f24362c509d13c3643d801cc78670e85.png', '8b904683f24362c509d13c3643d801cc78670e85.png', '8b904683f24362c509d13c3643d801cc78670e85.png', '98fb377c816484da9795657bc94917e9cdad085c.png', '98fb377c816484da9795657bc94917e9cdad085c.png', '98fb377c816484da9795657bc94917e9cdad085c.png', '98fb377c816484da9795657bc94917e9cdad085c.png', '98fb377c816484da9795657bc94917e9cdad085c.png', 'd0170b33252005d5daf43b603c4768b8192ad789.png', 'cf425cfa2c0a51ff44735553bbe393706f9507a2.png', 'd0170b33252005d5daf43b603c4768b8192ad789.png', 'cf425cfa2c0a51ff44735553bbe393706f9507a2.png', 'd0170b33252005d5daf43b603c4768b8192ad789.png', 'cf425cfa2c0a51ff44735553bbe393706f9507a2.png', 'd0170b33252005d5daf43b603c4768b8192ad789.png', 'cf425cfa2c0a51ff44735553bbe393706f9507a2.png', 'd0170b33252005d5daf43b603c4768b8192ad789.png', 'cf425cfa2c0a51ff44735553bbe393706f9507a2.png', '595c6aec254881481b2406d4de349141284f0149.png', '595c6aec254881481b2406d4de349141284f0149.png', '595c6aec254881481b2406d4de349141284f0149.png', '595c6aec254881481b2406d4de349141284f0149.png', '595c6aec254881481b2406d4de349141284f0149.png', '4f5ddac86792edc8479c5cdd88b5a0281ef9c64d.png', '5b190493ade0eb35c341d965b91c30af69f8c4b9.png', '4f5ddac86792edc8479c5cdd88b5a0281ef9c64d.png', '5b190493ade0eb35c341d965b91c30af69f8c4b9.png', '4f5ddac86792edc8479c5cdd88b5a0281ef9c64d.png', '5b190493ade0eb35c341d965b91c30af69f8c4b9.png', '4f5ddac86792edc8479c5cdd88b5a0281ef9c64d.png', '5b190493ade0eb35c341d965b91c30af69f8c4b9.png', '4f5ddac86792edc8479c5cdd88b5a0281ef9c64d.png', '5b190493ade0eb35c341d965b91c30af69f8c4b9.png', 'be322fadca8f25e604ae3a3137666747299f9cdd.png', 'be322fadca8f25e604ae3a3137666747299f9cdd.png', 'be322fadca8f25e604ae3a3137666747299f9cdd.png', 'be322fadca8f25e604ae3a3137666747299f9cdd.png', 'be322fadca8f25e604ae3a3137666747299f9cdd.png', 'bc4e6c352294d80538ab6f156b9d1fae465fa5c9.png', 'bc4e6c352294d80538ab6f156b9d1fae465fa5c9.png', 'bc4e6c352294d80538ab6f156b9d1fae465fa5c9.png', 'bc4e6c352294d80538ab6f156b9d1fae465fa5c9.png', 'bc4e6c352294d80538ab6f156b9d1fae465fa5c9.png', '873d3a054fbacf5755b2c50a92ba3d22e82643b2.png', '873d3a054fbacf5755b2c50a92ba3d22e82643b2.png', '873d3a054fbacf5755b2c50a92ba3d22e82643b2.png', 'f635afc91144749abadd999fc0e83e489024ef04.png', '4eef2ace53a0c940497d3945bdd5da820d9a7b5d.png', 'f635afc91144749abadd999fc0e83e489024ef04.png', '4eef2ace53a0c940497d3945bdd5da820d9a7b5d.png', 'f635afc91144749abadd999fc0e83e489024ef04.png', '4eef2ace53a0c940497d3945bdd5da820d9a7b5d.png', 'f635afc91144749abadd999fc0e83e489024ef04.png', '4eef2ace53a0c940497d3945bdd5da820d9a7b5d.png', 'f635afc91144749abadd999fc0e83e489024ef04.png', '4eef2ace53a0c940497d3945bdd5da820d9a7b5d.png', 'bee376165dbf364de43c30db1bd2e7946d0f10eb.png', 'b5550556fcbbbae8acd9c0826227a12a6c9e16c5.gif', '329261de38ff022fb67259e8c0fe766c743b9ca5.png', 'ce3a7e7e9971cb80b76c4d46b121de48f4ea9ad1.png', '678040ff236c8ebde7a9adb18bce47fcfc6fd6cd.png', 'ce3a7e7e9971cb80b76c4d46b121de48f4ea9ad1.png', '678040ff236c8ebde7a9adb18bce47fcfc6fd6cd.png', 'ce3a7e7e9971cb80b76c4d46b121de48f4ea9ad1.png', '678040ff236c8ebde7a9adb18bce47fcfc6fd6cd.png', 'ce3a7e7e9971cb80b76c4d46b121de48f4ea9ad1.png', '678040ff236c8ebde7a9adb18bce47fcfc6fd6cd.png', 'ce3a7e7e9971cb80b76c4d46b121de48f4ea9ad1.png', '678040ff236c8ebde7a9adb18bce47fcfc6fd6cd.png', 'bbe137ae0fe801053513abce549cec1c21974e99.png', 'd96be32813d0b72519a8f5622331e3a5b4635c27.png', 'a82e67e3c31acd9a5481c2197f7412efc97425ce.png', '25fa864f0108a545cb14e84907d82c2ba0f8f881.png', '8363fd804fa9c6e11716d1d6915d61ac2e2af56c.png', '214af18c9b14563495daf8d911a6aa490464c307.png', '214af18c9b14563495daf8d911a6aa490464c307.png', '214af18c9b14563495daf8d911a6aa490464c307.png', '214af18c9b14563495daf8d911a6aa490464c307.png', '214af18c9b14563495daf8d911a6aa490464c307.png', '6755858d2d10e28d298159892c1518a0fa39aff9.png', 'ab934a8289c60871d19dd55de310e36fba86511b.png', '6755858d2d10e28d298159892c1518a0fa39aff9.png', 'ab934a8289c60871d19dd55de310e36fba86511b.png', '6755858d2d10e28d298159892c1518a0fa39aff9.png', 'ab934a8289c60871d19dd55de310e36fba86511b.png', '6755858d2d10e28d298159892c1518a0fa39aff9.png', 'ab934a8289c60871d19dd55de310e36fba86511b.png', '6755858d2d10e28d298159892c1518a0fa39aff9.png', 'ab934a8289c60871d19dd55de310e36fba86511b.png', '2790bca626fd01b56cbadc8b979192bf884fc348.png', '61bf4206a619d8ba24057eeca59455fb21c8f027.png', '825a3c7856e3f733a1aafa4fa7b2d3c5b0a35bd1.png', 'd1d67bc8d5cec7208e28532bba2e6352a6b14ee8.png', '9f182bbc690093e1efec6bb64a8de29a1eac1188.png', '7826a0aa383da2e7873c93e173f343d75b82405a.png', '7826a0aa383da2e7873c93e173f343d75b82405a.png', '7826a0aa383da2e7873c93e173f343d75b82405a.png', '7826a0aa383da2e7873c93e173f343d75b82405a.png', '7826a0aa383da2e7873c93e173f343d75b82405a.png', 'aed33546aa0c58b8ca17c2a3ca5f43ebb99a23d9.png', 'aed33546aa0c58b8ca17c2a3ca5f43ebb99a23d9.png', 'aed33546aa0c58b8ca17c2a3ca5f43ebb99a23d9.png', 'aed33546aa0c58b8ca17c2a3ca5f43ebb99a23d9.png', 'aed33546aa0c58b8ca17c2a3ca5f43ebb99a23d9.png', 'e1fb488391d290bdad1b0b4f0c7b4880273d117f.png', 'e1fb488391d290bdad1b0b4f0c7b4880273d117f.png', 'e1fb488391d290bdad1b0b4f0c7b4880273d117f.png', 'e1fb488391d290bdad1b0b4f0c7b4880273d117f.png', 'e1fb488391d290bdad1b0b4f0c7b4880273d117f.png', '5ec91ba2451698faf67c62a1df5ab602b9428f0c.png', '5ec91ba2451698faf67c62a1df5ab602b9428f0c.png', '5ec91ba2451698faf67c62a1df5ab602b9428f0c.png', '5ec91ba2451698faf67c62a1df5ab602b9428f0c.png', 'fead46d20f96dd31851e21e47e5c8f03795c6ba7.png', 'fead46d20f96dd31851e21e47e5c8f03795c6ba7.png', 'fead46d20f96dd31851e21e47e5c8f03795c6ba7.png', 'fead46d20f96dd31851e21e47e5c8f03795c6ba7.png', 'fead46d20f96dd31851e21e47e5c8f03795c6ba7.png', 'efc41cb9a5db5644896dddee87887c6a2759d915.png', 'efc41cb9a5db5644896dddee87887c6a2759d915.png', 'efc41cb9a5db5644896dddee87887c6a2759d915.png', 'efc41cb9a5db5644896dddee87887c6a2759d915.png', 'efc41cb9a5db5644896dddee87887c6a2759d915.png', '4118cef82ce2eb5dcafe7c449ad5fd733599df96.png', '42d94003b4239da2ad532cc7d739c85d0f842b56.png', '97d4ea5b5bb16c94cc7130c4dc4670ac0ab2ba73.png', 'db55302da1fa94608bf15f3c7194e95ced7713d5.png', '878aa84dbec945cb49ebd0d10c9561162fca36d0.png', 'ea212205f1b44e63df055c963a001e105b6aa181.png', '3d038f60d8616f358e007881b71c84a5411ee01f.png', '72977e71285c1958c4212d080bc4968adb294980.png', '72977e71285c1958c4212d080bc4968adb294980.png', '72977e71285c1958c4212d080bc4968adb294980.png', '72977e71285c1958c4212d080bc4968adb294980.png', '72977e71285c1958c4212d080bc4968adb294980.png', 'ac3b942cc764586e07042ebc88780d4046d12e21.png', 'ac3b942cc764586e07042ebc88780d4046d12e21.png', 'ac3b942cc764586e07042ebc88780d4046d12e21.png', 'ac3b942cc764586e07042ebc88780d4046d12e21.png', 'ac3b942cc764586e07042ebc88780d4046d12e21.png', '63a8ca78295626e946d8cba7680dc4a9fcc47309.png', 'd317043a829bf93467436a68ee5bda57fe07aefd.png', 'b831ffc9ca8f201509dc3e55948130a91ce8b881.png', '63a8ca78295626e946d8cba7680dc4a9fcc47309.png', 'd317043a829bf93467436a68ee5bda57fe07aefd.png', 'b831ffc9ca8f201509dc3e55948130a91ce8b881.png', '63a8ca78295626e946d8cba7680dc4a9fcc47309.png', 'd317043a829bf93467436a68ee5bda57fe07aefd.png', 'b831ffc9ca8f201509dc3e55948130a91ce8b881.png', '63a8ca78295626e946d8cba7680dc4a9fcc47309.png', 'd317043a829bf93467436a68ee5bda57fe07aefd.png', 'b831ffc9ca8f201509dc3e55948130a91ce8b881.png', '63a8ca78295626e946d8cba7680dc4a9fcc47309.png', 'd317043a829bf93467436a68ee5bda57fe07aefd.png', 'b831ffc9ca8f201509dc3e55948130a91ce8b881.png', 'c6cb2e7384cd2e90be235538af9618666a7448e6.png', '42b16679d228888e5cd7e2172d7f37bf3c76a2cd.png', 'c6cb2e7384cd2e90be235538af9618666a7448e6.png', '42b16679d228888e5cd7e2172d7f37bf3c76a2cd.png', 'c6cb2e7384cd2e90be235538af9618666a7448e6.png', '42b16679d228888e5cd7e2172d7f37bf3c76a2cd.png', 'c6cb2e7384cd2e90be235538af9618666a7448e6.png', '42b16679d228888e5cd7e2172d7f37bf3c76a2cd.png', 'c6cb2e7384cd2e90be235538af9618666a7448e6.png', '42b16679d228888e5cd7e2172d7f37bf3c76a2cd.png', 'a9177725dba21dfa31ee913a1dff6f248a870c21.png', 'd41a7f7591995b0359e3696c78c4c48d93307f85.png', '08f98bdc76d214ce4ad1a117a1b60abbbdd9c3ce.png', 'd41a7f7591995b0359e3696c78c4c48d93307f85.png', '08f98bdc76d214ce4ad1a117a1b60abbbdd9c3ce.png', 'd41a7f7591995b0359e3696c78c4c48d93307f85.png', '08f98bdc76d214ce4ad1a117a1b60abbbdd9c3ce.png', 'd41a7f7591995b0359e3696c78c4c48d93307f85.png', '08f98bdc76d214ce4ad1a117a1b60abbbdd9c3ce.png', 'd41a7f7591995b0359e3696c78c4c48d93307f85.png', '08f98bdc76d214ce4ad1a117a1b60abbbdd9c3ce.png', 'a49216f0920016f5c8faa589a0e320f08b2e04ae.png', '5a7bd13218c5396ea578ca6bc8efcea12b903c2e.png', 'a49216f0920016f5c8faa589a0e320f08b2e04ae.png', '5a7bd13218c5396ea578ca6bc8efcea12b903c2e.png', 'a49216f0920016f5c8faa589a0e320f08b2e04ae.png', '5a7bd13218c5396ea578ca6bc8efcea12b903c2e.png', 'a49216f0920016f5c8faa589a0e320f08b2e04ae.png', '5a7bd13218c5396ea578ca6bc8efcea12b903c2e.png', '47918cddedb3748619c80fd57767c75c42b430f5.png', '42c388b10a9e79a862a6a994b6aacdc9d24c4a1f.png', '47918cddedb3748619c80fd57767c75c42b430f5.png', '42c388b10a9e79a862a6a994b6aacdc9d24c4a1f.png', '47918cddedb3748619c80fd57767c75c42b430f5.png', '42c388b10a9e79a862a6a994b6aacdc9d24c4a1f.png', '47918cddedb3748619c80fd57767c75c42b430f5.png', '42c388b10a9e79a862a6a994b6aacdc9d24c4a1f.png', '47918cddedb3748619c80fd57767c75c42b430f5.png', '42c388b10a9e79a862a6a994b6aacdc9d24c4a1f.png', 'b4e608e02d3becf355127edbc90512f7f898775b.png', 'b4e608e02d3becf355127edbc90512f7f898775b.png', 'b4e608e02d3becf355127edbc90512f7f898775b.png', 'b4e608e02d3becf355127edbc90512f7f898775b.png', 'b4e608e02d3becf355127edbc90512f7f898775b.png', '523c4e16480e10cde9bac6ebea7989e3ec8c2883.png', 'e0ac77f6cca873fddcbb8e200dcd350407ca7055.png', '4700235e842710cbe095616461dc278f8040a2be.png', '4bffca7cf896b44f44a8aab1eb02aa1f6b26080e.png', '6cee4eda5deffca847e06212c103704f08910b97.png', 'e2fe755b97bd37570ea1c3f387f2540a96794ba3.png', '0b6d4b702931291bac55dab19e292b6508e8f637.png', '607e1aed6d76139b4392547644c687a79965e07f.png', 'b0a14f769e647c28272cb45451011a541c78cb4c.png', '2e712a7976790e51e59185e582ddb132cddf35c5.png', '2e712a7976790e51e59185e582ddb132cddf35c5.png', '2e712a7976790e51e59185e582ddb132cddf35c5.png', '2e712a7976790e51e59185e582ddb132cddf35c5.png', '2e712a7976790e51e59185e582ddb132cddf35c5.png', 'f10e52d045b94e73dbcbae02b95440bdfdaa36d5.png', 'f10e52d045b94e73dbcbae02b95440bdfdaa36d5.png', 'f10e52d045b94e73dbcbae02b95440bdfdaa36d5.png', 'f10e52d045b94e73dbcbae02b95440bdfdaa36d5.png', 'c6450477f86b3ca230c18db9b358eb3f42e4dc5d.png', 'c6450477f86b3ca230c18db9b358eb3f42e4dc5d.png', 'c6450477f86b3ca230c18db9b358eb3f42e4dc5d.png', 'c6450477f86b3ca230c18db9b358eb3f42e4dc5d.png', 'c6450477f86b3ca230c18db9b358eb3f42e4dc5d.png', '70ba919bae4866ac51653951785a0106f5c1c6af.png', '70ba919bae4866ac51653951785a0106f5c1c6af.png', '70ba919bae4866ac51653951785a0106f5c1c6af.png', '70ba919bae4866ac51653951785a0106f5c1c6af.png', '9372d680ba240808550d6d5c1df743667ca488d5.png', '9372d680ba240808550d6d5c1df743667ca488d5.png', '9372d680ba240808550d6d5c1df743667ca488d5.png', '9372d680ba240808550d6d5c1df743667ca488d5.png', '9372d680ba240808550d6d5c1df743667ca488d5.png', 'bb2c70b76f45043c81a0b3b5a7f22f943daa96e9.png', 'aed36fc2dd1b1ca4ce445326e396c2baa2999c64.png', 'bb2c70b76f45043c81a0b3b5a7f22f943daa96e9.png', 'aed36fc2dd1b1ca4ce445326e396c2baa2999c64.png', 'bb2c70b76f45043c81a0b3b5a7f22f943daa96e9.png', 'aed36fc2dd1b1ca4ce445326e396c2baa2999c64.png', 'bb2c70b76f45043c81a0b3b5a7f22f943daa96e9.png', 'aed36fc2dd1b1ca4ce445326e396c2baa2999c64.png', 'f6265f04b8d331621e694c2e81ee3b2da4568dcd.jpeg', '19641f997598afb5c3043106c8fc09ba69d63513.png', 'b1a409d86efd19d99bb7fe267106a472df7357fa.png', 'b1a409d86efd19d99bb7fe267106a472df7357fa.png', 'b1a409d86efd19d99bb7fe267106a472df7357fa.png', 'b1a409d86efd19d99bb7fe267106a472df7357fa.png', 'b1a409d86efd19d99bb7fe267106a472df7357fa.png', '12b412baa8c1798e8d447f79e8dc1dbfae6901b1.png', 'b0c651fe6d76d76c7a7d3997a378073b43c4afb9.png', 'cbefadf69dc855bf995568578086312ff6522ccf.png', '12b412baa8c1798e8d447f79e8dc1dbfae6901b1.png', 'b0c651fe6d76d76c7a7d3997a378073b43c4afb9.png', 'cbefadf69dc855bf995568578086312ff6522ccf.png', '12b412baa8c1798e8d447f79e8dc1dbfae6901b1.png', 'b0c651fe6d76d76c7a7d3997a378073b43c4afb9.png', 'cbefadf69dc855bf995568578086312ff6522ccf.png', '12b412baa8c1798e8d447f79e8dc1dbfae6901b1.png', 'b0c651fe6d76d76c7a7d3997a378073b43c4afb9.png', 'cbefadf69dc855bf995568578086312ff6522ccf.png', '12b412baa8c1798e8d447f79e8dc1dbfae6901b1.png', 'b0c651fe6d76d76c7a7d3997a378073b43c4afb9.png', 'cbefadf69dc855bf995568578086312ff6522ccf.png', 'c5349686d188ee917710fc8c149fb253a918e5bb.png', 'd3f3cbb1557adcc4b8b4ee9a29565c0c8e1d710b.png', 'c5349686d188ee917710fc8c149fb253a918e5bb.png', 'd3f3cbb1557adcc4b8b4ee9a29565c0c8e1d710b.png', 'c5349686d188ee917710fc8c149fb253a918e5bb.png', 'd3f3cbb1557adcc4b8b4ee9a29565c0c8e1d710b.png', 'c5349686d188ee917710fc8c149fb253a918e5bb.png', 'd3f3cbb1557adcc4b8b4ee9a29565c0c8e1d710b.png', 'c5349686d188ee917710fc8c149fb253a918e5bb.png', 'd3f3cbb1557adcc4b8b4ee9a29565c0c8e1d710b.png', 'cff58e5d4a3881e9b3817ee39915315ad302cdf7.png', 'cff58e5d4a3881e9b3817ee39915315ad302cdf7.png', 'cff58e5d4a3881e9b3817ee39915315ad302cdf7.png', 'cff58e5d4a3881e9b3817ee39915315ad302cdf7.png', 'cff58e5d4a3881e9b3817ee39915315ad302cdf7.png', 'bbe137ae0fe801053513abce549cec1c21974e99.png', 'ab2a014b63255e26e2867cdc40cf009f30bd59a7.png', 'ab2a014b63255e26e2867cdc40cf009f30bd59a7.png', 'ab2a014b63255e26e2867cdc40cf009f30bd59a7.png', 'ab2a014b63255e26e2867cdc40cf009f30bd59a7.png', 'ab2a014b63255e26e2867cdc40cf009f30bd59a7.png', 'baf2e27599ef9127b6fe4739411aedbc6fdce015.png', 'baf2e27599ef9127b6fe4739411aedbc6fdce015.png', 'baf2e27599ef9127b6fe4739411aedbc6fdce015.png', 'baf2e27599ef9127b6fe4739411aedbc6fdce015.png', 'baf2e27599ef9127b6fe4739411aedbc6fdce015.png', '0fa3095654c49e064c083cf27c20295645d439f5.png', '88c1513184e6fbca26888337fd8a555fa0d7eade.png', 'cb94a140b12213c0cddb6843e696f3b24b6b6a86.png', '1957fcef056df602f9a803e31988b6e64acd018b.png', '24a13d1234ab4fb6ead1219f44c3c59691ee9521.png', '6e6438cb0b73ff99a4c16ec0fdb5a4c911a3dd1c.png', '9563a4e28a874e74968281b62a869a1f3252f810.png', 'a90cae7db55bd63a46b065977fbfef116ccfe852.png', 'd206939e04d9cc00524e325d0a77e9acdbcd4cc3.png', 'd962b36097c5d48fe2d9b5af03a5fad0c78c7872.png', 'dec419c72596912a3abd87d133e1a6775aa11555.png', 'bb2c70b76f45043c81a0b3b5a7f22f943daa96e9.png', 'aed36fc2dd1b1ca4ce445326e396c2baa2999c64.png', '692be29276945267d51344310f1eebd1f37cf15a.png', 'ac605eca5e05a3aa914b17d0b207041c9a67f407.png', '692be29276945267d51344310f1eebd1f37cf15a.png', 'ac605eca5e05a3aa914b17d0b207041c9a67f407.png', '692be29276945267d51344310f1eebd1f37cf15a.png', 'ac605eca5e05a3aa914b17d0b207041c9a67f407.png', '692be29276945267d51344310f1eebd1f37cf15a.png', 'ac605eca5e05a3aa914b17d0b207041c9a67f407.png', '692be29276945267d51344310f1eebd1f37cf15a.png', 'ac605eca5e05a3aa914b17d0b207041c9a67f407.png', '71438d63a1f6bde830b1fc116dbcb037b9904d8b.png', '71438d63a1f6bde830b1fc116dbcb037b9904d8b.png', '71438d63a1f6bde830b1fc116dbcb037b9904d8b.png', '71438d63a1f6bde830b1fc116dbcb037b9904d8b.png', '71438d63a1f6bde830b1fc116dbcb037b9904d8b.png', '4be61ec115d2ce1169da242f5616e4328a734181.png', '91dca69da28c562c6e2196b703242a93b59b7eb3.png', 'd06c3e9e8385a421d06df3db57ba621c84faf5b1.png', 'd06c3e9e8385a421d06df3db57ba621c84faf5b1.png', 'd06c3e9e8385a421d06df3db57ba621c84faf5b1.png', 'd06c3e9e8385a421d06df3db57ba621c84faf5b1.png', 'd06c3e9e8385a421d06df3db57ba621c84faf5b1.png', '91dca69da28c562c6e2196b703242a93b59b7eb3.png', '91dca69da28c562c6e2196b703242a93b59b7eb3.png', '91dca69da28c562c6e2196b703242a93b59b7eb3.png', '91dca69da28c562c6e2196b703242a93b59b7eb3.png', '5ec91ba2451698faf67c62a1df5ab602b9428f0c.png', 'f4ce1aefea5c311abbc9a1b4967b5a064f5afa31.png', '5ef0d1986c82f21759c5bfca363843f77fd75657.png', 'f4ce1aefea5c311abbc9a1b4967b5a064f5afa31.png', '5ef0d1986c82f21759c5bfca363843f77fd75657.png', 'f4ce1aefea5c311abbc9a1b4967b5a064f5afa31.png', '5ef0d1986c82f21759c5bfca363843f77fd75657.png', 'f4ce1aefea5c311abbc9a1b4967b5a064f5afa31.png', '5ef0d1986c82f21759c5bfca363843f77fd75657.png', 'f4ce1aefea5c311abbc9a1b4967b5a064f5afa31.png', '5ef0d1986c82f21759c5bfca363843f77fd75657.png', '42ad3c7fc7b095b0cf2c58714a79c2ef61aad91a.png', 'c6076437032a0a7e8c8257f9838397c2c0e8c62b.png', 'f10e52d045b94e73dbcbae02b95440bdfdaa36d5.png', '5fe2c8bfbf8b22c494a55ba0c5237ea74e75e75b.png', '5fe2c8bfbf8b22c494a55ba0c5237ea74e75e75b.png', '5fe2c8bfbf8b22c494a55ba0c5237ea74e75e75b.png', '5fe2c8bfbf8b22c494a55ba0c5237ea74e75e75b.png', '5fe2c8bfbf8b22c494a55ba0c5237ea74e75e75b.png', '1a2c92d52799558b3e75fa7db4fd59cb4726a428.png', 'cf4df0685ee6a45f6503a870005542022f5a927e.png', 'cf4df0685ee6a45f6503a870005542022f5a927e.png', '33b58a0ba5aac8cd72e8002ecb73ba64295f8adf.png', '7659b304555c3c4d590c8a98512688113ea88234.png', '56d54e50130089f6d56149935b4ed87678c2bc44.png', '56d54e50130089f6d56149935b4ed87678c2bc44.png', '56d54e50130089f6d56149935b4ed87678c2bc44.png', '56d54e50130089f6d56149935b4ed87678c2bc44.png', '56d54e50130089f6d56149935b4ed87678c2bc44.png', '395f9413128297845b70d7f2381c829021bbaf4c.png', '395f9413128297845b70d7f2381c829021bbaf4c.png', '395f9413128297845b70d7f2381c829021bbaf4c.png', '395f9413128297845b70d7f2381c829021bbaf4c.png', 'd9a83d2ddbe5ce322a524d2a750f9d859d851038.png', 'd9a83d2ddbe5ce322a524d2a750f9d859d851038.png', 'd9a83d2ddbe5ce322a524d2a750f9d859d851038.png', 'd9a83d2ddbe5ce322a524d2a750f9d859d851038.png', 'd9a83d2ddbe5ce322a524d2a750f9d859d851038.png', '04a9aa0ca9c2ce4901e0a05380e4d2d73c8c02fd.png', '04a9aa0ca9c2ce4901e0a05380e4d2d73c8c02fd.png', '04a9aa0ca9c2ce4901e0a05380e4d2d73c8c02fd.png', '04a9aa0ca9c2ce4901e0a05380e4d2d73c8c02fd.png', '04a9aa0ca9c2ce4901e0a05380e4d2d73c8c02fd.png', 'cda2843e0f402cc044477fc817da2dfe54dbcf1c.png', 'cda2843e0f402cc044477fc817da2dfe54dbcf1c.png', 'cda2843e0f402cc044477fc817da2dfe54dbcf1c.png', 'cda2843e0f402cc044477fc817da2dfe54dbcf1c.png', 'cda2843e0f402cc044477fc817da2dfe54dbcf1c.png', '312148f3a977b9d7418038e5a5cabb376f0ecf44.png', '312148f3a977b9d7418038e5a5cabb376f0ecf44.png', '312148f3a977b9d7418038e5a5cabb376f0ecf44.png', '312148f3a977b9d7418038e5a5cabb376f0ecf44.png', '312148f3a977b9d7418038e5a5cabb376f0ecf44.png', '4d25c32f666d5d10f5399d047a0ec9c4053c8d99.png', '4d25c32f666d5d10f5399d047a0ec9c4053c8d99.png', '4d25c32f666d5d10f5399d047a0ec9c4053c8d99.png', '4d25c32f666d5d10f5399d047a0ec9c4053c8d99.png', '4d25c32f666d5d10f5399d047a0ec9c4053c8d99.png', '717aba33de48ace3c482509d5c86d3e6bf26ea2a.png', '1daac90019e441f486228041739f03b74dad8329.png', '56798394c55448e8f2830d27782fb0534351cab3.png', '91ec6309225eb154a9a5247bd66ce82725c3708a.png', 'ae95b376042d3cd1b95bd48d7b24c048c43d8e75.png', 'ee98593c2ca2110238c7af58473f2fa2e178500f.png', 'b1ff1d57d5e8ec07cf424aa4df75ecfe3d6d0f98.png', '5a9240780f83bd11408cba490fb2b82bbab9dcdc.png', 'a14be0e4dc0f4c2f296d43a890b465a61c063337.png', 'de3db5a8ed9b904a80cf6660cb867a15a47305bb.png', 'fe4b3460ea34090da816114e55a260ffbf267e45.png', '800509e5045da566f39ead1b94a26e61b60dfbe3.png', '800509e5045da566f39ead1b94a26e61b60dfbe3.png', '800509e5045da566f39ead1b94a26e61b60dfbe3.png', '800509e5045da566f39ead1b94a26e61b60dfbe3.png', '800509e5045da566f39ead1b94a26e61b60dfbe3.png', 'da95fd64491d041ffbc7453b0c004f22ec441d19.png', 'da95fd64491d041ffbc7453b0c004f22ec441d19.png', 'da95fd64491d041ffbc7453b0c004f22ec441d19.png', 'da95fd64491d041ffbc7453b0c004f22ec441d19.png', 'da95fd64491d041ffbc7453b0c004f22ec441d19.png', 'adb59dbc2bf2ff38cacc2824ebc2a2a84a2dd410.png', 'adb59dbc2bf2ff38cacc2824ebc2a2a84a2dd410.png', 'adb59dbc2bf2ff38cacc2824ebc2a2a84a2dd410.png', 'adb59dbc2bf2ff38cacc2824ebc2a2a84a2dd410.png', 'adb59dbc2bf2ff38cacc2824ebc2a2a84a2dd410.png', '229284475ef86c4b4123acd4323f8d2ec8e5a341.png', '037fcc7fc89d9b8b34d58efeb7314354afe8fa94.png', 'fd15f4a6c512cbb5df96f130e893746ac3d4bd08.png', '229284475ef86c4b4123acd4323f8d2ec8e5a341.png', '037fcc7fc89d9b8b34d58efeb7314354afe8fa94.png', 'fd15f4a6c512cbb5df96f130e893746ac3d4bd08.png', '229284475ef86c4b4123acd4323f8d2ec8e5a341.png', '037fcc7fc89d9b8b34d58efeb7314354afe8fa94.png', 'fd15f4a6c512cbb5df96f130e893746ac3d4bd08.png', '229284475ef86c4b4123acd4323f8d2ec8e5a341.png', '037fcc7fc89d9b8b34d58efeb7314354afe8fa94.png', 'fd15f4a6c512cbb5df96f130e893746ac3d4bd08.png', '229284475ef86c4b4123acd4323f8d2ec8e5a341.png', '037fcc7fc89d9b8b34d58efeb7314354afe8fa94.png', 'fd15f4a6c512cbb5df96f130e893746ac3d4bd08.png', '4cdad5d8c742c8c99f95cbf95d152e1b0e6c88eb.png', '56354efccb33560147acdbc1c6d036d60b8b7f47.png', '6e0cb19c19d05e1894042c2acb3b177060173a44.png', 'd6a97a498252a54b6b1e8df9b3cbc912be27f7dd.png', '395f9413128297845b70d7f2381c829021bbaf4c.png', '6b8e1e306dfd8cd40991a5691b6f0b2ceb0ff546.png', '6b8e1e306dfd8cd40991a5691b6f0b2ceb0ff546.png', '6b8e1e306dfd8cd40991a5691b6f0b2ceb0ff546.png', '6b8e1e306dfd8cd40991a5691b6f0b2ceb0ff546.png', '6b8e1e306dfd8cd40991a5691b6f0b2ceb0ff546.png', '1811f9636af2d66423b941ee705976e7674c4088.png', '37903aad170dd1b74bba0601977ec6b3c82b7a05.png', '2070ef590a84c77f5eba15f98fbd93fcf2e1226f.png', '5bafc46621e05a5afe5fa4fc4de3f98013126565.png', '0aa6d46317560bb79285e7d589520f98dded8efb.png', '2070ef590a84c77f5eba15f98fbd93fcf2e1226f.png', '5bafc46621e05a5afe5fa4fc4de3f98013126565.png', '0aa6d46317560bb79285e7d589520f98dded8efb.png', '2070ef590a84c77f5eba15f98fbd93fcf2e1226f.png', '5bafc46621e05a5afe5fa4fc4de3f98013126565.png', '0aa6d46317560bb79285e7d589520f98dded8efb.png', '2070ef590a84c77f5eba15f98fbd93fcf2e1226f.png', '5bafc46621e05a5afe5fa4fc4de3f98013126565.png', '0aa6d46317560bb79285e7d589520f98dded8efb.png', '2070ef590a84c77f5eba15f98fbd93fcf2e1226f.png', '5bafc46621e05a5afe5fa4fc4de3f98013126565.png', '0aa6d46317560bb79285e7d589520f98dded8efb.png', '87e88e4834b456624514349a45160da2ad7ab4ad.png', 'c1e49a66cc46a094f068074271cd456d61c52dcf.png', '5391dc31c0090cb817a2e8fb30bec3eb597655ee.png', 'e963c4e3a0627df7b1592e4fc2c8078584874832.png', 'e963c4e3a0627df7b1592e4fc2c8078584874832.png', 'e963c4e3a0627df7b1592e4fc2c8078584874832.png', 'e963c4e3a0627df7b1592e4fc2c8078584874832.png', 'e963c4e3a0627df7b1592e4fc2c8078584874832.png', '5e93d4da0862e79dc7a39e48990f78475c4427c0.png', '7ee311da51458f97a43f4186d71ffc8f4998c1ba.png', 'deebafc5d5e514fde80d45375e074d7665af2d5b.png', 'f8d771ec2fd7e01ad6a0ef318a2e9f146ea88e58.png', '49b289b56ac8b8e58ff8135590aabcb5796e5e79.png', '30a0b9172be2f0078cd5f7b9760d75cf4d15cdc3.jpg', '19b17171072bc3d64160ea0561e6bd2fbd9a5ecf.png', '49b289b56ac8b8e58ff8135590aabcb5796e5e79.png', '30a0b9172be2f0078cd5f7b9760d75cf4d15cdc3.jpg', '19b17171072bc3d64160ea0561e6bd2fbd9a5ecf.png', '49b289b56ac8b8e58ff8135590aabcb5796e5e79.png', '30a0b9172be2f0078cd5f7b9760d75cf4d15cdc3.jpg', '19b17171072bc3d64160ea0561e6bd2fbd9a5ecf.png', '49b289b56ac8b8e58ff8135590aabcb5796e5e79.png', '30a0b9172be2f0078cd5f7b9760d75cf4d15cdc3.jpg', '19b17171072bc3d64160ea0561e6bd2fbd9a5ecf.png', '49b289b56ac8b8e58ff8135590aabcb5796e5e79.png', '30a0b9172be2f0078cd5f7b9760d75cf4d15cdc3.jpg', '19b17171072bc3d64160ea0561e6bd2fbd9a5ecf.png', '2ba5b65ec4e1d4ba4c0c448548119210ee609719.png', '7fc5c15de8664177d1907c593f86891db898c975.png', '2ba5b65ec4e1d4ba4c0c448548119210ee609719.png', '7fc5c15de8664177d1907c593f86891db898c975.png', '2ba5b65ec4e1d4ba4c0c448548119210ee609719.png', '7fc5c15de8664177d1907c593f86891db898c975.png', '2ba5b65ec4e1d4ba4c0c448548119210ee609719.png', '7fc5c15de8664177d1907c593f86891db898c975.png', '2ba5b65ec4e1d4ba4c0c448548119210ee609719.png', '7fc5c15de8664177d1907c593f86891db898c975.png', '146acade813a4a86c7eeea81ef0e0cdc2d91b413.png', 'a9a1c1117ab3933f0defb6484fae3caeee277887.png', 'bfeed0724a159667bcca2c6324e21ec2cfd7b4de.png', 'a75538928b4b027f383e70f476457b51b938b14b.png', '2fb5ca51503e8d2de01cb8416709a51f715460f7.png', '4efa8be05b72f82f9387f6ce9a90ed7d1b76b762.png', '02567ee614f80b8b1beebdd761290b4a2fb0a34e.png', 'a310e3de5376f3d736afb5420c53417590fc6450.png', 'd6f6fd4728d1faf7f438039a0856320d234b7c9f.png', 'f5b6cd68146aa57455dd506f6e482c805a4c40bd.png', '09d722d5890853bdca58ecaabb817bc69eff4e02.png', '21a61f86f772c57978f6d63fdf7e2cbc4b2bb631.png', '8da44222dfa5791a898f6531c678622d31f0a78e.png', '8ebd6f55ee5aef617b95718ae0b47b702c350bd9.png', '6701ba8049b5e846fad11bc3075612f6e90b1587.png', '853259475a9fd07310f1a49fc1d482175506b65a.png', 'c8bf8b042d9272e9baabef72d6456c40403381e1.png', '21a61f86f772c57978f6d63fdf7e2cbc4b2bb631.png', '09d722d5890853bdca58ecaabb817bc69eff4e02.png', '8da44222dfa5791a898f6531c678622d31f0a78e.png', '8ebd6f55ee5aef617b95718ae0b47b702c350bd9.png', '172c5aa87d8e2b9c929c7834ffe507a0f26d2e19.png', '55b5967892c3542fd14e5642d95c1946db096c73.png', '63903ceefe8e40af8661e8d897525fc198d553cf.png', '655ebc86a2df374656184309d12864b439a9c0b8.png', '655ebc86a2df374656184309d12864b439a9c0b8.png', '4ede5a3218abe1404fddd1d998c33db42aebe2c5.png', '4ede5a3218abe1404fddd1d998c33db42aebe2c5.png', '4ede5a3218abe1404fddd1d998c33db42aebe2c5.png', '4ede5a3218abe1404fddd1d998c33db42aebe2c5.png', '4ede5a3218abe1404fddd1d998c33db42aebe2c5.png', '172c5aa87d8e2b9c929c7834ffe507a0f26d2e19.png', '1dd3797667279c0d3965126498a759284c64a2ea.png', '1dd3797667279c0d3965126498a759284c64a2ea.png', '1dd3797667279c0d3965126498a759284c64a2ea.png', '1dd3797667279c0d3965126498a759284c64a2ea.png', '1dd3797667279c0d3965126498a759284c64a2ea.png', 'aa8383339bd26a69cdb92b951d51b07aac7aad12.png', 'aa8383339bd26a69cdb92b951d51b07aac7aad12.png', 'aa8383339bd26a69cdb92b951d51b07aac7aad12.png', 'aa8383339bd26a69cdb92b951d51b07aac7aad12.png', 'aa8383339bd26a69cdb92b951d51b07aac7aad12.png', '11045fbeac72d3b98904af5c1a471a01cd78bcb6.png', '11045fbeac72d3b98904af5c1a471a01cd78bcb6.png', '11045fbeac72d3b98904af5c1a471a01cd78bcb6.png', '11045fbeac72d3b98904af5c1a471a01cd78bcb6.png', '11045fbeac72d3b98904af5c1a471a01cd78bcb6.png', 'c3026b317784879a34cbe0a1664e6e617e3c13e0.png', 'c3026b317784879a34cbe0a1664e6e617e3c13e0.png', 'c3026b317784879a34cbe0a1664e6e617e3c13e0.png', 'c3026b317784879a34cbe0a1664e6e617e3c13e0.png', 'c3026b317784879a34cbe0a1664e6e617e3c13e0.png', '011db7a0c2f7786fd9581b7bf933efdf5a229229.png', 'f111c00afcc1dbc8b29c68137e7e93f3d7ebda35.png', 'f111c00afcc1dbc8b29c68137e7e93f3d7ebda35.png', 'f111c00afcc1dbc8b29c68137e7e93f3d7ebda35.png', 'f111c00afcc1dbc8b29c68137e7e93f3d7ebda35.png', 'f111c00afcc1dbc8b29c68137e7e93f3d7ebda35.png', 'c475743875999d45813139e32ff9747ec966b451.png', '0c663dd6fec6149a560cb3254c1a9639c3b65984.png', 'c475743875999d45813139e32ff9747ec966b451.png', '0c663dd6fec6149a560cb3254c1a9639c3b65984.png', 'c475743875999d45813139e32ff9747ec966b451.png', '0c663dd6fec6149a560cb3254c1a9639c3b65984.png', 'c475743875999d45813139e32ff9747ec966b451.png', '0c663dd6fec6149a560cb3254c1a9639c3b65984.png', 'c475743875999d45813139e32ff9747ec966b451.png', '0c663dd6fec6149a560cb3254c1a9639c3b65984.png', '611fbfffe11afd7c303e5fd2a6950a1564db34d7.png', '928dc9134dbfcda5a80c4438f2404c1e09f7e13b.png', '611fbfffe11afd7c303e5fd2a6950a1564db34d7.png', '928dc9134dbfcda5a80c4438f2404c1e09f7e13b.png', '611fbfffe11afd7c303e5fd2a6950a1564db34d7.png', '928dc9134dbfcda5a80c4438f2404c1e09f7e13b.png', '611fbfffe11afd7c303e5fd2a6950a1564db34d7.png', '928dc9134dbfcda5a80c4438f2404c1e09f7e13b.png', '611fbfffe11afd7c303e5fd2a6950a1564db34d7.png', '928dc9134dbfcda5a80c4438f2404c1e09f7e13b.png', '2872c09e4050ad926dcb09076060b70d9f94dc9c.png', '3187d1b57acda59938c005d4688a66c42e5e41c3.png', '2872c09e4050ad926dcb09076060b70d9f94dc9c.png', '3187d1b57acda59938c005d4688a66c42e5e41c3.png', '2872c09e4050ad926dcb09076060b70d9f94dc9c.png', '3187d1b57acda59938c005d4688a66c42e5e41c3.png', '2872c09e4050ad926dcb09076060b70d9f94dc9c.png', '3187d1b57acda59938c005d4688a66c42e5e41c3.png', '98b401bc636f5ec786d73e14fc7dcbb125a1c40a.png', '98b401bc636f5ec786d73e14fc7dcbb125a1c40a.png', '98b401bc636f5ec786d73e14fc7dcbb125a1c40a.png', '98b401bc636f5ec786d73e14fc7dcbb125a1c40a.png', '98b401bc636f5ec786d73e14fc7dcbb125a1c40a.png', '5180550f97f1c2dd1a77a9ad4cfcb9afeb506a2d.png', '98a244c00ec82ac6ec568a257817fd4797cb925d.png', '6ec7a3d930365178439d34b8e181bdf1a1a83f2f.png', 'a49216f0920016f5c8faa589a0e320f08b2e04ae.png', '5a7bd13218c5396ea578ca6bc8efcea12b903c2e.png', '6701ba8049b5e846fad11bc3075612f6e90b1587.png', '44f2116898e9ff4379d3f353d54678ff3bc7304b.png', 'b442e67ea4a8725e80c139d626f24be53898c03d.png', 'e43aeeb861ec2f0a7b769dda4f6372fc18399f19.png', 'b442e67ea4a8725e80c139d626f24be53898c03d.png', 'e43aeeb861ec2f0a7b769dda4f6372fc18399f19.png', 'b442e67ea4a8725e80c139d626f24be53898c03d.png', 'e43aeeb861ec2f0a7b769dda4f6372fc18399f19.png', 'b442e67ea4a8725e80c139d626f24be53898c03d.png', 'e43aeeb861ec2f0a7b769dda4f6372fc18399f19.png', 'b442e67ea4a8725e80c139d626f24be53898c03d.png', 'e43aeeb861ec2f0a7b769dda4f6372fc18399f19.png', 'f64a8090b91e832a68c5f23e2afb49699ec0eefd.png', 'f64a8090b91e832a68c5f23e2afb49699ec0eefd.png', 'f64a8090b91e832a68c5f23e2afb49699ec0eefd.png', 'f64a8090b91e832a68c5f23e2afb49699ec0eefd.png', '207e2b3fbf55d3cae1f90b5683bab614ceaa1332.png', 'f9f4362a3ad50c470420b1ce31c41d6ccbcf4154.png', '207e2b3fbf55d3cae1f90b5683bab614ceaa1332.png', 'f9f4362a3ad50c470420b1ce31c41d6ccbcf4154.png', '207e2b3fbf55d3cae1f90b5683bab614ceaa1332.png', 'f9f4362a3ad50c470420b1ce31c41d6ccbcf4154.png', '207e2b3fbf55d3cae1f90b5683bab614ceaa1332.png', 'f9f4362a3ad50c470420b1ce31c41d6ccbcf4154.png', '207e2b3fbf55d3cae1f90b5683bab614ceaa1332.png', 'f9f4362a3ad50c470420b1ce31c41d6ccbcf4154.png', '93bda26175cea5850602d96b569fad1ea6b4bb74.png', '93bda26175cea5850602d96b569fad1ea6b4bb74.png', '93bda26175cea5850602d96b569fad1ea6b4bb74.png', '93bda26175cea5850602d96b569fad1ea6b4bb74.png', '93bda26175cea5850602d96b569fad1ea6b4bb74.png', '93bda26175cea5850602d96b569fad1ea6b4bb74.png', 'bf430fc13bb21ef568bd0b7a6c5390c72293f357.png', '5f3d7d27a3a93f7a1008aaba2927d865688a272c.png', 'c73247664b7621442f2fec967ae98a63598f3f86.png', '5f3d7d27a3a93f7a1008aaba2927d865688a272c.png', 'c73247664b7621442f2fec967ae98a63598f3f86.png', '5f3d7d27a3a93f7a1008aaba2927d865688a272c.png', 'c73247664b7621442f2fec967ae98a63598f3f86.png', '5f3d7d27a3a93f7a1008aaba2927d865688a272c.png', 'c73247664b7621442f2fec967ae98a63598f3f86.png', '5f3d7d27a3a93f7a1008aaba2927d865688a272c.png', 'c73247664b7621442f2fec967ae98a63598f3f86.png', '25444306b2f81a4291c609bc0546cf8a4867dcd6.png', 'e90ea086c0b6aeb2a4e32ad254c5a1786c6e508a.png', '25444306b2f81a4291c609bc0546cf8a4867dcd6.png', 'e90ea086c0b6aeb2a4e32ad254c5a1786c6e508a.png', '25444306b2f81a4291c609bc0546cf8a4867dcd6.png', 'e90ea086c0b6aeb2a4e32ad254c5a1786c6e508a.png', '25444306b2f81a4291c609bc0546cf8a4867dcd6.png', 'e90ea086c0b6aeb2a4e32ad254c5a1786c6e508a.png', '9bbf53d6f5c3982bc35b8e02ab794c9495f1e00b.png', '55d5b96aefd09b067097c23038ad9c7adf3d7f69.png', 'af520ed8741a57c895d6d7933a58bb02bd8d231c.png', '85d06d507a1f90967ec47cc3a8d51cd485c20c4d.png', '25444306b2f81a4291c609bc0546cf8a4867dcd6.png', 'e90ea086c0b6aeb2a4e32ad254c5a1786c6e508a.png', '463d7e60f019c3acb2abf09aecfbe6507f8c01c3.png', '463d7e60f019c3acb2abf09aecfbe6507f8c01c3.png', '463d7e60f019c3acb2abf09aecfbe6507f8c01c3.png', '463d7e60f019c3acb2abf09aecfbe6507f8c01c3.png', '463d7e60f019c3acb2abf09aecfbe6507f8c01c3.png', '7540c10aba47275e721937c82174bf2a1668aec4.png', '7540c10aba47275e721937c82174bf2a1668aec4.png', '7540c10aba47275e721937c82174bf2a1668aec4.png', '7540c10aba47275e721937c82174bf2a1668aec4.png', '7540c10aba47275e721937c82174bf2a1668aec4.png', '93626938488096b66d6504978a6ab1aab2b8e6a3.png', '2455b014bc6897cd1220bdff573fd62902b0a87c.png', '8e1e300d923bcd84ebce3c716ad650ea7125b284.png', '8e1e300d923bcd84ebce3c716ad650ea7125b284.png', '8e1e300d923bcd84ebce3c716ad650ea7125b284.png', '8e1e300d923bcd84ebce3c716ad650ea7125b284.png', '8e1e300d923bcd84ebce3c716ad650ea7125b284.png', '8e3a817bfc18715525326fa572329f4945e83213.png', '8cc54bc5350494aaa9ceb57dfb9da5dea2e7ae81.png', '8e3a817bfc18715525326fa572329f4945e83213.png', '8cc54bc5350494aaa9ceb57dfb9da5dea2e7ae81.png', '8e3a817bfc18715525326fa572329f4945e83213.png', '8cc54bc5350494aaa9ceb57dfb9da5dea2e7ae81.png', '8e3a817bfc18715525326fa572329f4945e83213.png', '8cc54bc5350494aaa9ceb57dfb9da5dea2e7ae81.png', '8e3a817bfc18715525326fa572329f4945e83213.png', '8cc54bc5350494aaa9ceb57dfb9da5dea2e7ae81.png', '164ee555539156487d559179797970fce98cb0ed.png', '2f149ddfd7f206bd4997ca59cabc3f9582850422.png', '2dfa007d612b438730267381a9c61025304b4fcf.png', '2d0d25d0758be7f82496696f3582f98543fb8a06.jpg', '7c4defa015accd183d101d90281f62ea32d8852c.jpg', '7e90f5139d0cd018f3d698c0fe9c57450fc4ea62.jpg', '2d0d25d0758be7f82496696f3582f98543fb8a06.jpg', '7c4defa015accd183d101d90281f62ea32d8852c.jpg', '7e90f5139d0cd018f3d698c0fe9c57450fc4ea62.jpg', '2d0d25d0758be7f82496696f3582f98543fb8a06.jpg', '7c4defa015accd183d101d90281f62ea32d8852c.jpg', '7e90f5139d0cd018f3d698c0fe9c57450fc4ea62.jpg', '2d0d25d0758be7f82496696f3582f98543fb8a06.jpg', '7c4defa015accd183d101d90281f62ea32d8852c.jpg', '7e90f5139d0cd018f3d698c0fe9c57450fc4ea62.jpg', '2d0d25d0758be7f82496696f3582f98543fb8a06.jpg', '7c4defa015accd183d101d90281f62ea32d8852c.jpg', '7e90f5139d0cd018f3d698c0fe9c57450fc4ea62.jpg', '25fa864f0108a545cb14e84907d82c2ba0f8f881.png', '8363fd804fa9c6e11716d1d6915d61ac2e2af56c.png', '25fa864f0108a545cb14e84907d82c2ba0f8f881.png', '8363fd804fa9c6e11716d1d6915d61ac2e2af56c.png', '969c880c0f67dd606ed9d731dfd63fb8dd6974d7.png', '796bd2e83b7c157d1f244da42e58afb64e6b0113.png', '451c57c5d9bc33b967c7eb33e2ab301e7b78427a.png', 'ab3b0206f6ef0ff527562e215fc52d2a6c0e9415.png', '969c880c0f67dd606ed9d731dfd63fb8dd6974d7.png', '796bd2e83b7c157d1f244da42e58afb64e6b0113.png', '451c57c5d9bc33b967c7eb33e2ab301e7b78427a.png', 'ab3b0206f6ef0ff527562e215fc52d2a6c0e9415.png', '969c880c0f67dd606ed9d731dfd63fb8dd6974d7.png', '796bd2e83b7c157d1f244da42e58afb64e6b0113.png', '451c57c5d9bc33b967c7eb33e2ab301e7b78427a.png', 'ab3b0206f6ef0ff527562e215fc52d2a6c0e9415.png', '969c880c0f67dd606ed9d731dfd63fb8dd6974d7.png', '796bd2e83b7c157d1f244da42e58afb64e6b0113.png', '451c57c5d9bc33b967c7eb33e2ab301e7b78427a.png', 'ab3b0206f6ef0ff527562e215fc52d2a6c0e9415.png', '969c880c0f67dd606ed9d731dfd63fb8dd6974d7.png', '796bd2e83b7c157d1f244da42e58afb64e6b0113.png', '451c57c5d9bc33b967c7eb33e2ab301e7b78427a.png', 'ab3b0206f6ef0ff527562e215fc52d2a6c0e9415.png', '8b904683f24362c509d13c3643d801cc78670e85.png', '118064ba6986b20c7f1b601aacf768c2c691c38f.png', 'ccb8d1041f8275255c4fb691273123a5c2d154d3.png', 'ccb8d1041f8275255c4fb691273123a5c2d154d3.png', 'ccb8d1041f8275255c4fb691273123a5c2d154d3.png', 'ccb8d1041f8275255c4fb691273123a5c2d154d3.png', 'ccb8d1041f8275255c4fb691273123a5c2d154d3.png', 'f64a8090b91e832a68c5f23e2afb49699ec0eefd.png', '873d3a054fbacf5755b2c50a92ba3d22e82643b2.png', '873d3a054fbacf5755b2c50a92ba3d22e82643b2.png', '98ee77469511f3a22f1209cdd91c14bc041f5b4a.png', '98ee77469511f3a22f1209cdd91c14bc041f5b4a.png', '98ee77469511f3a22f1209cdd91c14bc041f5b4a.png', '98ee77469511f3a22f1209cdd91c14bc041f5b4a.png', '98ee77469511f3a22f1209cdd91c14bc041f5b4a.png', '34dd479b055ecc3c6e92bc71d60cbaf90f2518b8.png', '34dd479b055ecc3c6e92bc71d60cbaf90f2518b8.png', '34dd479b055ecc3c6e92bc71d60cbaf90f2518b8.png', '34dd479b055ecc3c6e92bc71d60cbaf90f2518b8.png', '34dd479b055ecc3c6e92bc71d60cbaf90f2518b8.png', 'b69b50c3dbe97fc8c3fddc9ab392f5666384246b.png', 'b69b50c3dbe97fc8c3fddc9ab392f5666384246b.png', 'b69b50c3dbe97fc8c3fddc9ab392f5666384246b.png', 'b69b50c3dbe97fc8c3fddc9ab392f5666384246b.png', 'b69b50c3dbe97fc8c3fddc9ab392f5666384246b.png', '95ef84147ad8ed723fde239bc1ecca2bb258e9d7.png', 'c5c1171aed766416a56fea90e83b5e2d44590827.png', '95ef84147ad8ed723fde239bc1ecca2bb258e9d7.png', 'c5c1171aed766416a56fea90e83b5e2d44590827.png', '95ef84147ad8ed723fde239bc1ecca2bb258e9d7.png', 'c5c1171aed766416a56fea90e83b5e2d44590827.png', '95ef84147ad8ed723fde239bc1ecca2bb258e9d7.png', 'c5c1171aed766416a56fea90e83b5e2d44590827.png', '95ef84147ad8ed723fde239bc1ecca2bb258e9d7.png', 'c5c1171aed766416a56fea90e83b5e2d44590827.png', '6b0daee60b619b8235dce1960e596cf31e73ba16.png', '97cf3884bfae8ee95ce8db830f80c01f67c8d8a4.png', 'bd88cf4e54722a91a519874828d387d83907f8bc.png', '6b0daee60b619b8235dce1960e596cf31e73ba16.png', '97cf3884bfae8ee95ce8db830f80c01f67c8d8a4.png', 'bd88cf4e54722a91a519874828d387d83907f8bc.png', '6b0daee60b619b8235dce1960e596cf31e73ba16.png', '97cf3884bfae8ee95ce8db830f80c01f67c8d8a4.png', 'bd88cf4e54722a91a519874828d387d83907f8bc.png', '6b0daee60b619b8235dce1960e596cf31e73ba16.png', '97cf3884bfae8ee95ce8db830f80c01f67c8d8a4.png', 'bd88cf4e54722a91a519874828d387d83907f8bc.png', '6b0daee60b619b8235dce1960e596cf31e73ba16.png', '97cf3884bfae8ee95ce8db830f80c01f67c8d8a4.png', 'bd88cf4e54722a91a519874828d387d83907f8bc.png', 'a7886d519e0cf27a4649929c5c16c2f6a5d03e88.png', 'a6f2696182436fc48ea8bb432e96f749b72f34df.png', 'a6f2696182436fc48ea8bb432e96f749b72f34df.png', 'a6f2696182436fc48ea8bb432e96f749b72f34df.png', 'a6f2696182436fc48ea8bb432e96f749b72f34df.png', 'a6f2696182436fc48ea8bb432e96f749b72f34df.png', 'f6265f04b8d331621e694c2e81ee3b2da4568dcd.jpeg', 'f6265f04b8d331621e694c2e81ee3b2da4568dcd.jpeg', 'f6265f04b8d331621e694c2e81ee3b2da4568dcd.jpeg', 'f6265f04b8d331621e694c2e81ee3b2da4568dcd.jpeg', 'b6a91b615ccb33eae1b1e1f93ce870ecca8d8500.png', 'f53d1b8b87b863e0954d6f0565abbd68d4e79fd3.jpg', '595655bc4c9670e3a5229a17e50386d0a9eaa17d.png', 'b6a91b615ccb33eae1b1e1f93ce870ecca8d8500.png', 'f53d1b8b87b863e0954d6f0565abbd68d4e79fd3.jpg', 'b6a91b615ccb33eae1b1e1f93ce870ecca8d8500.png', 'f53d1b8b87b863e0954d6f0565abbd68d4e79fd3.jpg', 'b6a91b615ccb33eae1b1e1f93ce870ecca8d8500.png', 'f53d1b8b87b863e0954d6f0565abbd68d4e79fd3.jpg', 'b6a91b615ccb33eae1b1e1f93ce870ecca8d8500.png', 'f53d1b8b87b863e0954d6f0565abbd68d4e79fd3.jpg', '0c944f0ed90136ffb5805dbdba9b2dbe6a72b921.png', '442f7058730006ba014978955573cee713297be3.png', '58f921af672a35cc036d841589ea4738ed75911d.png', 'dfd7aaf096fc7dcd454986fd53e2951e82c0acd9.png', '98bfd814caef51ed1bb24347d817a650958cea5e.png', 'a9a4929cabb11b09aba356d192b91eb8b8b59c2c.png', 'c682b229ab07a9090b86648abd1cdaeaba6e7578.png', 'f13347374983be1ae90319662bd62c9822a8cfa8.png', '23297b5d11508651842b45bcdfc7b713bb17d737.png', 'dfd7aaf096fc7dcd454986fd53e2951e82c0acd9.png', 'c216b55f91667f5d43a37c7baa798489166e9a5a.png', '3dbec0c3880a94ba5b5ed397a2b3481e7a5b7d88.png', '4a12d4eafef62db1c0b0bb2acd1755bfcb1431a3.png', '18aa0a59e125604998a7a4802b875cbd92eb7676.png', '7b8d5ea44510d490b9344eaefa6e2748a7be839f.png', '4b18d1b9259e4cbaac0793df5f8cea45b84bad2f.png', '84d40dee39302f825e225a1f31d12010c002af2d.png', '52faf6fe79e19bc8629087150a68ea9b1fb102c8.png', '1d682199d1b9c8846ad711e63f33b0fdd9d6e2da.png', '5fbc04f333befdb3cecf314483e09da4ad721198.png', '0eb473ba80b786217a75c5388d4d725fdbb2e437.png', '224974da5a83133248a8c7dd872cfe3bea3f215a.png', '36da9bf08e8355fc3b079b27d75db15efefb6737.png', '44928357b5d10713b96f312400f14b4be49b0f85.png', '6402aaef77b6d2bea7aeac10fc54f0de042e7554.png', '6faa9d1c2c1d1c83ff2e7f83ad52595305c9f8a7.png', '9aaf4b2fa41d0c1358a71ac7d7a26ffcaa3062af.png', '9dc195a572b4eb224968191073eab7b40d2a6259.png', 'cb01903d99af1908809ceb03b1bb658902700f1b.png', 'cc98ddc4df61db59e1e62ae86ec8a8fe7cb53442.png', 'cd558ef1bacbeeba598013bf72df8cbb368e1b4d.png', 'e24adf504e1d6d0717bf500609d00d9c1b033d73.png', 'a0e33b6a5ff37ed3c7fc159718ca4840b9bf096f.png', '501be2890bbe1ba6ee6c2f860b888cc5e786ca16.png', '651717aa4f946385baf6e4191cc80b2d5e716155.png', 'e7fbfa7d67501ce8beacf2a94b0272d6ab69b4e0.png', 'd3dd57ae8c4d49a0b61d0d680567a5acbaf87495.png', '83f8f1cb26dcaa887c0256ce9e48679b3580f8e1.png', 'dca8d19f3f40f205c57546a36d1079adf9915c3f.png', 'cb48f4a468d33c8ea292bf7d84ee09378fa62ad9.png', '2dabbae6ab3c8c1f956cd3491fccf68681b4cb23.png', 'c797ec62aed14d54a9a49a6d1133be4f2277af7d.png', '5e4c2daa6954a856d69acbedcede6d92b0a14128.png', '3787c27168d3a2223bac094a362e0015b8d3ddc5.png', '3cdc416c6f8d85d3226d0c2527aba6d68a2e181b.png', 'b966e3e0a0626d22cb376f9c91e134e67d0bbf1d.png', 'cd11a803835e237f3b5fa7a241e8a40b1b29435e.png', '022d189c711c0a2a9fa99379b73b022867816456.png', '13b61561e858560da5dc9e44311902797e346717.png', '150152f022a602a54581181bf7a68ed46ab06e7f.png', '2742511cf83d1c12eefc73ac1f307f8ede929217.png', '4970c350be644bb3dbd4f1d5967d9fdbf95c93a3.png', '4d822bf04570080237b833598a40ba1cb7ae854a.png', '7fd6ebd6a6d116a41cb5a8f0d58adfaad043174a.png', '91bf35a99e3382c3eac6174506335e0805496116.png', '91bf35a99e3382c3eac6174506335e0805496116.png', '9a4b34022e634ba9a29ac1fde755d1d49050fd9f.png', '9f959ea07347e157db68de090e8585b436527802.png', 'a6c3fece2a3cde5d663a5c83d833ef00dc0e1454.png', 'b372d1a0db0786a2fa9ee1164787018f19b6c0a6.png', 'b372d1a0db0786a2fa9ee1164787018f19b6c0a6.png', 'eec9f93576776ad0ad5628cb80dd9cf40c328d9d.png', 'f42b7b55e26c6ed4b0ada1071835f84dd39921d2.png', 'f42b7b55e26c6ed4b0ada1071835f84dd39921d2.png', 'f60d5b2815cc1ee11405b250f57995e36c28b0da.png', '4fff38838b35bf48f9b0823768a12e882ad3a016.png', 'ce0197e35afb822b9445ac488dcaee4382d62d82.png', '4d223f3eba5141abf8943ed4bac7230fac2f4cb3.png', '7e3ec29b87d69f077188f1628bcd72a3d5a109d5.png', '0cc38097fb6ba0bb635c19457ee2e84b34762a64.png', '801da8266528ed0f25faba492106d6ba7c4b163b.png', '2ff5e68b58003212e63ad7227831ac802cf16384.png', '9e662f03f4626ec71ec4efb155ccd92247bd8416.png', '5ab955af9b44d39ab6c6c4d4a3949bf0f9eb2349.png', 'b45cc927aa5455801fea09652cbaeb87943a244b.png', '0080339a4757cb8522fe3404560bf6e2fba73982.png', 'f685dbd246e7b5076225b3902ade18f9c477ad35.png', 'bed7353f3c089ef26cf32063ee339985ad0c4b03.png', '279131d4cd42b378044827958183485f5f3846d9.png', '975aa98e87d4f440f251b10e210d415db7a54d59.png', '006fd96811ad29ef16e657c38d763a44b89c663b.png', 'f53122379298f495a8b4cd67e7c91758a86f7f9a.png', 'b89c324ddc7e26d8bccd60449e7fe646c54d4eca.png', '2e0f35c078d66868a21cae5f690e5b3ccaee9d8c.png', '5aff62b4715e815cb0b2e36a0a65488b75ebb9f4.png', 'b75faf1f545c300ebd36664bb2eb611dfaa502fb.png', 'da663f8367c1e818de25678a7cd457ec320aefd9.png', 'b6992511798a447cdfbded38de8b4716a389e959.png', '1a8158c571b3ed8b3302fb24a98c6cc377940f9d.png', 'f77d0dbe93c6ad5cc928de9efc69437629881dd8.png', '411bdc0aaca00cafccf721d5bb65ad7b3998a2e7.png', '46bc7ced6c0715256118a0a4e1b60ebd4a1f175d.png', '28b77dc5961d042c908c080af69b134bf7e0756d.png', '0e99376cf525dfec891e4b840e73a4b63931266b.png', '0f56c40aca2216a3961e5866af867ffd65f4cf30.png', '58c890dc5cb4dad366d447cc435d8e73cc562ed2.png', '03357a8ff27b9f08af1f04c794b074a0a8e79d91.png', '9df72386d3f05f5ace20440f9a49c421f20ce992.png', 'fbc5e61ef3a964b683c7712c12d5e4bac4dddfc7.png', '00b4e7c742c489ec3fbaea57b4d1fb15d91e381d.png', '1225f24b6eb6b9dde5e770d01fd3b7b66b8a26f8.png', '12b971870dd9b7d380cdbc1cd5c0a20d5e84959a.png', '149a7017dd72930b971028fefbb363c0a79ed03e.png', '19d608e29c9b4cc2da4845bdbf79fa9df6ffc812.png', '71c314c56080203ccc746290afb760bca4662c2d.png', '7a4e12a7320aa1fe8a24fc998cc76ab9de289b47.png', '8dd8bdf6289e09b7e2bdfaea5d5d3f8112f1487a.png', 'a136f122be0d9ec081935be6c1f95e63829a2da9.png', 'c42e5e133068fa6b19e6ac7ff78f25195e80266f.png', 'ed99313ea1f5a0deb692aadad16d487b72273b69.png', 'f4c238cf963e9983834c4bb48cba4fefc7f52718.png', '431fd152e48216c04e2193fb2d152f73ae9d89c0.png', '959bfe2593be637b1089911344635ef8ca2b40da.png', '7eec735b08bfb1a9098c81337532862c54f4de27.png', '74c1fd66b5c68026ae88db446013dccaacdbbf03.png', 'e67e811eda3b79b34fef7c23ba73945ab42118a4.png', '188ebc3d8069aa2e0605d3f24db264601b576658.jpg', '4530e36bfe3fa5aef7efa4cf7c2f04d665af4d05.jpg', 'eb5afd7b0ef9c60ade8eab158bc6d24be5ef2b10.jpg', '5a2645463728ce6607b0e465278be171b7638991.jpg', '463964625a0827ce536d8017b4e06626ec9be7f8.jpg', 'f02df79de5b3aaa9abbb55688e2c0164a1ccfcfd.jpg', 'dc51645441d353d1eba566e26b7e13fca877e8db.png', '9fce3debb0fe69a25b55783438af6fa7e0b440de.png', 'ee662c776201cb9377048f7290002dd7a4299717.png', '727ef333dc08f62f019e9c418d3b458e6f61a633.png', '4cbc118538da666a66d2bfd25bdf3011e09b0754.png', '2246ecce859c5e4772601f01e100d3d3b3bb8e96.png', '917a7b91ab39c67f3257e7d4ce9bb6a94e55ab35.png', 'c44eee2bd3c99bb72c1c4fe518d861ed3a223f6a.png', 'ef8d16091586890bb566bebe38c55ccd0d124323.png', 'f7b99cc4302021bfb24fe667e0dbecb6d20764a3.png', '3e2ae227f5643eb07e4bdf6b7e874568301b1c72.png', 'ff33d3628d0906e4dd7d3377d2054f9532d9a0e2.png', 'e23cb060d6b05870643826f50fe18dfd07260a4f.png', 'eaebe3e45ca23edc23b4c09dcf780a518f042af0.png', 'c2553bf5fe5b6c67448915bc9deec0d002ba012a.png', '210e27fa83cf4122582a732b519de80d0a63cf99.png', '3879eadcb8bcf76290bcf3ab300463d0f01d1795.png', '617828c9d607a2ec472e3d19b3334b57e22a1a33.png', '63c2f8d972741a59d504dcff7434f7f5d2cbef80.png', 'b69a88b5a04719e432eb77b246ba279591be770e.png', '1539cbafd917a3e553830b45fd381b756f39a812.png', 'a5bc537d3a7fbce113be664a27aa7e876369b3d0.png', '4c5e21172c62eaa29a4ab93765beb025137a2826.png', '125be74364fdba3ae71d0a5e3014a7830fc84601.png', '0693503d99b993c558ca7bcd5db39cb1f411153e.png', '1303af89e3780f54c70ee13206added46fc5fae1.png', '7ce94f864c1e962fd4bdab8e6d469937cd21ccb4.png', 'e2bc19c3dd63fe10a5c8240c83f03dc95127285a.png', 'f258ac2ac9f30b9e8450feadd5a813f6909410c5.png', 'b284f6f11364a588f3f617946fb12e581065235c.png', 'ba2049ffc5a92fd759d9a2cd12252a64b82a51d2.png', '676e4a4ef93d78f71b23a97c88a1f7e68fe10e94.png', 'a9d28d805f64c5d25a12e7427c6e57de858027c1.png', 'f64446e867f3a37ba4049fea879ac5ebc4acd462.png', 'b4d3be4e871b5ba3f63790d9f441fb41c1f0bef6.png', '5d4cef0c39221e47cef08c23ee0ef829a3e09671.png', '8dec504d9adbcdea139ff9591b3bcb50420e14b7.png', '7825ab44853f11cf9ca69e080a8c1edde7644ad0.png', 'b3711b7863b52bc4d3b292f42d88775e347906ca.png', 'db66a25dbccbee8b0e9c4dddfc4d746e6b0a9b32.png', 'f26dd1b4e52cf71e9b6956489381f926ec53c0ba.png', '0227767a6da66b2766f30fa708b97716836071b9.png', 'def611dd0d72e0c9037d6ec0199fc985d2afa92e.png', '5e8cfefff3305ca8a69cb41838a37e054b49e8ab.png', '46dfdcf76f4ad9cef38cf7beb4efa3fb10338f73.png', '3ab27fbe1208e7d17ffb5877abeffe827bf24960.png', '03c76ae661c96d5b1d7410c182a0ee95084b782d.png', '3c1133453674d3faaedd934fd6da1e54225640e7.png', 'a21ea98db12aa15122adc692081678ae23a1f9a9.png', '877b7997f637d29a59a9dc25eabbae9ba46adff2.png', '9d99917dcbd7483374524a030e07286fef5a3b5b.png', 'fd2bf789b3f7b04b0dbdff72359eefceb499df8e.png', 'cc209ed38bda837a8dc226132482e85ce39c8607.png', 'db6c7441166bbbfc6ca4b41660edaafd131b0078.png', '59ed9bc4f1c161d5574ce4617b338dbe518240f5.png', 'd723a51a4537795b7af45c386f9e60db21eae933.png', '4dcfb1b98fa1306cd253cb4e57a1317e44a3d6dd.png', '9b02cc11c8310b12bd5612acd688b7b2eead32ae.png', 'c7cd905587c7f906ec55e51e4e59751601d84425.png', 'c9a8f50f7860eeda551da3ec5bb35622d0a236d0.png', 'fa2977385481f1a9a432c1a39cd892727b06e73e.png', '307939449fe237ebad302a969864ce7842fe4890.png', '792c3bc0e8074f1259c815e3ee64234c1441fb1d.png', 'a5587b00ce4f9d68b3e9cba9f274841864c58855.png', 'd29b51a76e892c252d90506906b99d6df80f29af.png', '5c26f304813f0704b015a1bacc56fd0ac0b70187.png', '746279d70ed556a4e13e2189e4e47ba1e29d001c.png', 'b91fe76f7c6a06f83e57e0a8dc065921152e2bc5.png', 'c5052043c47cb9227676b68586de1277a13ad0d3.png', 'c7ece23ee8d5bd2b96070b96dbd901651aed9e4d.png', 'e0bfb0b4bd6b81d15989a0b0570b2d43220bbc24.png', 'f84479427e0d95e7cf38bddc09b47fea405f4caa.png', 'ff96abcf991a046623ffa70805b22c42a10049b5.png', '4ca6d6b2d4d5e92f5b530481d733e2d8efef4daf.png', '7ab6f0911f04f7bdba8505b68623f49189e7d342.png', '1a1d46cceb809f778d058a0acdb250eb5965d231.png', 'ce2e9d1c6ae1533aeec79b982db95398d05db237.png', '82f26e77bcff15d2f2905c9028344c8267d05d10.png', '3e6c9a38d32b9a926c2a4e4d5423c23b390dd4b9.png', '5b172b6cd809e4b02632f96d13dbdff851ec6e4c.png', 'dc9b50ede76b85b28d0370c658da9dd7cbad906f.png', '40109dd89f989194ed64c7019fb1f26ea43f8b15.png', '17e7fa5e315e82b78daf1ed22008b39fc9866df7.png', '3d624e273f7a6543d6b36b83fbeae6c3ca93282e.png', '6f66001dc9a179fa9808ed68bf816054bf8fdd38.png', 'c8e471c8206305988993f77729424245808bd1d2.png', '587d0868100ab820a2de8926ebd9c9ef48856916.png', 'fbf4a67312a7372420ae1839367334723dc36110.png', 'd6ae4fa7ae67c61e77628472291a401a6d1fb9aa.png', '18a997eaea0200669d82c4cd92694dace597dbfc.png', 'ccead84b6f8d2b6f7ff5a5333d120d0e395264dc.png', 'fa2977385481f1a9a432c1a39cd892727b06e73e.png', 'd68a945485ab6a92f72d563190d5dee688389b7f.png', '69df6f7de0de2e1d0927dfd257c9f64216fa9614.png', '8dafd416d1dcf8696cdd9fdcba0f903b6b27ffc6.png', '79049b702c51fd87a7acf177bcfd827fc4bf107a.png', '0e9c7977c07f1161175cdd1fefb0bb1b475f5d3c.png', '51ad5fe12eb5471c65d844ecce8a7b872db2e1bd.png', '1aae28e63560e2427dbe815de4632ff6d1b20363.png', '4e84827e93f9fbe5e9b176ba8f0b12d1d6140d42.png', '65a40195db5774ce6d5fc3d8a0e774c7e746d4dc.png', '6fd8034b2db851a6f6c21c86bd81cb93cd4e08e5.png', 'd9965abff670112d5533605c12fcd29a228bc912.png', 'e3980fba0476acef97b45f048d2368f05affe3a8.png', '351e68ff85dec93cab7127721abf2497d5d46b10.png', '17e7fa5e315e82b78daf1ed22008b39fc9866df7.png', 'f7a2a23d72f3c2111ba2e62ddd71e95bb8dfb7d5.png', '02c3c434b9cc31e0c58fd6522dc922eff3a07aef.png', '557f7830b1073d6390a2b12f213cdac15d7ae2aa.png', '732d221927fd2572e3b199fe43374f2be3715585.png', '7634bc7667ac9d3637f301f3e730e8f48373b147.png', '7ad94a63d63f63264a7ab8ec7a53062b05c1dd09.png', '7cf303e3728b7057189e2f5791b2df8cf50ae4e0.png', '89ddcc8b906c2e2136c5dc1181be4698b49b1efb.png', '9c89f1ec8a8f3ebdee833897eb3fb540f97c7014.png', 'a17a45fd37bf8706d57483e605311d6331019796.png', 'af827f960650627f4b1b24df8702f385a042c620.png', 'c23d359d5bd88767cc73f5dfcce8417fea1a2053.png', '4df3051740c28853712f2099e358a55b4c53a13d.png', '68b72a557e305c354bffe11181cc21e23bb2f7cb.png', 'b30afa5e6664b197d970a222aa8026e5b439c2ff.png', 'f6b9884d71c51bc40b8b3420fe045857e45390b8.png', '8a16bc0b4e7ada6a40b92db4763ede9015f614ad.png', 'f558b26c34a54034e0784ffe1e321647edd06306.png', 'ad8205605906802d14d8b28dcad5b1c41ad9ba1c.png', 'd857171c6ceb9c32264b5e47060addbea08951a9.png', '40e10e9fd132427a34731152948adde519e94ee6.png', '863284b2d565dbf72b029fb3e30cc3989ddc2627.png', 'd26b49c5ae2f46c757736dc22d56742fe0011f3c.png', 'cfedd23e2069d225b666c9aa770a3511cbad980b.png', '313d75a15980ed5b9442454c6c069a7f6dbe8e88.png', '21425bb5dae04f0b1a6555a3d58f36106e12746c.png', '963f00fa35129b22051d27f9e70bc274ad87a294.png', 'b8733ad10a5dca13e3640f12e4e105dec2f2812f.png', '88e89c3f316efef6d339452f73616b85015dfada.png', 'eda1a56ec434c4affe61c37751ad0cf8a500c344.png', '240edd0abc9d5a7bbb583e2d4a9bedab1a16cf7d.png', '9f0cdd3bdbb33d3656e4fa22f1fce21b88b7b705.png', 'dde01acac500bd15461c0fe97bfde271d5dcf9ef.png', 'f6b9884d71c51bc40b8b3420fe045857e45390b8.png', '9c32453447defbb1a478216f3edfa0c32d0c768f.png', '0cfee1ac5f4713ea2af6fa7a812f553d00609240.png', 'e5ff0947d94ffcf9553e5c29b332dd8ee46c8db3.png', '8eaa57e0443cf33c663bf46349dcbb359e4e865c.png', '14fac651879359d45d862137fbdfaa2978f4661c.png', 'a0113e3628059c63ae21e9b0c9ef11cb9c00172c.png', '911166d4e5db5b5d9a877a0aacb313ff533d5f98.png', '40419bee3dd2001dd8df7d462b1a36a7f664028c.png', 'd8e43fff88a0d1e238805d569ea11c5ef9274184.png', 'c7f22b36046a6b6829ae2816a10ad10e67f84ef9.png', '43fb826ad729de792d22ab6095953a5939550ce4.png', '90353e1612356abb8a9c5f929918bfe5ac8dc73d.png', 'caffd013cb948bf84803ad975be9a21722638d0a.png', '4e906cd94e8d150a1b45f273793579c77b38f5e6.png', '98a244c00ec82ac6ec568a257817fd4797cb925d.png', '9b7dbdd7929192faa857b565188117ffd2d722d2.png', '55093a1b11cb7c115c7ecdb877fdfd2a3229f270.png', '550f7bb652f37f7d96479917f8ee2b69d327b9d6.png', '637aa1fd42542bc271021c93a1dd4c8b2481654f.png', 'a7d4238a28e6eef5321d3f6278fb17ce5a9461cf.png', '02bcfc341cbf6b3913afcc42d21601455d6371a5.png', '1a9761e956d0c573c0fc7bd1869b66a7b678fce4.png', '187f46faff3a64ede274f7f57f347cdd25b7715a.png', 'b3c685115a0a633efc24d3c0cc9d3550bc5373d6.png', '313a99b1e7c1a64e79359d701f30b71d6b22ebca.png', 'd791be3046c0cb12d467bbdea3d631a15b7ee595.png', '187f46faff3a64ede274f7f57f347cdd25b7715a.png', 'b3c685115a0a633efc24d3c0cc9d3550bc5373d6.png', '313a99b1e7c1a64e79359d701f30b71d6b22ebca.png', 'd791be3046c0cb12d467bbdea3d631a15b7ee595.png', '187f46faff3a64ede274f7f57f347cdd25b7715a.png', 'b3c685115a0a633efc24d3c0cc9d3550bc5373d6.png', '313a99b1e7c1a64e79359d701f30b71d6b22ebca.png', 'd791be3046c0cb12d467bbdea3d631a15b7ee595.png', '187f46faff3a64ede274f7f57f347cdd25b7715a.png', 'b3c685115a0a633efc24d3c0cc9d3550bc5373d6.png', '313a99b1e7c1a64e79359d701f30b71d6b22ebca.png', 'd791be3046c0cb12d467bbdea3d631a15b7ee595.png', '187f46faff3a64ede274f7f57f347cdd25b7715a.png', 'b3c685115a0a633efc24d3c0cc9d3550bc5373d6.png', '313a99b1e7c1a64e79359d701f30b71d6b22ebca.png', 'd791be3046c0cb12d467bbdea3d631a15b7ee595.png', 'c7a20f7c4246761df97a73526b1e65a5a4ac6b17.png', '3eb2f9d9de3e4a8a7e665cbf4efc56ea5472a66e.png', 'c7a20f7c4246761df97a73526b1e65a5a4ac6b17.png', '3eb2f9d9de3e4a8a7e665cbf4efc56ea5472a66e.png', 'c7a20f7c4246761df97a73526b1e65a5a4ac6b17.png', '3eb2f9d9de3e4a8a7e665cbf4efc56ea5472a66e.png', 'c7a20f7c4246761df97a73526b1e65a5a4ac6b17.png', '3eb2f9d9de3e4a8a7e665cbf4efc56ea5472a66e.png', 'ccced7898c7e1f91380f15d5312769d11ef6e19c.png', '518af2d7ca677fe5727ab0d558d23c6f98d9efaa.png', '00377d62ea1b2dbada13197e5d9ebe143bcee7ca.png', 'c3fb8509ca599bb4b2ddef4279d064baed4fb4a1.png', 'ced0bfd6aa6528cd5a37f110ed20a1fa533c08d1.png', '962b647bce2ca7c8885d31822dbd8e66ee5a52b6.png', '94c8ea8959c110e0839e4a3dd6dd92d413dd8fb3.png', '8fa104852afecb155f07382d62812dae96b6ff56.png', '24523dc3262ef456956abcff4e538381fdc1bd21.png', 'a7aa46be68e22e7d3418bf338dd56c5e689a2f55.png', 'a7aa46be68e22e7d3418bf338dd56c5e689a2f55.png', 'a7aa46be68e22e7d3418bf338dd56c5e689a2f55.png', 'a7aa46be68e22e7d3418bf338dd56c5e689a2f55.png', 'a7aa46be68e22e7d3418bf338dd56c5e689a2f55.png', '13b7bdd9db6135eb9ece01646f2a5ee535d046d8.png', '13b7bdd9db6135eb9ece01646f2a5ee535d046d8.png', '13b7bdd9db6135eb9ece01646f2a5ee535d046d8.png', '13b7bdd9db6135eb9ece01646f2a5ee535d046d8.png', '13b7bdd9db6135eb9ece01646f2a5ee535d046d8.png', '84b66ef337e07f2f01970b1630d0d621d3a02219.png', '84b66ef337e07f2f01970b1630d0d621d3a02219.png', '84b66ef337e07f2f01970b1630d0d621d3a02219.png', '84b66ef337e07f2f01970b1630d0d621d3a02219.png', '84b66ef337e07f2f01970b1630d0d621d3a02219.png', '8cae71fc25927aaf8709c8a9a7ce5bd5bc81564b.png', 'b5914693cdcba25ca323d52370ede90772683ae5.png', '8cae71fc25927aaf8709c8a9a7ce5bd5bc81564b.png', 'b5914693cdcba25ca323d52370ede90772683ae5.png', '8cae71fc25927aaf8709c8a9a7ce5bd5bc81564b.png', 'b5914693cdcba25ca323d52370ede90772683ae5.png', '8cae71fc25927aaf8709c8a9a7ce5bd5bc81564b.png', 'b5914693cdcba25ca323d52370ede90772683ae5.png', '8cae71fc25927aaf8709c8a9a7ce5bd5bc81564b.png', 'b5914693cdcba25ca323d52370ede90772683ae5.png', '6e70877bb05a75cf3b5592cbeb2d0b8ff9aae153.jpg', '6e70877bb05a75cf3b5592cbeb2d0b8ff9aae153.jpg', '6e70877bb05a75cf3b5592cbeb2d0b8ff9aae153.jpg', '6e70877bb05a75cf3b5592cbeb2d0b8ff9aae153.jpg', '6e70877bb05a75cf3b5592cbeb2d0b8ff9aae153.jpg', 'c3b5bfd19f51a487eb992d760299d972edeb91f6.png', '5d632181c4aed011f1a19a840f4b3747a25395f5.png', 'c3b5bfd19f51a487eb992d760299d972edeb91f6.png', '5d632181c4aed011f1a19a840f4b3747a25395f5.png', 'c3b5bfd19f51a487eb992d760299d972edeb91f6.png', '5d632181c4aed011f1a19a840f4b3747a25395f5.png', 'c3b5bfd19f51a487eb992d760299d972edeb91f6.png', '5d632181c4aed011f1a19a840f4b3747a25395f5.png', 'c3b5bfd19f51a487eb992d760299d972edeb91f6.png', '5d632181c4aed011f1a19a840f4b3747a25395f5.png', '3792844dc828d8620b43d00c5ac331dc2c5fcde2.png', '3792844dc828d8620b43d00c5ac331dc2c5fcde2.png', '3792844dc828d8620b43d00c5ac331dc2c5fcde2.png', '3792844dc828d8620b43d00c5ac331dc2c5fcde2.png', '3792844dc828d8620b43d00c5ac331dc2c5fcde2.png', '730afefa247623e7993036166c07e44a52dc8cb7.png', '730afefa247623e7993036166c07e44a52dc8cb7.png', '730afefa247623e7993036166c07e44a52dc8cb7.png', '730afefa247623e7993036166c07e44a52dc8cb7.png', '730afefa247623e7993036166c07e44a52dc8cb7.png', '3cb0852aac78fec0c22cd2920e86bd4b47614d2b.png', '3dd4379a6092cae70cea2b36f13688052864383c.png', '3cb0852aac78fec0c22cd2920e86bd4b47614d2b.png', '3dd4379a6092cae70cea2b36f13688052864383c.png', '3cb0852aac78fec0c22cd2920e86bd4b47614d2b.png', '3dd4379a6092cae70cea2b36f13688052864383c.png', '3cb0852aac78fec0c22cd2920e86bd4b47614d2b.png', '3dd4379a6092cae70cea2b36f13688052864383c.png', '3cb0852aac78fec0c22cd2920e86bd4b47614d2b.png', '3dd4379a6092cae70cea2b36f13688052864383c.png', '93c5c517aced89ce65d7849a6fa0de09da27ac85.png', '93c5c517aced89ce65d7849a6fa0de09da27ac85.png', '93c5c517aced89ce65d7849a6fa0de09da27ac85.png', '93c5c517aced89ce65d7849a6fa0de09da27ac85.png', '93c5c517aced89ce65d7849a6fa0de09da27ac85.png', '2d87f87ff7d090ac5790d631cbdbd90893d75e3d.png', '2d87f87ff7d090ac5790d631cbdbd90893d75e3d.png', '2d87f87ff7d090ac5790d631cbdbd90893d75e3d.png', '2d87f87ff7d090ac5790d631cbdbd90893d75e3d.png', '2d87f87ff7d090ac5790d631cbdbd90893d75e3d.png', 'b6b4cf57bd56aebb8c4b2fd06910731a58fc9043.png', 'b6b4cf57bd56aebb8c4b2fd06910731a58fc9043.png', 'b6b4cf57bd56aebb8c4b2fd06910731a58fc9043.png', 'b6b4cf57bd56aebb8c4b2fd06910731a58fc9043.png', 'b6b4cf57bd56aebb8c4b2fd06910731a58fc9043.png', '4da94e7a8f3244f7dbf2bf254754c948d048cf5b.png', '8421095aba85c79a16d5503f8d4e6a91d9947485.png', '8f9edf372f8e5c7e303be53a23d01c1848bf6c16.png', '8ab464d201f7ba692333e05df93405bb6af78dd2.png', '4da94e7a8f3244f7dbf2bf254754c948d048cf5b.png', '8421095aba85c79a16d5503f8d4e6a91d9947485.png', '8f9edf372f8e5c7e303be53a23d01c1848bf6c16.png', '8ab464d201f7ba692333e05df93405bb6af78dd2.png', '4da94e7a8f3244f7dbf2bf254754c948d048cf5b.png', '8421095aba85c79a16d5503f8d4e6a91d9947485.png', '8f9edf372f8e5c7e303be53a23d01c1848bf6c16.png', '8ab464d201f7ba692333e05df93405bb6af78dd2.png', '4da94e7a8f3244f7dbf2bf254754c948d048cf5b.png', '8421095aba85c79a16d5503f8d4e6a91d9947485.png', '8f9edf372f8e5c7e303be53a23d01c1848bf6c16.png', '8ab464d201f7ba692333e05df93405bb6af78dd2.png', '4da94e7a8f3244f7dbf2bf254754c948d048cf5b.png', '8421095aba85c79a16d5503f8d4e6a91d9947485.png', '8f9edf372f8e5c7e303be53a23d01c1848bf6c16.png', '8ab464d201f7ba692333e05df93405bb6af78dd2.png', '333e19e964c3801bcdd62f33ac989b3d00e05eb4.png', '9dd520d92014fad5731fc01da23dc664b56e021b.png', 'a4efd156a8cc4db23123c6f738377b97ae7ad374.png', '333e19e964c3801bcdd62f33ac989b3d00e05eb4.png', '9dd520d92014fad5731fc01da23dc664b56e021b.png', 'a4efd156a8cc4db23123c6f738377b97ae7ad374.png', '333e19e964c3801bcdd62f33ac989b3d00e05eb4.png', '9dd520d92014fad5731fc01da23dc664b56e021b.png', 'a4efd156a8cc4db23123c6f738377b97ae7ad374.png', '333e19e964c3801bcdd62f33ac989b3d00e05eb4.png', '9dd520d92014fad5731fc01da23dc664b56e021b.png', 'a4efd156a8cc4db23123c6f738377b97ae7ad374.png', '333e19e964c3801bcdd62f33ac989b3d00e05eb4.png', '9dd520d92014fad5731fc01da23dc664b56e021b.png', 'a4efd156a8cc4db23123c6f738377b97ae7ad374.png', '06f652bfc4e12ef9bff10a0c7633dcf92f23b08e.png', '770fbc641a85a87ab874cc8f168a2675a4a862e4.png', '50b23e186a6b1e88b0a0b43ccb6bda8dfee4401b.png', 'c0091a447020795477745327f3dbcf238f67b3cc.png', 'cb0a1dab8a63d9df04b9b76d88f694acb7a3b4d3.png', 'e0d4c094d4988b154cc4d2094b6bf6f241efdbaa.png', '13890e62574949ed1c0b0acc01ca62470734d2ca.png', 'febadc131b529872c620b2d7cfb6f3aab62b3b53.png', '0b5532a01324ab8a8be38a7411b37fd4e7ab01fa.png', '3700738ba442b0f2293489f8d688200346a62cad.png', 'ed19542fb485450a14a8c5a71925b2967f93d92a.png', '5f8776fa305033754e3391072ecc96a30b2e3bab.png', '385487620e7e592f7768134f8b08f51c6f7a90e4.png', '805a925448bf1459bad8b92049133742567f64c0.png', 'c0091a447020795477745327f3dbcf238f67b3cc.png', '9d3d4a58b008fb636b2351c8c31caf83d2f6a09c.png', 'dd2416e4693763f4d1b7ab913a5219ca72d67cbe.png', '680af1c06d07921c68255ca7736d0b1810abafc9.png', '6df5f33867a46aee66bc74c86a04ad115b846fe9.png', 'b33e2844d591c97f35eee5d1e9508499495998e3.png', '41618c7f610a9c9222e5a575e2d3c2ef90f2ac18.png', 'f27d4b15b4910aeafbb3f244adfe050bc5878bfa.png', '5c25d5a740b3d8b6e966050f3917ee4d54550563.png', '7a5097a4b2b0f7e7fc08fa634548154cdf7b8945.png', '12b86a6fee014b717cb95ff36058b7cab6bcbcb1.png', 'f405e01afb3fcd02a27aa7ccfc1196b82a2d76f7.png', '390acdb3aa9eddac616ee433fab56315789de042.png', '261939265bb897d1d188edb6ebaadf25eb76d5ed.png', 'f18e9ab41b692ebfda335b46a494c6d6b5327654.png', '3dd3ef23b4ead56d143e8518f33dafae6d828390.png', '2daa0bc4b71aaa1514b14ec8187c73eb191b2802.png', '3c3cb721b1ad1028727acd0ed2978f47c088592d.png', 'af2e7db85781d573c0c213bfef81b22b24b621a5.png', '655b4256b864dc53207517496ff7d84303097095.png', 'fc81c28a6bafb49415e657fa415999fea91e0e43.png', 'a71269e2670863562327600d912d12ebce5b1b9a.png', '13003323c6cf6e92a7c608e22958103447b2a183.png', '2b5c5d8553033099b0e47503842cac178fa0c3cd.png', '3a568634841cbb942eb299efbaa6f906e6ab40fa.png', '5a4b3a144521fbfeef1d22b4f800cd4ec3f89291.png', '5f35cc357157267a226f14b23517a5275289fa64.png', '88d63e51a195180a6932a9398d4a83b6d65a8aaa.png', 'a255354a15d1a2c1723658008a2733d94952fb91.png', 'ece93cf5a2a761c57dd7c320620a49f2cbf123a7.png', '5f55b182dcc68c86ce23d8626e44b9f64000365f.png', '649688e8d1211478260db042f7464dea08538629.png', '4dd308035565441fdf52cc9c4f68a6efbb05f3a5.png', 'f0494d856ff017e6b187c80db6cf5ef873d51ee7.png', '35c6545920ffbd2d6f6000dc94e59322391363d3.png', '8a786090c62d4a86f09ee3b41cd3d6cf92f4e963.png', 'c8c68e0373667bd5b88a621c884ecd1ee7722099.png', 'bce2ee754a6095a2805d1e13bac58ed3aa9c90f3.png', '49c3dc00826e6b8c030b9b847a8d566cf21f750d.png', '39a80313a6b3787390eb44adafe6ce656522fc08.png', '6390513bf55aff26da68cbfe07f7fb387be3814d.png', '7821136b3e90ea8ef3d402e11eed0db26d098f04.png', '17ee281e3a3b81b451257e03708bb5ee51f3eb66.png', '3b8aa8adf5d627c6e522371f862029447a3b799c.png', 'dcab2915af9a780bab61eae6d92871d3d9650c85.png', '7a55b0912551d52c06cdeb1b9860f33fcaa774e3.png', 'fb6f0621cdf4d7cac3ba569a97d821a54bf2be1e.png', '70e650c475fad244906be98b49338616c868e8c1.png', '08248dfd5fa773f76e5f944e6fbcc25e4321d2f3.png', 'a1e2dd41d5a7d893e9cc8c429b18d6685a978cfd.png', '0fd12ce8e23259d65badbf8890d0a42e1b57168c.png', 'f84174edfd4cf2e17e8916241aac7cfc82d6d88b.png', 'f07b8b840ff5c4b773a358d820ee34b7ccc8fa90.png', '0de484efc0a676413918fa7ac2c3415083707e03.png', '292b46993207e9825c46542d30a0f239b971d4e1.png', '61f3fe1b117630952ed1fb826b9ec9e1d4d71668.png', '2b5c5d8553033099b0e47503842cac178fa0c3cd.png', 'a4fb9cfa895cf1fe47f4142be1e4cce817483ba6.png', 'd4aaa87b4cd74b57b38a054fa4df5b6ae715dab9.png', 'b2a4ee2ed73cbe70192f71b8751f2c04a07da6f4.png', '9ee1a1aa98e082917a2624a3b441a0618657ad95.png', '5ca0c3bb389966f73d708a62781e2a6160f46b26.png', '8814e36cd34284d7ffeab040b7964603ea266021.png', 'c34f58660d1f1489bce0d27f350dc4c91337d6ba.png', 'e427bd172b15d706b4f590dd0f0f756cf90824be.png', '2bb5217c33bef15889ea05dd8e15efc03ada08f7.png', '4e959c00513434c92150280e8645bf7dc2d5e936.png', '0c16eb87efdc0ac69bdef7e673edb5539c14565d.png', '0ad2af9560936a23fc16ecc97626dad9e94a6e5f.png', '19551fbfe6e95e82be2af976adf6a1f9eaf6475e.png', '8918c8439ff2bf4dcca9e1faf82d292fc5bf930b.png', 'cebd795735dd7885be568b15a8118e0b3e97356a.png', '19551fbfe6e95e82be2af976adf6a1f9eaf6475e.png', 'f956ec9ff691db76b613562c01410cd6d2682a81.png', '504abb7778cf6e6c031c0d21c09c60a50233ab1a.png', '7bd567429484c8111ac21a52329248ac0d768c8e.png', 'a47f7847c530128125c64aab43ca327d5994a848.png', '2c4a0b8922e10ca88d3da0c93de733f033a026ca.png', '625e590e6ae713da9cb2db3ca5c9d719f2264ab3.png', 'aa864717f98cb815c3e637d03f1199c3ddc70f15.png', 'c3bd45ec92958c8ada022264713814fb2d29245f.png', '1c9cad6e324e35a45b9eca2955f2bcc0f0eafc12.png', '396f2aed83868d074b24b94bc69d6e7ce45669b5.png', 'a56fba0c9cbe6df3c5f7b4e09e93fe562a395fce.png', 'e84aaabdfbbaf89b12c74e3ac6f17708b6ebcaad.png', '572476c5acd482689361224edf75a6949921012f.png', 'df0f42dc991e2338200c24c95b60f8f5742d1754.png', 'b26e3a5aa9d8f9953670095697d6670ed66f4687.png', '6d44e0ef183ed25c5266cc900cc3b10fe2d388ef.png', '3dd4cd620edb55fdee0d697f760ff9de010f078c.png', '83fe6bab54931aaa7a126ec178486fa4b463e061.png', '0bdb50c6cdd53f53fda8afe04c1c1a65c3df487a.png', '0248b67682cb270ecc95367ce3a71d91e0d1c13a.png', 'b98066cf4fdf0a07acc97cbf58ff8756353ed83a.png', '5f6a916c549fa1b7ddd3644ffcb1ba964b832fbb.png', '10a22b42be10d2388b1f8f3691e2cfe9ca9e3d7b.png', 'd3e1a8531246c68f9897dd7b37221f3ff305ebab.png', 'ac5344ff1841e588863c98527405b59fe7606e72.png', '94ca5ff24d6864f7fa8ca690a3698f772f8d3afd.png', 'a0315e92dbc7f8752b07cb3b632ea8ced8c8197b.png', '1b432671716fa5fb399cdecee53d42dc7d4acefd.png', '5880d409f4b0261ac352ec39f380c7b15e3da744.png', '02c55e947ea07dcda8eebeec287d9b04e5b1bb51.png', '704ebcaf4a4a065cfb61089056946acc78dc0b45.png', '404b4c1d0cf4e15a344999a9bd45f340e0642db9.png', '532da060b48e80d1d0e0a3ec968c69ca993fe44e.png', '53590ad53a7c4d5d3ef918f33c265fd9d252e25e.png', '8b4fffd1dcd5a5325c6cca48121b83ac94909497.png', '447d25335a00fcf62e39f48270b92dd7a8633f6c.png', '62330681c1611db923a08007f7a4222b124eecef.png', 'cf329143304d14eb91410c1d2a97cf9c19ea516b.png', 'db5ecb66f68662bd8ba6e7a0923fc3dbea624239.png', '3a59c473d535c9fc2444bc5e41d86f1e9b60a089.png', '8bded46d9308068fdc5ea86d6c4ab867e51ecc17.png', '404b4c1d0cf4e15a344999a9bd45f340e0642db9.png', '4a7e37d18fd315ffbae1dd6c6d5d1d88cd133427.png', '2459618e86911ad73a851dff5dcd47ef2fa0738b.png', 'a2d4eab7d1f679b1fb5dd9d13db5634c680402f1.png', '864bb2713dfdd056e5ae69a24288ef3fbe3f93f1.png', '8d902c882179d849acaf55bb08d22543ed8a03f8.png', 'c4987b18a11cda2a80f9120055a3a7fc2d7f2f51.png', '2b1f7bfb55af0477b989940b0378a92f9d49c3f6.png', 'ef8e05421ec0beb5a1bfa9eda7bca4f60c59386c.png', '828263ee63b648789b8706ddd0896c320b6bbced.png', '679c3ea6162d30187ba96970bdd6509394ca9eac.png', '679c3ea6162d30187ba96970bdd6509394ca9eac.png', '679c3ea6162d30187ba96970bdd6509394ca9eac.png', '679c3ea6162d30187ba96970bdd6509394ca9eac.png', '679c3ea6162d30187ba96970bdd6509394ca9eac.png', '4f2f00e3ad6702c7d42cda06caaeafdf002afbff.png', '54c679e5c2ac4b7d5e00f0b02cea31f83f496f8b.png', '4f2f00e3ad6702c7d42cda06caaeafdf002afbff.png', '54c679e5c2ac4b7d5e00f0b02cea31f83f496f8b.png', '4f2f00e3ad6702c7d42cda06caaeafdf002afbff.png', '54c679e5c2ac4b7d5e00f0b02cea31f83f496f8b.png', '4f2f00e3ad6702c7d42cda06caaeafdf002afbff.png', '54c679e5c2ac4b7d5e00f0b02cea31f83f496f8b.png', '4f2f00e3ad6702c7d42cda06caaeafdf002afbff.png', '54c679e5c2ac4b7d5e00f0b02cea31f83f496f8b.png', '5f0414e0fbac8773ec2385dbe9139d3874966ad1.png', '5f0414e0fbac8773ec2385dbe9139d3874966ad1.png', '5f0414e0fbac8773ec2385dbe9139d3874966ad1.png', '5f0414e0fbac8773ec2385dbe9139d3874966ad1.png', '5f0414e0fbac8773ec2385dbe9139d3874966ad1.png', '70ba919bae4866ac51653951785a0106f5c1c6af.png', '5960cebf3927022de8792878e5b6e82b329a5008.png', '6925ea28c2925d65b3e487df4957bfc9ecde5bb4.png', '5960cebf3927022de8792878e5b6e82b329a5008.png', '6925ea28c2925d65b3e487df4957bfc9ecde5bb4.png', '5960cebf3927022de8792878e5b6e82b329a5008.png', '6925ea28c2925d65b3e487df4957bfc9ecde5bb4.png', '5960cebf3927022de8792878e5b6e82b329a5008.png', '6925ea28c2925d65b3e487df4957bfc9ecde5bb4.png', '5960cebf3927022de8792878e5b6e82b329a5008.png', '6925ea28c2925d65b3e487df4957bfc9ecde5bb4.png', 'f5be2be1b6fcfc5ab8fdc2ea2de6b6108182889e.png', '41478a398750d369374fbac1b94353d85328da32.png', 'f5be2be1b6fcfc5ab8fdc2ea2de6b6108182889e.png', '41478a398750d369374fbac1b94353d85328da32.png', 'f5be2be1b6fcfc5ab8fdc2ea2de6b6108182889e.png', '41478a398750d369374fbac1b94353d85328da32.png', 'f5be2be1b6fcfc5ab8fdc2ea2de6b6108182889e.png', '41478a398750d369374fbac1b94353d85328da32.png', 'f5be2be1b6fcfc5ab8fdc2ea2de6b6108182889e.png', '41478a398750d369374fbac1b94353d85328da32.png', 'f5be2be1b6fcfc5ab8fdc2ea2de6b6108182889e.png', '41478a398750d369374fbac1b94353d85328da32.png', '74211e1a67430d2b4b5dda446ba93081c23e3409.png', '74211e1a67430d2b4b5dda446ba93081c23e3409.png', '74211e1a67430d2b4b5dda446ba93081c23e3409.png', '74211e1a67430d2b4b5dda446ba93081c23e3409.png', '74211e1a67430d2b4b5dda446ba93081c23e3409.png', '76254d21d3c241f4563cf636a15703eae4d36584.png', '76254d21d3c241f4563cf636a15703eae4d36584.png', '76254d21d3c241f4563cf636a15703eae4d36584.png', '76254d21d3c241f4563cf636a15703eae4d36584.png', '76254d21d3c241f4563cf636a15703eae4d36584.png', '90f106ffe070e3dd3758c59cd86a38f0330f8609.png', '9f3a45b8f52d744d4e617ea2658114a317a50f4b.png', 'e3e3e007e12c94cc4e107ef7a360d1c9f18317e8.png', '90f106ffe070e3dd3758c59cd86a38f0330f8609.png', '9f3a45b8f52d744d4e617ea2658114a317a50f4b.png', 'e3e3e007e12c94cc4e107ef7a360d1c9f18317e8.png', '90f106ffe070e3dd3758c59cd86a38f0330f8609.png', '9f3a45b8f52d744d4e617ea2658114a317a50f4b.png', 'e3e3e007e12c94cc4e107ef7a360d1c9f18317e8.png', '90f106ffe070e3dd3758c59cd86a38f0330f8609.png', '9f3a45b8f52d744d4e617ea2658114a317a50f4b.png', 'e3e3e007e12c94cc4e107ef7a360d1c9f18317e8.png', '90f106ffe070e3dd3758c59cd86a38f0330f8609.png', '9f3a45b8f52d744d4e617ea2658114a317a50f4b.png', 'e3e3e007e12c94cc4e107ef7a360d1c9f18317e8.png', 'a2fa9a2f9c3dde0cbc725706a1d51f01afacd38b.png', '90f106ffe070e3dd3758c59cd86a38f0330f8609.png', '9f3a45b8f52d744d4e617ea2658114a317a50f4b.png', 'e3e3e007e12c94cc4e107ef7a360d1c9f18317e8.png', '2ff2780c990fa9d3aae0e58c3763ee33a5606028.png', '2ff2780c990fa9d3aae0e58c3763ee33a5606028.png', '2ff2780c990fa9d3aae0e58c3763ee33a5606028.png', '2cc276f122565cba701ca66706bda6698cbe7a31.png', '6e365341de859c2436888c5338c45de832ac1a70.png', '4d0a62d642636f3f9397187254013d847e39adb7.png', '98e0f79dea9b0c6fe8937c98d64044d0f837a402.png', 'ff0f63f09fd4cbd3bbfff3578a05d2f69dce963f.png', 'a455a454fc57017b63876bf367bb36d2ee3f24e8.png', 'a455a454fc57017b63876bf367bb36d2ee3f24e8.png', 'a455a454fc57017b63876bf367bb36d2ee3f24e8.png', 'a455a454fc57017b63876bf367bb36d2ee3f24e8.png', 'acafbb27a6435e09b0e56d40f3b2b8937093c62b.png', 'acafbb27a6435e09b0e56d40f3b2b8937093c62b.png', 'acafbb27a6435e09b0e56d40f3b2b8937093c62b.png', 'acafbb27a6435e09b0e56d40f3b2b8937093c62b.png', 'acafbb27a6435e09b0e56d40f3b2b8937093c62b.png', 'ccbb8ac628647174a5bfd3ff6ed29d0eb9d1dbb9.png', 'ccbb8ac628647174a5bfd3ff6ed29d0eb9d1dbb9.png', 'ccbb8ac628647174a5bfd3ff6ed29d0eb9d1dbb9.png', 'ccbb8ac628647174a5bfd3ff6ed29d0eb9d1dbb9.png', 'ccbb8ac628647174a5bfd3ff6ed29d0eb9d1dbb9.png', '89b3c8171c7a64adda5d5820ac7fada75e9bd7dc.jpg', '81d272003af79006a95d6f565503d26766a4ae65.png', '89b3c8171c7a64adda5d5820ac7fada75e9bd7dc.jpg', '81d272003af79006a95d6f565503d26766a4ae65.png', '89b3c8171c7a64adda5d5820ac7fada75e9bd7dc.jpg', '81d272003af79006a95d6f565503d26766a4ae65.png', '89b3c8171c7a64adda5d5820ac7fada75e9bd7dc.jpg', '81d272003af79006a95d6f565503d26766a4ae65.png', '89b3c8171c7a64adda5d5820ac7fada75e9bd7dc.jpg', '81d272003af79006a95d6f565503d26766a4ae65.png', 'edbc6903c08bbbf085d76fc6fd0b55cac81bc9df.svg', 'edbc6903c08bbbf085d76fc6fd0b55cac81bc9df.svg', 'edbc6903c08bbbf085d76fc6fd0b55cac81bc9df.svg', 'edbc6903c08bbbf085d76fc6fd0b55cac81bc9df.svg', 'edbc6903c08bbbf085d76fc6fd0b55cac81bc9df.svg', '93d112af67c91668c8085aadd81986c3a1d8a902.png', '687efd99003eeb729f3df77308eb24b058c3a47c.png', '93d112af67c91668c8085aadd81986c3a1d8a902.png', '687efd99003eeb729f3df77308eb24b058c3a47c.png', '93d112af67c91668c8085aadd81986c3a1d8a902.png', '687efd99003eeb729f3df77308eb24b058c3a47c.png', '93d112af67c91668c8085aadd81986c3a1d8a902.png', '687efd99003eeb729f3df77308eb24b058c3a47c.png', '93d112af67c91668c8085aadd81986c3a1d8a902.png', '687efd99003eeb729f3df77308eb24b058c3a47c.png', 'a455a454fc57017b63876bf367bb36d2ee3f24e8.png', '2872c09e4050ad926dcb09076060b70d9f94dc9c.png', '3187d1b57acda59938c005d4688a66c42e5e41c3.png', '25e5dc979e9eae939becee3c877de81c4612291f.png', '25e5dc979e9eae939becee3c877de81c4612291f.png', '25e5dc979e9eae939becee3c877de81c4612291f.png', '25e5dc979e9eae939becee3c877de81c4612291f.png', '25e5dc979e9eae939becee3c877de81c4612291f.png', 'a67ca65c6349c021e65be643911ddfbf21f2ee42.png', 'a67ca65c6349c021e65be643911ddfbf21f2ee42.png', 'a67ca65c6349c021e65be643911ddfbf21f2ee42.png', 'a67ca65c6349c021e65be643911ddfbf21f2ee42.png', 'a67ca65c6349c021e65be643911ddfbf21f2ee42.png', '5545110b794b9fc393ebaf81af9b2bda8d3bd05e.png', 'd59af4de8a4f970637903a31da630e363dadc3e7.png', '6de7572fc332e12290ea7d7961900128d30b93df.jpg', '1899272b476853ed405acb5ddc05c8ba96438d8e.jpg', 'd59af4de8a4f970637903a31da630e363dadc3e7.png', 'a024a6d4e2e749a11d55cd2a0594ee7ac165734a.png', '5651e25c82ad7a259c50584a31f355e12c0f48cb.png', '5061c98f19bdb194083d0de0ebedd56fa845529d.png', '7d5d984daef454a79a316d5bd30cec99bf3aae7b.png', '14d3c98110a972661d32ad0f4488947891385902.png', 'c8908b3c76ea74e03750d4ad48609fdc19e35bd0.png', '60829d86234b2365d4e8ba170041f061669569f5.jpg', '8b1d3590003562f9499bb4c7f7df057153f3e9fb.jpg', 'd60970b6ea639905e20222414dfdf68c74fc7a9f.png', '742e6ff11b19ce57faf188597c5b4482b358b0ae.png', 'd59af4de8a4f970637903a31da630e363dadc3e7.png', '97d6e0ed038475b0e4a43d92ed698fddb513afbd.png', '6a93bf9498b0c70b083b9127adfe28672d90c2db.png', '70fcdc89453ab968fcfd1b43d87d6787760c7089.png', '785c69f38f972a2568f7bafe677244d459f2aaa9.png', '6a93bf9498b0c70b083b9127adfe28672d90c2db.png', '41e7c074825c3219ff889d4d43e80107a7a9c4e8.jpg', '0464e07720c39e94072a764522923de001721e19.jpg', '0ebb6f18f1248cdfacb7bb15c60cf305475eac71.jpg', '61a45eb30fc3c9c3993ead3058182d68353f4737.jpg', '910f6154f41b5b1829e41fb686c00ce9c914048c.jpg', 'bef61c53ba01b25e8a259c5609bd490eae7d2663.jpg', '3d54ffddd9f851d69383349da06895b330302cae.jpg', '43f6162fedf08e3d3f28224bfe2bf6fd9487a553.jpg', '4f0b576444a7e21d3ec1279afa1855a556614f38.png', '8967cbcf068913e3ac4cdb1c4b6ac79504c14e59.png', '18b3b8a12226abd3b6b50d3721110fb7e28ee3af.jpg', '97d6e0ed038475b0e4a43d92ed698fddb513afbd.png', '6fa1ddce4f5bc152b88c523dcfc724f750fd80ae.jpg', 'bc029d161f82b6ca2e54367f8b1d7c1cdc54b765.jpg', 'ca467ae701b9f6422df251aaf4d2819728d29c70.jpg', 'f5d1b1a42b9719eeeec951723b476239dfbe2a06.jpg', '1b6ebc3ba11fe0ea6457cdda00b06873ff56c2cf.jpg', 'ca467ae701b9f6422df251aaf4d2819728d29c70.jpg', 'bc029d161f82b6ca2e54367f8b1d7c1cdc54b765.jpg', 'ca467ae701b9f6422df251aaf4d2819728d29c70.jpg', '0702991f5608d22c75c2216695096fef53447376.png', '810a87bbf09a2c41bbe02b1611cd91b047f69412.png', 'cddb2d9b9e814d408b83ea63d1161c112dbc4587.gif', 'ac6d620060bfae7fcc23df106317b9bee0c05c57.jpg', 'ba3bb1a9d9f683c19afe34ad52e4cb97d76ff1eb.png', '1ed79e208af97e391cb112928ff59410a93697c8.jpg', '70653e22f084681590ca1a6fe960f66a51343e9f.png', '1577992e5948b19d8ae5bcba477b45b92cadc9a6.jpg', '5651e25c82ad7a259c50584a31f355e12c0f48cb.png', 'f343c28dd7b03239cad46c02e82e16a41fe36a7d.png', '8bb5e79db5a4cb62e8c5528150555bf441cac3ca.png', '1db0afb4cd428fad90547f6b06a5ce221f9dd7b8.png', '29d83dc30ef424f1a077e9a076f30a685d45397e.png', 'becf896f2404984f0260c26910d46e7c44528833.png', '5651e25c82ad7a259c50584a31f355e12c0f48cb.png', '5651e25c82ad7a259c50584a31f355e12c0f48cb.png', 'a120b7c399918505035a2ab76dd86c0058a78e59.png', 'bfe71868016eb885c45ef3f285703580cccb89d6.png', 'fba570209dcb12445b3eef7aa2d98af9ccbe3ba4.png', '236d842d10d78ce9282ca7467690e446e3214f24.png', 'bfe71868016eb885c45ef3f285703580cccb89d6.png', '43d22b2529ccc6224d3ce02f3cd7577a3086ed46.png', '446adafa590e328a0c81cb7df1ff094c9d55a604.png', 'c4ab5788a10c5da5abfe4353902fc6a34cdb60b4.png', '446adafa590e328a0c81cb7df1ff094c9d55a604.png', 'c4ab5788a10c5da5abfe4353902fc6a34cdb60b4.png', 'eeb230aeec110fa4b7e2f28b36ab550d26db03e6.png', '4eb56445aaae34fdb0336a9712d2dabfe8ab371d.jpg', 'ec3199bd52c57bcdb3ab16d727a172def834d4fe.jpg', '97d6e0ed038475b0e4a43d92ed698fddb513afbd.png', 'c215ef1bea63e7c3b0f269e8241387605408f4da.png', 'c215ef1bea63e7c3b0f269e8241387605408f4da.png', '742e6ff11b19ce57faf188597c5b4482b358b0ae.png', '918536c4104e8e9217053fabb0c94413ed2f68f3.jpg', 'cb271be563dfe4ad86590ec23d9cded4af2def20.jpg', '6818d5fd7919649bf31a583f908191f87742b176.jpg', '4e27798568f72f82252a782d12a6a3920fb39cdd.jpg', '658f58f5d0755e360b220386be3e7514bc3bd9f3.jpg', '589ee76ff6ba3e7f9a8e65f2e32a73fca70d77fc.jpg', '930f2fb1f5d87f45631a872a9dbc485322e209ef.jpg', '56a88d5fea0299543b59bbdb5416bc4912ba5661.jpg', 'd450cc7ea5707396cb4e0a4850ba94308458b6be.jpg', '00414afd7c9c9268d618b81b577ec3a76ab6d22e.jpg', '22498e158a79863912e0b3e424ca74836305d0db.jpg', 'b9efdaae9da670199ff6798f6af93669542e4c51.jpg', 'cb391d9b96ae189ce62c675617fffafe7596100a.jpg', '3777b2d39d82617504826f5e6683116db27ea505.jpg', '3b4b53c4454c345ac8caf9b3c5090c22d628b104.jpg', '52163ecd119288f020fb0d1ac988b868c95161e8.jpg', 'a7eb4d54c79280aebdde0fad2aede0cb4a5e7f2c.jpg', '30a3c8d9d31d4b21589fc3f1fa848edf1ca38df9.jpg', '946d565c13ae30d32afb749ed0ef37d508248ac8.jpg', 'fe70b4848ecc2cfe83480f6004797f42176918d3.jpg', '0f63e0f56e1461a6ead1cb1044c0614a5d47d8d4.jpg', 'a8a333174901bebb01dfaf555bc24fa2e2d9f142.jpg', 'dd686447ec0a117b3b34bd7290195fbb47390ad9.jpg', '0846afc89a596fc2d8a0703166243ae48ac97d20.jpg', 'c0597322c7cdbb69f28694d4dabf1e72b85acc6e.jpg', '40059b34ff442803043b6939ee6a1b1e90df1969.jpg', '5acb3219d6e7a43a28059bbcf309c3f4fb548b3c.jpg', '5404779b5a87c2b05d86aed505dabe58abc9bb62.jpg', 'd28d68573f26b3423a95f7c33162b76493956671.jpg', '4ff21aa8ea6495f8232e36ecb75e2c5801bdd093.jpg', '2cebb7d80f35b24b4a4d7d4d6e74edf106d43732.jpg', '115fc65755550076cb89a5c865bdd4e58a22af90.jpg', '216736867aa566a20d3d2febc3c35e00c2da1c50.jpg', '98ce2e1171fbac1c3128e5907afef796d692a9d8.jpg', '33d5019bba0d729f246a86867dfc98ab14632e35.jpg', 'b315719937b9b1ce63dee020bc5be92d848bb60e.jpg', '4fff2a46151dc02f56872b537481d8a754512da6.jpg', '8e501fb01021da75fe546791bfab24a41531ddab.jpg', 'dd9b595b5cb9c6dec43ed336ff438802459060df.jpg', 'deb17ed0627ead7c1fcc5512a75e0604dcf30262.jpg', 'ec87fc8303c3348f61bda39494d0055d8a41ed65.jpg', '8e27564bc0a4ae843c22e7633a5e7c8b01f5fed6.jpg', 'c3cafc1fa67ab9156356c040d7434308d06df5fd.jpg', '488fa17e6d24c86a0070d467cfde5dc10b002bd3.jpg', 'ae22db66a81084db73eec6abe7a4f7e344a083ff.jpg', '2fe6858fc53b64ce2da34f105848aa9fc9cb17d7.jpg', '824cb0d420b1de714706194ef30b76287438c4b8.jpg', '4e982f051c163198450345c52f5a132aae7307aa.jpg', '991e6dfeccf31210342912ccc4d8505759cd3b21.jpg', 'c79c14a4f3b9d00d2fa129d594eb9f258946d1b3.jpg', 'e10aa70bda5b0e172388c35fb562557909c59be1.jpg', 'cf4c2de0330c5e8fd8eaf5fd58d09aa68860194c.jpg', '6057994bdfc50dc63d6c08b807c3ad68523e95ae.jpg', '1ae73704ee0504b450a276ab2bef2fc5dd91a031.jpg', '8e6c40c51cdee96a46630a33c10b8410ff824ea9.jpg', '355fe0715fe1e501a81b2e182bee2ddd796de0d4.jpg', '031eaf9df63d62c5236eaa699d56dbc16ebb0d16.jpg', 'ce6f0238c189c30e22089001c2f19fefb76df115.jpg', 'ce6f0238c189c30e22089001c2f19fefb76df115.jpg', '7a0299c822ac94f4ec274ba1bc8281ec4a4f0db6.jpg', '5c1fed18202324b2a99f55e650c0b334bdd4423e.jpg', '289993c284b760965c48b95acc7e2e3975d417c9.png', '214f81a9597e2e560b5e1e3c203a61fe2b62aaeb.png', '6c6d615e9e691703963b63f88cc4ec875669cfe7.png', '3c7a9bfa6c04f27b8bcf3f995ffb420c4160b090.jpg', '869f9dfbc3935af9c4392690c112674f8e59f308.jpg', '869f9dfbc3935af9c4392690c112674f8e59f308.jpg', '4ec0259df77885ce972fb45d884bb26b53ee8f38.png', '5e0132bab0d4d395146b749ef8b03dda2686f523.png', '52e55541848ad3e5ef105268fbf1ec29c47a0b7d.png', 'dabde8cc3b2f2582491fec2053236b5e02111ddd.png', '52e55541848ad3e5ef105268fbf1ec29c47a0b7d.png', '987276d3adc848c9a8056d10328a7ed68879b24c.jpg', 'd942d1f3ce77d56421def3357a0efaf1a503db95.jpg', 'e6a5b820759f8937770126aa3f264ba46a931a2e.jpg', 'f35c1131b7257e76cc704dd7f87ccab16122dda3.jpg', '18a4ddce480403e64040e8644cc11d1106773733.jpg', 'cafeced4ec9611505fdb6a67cba2a62ff4082c3a.jpg', '6e17b33701f32b9544c9725a0989bc4c6e4ab74b.jpg', 'd15459abfeb3e7b93b33997b0a872ff8a01ec93e.png', 'b2c11e5a499cc194f74c0a46e27e5d33a772eac7.jpg', 'eec9fe1349d2690683c097ea064fc120b64c94d5.jpg', 'fa5a58f70c80cdf43b1b156df4c51d6829440a0f.png', 'b0fca3ab1ffa543263569b83240652ff2a7c8372.png', 'b0fca3ab1ffa543263569b83240652ff2a7c8372.png', '83e9eb12e1c512a5d62b7485b882eb62dba845e6.jpg', '9cff59e58b7da6ce15d9ee3443c51d24eebe765c.jpg', '39a0a53fc5dfa556f28c2b11283eaef29ebaf0e3.jpg', 'd4f45b94f80e366ee6849c67115e5a24b4459a0d.jpg', 'da7e6b56a1374caab9f5c209b05015e50502a6e3.jpg', '1452b414586ba128062ae60e1ae2c550ed1e8968.jpg', '2839cfaad3eff4312671fa375857e7e629bc4ecd.jpg', '96956f04c4f0e9825dbb56f57944c641b1dec548.jpg', '1c51a830377fb04d194ab8d1d44cebcf4b001890.png', '45ff66c9387dcb419651883677cfb11fbbf8e075.jpeg', '54ea9b0cf1a57bf2879772ea81f656264605d75e.jpeg', 'a9387c1491bb743a0c76d2ab74c4dd145c964c7b.jpeg', '0eaec173b7a988f26be6c4e0ddb159545fc9f7c1.jpg', '207c6dd467f9a99fa1a17726fa09bbefe5d0d9f7.jpg', '80c2a6ab8f5217560a6d261e6da720ad3bcc44dc.jpg', 'a9bd192e6d64c293ef7fdd01161097f81c87848b.jpg', '3ec8c6eeac0c976086a5557f8339cbb7d96db657.jpg', '67b6d6a798deb21ab88410aae5eb5c413248d3b0.jpg', '7e8a3ab6724a717d7dfd56f09b28f991ef9440a6.jpg', '5608867527f9cb0c33e74c1716c8f4f12d39aa6e.jpg', '4b031fef18379b2e84cbd4c6c7a45bd5672b8885.jpg', 'a5568a67fbd3ea109091e481471d0f4685911af4.jpg', '12c1a350d0e23eed380e5c482be728534781ed84.jpg', '0453acf422d389828e1f553d4dec0a2765dc1b4f.jpg', '28f9d943a4e9ff9ad0adca6addcdf5c23ab00e5d.jpg', '2b01cba56806ea05b2f294a73bd1b6f34bbfbe0a.jpg', '33a186413d011974a9f7688b01738239851dcba4.jpg', '33a186413d011974a9f7688b01738239851dcba4.jpg', '02a066eabf9a5af381a449764412e5149901d5dc.jpg', '9c06cbf996c4570f6b800da5ad7c0cd8e91da73c.jpg', '9e4ca238e80a19f476f8d9d119abd426c9b24ba3.jpg', '0eaec173b7a988f26be6c4e0ddb159545fc9f7c1.jpg', '0eaec173b7a988f26be6c4e0ddb159545fc9f7c1.jpg', '48727a19f106c89bfd515c40f9c70ffe9a8bd9a6.jpg', '7d4475a120ca561bb45f6b24d8e9de4ac3fe21db.jpg', '2cf2ef95b1641c2a8937a6aea4ec27dbdbcdd02b.jpg', '2cf2ef95b1641c2a8937a6aea4ec27dbdbcdd02b.jpg', '8de66a602f1feb1cf5b87a2c7f1649c4532a126c.jpg', 'c18abc3433dcd921c7bc9d75d6ab4c9e9eb20254.jpg', '2cf2ef95b1641c2a8937a6aea4ec27dbdbcdd02b.jpg', '2cf2ef95b1641c2a8937a6aea4ec27dbdbcdd02b.jpg', '72394f2bb66148d5ae41a84efcd719bd4b9b36ee.jpg', '000a83e0993424e500aab12a9b92068515ac2bf0.jpg', '8dd49e06403a322ffbc95e72c120f0375d4e2f55.jpg', 'e8d867ceb60cb9cc0af0ed5b771b6529ad8e27a6.jpg', '17e3b9a1f0d1fc022b259b627b2963450169c422.jpg', '17e3b9a1f0d1fc022b259b627b2963450169c422.jpg', '33a186413d011974a9f7688b01738239851dcba4.jpg', '57f2f07e8286b83335300ade42b892125b5e3b7f.jpg', '0b6b665f9b9336baf196b19d77536a9056c95b43.jpg', 'e255ee77d47ade1f04b73efbe197c7d772106461.jpg', '92de36cd10d0301b920a83b3f5730bd6add20111.jpg', '92de36cd10d0301b920a83b3f5730bd6add20111.jpg', '56178a3a9b43805c54654b5948cf3c20da8a8bb5.jpg', 'efe64267bcbeaeade2ed0b2161469b93c9857618.jpg', '61ad5c747068c34b2ff877a075f22802af0e7bf3.jpeg', 'a348ea2a8522ac8b7f6e722d16709ab163dfb4ef.jpeg', 'e8d867ceb60cb9cc0af0ed5b771b6529ad8e27a6.jpg', 'e8d867ceb60cb9cc0af0ed5b771b6529ad8e27a6.jpg', 'e8d867ceb60cb9cc0af0ed5b771b6529ad8e27a6.jpg', 'f6aadc6905f991b12bea53b22e62a755a55bc5c9.jpg', 'a8796e38836e25f35b9df721278e24b3fc496f74.jpg', 'c0a5f408469fdffd9a8d2c463064a79b004b5ebb.jpg', 'cb8925527c6d5969ded9f6a0871eed9747da5385.jpg', '1a1d07e579353782b021f0b42f59fbd09571c0dc.jpg', 'fb9776be8530f0b59acc34db506ac19843116078.jpg', 'be8928c8620673f719de03c6d46b6ccd33ecde0f.jpg', 'edeb1bbff5c70c826a28e798e404faf88fc0ee7b.jpeg', '43c98c77a866a116a2486481952a7523eba8b537.jpg', 'c18abc3433dcd921c7bc9d75d6ab4c9e9eb20254.jpg', 'b734cc8d957354dad990bf6145531ea51a432f98.jpg', '18a4b4948a6c680987fda0b513cefa89188f62f4.jpg', 'd255fdba15992a1c1ed5f972af63102eb570b254.jpg', 'd713f93fac1a979bec998b1e27b235555b7d5fc6.jpg', 'f4d5bea4655227903ca328693f52b512ca1340d8.jpg', 'f4d5bea4655227903ca328693f52b512ca1340d8.jpg', 'cd2f1b5950e308a99910cb8593ed6f4202457be0.jpeg', 'b77c066af3b20cf68429bedc4325e24e2534b454.jpeg', '8a75d2dd5ea781e541f9c4501c70d6dee2812d44.jpeg', '41839e6be1ff7cb01dd6e9723d1799984f697dd8.jpeg', 'c4c23335ea0bcb42618d680f2a51c31d5a37ef78.jpeg', '4ae837dd892ce39b5e8f86aabba93336b4b77e12.jpeg', '3059d4bad58b78893b097b7436a2b8441919498b.jpg', 'd2c3b35e29ef1c3510e9537957b8f2966cca0bbf.jpg', 'fa45a3584e1f035373cf8e7b5b599e12a8679d36.jpg', '9e69de6c7736baaf6bf94ee933ee5c09f0e8f560.jpg', '5aa6559e04c7a87e3647031afc1f3b943e7c327a.jpg', '36d767ddfc1991dd14b6e00612069a6bc8d918f3.jpg', '210c8c82ab8759f6f25a1734d48bec8df19e8073.jpg', 'b07cb78028ffc6aaf45b468e341c6b3ff40777d3.jpg', '33a186413d011974a9f7688b01738239851dcba4.jpg', 'e0c6f925db406508267b81d466c773677292fd48.jpg', '28f9d943a4e9ff9ad0adca6addcdf5c23ab00e5d.jpg', '28f9d943a4e9ff9ad0adca6addcdf5c23ab00e5d.jpg', '28f9d943a4e9ff9ad0adca6addcdf5c23ab00e5d.jpg', '18d588d728729052f7ebfcb655f0043391aa8720.jpg', '18d588d728729052f7ebfcb655f0043391aa8720.jpg', 'c678d8b8defeecf0ef3fbc4a59cc247c8472ed98.jpg', '29f6b6575361a919ba648ba6cda5d2766ac3287c.jpg', '29f6b6575361a919ba648ba6cda5d2766ac3287c.jpg', 'ca860817ec39c3a8d992f92d5b97289eb1c6d2a3.jpg', '1c51a830377fb04d194ab8d1d44cebcf4b001890.png', 'a583b56e9d072bb19308252e29ef1fe4f1a0293d.png', 'a583b56e9d072bb19308252e29ef1fe4f1a0293d.png', '42fed75bb94014ad128a1c7a71aec3677720c346.jpg', '2759dd0ac5022d41496843e5b615c6e5f67178ef.jpg', '4f051064630db79f14508bb083dc5d7aa01c47d6.jpg', '59570027d35205deddb06dfd50d26d1848caafb7.jpeg', '25b6dbc8256340cfc03791727d22ca0a4a99a9bd.jpeg', 'f99aab91b5f1a997c3cf15ad03883f0560a54f60.jpeg', '01faafcf520943aa28d72f8597f56fac955139c5.jpeg', '4b70399d3f9084313bc8943163e41ec7ed53d694.jpeg', '03496f889329752a3edf0f699a049cdba186db44.jpg', 'b9634ed9e25db6ee5ca4d01f0ded6e666ebeb870.jpg', '252c9a598a9e08b765326fb9b336c74502542e77.jpeg', '3d7c7bf447b52a2384e0d71b22e96d6759f09ffc.jpeg', '811dbd06fbed602c386a087fde0697640b9d3ca1.jpeg', 'af8f3dfbbf4761646e3427ee7d9b9191519b74ad.jpeg', '1804308e6296146bd91ded6cc93efc6f1085915b.jpg', '903557c1d9e83a8d2caf3ba2a034b6532cf8777c.png', 'c9f2e3378e6668838a8cbdb8833946d79c0afbe0.png', '06b2ae0f6f6ee7977437df9f6f4a734deb1bdec7.jpeg', '92dfbcc73384144922df4329d9f43e35525bb090.jpg', 'a5568a67fbd3ea109091e481471d0f4685911af4.jpg', '9c06cbf996c4570f6b800da5ad7c0cd8e91da73c.jpg', '93892d4d62e2d95b902faeecb05df4a84c7ddfb8.jpg', '1a47a59ce50ad982c26b40dce11e39c2a86691f5.png', '1a47a59ce50ad982c26b40dce11e39c2a86691f5.png', '1a47a59ce50ad982c26b40dce11e39c2a86691f5.png', 'a4dc927308d03bf1468b8db66926ee20b13f8aca.png', '042f7800d771ca7a3c4497e14db2ee5f4dec3900.jpg', '7c02b8937ab0b601b2d4908d49044bcf37d5e23d.jpg', 'c9e1471e7f49c255e60a3d09b200f832fc31c285.png', 'c9e1471e7f49c255e60a3d09b200f832fc31c285.png', 'c9e1471e7f49c255e60a3d09b200f832fc31c285.png', 'aa7d523b6fe9138fe6d85403ebd5cee11397ab45.jpg', '132fe2728862a5883f95cf84c57cb1b416d4ce38.jpg', '5fb1f2ad68d03ef864024ef5fd5f9ab059abe496.jpg', '8ffc0a4567337154c08490510d8ffdb901d0d090.jpg', 'ff63c9212e586c75a93cf9e783247dc2b53650ce.jpg', '9c7144a0b6867164dd86cff5018c4b84767d085c.png', 'bdfb5ebd551d88a7a01990f2c4391ed5659f3358.jpg', '4e755090f5f9c5d58437377f8256751dcdf9f74c.jpg', 'e61de7ca924a5246663c07dc35a6a9c9438ac404.jpg', '125dea1d926e0881ecedc4764ace053b18bf2182.png', '125dea1d926e0881ecedc4764ace053b18bf2182.png', 'cee1a1f84827a1ac2913ec61b8c4ec3ccf08b0ab.png', '880bdc8a0ccd545bfeeb0ee9fcee4b90bbf4bbdd.jpg', '7a22f8aafa919678f4a63881fcd00662577f6b3a.jpg', 'c2f35b36dae0b53efe4f2f4aa3c2e58ddc4f729c.jpg', 'fdbae88b14d000f2905d9f584b82c28c3f6d483a.jpg', 'c8108d3b0c4c8cadf29e9fb31db74d03727242a0.jpg', '654bb3d529dff068819a7e641a55c51d53f6c375.jpg', '05fd83d572a09ece387e8bc9daed7a076a69cce3.jpg', '5b7bcc841162df62e52b8405fddbe106200c7635.jpg', '5e75ddc7475d311f8dc3ca253eebbf3e670d5fad.png', '5e75ddc7475d311f8dc3ca253eebbf3e670d5fad.png', 'bed92e6516d0094385f1b2ef75d71d5c5866be89.png', '2c6e7e1872a172ee2fbdb91be44229a97883934f.png', '2c6e7e1872a172ee2fbdb91be44229a97883934f.png', '00bd1d76695b9bd8a7394da281501096dd1b253a.png', '2c6e7e1872a172ee2fbdb91be44229a97883934f.png', '00080f3e8e777429056d54236dbd0ff82693e5b3.jpeg', 'c9e1471e7f49c255e60a3d09b200f832fc31c285.png', 'aa7d523b6fe9138fe6d85403ebd5cee11397ab45.jpg', 'aa7d523b6fe9138fe6d85403ebd5cee11397ab45.jpg', 'aa7d523b6fe9138fe6d85403ebd5cee11397ab45.jpg', '650a52a7abcb3f7ba3c07302ba62b5f7226f3b75.jpg', '650a52a7abcb3f7ba3c07302ba62b5f7226f3b75.jpg', '3c941b799f85bef9327b2179d41881401d6818f0.jpg', 'cec9f44a286c48b81b1e42138d9f1f300a6a85a8.jpeg', '4f4e80fce09ce2974d0044a3ea24c93986fb3e1e.jpeg', '720188dd8ee6da6f47c03019bc30cbf7c5b983fa.jpeg', '9c83c08017cbeacd80748e9ba68635603f084eac.jpeg', '89db0ac7d792f12b3589fbd4d77dc001d2a8bb4d.jpeg', '75ae003d71af287b39fc025c3bf080090c6c0845.jpeg', '7ca7cb6bbd1e2d6af91370b257592ab65c3b0146.jpeg', 'ca2073a979e1547a543a0945b5ed9bd5eb5237b0.jpeg', '81f0f26b6ae25ab7570ee118489713f931c54854.jpeg', '81f0f26b6ae25ab7570ee118489713f931c54854.jpeg', '5127186d99b08641327fc2ae102d8ee09e4c7be6.jpeg', 'a2e2c3652f991af8e7f75c5f43e6bd63c2768697.jpeg', '0dfffb663b6d16ed87efb4225c6266d23d00ce34.jpeg', 'e5f1c85669f55bef3bccb957d478e62435b9b172.jpeg', 'd48cd7047524e0295d04af78fdc0ec44e8d880c8.jpeg', '0a34ecbdae29eb628b0fcbbd0b63a2df3ff1bc3d.jpeg', 'b8262498f66357aa6cd9362af5a5633ea863fd43.jpeg', '8c144b2c8b12f46082d014bfbfee46c4aa274c70.jpeg', '252d8e1f9cc9420df9662b2d79f3e137e32ede74.jpeg', '36f09351faf448fbc8c39f5a581ba65f1934826a.jpeg', '008bf90ea4cfcc31ea9eca0741d23363069442a6.jpeg', 'a00242482e3fd1d71c1cf42c8dcb04e1eb922d12.png', '54cec2c80058c8a0c4585dc02e6f5b681d22d6e2.jpeg', '2fac3384f4be0f4e6df1c512cf4b0559b071c2e2.jpeg', 'aa218085def41834967a9fd1afe2513009d15542.jpeg', '21dce25fac6355e13c3fd95789f7ba9f05203d67.jpeg', '42062e5f144d628cb02ee7681fd9b09e13a7b406.jpeg', '08ba1f5c1148c6d51e5037b3e2d5e77a24f74a03.jpeg', '21dce25fac6355e13c3fd95789f7ba9f05203d67.jpeg', '3ed1b354e26b1939b5f41d3ed7ae4eece6b0e209.jpeg', '3ed1b354e26b1939b5f41d3ed7ae4eece6b0e209.jpeg', '54cec2c80058c8a0c4585dc02e6f5b681d22d6e2.jpeg', 'fe2b77e8bc6a8254900819d7716b208667089f30.jpeg', '3ed1b354e26b1939b5f41d3ed7ae4eece6b0e209.jpeg', '2fac3384f4be0f4e6df1c512cf4b0559b071c2e2.jpeg', '008bf90ea4cfcc31ea9eca0741d23363069442a6.jpeg', 'fe2b77e8bc6a8254900819d7716b208667089f30.jpeg', '08ba1f5c1148c6d51e5037b3e2d5e77a24f74a03.jpeg', '60519967c969968f33f52463c50632024f9f1426.jpeg', '9c7144a0b6867164dd86cff5018c4b84767d085c.png', '607939df59b4ee9b643fddc7afd8760171878ef1.jpeg', '80f2b5b62b0d71f05545346820140c7f2d566e6b.jpeg', '62b863e2a58f3c786b5cc13e2628485adb546bcb.jpeg', '5d60ba8d75e939729f6efa8be49b933314d745a2.jpeg', 'b1e0f106e93d2874d6e603a7f05cc5df08209ba6.jpeg', '80f2b5b62b0d71f05545346820140c7f2d566e6b.jpeg', '9e51b82efb5179b28d1d867922fdc028ba1d0f8e.jpeg', 'be16a715f63f5277c2b7e765bae5ed75d0848d91.jpeg', 'ba5591456902fa88ce464d43695513ee63cf7a0b.jpeg', '8e3384fe4450d35ed813dbd114b8c51e500a63ab.jpg', '8e635915e2dc9b2ab27633a3f650d157a909323b.jpg', '8f6ee451b49a90007517e74167fc445309b27fc6.jpg', '8f6ee451b49a90007517e74167fc445309b27fc6.jpg', '9bfeccd5d2d580e781634ed5fb99b1f631e2df95.jpg', '8f6ee451b49a90007517e74167fc445309b27fc6.jpg', '8f6ee451b49a90007517e74167fc445309b27fc6.jpg', 'e61de7ca924a5246663c07dc35a6a9c9438ac404.jpg', 'e61de7ca924a5246663c07dc35a6a9c9438ac404.jpg', 'e61de7ca924a5246663c07dc35a6a9c9438ac404.jpg', 'f1dfa90443f6e15f404754505c686bf45d394a84.jpeg', 'ec4dd3567d396c1897092f0f48cff8de307335d6.jpeg', '86ce24c3a2211e5d3271aae4c72abbeababe2937.jpeg', '304ff9df68e7b48576dff0a6d28f16819e7e089e.jpeg', '63d8ea29e6b49af18aef4f8a17abdb53ea6eb77f.jpeg', '125dea1d926e0881ecedc4764ace053b18bf2182.png', 'ca90874d282bb9de3cbee5b984adf413f6f898af.jpeg', '5c7f885d8d13c4cc4a7557c2ac6da1fe5e1b99d3.jpg', 'aa314893d629fb1a06305ff0a9fc4fe74f8c2a72.jpg', 'cee1a1f84827a1ac2913ec61b8c4ec3ccf08b0ab.png', 'cee1a1f84827a1ac2913ec61b8c4ec3ccf08b0ab.png', 'be57035a70027c7b98e39ff347b4e02ee5ad11c0.jpeg', 'cf87cb812ab6b2fed28f83f5e2f417ab3aece9b6.jpeg', '5792734368e39eb2dc9ecd702eb31d50014717c2.jpeg', '64bba674935b833a115723fa38ea2f02207ccd9e.jpeg', 'ca90874d282bb9de3cbee5b984adf413f6f898af.jpeg', '7450b636f9b7b7a298c3d3de61342f60c44a9cdc.jpeg', '44fec54311a985f0c40bb86991ff1bc3a2a2d4a9.jpeg', '880bdc8a0ccd545bfeeb0ee9fcee4b90bbf4bbdd.jpg', '880bdc8a0ccd545bfeeb0ee9fcee4b90bbf4bbdd.jpg', '7a22f8aafa919678f4a63881fcd00662577f6b3a.jpg', '880bdc8a0ccd545bfeeb0ee9fcee4b90bbf4bbdd.jpg', '880bdc8a0ccd545bfeeb0ee9fcee4b90bbf4bbdd.jpg', 'b7c3b71e5b6c2affbc5fce09d1993b0a5502384b.jpeg', 'b7c3b71e5b6c2affbc5fce09d1993b0a5502384b.jpeg', '4eebf527e5166b2cff838f57a82575b86b3005b9.jpeg', '90316530197b51cec92f0c2c9e800feb35c22925.jpg', '90316530197b51cec92f0c2c9e800feb35c22925.jpg', '709df36aedabfcaa1991fc05c1eece2486e5c072.jpg', '81d514d7c293b4e5f40a23b5cb3ba5844b794d1e.jpg', '5d2f1ad4fa0907a6084bfe14366a6b74d6d95ca6.jpg', 'e537f39562b1a528f8b1dda09e9f78a85236dc85.jpeg', 'bed92e6516d0094385f1b2ef75d71d5c5866be89.png', 'bed92e6516d0094385f1b2ef75d71d5c5866be89.png', '9e7585e2abf6ac0664c53e28245cf4b2bde984f7.jpeg', '8bc9b8a506340e9ee1fbe0453365773bb350f2fc.jpeg', '446b9e85ec36d976856bb369c24e92080d7e5966.jpeg', 'c1e349f6efa4307af6f10f2801b15e9a96052462.jpeg', '5210a39fde81f5befb8544cdd833289153e8e7d8.jpeg', 'b7382ddce09b04552db1e970d3150e70f99f2628.jpeg', '2b6a2506507e34354a1790290ffa1bca72c6fe99.jpeg', '294ed060c36a9d46592b26a3be080de8ce9fdef4.jpeg', '502cc1a592eddf4f5c5c76d26804f9278c0df082.jpeg', '7848dfe03d703982934395b4db01e2da3ff94c25.jpeg', '5210a39fde81f5befb8544cdd833289153e8e7d8.jpeg', 'c1e349f6efa4307af6f10f2801b15e9a96052462.jpeg', '294ed060c36a9d46592b26a3be080de8ce9fdef4.jpeg', '446b9e85ec36d976856bb369c24e92080d7e5966.jpeg', '9e7585e2abf6ac0664c53e28245cf4b2bde984f7.jpeg', '5210a39fde81f5befb8544cdd833289153e8e7d8.jpeg', 'be16a715f63f5277c2b7e765bae5ed75d0848d91.jpeg', 'b135dea6b7eec978d7c27ec962225c28d437ad71.jpg', 'ff514c1fbc83d84bc86d9905e38c5426ff340961.jpg', '5e75ddc7475d311f8dc3ca253eebbf3e670d5fad.png', '5e75ddc7475d311f8dc3ca253eebbf3e670d5fad.png', '341df316c7068d6de94189ff51f744ca22a4f7b0.jpeg', 'e2bcc193eb58fa30fda2d2969d3c860dbd937d3b.jpeg', '9c7144a0b6867164dd86cff5018c4b84767d085c.png', '5792734368e39eb2dc9ecd702eb31d50014717c2.jpeg', '85a7c4c24a11bc24b67ff5c947a9cc210f546967.jpeg', '85a7c4c24a11bc24b67ff5c947a9cc210f546967.jpeg', 'e7c4dd71ac35fb5086ee65fc0e856caeb446eee5.jpeg', '0617f99d10666706fde5a042660db3e58153a0c3.jpeg', 'bdf844b6a5e23549a6bdde2c93f579b4b4dbbb15.jpeg', 'bdf844b6a5e23549a6bdde2c93f579b4b4dbbb15.jpeg', 'bdf844b6a5e23549a6bdde2c93f579b4b4dbbb15.jpeg', '44f8264b2bdf838f353b5917ae7dc68396f93d91.jpeg', '519b0d8ee30c5243fe31dc782e569e79d9c03baa.jpeg', '4bf4ef4fff8dd08d8b101b0da5243e008030a27d.png', '066734acab3beb5cb2951f2fafd3e2a93d1e8397.png', '8fc884b2e2763345c42121e0478326bb3ba5a720.png', '31bd0756d1172ec36f1d6e0a34f44e461d5498bf.jpg', '4b262f9100aa54ca2a0978f44826500cbea3a8f4.jpg', '814fb616b4b189ba9d30f3567894631155bc4435.jpg', '9ba1f46c4e2b36fb3fe5bedeccb5c4707298767b.jpg', '2359e2ccfe433fb4192f5ca9d5cbb698b0e7bc59.jpg', 'd87529420f2064a9837cd875036792a451fbe25d.jpg', '41acd4550b63bb8966bf82bb53a2a6e26f13b4d2.png', 'f4d0d87513df340bf5027446db08b5ee982c190e.png', '75ffcb49f67563714950abe6f47a95110f631f2c.png', '9ccfedbf032c3a76ddc555f887121741d33d6df9.jpeg', '8fbf1fca21d97b8c2497e51eaa43c1ed0cc98487.jpeg', '8072d03e73e48b536297eb57e1324ca73551791a.jpeg', 'b10f1e1c6ec3cdd7ad725d205a5c45ac1eb68e98.jpeg', '7c5dbd9acabed0fb608357e9b23fd89803017d6a.jpeg', '061998b0b972612c359b4842b095640f56c192f8.png', '04124f3fed5929c0eaaced39096340201ce5c164.png', 'c0d45c43bbe5f6e4b8d74ec7451155f0eaa99e4f.png', '263afc2fc0c91ca4e7d2c2007dd31f6076be07cd.png', 'db537a3ad46f5af52830da6c95c19844bbbcdce9.jpeg', '5ced0a6cd0415ea0d6bf5e04a8e807b15fe0699a.png', '9b4fe887959a476fb5d202064f5f440d6168458e.png', '7fd3353b442f1b450e4ab9a697359bb172df2873.png', '6de0c104dd42a6b9582c729fd2a71ac7532c5174.jpg', '3837c27629f754194940662a4f4c74da597b5a54.png', '66c8ed40db6993baa4538bd4b7f4318ef6d6c4f1.png', '5e9dd8f6ca816330c350f86ec50234adef732d57.png', '3837c27629f754194940662a4f4c74da597b5a54.png', '3837c27629f754194940662a4f4c74da597b5a54.png', '3837c27629f754194940662a4f4c74da597b5a54.png', '37bcbce7ec010f2c180e54096aa1d9244780d6ae.png', '37bcbce7ec010f2c180e54096aa1d9244780d6ae.png', 'c7b742e78583b4ed363c9dc87a1a2fa1b4a9525f.jpg', 'c7b742e78583b4ed363c9dc87a1a2fa1b4a9525f.jpg', '1c3a3540bab59b4921d895250f368db34c999ce1.png', 'ebb6fc09b7517ef2c033770a9674865c3c8303c2.jpg', '5897af848ab769e05f141494a983d30748012456.jpg', '7048624af243b7fe2b4a87da7dc51d3a41e7f04a.jpg', '4d879684e60a9c5c9d6d54b96c1c8bad54ca98ff.jpg', '911b436f9226733c22b526646426bf0b2930ba72.jpg', '5e32c9f70a4d2cc6682bec6a8a097af8f9ba63fc.jpg', 'aec95a43a31c74d7f208e5cb642edab17423c53d.jpg', '7c157a87426e3b8deb6ce7c5ae9cc66d00517f88.jpg', 'c5ccdfed263216ce921dd5b35099261fc5b10df0.jpeg', 'c5ccdfed263216ce921dd5b35099261fc5b10df0.jpeg', '66c8ed40db6993baa4538bd4b7f4318ef6d6c4f1.png', '263afc2fc0c91ca4e7d2c2007dd31f6076be07cd.png', '11737acb73855c6a5eccaeecf854b804b1b66251.jpeg', '7e9a020ca226021124468d9c03986490ee60a3be.jpeg', 'bf9f134020f8cd6338600bc7b562541f90a555e5.jpeg', '02adb401a5f5c74709c29892e0968a04483a6d75.jpeg', '238800f67493bc65d091e41362cc568904a9d952.jpeg', 'e1a72b5ee281daabfe3feb1c901ff8dc50405fbf.jpeg', 'd909f28111b75e0fd806354ceed52fc0a5ed082b.jpeg', '1bea53afcaa4883eb030458b2a1f0985702b6f0f.jpeg', '65ae143191eb350201b41b50276cbd2287a696ab.jpeg', 'ff8a6a08f0ef9fcc5c43e106f587c58922e1a4fa.jpeg', 'ad2d3bf60c4862cde4be2fc5b64d235d4deea385.jpeg', '65ae143191eb350201b41b50276cbd2287a696ab.jpeg', 'd4b6bc4a7174f4c525956451c61e68315c011fd2.png', 'cd44ae24524932bb2fe9ba934598c4f96c4384ca.jpeg', '5195522d17536bf148f12b23e023f9c32db2c37d.jpeg', 'afe45a507193d4b997d2b60957a51ae1bbfc6776.jpeg', '8fc884b2e2763345c42121e0478326bb3ba5a720.png', '4505e52104970463107283722e6de1ba30144d55.png', 'ea8bb5ee02d2c24daabcb9fcdb40ccc6d639e471.jpg', 'ee948440cceae9ae97b0c012927be656416cfaff.jpg', 'fe724f9ac76df7bd4c9f40d9e90e6d2bd298d51e.jpg', 'c0c7562f2685215542c186a613dde7c09257c29b.jpeg', '3a1bcb8e975f5176da4c53c317c0056c1633f30d.jpeg', 'b6dbf8073fba597daa5fd8cefa44f0bfe702500d.jpeg', '6cf82d5e4e8330854748354e89feacb92ee0ab35.jpeg', '3a1bcb8e975f5176da4c53c317c0056c1633f30d.jpeg', 'c7b742e78583b4ed363c9dc87a1a2fa1b4a9525f.jpg', '57d930779603b111a37c7ecf974cba2aef19e3f8.jpg', 'e9ac5b6b37b2d2569b34b293ec45175afb120373.png', '3e4f6e502dcc80b46c593626c82606d5360d6aef.png', 'e3b52fde01cc5f0d37e11d27d0351a801aefbf36.jpeg', 'c0d45c43bbe5f6e4b8d74ec7451155f0eaa99e4f.png', '3e2dd13ed098498c42ce91c1da92bde1e01c2d7a.png', 'd8bfad51e4f2f1a2c267d913081a2b4368c5e1a6.png', 'fffb8d582c96b247f64cfdd71a0c8b21a84b7e29.png', 'db537a3ad46f5af52830da6c95c19844bbbcdce9.jpeg', '2cd0cefc00c7ee55bcad1f9a84ad262e5c4334a3.png', '9f332596282a8c54db4476d4e807926e445c0e60.jpeg', '81466fbb6174bdc6bcf32546551bc244404faedf.jpeg', 'dd046b381dcfa3b031f8ae7be06b9b87ea14812d.jpeg', '2b1ba62eaddd02ae1720af5cbe33753a3f83b0b2.jpeg', 'cefa20d04f85fb704a9cb6d28ca0f4200b5b68b0.png', '37bcbce7ec010f2c180e54096aa1d9244780d6ae.png', '7df9ba211a5df9857a4ef0c2f8da17686292b5e1.jpeg', 'aacbfdd31c5115f4e501db0f1a072ca62e9baed5.png', '2bb0529e79a530ec13f3f8aec974187441b70abe.jpeg', '6dbb6829344e4af6d958f2ef281596535bf44bc0.jpeg', '085bf462214d38eb3e3f45558cb4ac5ed13484be.jpeg', '7e02ecd9128efbd7e3d1da3484d8415db218c33f.jpeg', '14ad9e4552ee2c24d9e374e1941255e14ca226e4.jpg', '0372ca036faf7c538ecf04a2e9e2ce8b9c5c5207.jpg', '1bec128017839a80fc7662154b1fa9eedd97571c.jpg', '4df404d1a97b03240e14d4cd437d998f318062d9.jpg', '8dbc57c677c622dcb1201dbd8a87b9c4376d5c5f.jpg', '58808ec289753ca8063bf81651dc5ed87742eeaa.jpg', '0911931ae7082899704769d7108baf06bfc69067.jpg', '53946b4b3c203ce7c065b7affcaa0be5951e89cf.jpg', '80fb96e7483d338156d554ae9806b289ab6ba893.jpg', '69c0bdff3d0ddfee4f362201ca672d429a30f848.png', '3294af04bcd926e8b4e429c23140f9e94a28d5bc.jpg', '67370fedd38caed858ed5780d20b4c19cb79eb79.jpg', 'b7583a039a2d9486e39d2b699c8142e4c3b12b93.gif', 'f8ed9dd3698b3c13560b179f45391d8678f2bba1.jpg', '7b146ce5c2ca72b4b9a8088c7b9626f13446ca36.jpg', '6e25bcfd44060682b7c29fd83b9e15d06d1e0f9a.png', '407fc00ba22c46891622aebf7ad145a1a2c69132.jpg', '14ad9e4552ee2c24d9e374e1941255e14ca226e4.jpg', '14ad9e4552ee2c24d9e374e1941255e14ca226e4.jpg', '14ad9e4552ee2c24d9e374e1941255e14ca226e4.jpg', '55be65f67b4d9921bf11d5e289064e6c50d875b1.png', 'b881e78312c0f383fc963d948682c222f028e095.jpg', '0dcd0f18ee4dcb9483744afb3a85fed2bd5b2eb6.png', '9ec6b2b4d3ee8e1b00c1f8eebb459440d6aa7250.png', '075b692b1d08c77990161e4c317bb7a689fb150e.png', '0dcd0f18ee4dcb9483744afb3a85fed2bd5b2eb6.png', '9a7fc03d89204aaa2f9527cc4c3f73bd653b197c.jpg', '9c3bae4c7079e41d9458dcb2d9dd41f6040e59d0.jpg', 'f8e9e0d2116deaaf5d05575c9816802f0f96499d.png', '346107a402927f9ec8ebd5bfeb1010e57079054b.jpg', '6d9685f855e76c97f728f8eff522e87f3226f757.png', 'abeb8c00fb34ee530f2f678ca4de863f075f4a7f.png', 'e4818a568a4f93abac3751a2d6805e40744d74e0.png', '3219e48fc27bd00f57861025c01a8bf335c97673.png', '189c5aeb79a196403f9106fec7e7ca3c6b2aae9f.jpg', '189c5aeb79a196403f9106fec7e7ca3c6b2aae9f.jpg', 'a49fda82cafc4d1731841bc60f04b1fa657cc019.png', 'a49fda82cafc4d1731841bc60f04b1fa657cc019.png', '2cf74558b8d1e91500b559955bbbdbed34a5da4e.jpg', '2cf74558b8d1e91500b559955bbbdbed34a5da4e.jpg', '27cf9ab3788f9d81efc9232879cfcf4566e2cb44.jpg', '49aae70941a6dfac046803769e71d9f3ff64eda1.jpg', '4e0ac698711befef4bb0cc3bd1b249c53b404e6e.jpg', '9ab230cf167314e965e42ad04ef5f0731c662cfb.jpg', '9ab230cf167314e965e42ad04ef5f0731c662cfb.jpg', '9ab230cf167314e965e42ad04ef5f0731c662cfb.jpg', '70e6db701d6a92b0ec4c8240d7f1a08d19f35862.jpg', '1bd5467f94ad7327976dabb9ab2ceed30e4dbcdb.jpg', 'f70fa4cdbeb7514fc00b188458f5ca14249f7242.jpg', '287bc4a4cfa835259d1af841e31edc320dcc6791.jpg', 'b599c5c0230ca1fd222acd317e9c8343bdcb6a77.jpg', '183480548173ef235dc3395890ac1e4df09f0827.jpg', '21f3f899185543773f965cef2cf60f25bd669ec2.jpg', 'e58e14cd123edff87431afd1f2442be566a76de1.jpg', 'a4e4aa454ece1f52442ed8ab8dd47155dac6d3b9.jpg', '5bee6ce2c6c0015cec372aa55c7bf26adf94ba16.jpg', 'd42ab37ccce6d2385b896bb00856823a2ff42f37.jpg', 'c37219f9a09da7ed2d1569e313c7834baa8dd10a.png', 'edd4ff59ba9a960e5deb3c70570bf36d1c7e3da6.png', '44fb96b888ce9c73545d4ae305bc6b414f70bca3.png', '4a076eccb8df0a5c597ab172486417257a3e4cf0.jpg', 'ab0f33f61f5e32e04cc1098a02d2a750f69e8988.jpg', 'f9d4657fad7b0a28e299aacbcc997ae8f8649842.png', 'f9d4657fad7b0a28e299aacbcc997ae8f8649842.png', '8fddf516b59bc730f4b6cef399f91e6164b3b6cc.png', '9c22a879d66b1ba505c861d70fd25053cca81590.png', '3525006990c69a161ec5725e26c3933159c9a37a.jpg', '23071f0eede516c5339aaee63096edfd95467073.png', '3c4ad7926018cd7fbf4022c9bc7a19caa39fef32.png', '5c62832da261d11bc2451f7e8a660a24e646a49d.png', '61adbd4e54767c77694d90b08dd1fd0bafbf4c76.jpg', '9eeaab710b84776628635560d21446811820b4e3.png', 'b9b22a747ee865486c6b9c49b36b607649896eec.png', 'e72097435d1b12e8dd5ad352f72f7b398808df08.png', 'dae64efce9238a04c1f5d91361a3b214fde4be74.jpg', 'ebf0bf885e3ce70222ed123dc1b98c1284f97f07.jpg', 'f324f7b94f611c2199decd058ce90b9c13aebcdd.png', 'f7b60a7dee0431f8b649f3b4760cd88c5b494174.jpg', '49aae70941a6dfac046803769e71d9f3ff64eda1.jpg', '2cf74558b8d1e91500b559955bbbdbed34a5da4e.jpg', '189c5aeb79a196403f9106fec7e7ca3c6b2aae9f.jpg', '66f6378127efdc0e16f52115d54207389d88d971.jpg', '6350aa7269c7f85ae9f3adebbb5b31ce539e1d2d.jpeg', '189c5aeb79a196403f9106fec7e7ca3c6b2aae9f.jpg', 'a49fda82cafc4d1731841bc60f04b1fa657cc019.png', 'a49fda82cafc4d1731841bc60f04b1fa657cc019.png', '8a63f655540e3033bb5c0f54750abcbf9701e615.jpg', '8a63f655540e3033bb5c0f54750abcbf9701e615.jpg', '518ad11d6cef50f9a08af652d29c0bb621dbc776.jpg', 'b89d982fcc6317ff97b8ea674bd400d981d5b65d.jpg', 'b89d982fcc6317ff97b8ea674bd400d981d5b65d.jpg', 'b89d982fcc6317ff97b8ea674bd400d981d5b65d.jpg', '3525006990c69a161ec5725e26c3933159c9a37a.jpg', '3525006990c69a161ec5725e26c3933159c9a37a.jpg', '3525006990c69a161ec5725e26c3933159c9a37a.jpg', '679d30793e85e97d848c735e4bf792e3ddf95c6e.jpeg', 'e8f97161081cdea856c62f532b4e3968cbee4627.jpeg', 'd876c74e0a8e166c29c238bb96b4f171af751374.jpeg', '6706398f112fe5b52e402dc39238a168cf64d562.jpeg', '96a0817ada2c92f231c3b1f0d57577b4e971516b.jpeg', '0f5083e86459d1f196f15125f1c97f93ab5ae8a5.jpeg', 'a232eda34e8388f5ef9438f82df91e9ffe8961a3.jpg', '38fd71578a55652e09efd7bdbe03469b6c8535fb.jpg', '9ab230cf167314e965e42ad04ef5f0731c662cfb.jpg', '1bd5467f94ad7327976dabb9ab2ceed30e4dbcdb.jpg', '1bd5467f94ad7327976dabb9ab2ceed30e4dbcdb.jpg', '1bd5467f94ad7327976dabb9ab2ceed30e4dbcdb.jpg', 'd4786e41cda1b7657f4f62dcfbc643fc97da5d61.jpeg', 'd3de914673b2bf1f1069d72b1636d58be3443a57.jpeg', 'be467db1d515fcac5c68917f98ace5222a0f58c3.jpeg', 'a30f41a8f9a1e72f547d931b3ba74c643e7065dd.jpeg', 'a533f5ef8b82df6e327ce6f9cf3ead5592ae8361.jpeg', 'd7bc3b2ad6d3c9851ad592a326e4c18eb713868c.jpeg', '359d1e11418829a8ae53e7e10a19ea17b7e5809d.jpeg', '44fb96b888ce9c73545d4ae305bc6b414f70bca3.png', '0a34bf748c942b053eb997530e5b9ef1578f96fa.jpg', '0a34bf748c942b053eb997530e5b9ef1578f96fa.jpg', 'e5532c209dad1fe5fb1bec299f8da8482dd08758.jpeg', 'e72ba6117c1da2bd85a9b7876a3f73fd8352aecb.jpeg', '5029832aa86baa93f6705e5db85bf45bd866973f.jpeg', '1b816b9e69eac986fd23974efeb2c76f5281f4f3.jpeg', '5029832aa86baa93f6705e5db85bf45bd866973f.jpeg', '1b816b9e69eac986fd23974efeb2c76f5281f4f3.jpeg', '346107a402927f9ec8ebd5bfeb1010e57079054b.jpg', '9d0f54ded90b5371672eae0d641c5a377c486169.png', 'e4818a568a4f93abac3751a2d6805e40744d74e0.png', '6d9685f855e76c97f728f8eff522e87f3226f757.png', 'ddbf8e780a4c0a3b7dc2775f3a536a6e92809083.jpg', '020eb005dc75a1fb582e61f697cdd18dac3a7b88.jpg', 'b89b4eb2ff00bbce0e0cd61754d886b1f0539ada.jpg', '020eb005dc75a1fb582e61f697cdd18dac3a7b88.jpg', '2854d50821d7d13c10e6761fdb26c003b546d8cc.png', '59c600622ff27400fc57da5d62986f4358a09998.png', '24558930221e5cd26dbfa32f47adefa87cb983a5.png', 'eabb7218c5731f466b791eb73c158bdd6c16d6e4.png', 'eabb7218c5731f466b791eb73c158bdd6c16d6e4.png', 'eabb7218c5731f466b791eb73c158bdd6c16d6e4.png', 'eabb7218c5731f466b791eb73c158bdd6c16d6e4.png', 'effd8fab1b9bffc5c71404f9e53c13a95e0f23de.jpg', 'bb8e03bbf78e4fa8ebcdd2a8852ef0ebbc3c7730.jpg', 'f9d4657fad7b0a28e299aacbcc997ae8f8649842.png', 'f9d4657fad7b0a28e299aacbcc997ae8f8649842.png', 'e3c170d5a0ee2a21f2d59b1910e27466651f8d28.png', 'b73be86c9560253ed2d848a1a8bbb3e6da83e7db.jpg', '1e87ad1d15c4318beb03915fe566f7c084815c02.png', 'e067d8db4823ccebc594888dc66d947ff1b2c7ad.jpeg', '21039e6b9fbbcaa6c56a2dae76b28386db849217.jpeg', '259f994cbba973a05b20b212cb6a87329540ca19.jpeg', 'a34ae33bc01a4405722b061a781c011d34066005.jpeg', '5c503a7b95021285c15427a2de9b9fec6adfbea6.jpeg', '579121957ec40b85451cdc371dc4c0b7d29175e2.jpeg', '09091d80632527b94e00246eb588b429ae543d1c.jpeg', 'a88d97cdf72cac7b336ced9e29a7ce306e511ee3.jpeg', 'e3f7fbfb42d3520dace2d2fe19c384cae161c8c1.jpeg', '9bb66e00d0677aabb234aeb0437495dfdeb898d9.jpg', '18b5bf1c69a9201c8ed1e94c07601b7a178c3984.jpeg', '18b5bf1c69a9201c8ed1e94c07601b7a178c3984.jpeg', '97c51b2c5e6faa85a3fff935369dd26982328f5b.jpeg', '3f9604e6d84cccf3d4e88850d28242aa61f378a6.jpeg', '803400c3a8373f6c32d0ec37e2374a862f2327c6.jpeg', '6579c5ee1b2c45835dae37f73286135c19b41ea8.jpeg', '414192712d7c9318a3822a5331ce45b378bd88f6.png', 'c89e9eb2d2dbe25f41057b482e5f810a43ad197e.png', 'b97328aea22d805fe207d6ddf9cb17d1e48908e8.jpg', 'eb6ac5705390a1166190679c5389571e3cf5baf4.png', 'c61cb21f733480501e78135b3483adee3f9ec766.jpeg', '98c88b41475489579db953579a86e3b515cab83f.jpeg', '94d127fcc793800d3661ecdb28e6ab236c35bfdd.jpg', '1ab154b19c0e3bd4ed4dcee38696b380697d2196.gif', 'a332d3958021825fe13c8055591dda1ac1ee128e.jpeg', 'de7116bdd04786ac013f3aaa267a5144e71e1337.jpeg', '1a35c87215f2cb97e8edf97c77c8f307ab924e91.png', '6c72292150f1d9f1abc353f2f513172158e520f1.jpeg', '365c9b8321a2596a2553bf933053dcb3895d4cb3.jpg', 'c236fa6ffa976a656d8de82c59527dd484eef085.jpg', '01e3ed5b1a0e050db5f598451d57169737418670.jpeg', '9704b293aab4da9c9860485e4eb73ae7cdba061b.jpeg', 'ab714aa0a6cedd1e05d884179b718544281ab7df.jpeg', 'e3ac2c78c16aeb25d38050d8bae677275f0c6e5c.jpeg', '9bb66e00d0677aabb234aeb0437495dfdeb898d9.jpg', '869f9dfbc3935af9c4392690c112674f8e59f308.jpg', '1d230ccc4f8538434cce87210c39df2a59800386.jpg', '29b71fb7cc5d11420cc5cd8aeee933f951fc6f17.jpg', 'fd7c76b945134dca21d784e16fbef2a0aabb9e1f.png', '8bda84801798c9786169b66a07a2c7abd09f9755.png', '8bda84801798c9786169b66a07a2c7abd09f9755.png', 'fb2a7121ee39cee90eff094c19d51aab71cbb16a.jpg', '36fea3c09b123717744fc114e6bbaf634cd23f7c.jpg', '91a8893375be376aacf56a267dd86bf3b76b28ac.jpg', 'b0ac9f9c7a633c855192f16060a53067ef935f94.jpg', '5a3c834fe5d8878a168e0cf1e3d4c1f7c2595fc8.png', '8e9448693c92bf934f18b674ff0bee7f8463600e.png', '8a92bd03c2981b2783477da77b160821be248176.jpg', 'c6cc378b62802f3860ad62c452bf25c9c9465577.jpg', 'abc167bac132b8013293011f0f0ed8eca85a4e8a.jpg', 'b3b8b5983afa46f92c26b6627bbc1aff936cbf35.jpg', 'dcb4be01c18ec250ebb1d4726fbd93bdab12853f.jpg', 'eecae4e01c36e06abadf118068822fe283b19d7c.jpg', '693343f54738e1adece3fd3a3b82eceae0ff86da.png', '46e62a994e760e1763a675b65087e358338f25e7.png', 'f9e25e493af414da3cf39945f541e13707dbbb4e.jpg', '6f9cbd1e601683032cbf947f94b8818dbc4771de.jpg', 'bc41cb33bc1702d4bc5105872179db40816aca6f.jpg', 'dbcf7e71e1db42ab6654673ddb007762afb018be.jpg', '959d9792298c792b81ddeabd11d30d70dc14d8e5.png', '959d9792298c792b81ddeabd11d30d70dc14d8e5.png', 'b0fca3ab1ffa543263569b83240652ff2a7c8372.png', '077b477af14a8d4b2efb86d4f4684e5171123c81.jpeg', '65ed61047ffdbfd684f554927e17345ed7f2fabb.jpeg', '122cdfb1fd0fe4216afe389c16af225332a095ac.jpeg', 'c2ee41c9d0b94c9d33cfb8d47bcbf47f41e2806a.jpeg', '9a06b2df9bb131a8fe11d8d7ea4cd8673986c66d.jpeg', '42b80f5a51ee3ff656204c7936f1fc8f669f190b.jpeg', '629dae1c011ce0e0f161545bdf3ffb7969c2036a.jpeg', 'fd7c76b945134dca21d784e16fbef2a0aabb9e1f.png', 'fd7c76b945134dca21d784e16fbef2a0aabb9e1f.png', '8bda84801798c9786169b66a07a2c7abd09f9755.png', '8bda84801798c9786169b66a07a2c7abd09f9755.png', 'c765ebc972ba7a24a5a4186247d9563228a4c4e6.jpg', 'c765ebc972ba7a24a5a4186247d9563228a4c4e6.jpg', 'c765ebc972ba7a24a5a4186247d9563228a4c4e6.jpg', '3333dcf8106ba13c993477bfb55a6e5cbf215acb.jpg', 'cdf5cd5ca9304292c1398257e64b3676eea340d3.jpeg', 'cdf5cd5ca9304292c1398257e64b3676eea340d3.jpeg', 'cdf5cd5ca9304292c1398257e64b3676eea340d3.jpeg', '3a220fe3560e406ea72f8f0ac5d2ec85e21147b1.jpeg', '3a220fe3560e406ea72f8f0ac5d2ec85e21147b1.jpeg', '2049e07e2b786af4e89e7f8ec134d288f4bbeec3.jpeg', '2049e07e2b786af4e89e7f8ec134d288f4bbeec3.jpeg', '3a220fe3560e406ea72f8f0ac5d2ec85e21147b1.jpeg', 'd731121ec15f108e395c937e2835a045fa8869b0.jpeg', '615482dfb606b4b4ca41c55b7e14fb67c36e2332.jpeg', '8542778fdf6dc6b90d40d7e65814d55da626c594.jpeg', '8542778fdf6dc6b90d40d7e65814d55da626c594.jpeg', 'd731121ec15f108e395c937e2835a045fa8869b0.jpeg', 'd731121ec15f108e395c937e2835a045fa8869b0.jpeg', '5a3c834fe5d8878a168e0cf1e3d4c1f7c2595fc8.png', '5a3c834fe5d8878a168e0cf1e3d4c1f7c2595fc8.png', '5a3c834fe5d8878a168e0cf1e3d4c1f7c2595fc8.png', '8a6bb441d43a75ec31aaa84efc28940fc6b4a277.jpeg', '65ed61047ffdbfd684f554927e17345ed7f2fabb.jpeg', '8e9448693c92bf934f18b674ff0bee7f8463600e.png', '7ebc2d9af87b9a91c4ca3964112945972faf0052.jpeg', 'a95fcf1997e04f9e9ad090cc56fbac8d19e695ae.jpeg', '40b99438c442a6dc7c280fea4932ab1d60a7a251.jpeg', '40b99438c442a6dc7c280fea4932ab1d60a7a251.jpeg', '7ebc2d9af87b9a91c4ca3964112945972faf0052.jpeg', '029a9a42f78353b00a64bef40486bdcbfe157371.jpeg', 'a95fcf1997e04f9e9ad090cc56fbac8d19e695ae.jpeg', '924dcb4ea8867e05931939fd8dddbdeed6c6414d.jpeg', 'a019a6d638e9290a6dc9bc4690f3dcd5d3ee8b87.jpeg', 'c7c13628c80b140ad69c6d19402f5d1045380cca.jpeg', '9183a8d6ae2a7e9aa881b17c10c22412ce18f385.jpeg', 'a9f993998e6dc4e94bf38e69b5f7b382fe7c9ca3.jpeg', '924dcb4ea8867e05931939fd8dddbdeed6c6414d.jpeg', 'f548ac95ff527a62221191f4ef2586ae7a0af866.jpeg', '6f584c2ed2eb7d71593f985970f4c3e117073d20.jpeg', '959d9792298c792b81ddeabd11d30d70dc14d8e5.png', '959d9792298c792b81ddeabd11d30d70dc14d8e5.png', '199e104a0ff36fc715b00d373db47b15500d2e9d.jpg', '199e104a0ff36fc715b00d373db47b15500d2e9d.jpg', '693343f54738e1adece3fd3a3b82eceae0ff86da.png', '693343f54738e1adece3fd3a3b82eceae0ff86da.png', 'd2bccaefca908c5b893e184d43fb72be632f34f2.jpeg', 'd2bccaefca908c5b893e184d43fb72be632f34f2.jpeg', 'bc1937c1d7feb713912b161f48af8d4217b14e70.jpeg', 'bc1937c1d7feb713912b161f48af8d4217b14e70.jpeg', 'bc1937c1d7feb713912b161f48af8d4217b14e70.jpeg', 'c73b7e5bfbb8cbb159f26a38e2a59c0fe59b1784.jpeg', 'e2cff6ac4ca4c207e7c80c9f012dae7f453231ce.jpeg', '46e62a994e760e1763a675b65087e358338f25e7.png', '9306ea5cfd17ea84183e0580a6c00aa596f82c8e.jpeg', 'c6edf002981d5bc977818c207f5795eb7e4c94ca.jpeg', '37bd5e2bb2609bff7fee78fccb75bb4af42537da.jpeg', 'dfcc0e71aa67f2280bdbd7c3062e7e38aa808ae0.jpeg', '9dfbac6d77d6ace4ca2dafd840c0604473cac12c.jpeg', 'd69bfda0af549e983287801c292cddf2c0613ec1.jpg', '8df5010b2da53ef3696fcbb499c0522877871d30.jpg', '8df5010b2da53ef3696fcbb499c0522877871d30.jpg', '8df5010b2da53ef3696fcbb499c0522877871d30.jpg', 'eecae4e01c36e06abadf118068822fe283b19d7c.jpg', '8a92bd03c2981b2783477da77b160821be248176.jpg', 'c6cc378b62802f3860ad62c452bf25c9c9465577.jpg', 'dcb4be01c18ec250ebb1d4726fbd93bdab12853f.jpg', 'abc167bac132b8013293011f0f0ed8eca85a4e8a.jpg', 'b3b8b5983afa46f92c26b6627bbc1aff936cbf35.jpg', 'c73b7e5bfbb8cbb159f26a38e2a59c0fe59b1784.jpeg', 'b6e3c9cbeb07abda15285f8322a5cc8f0c94e77c.jpeg', 'a9f993998e6dc4e94bf38e69b5f7b382fe7c9ca3.jpeg', 'd1b79296c689213782e0d83678ea5454c96fe7ac.jpg', '86fe27f5ad553548a3063f57adbba2d42bff8684.jpg', '86fe27f5ad553548a3063f57adbba2d42bff8684.jpg', '0a19847119e9b6da00caecaf1cc890be1ca680ba.jpg', '0a19847119e9b6da00caecaf1cc890be1ca680ba.jpg', '0a19847119e9b6da00caecaf1cc890be1ca680ba.jpg', 'bd29abe7cf96504dd1b97a99943ccb95708a37d7.jpg', 'bd29abe7cf96504dd1b97a99943ccb95708a37d7.jpg', '2648bf8cb904d27d034effd158731fdf35a94f0a.jpg', '8313c148556e87135ed120ad427b320fe61fc81a.jpg', 'd3ffc5be134ea403125fb7d2489207ad3ce3ce73.jpg', '92ff3eb04867993575e33f5762dde8003e6d0322.jpg', '2be763570d21a8aa810ce06ac1adf2a31778566a.jpg', '2be763570d21a8aa810ce06ac1adf2a31778566a.jpg', 'd360a551d2e00adb21ffb5405321c30da9e49237.jpg', '72076a171ea16533be9dbb3c5c3f907eecc7b5ae.jpg', '0aece515931043ca9c1b950773e0971852de87b3.jpg', '1e98b26ba4be42cd98425fb7a20f6cff018f3c09.jpg', '64a2c41fc396415755b99561330d7f48471c8924.jpg', 'e33ef743f0d605a10c2a4cc1d25da23d6e883300.jpg', '33104daac48566e3971095aefbde603d31c03d03.jpg', '6b063f00ed8c362c50c03ba6b42d64623c00d345.jpg', 'f908c88935bb7c9ccaf9c912d0ee4db7cff8837e.jpeg', '0e28273615a470e3f4544eb50d60bee1dbce3f07.jpeg', 'ed2ca9ead3d50a0e705d91a4b47ec6a81a731f9c.jpeg', '7a94fbccdf4073f76d81353c4628a7f67c60c64b.jpeg', '921891c94689db092e0b4ae685f887078413e209.jpg', '921891c94689db092e0b4ae685f887078413e209.jpg', '921891c94689db092e0b4ae685f887078413e209.jpg', '662574c61a8ac3a2165c49f14705c196b3da66c0.jpg', '9fb21cafb766ac9dba5a7db0af557cf1d7afcd3b.jpg', '151c1e6350eeaedbb04fd06a2fc23a9dd6e9300f.jpg', 'c6a3cfb8111044092c7bc1f3b7413374c5c227d5.jpg', '6399bc8c5fa351bc4390bb90319cf3e61b95d95d.jpg', '4c4fe95a7285f8ca89b891ac331d2a500dd8358b.jpeg', '500d32a6e52b7ff6a9014178dc44df5dfbb819d4.jpeg', '528b0dd46f286635574b3f7bec3990e4721d0dbd.jpeg', 'bd29abe7cf96504dd1b97a99943ccb95708a37d7.jpg', '2f4abac255e9f0d3709d9b32a0291b4099fa8319.jpeg', '4363dfe05748f1457dd0a5272575c226de9350bb.jpg', '4363dfe05748f1457dd0a5272575c226de9350bb.jpg', 'f7d28ab2f0ec1d19bba9938a33ec0abf0ed43130.jpg', '0aece515931043ca9c1b950773e0971852de87b3.jpg', '4f7f124b605900c76f360e6e4e80a96daed325c2.jpg', '06785bdeaf256658e09e265c15709bee491ebc64.jpg', '2f4abac255e9f0d3709d9b32a0291b4099fa8319.jpeg', '83406d6ff14f982e7ad0bbddfc7c5e349b1b0fd1.jpeg', '51276bad97938b68ef952e4340b20c097d80d9ab.jpeg', 'd02f056f7c496ba97b91d6858f94c5cd2cf29e96.jpeg', 'd02f056f7c496ba97b91d6858f94c5cd2cf29e96.jpeg', 'aa393e287aa4cb88b56744220bab9e093fbe716a.jpeg', '5306833918e1c2f27c7436ad89c3c901cce1e960.jpeg', 'be91f95d11a5477ed059dce7a9e2f63c434f9114.jpeg', '06d97a1fd9e7669bfbf553e625bb468df4d5621b.jpeg', '50a3ebb46d953f79f6b4a8f3cd2e3eaf3275d83e.jpeg', '7a94fbccdf4073f76d81353c4628a7f67c60c64b.jpeg', '5306833918e1c2f27c7436ad89c3c901cce1e960.jpeg', '5170da75be896576518a2c2e22051f31f39315b3.jpeg', 'aa393e287aa4cb88b56744220bab9e093fbe716a.jpeg', '92825104259a124d55e5e07c2d32639fea8022fb.jpeg', '7a94fbccdf4073f76d81353c4628a7f67c60c64b.jpeg', '7a94fbccdf4073f76d81353c4628a7f67c60c64b.jpeg', 'fba29c320f90c5396fec4514e2a4422e85491be2.jpg', 'f52bd699474d4bf65f55b43cc405971b70a52abd.png', '2b5e9d16fc2d81cb8bcb433117c640ee450eee44.png', '95b5ff80fd180aa794ec66fa951db433c950621f.jpg', '95b5ff80fd180aa794ec66fa951db433c950621f.jpg', '5c45c756f778a6b5918dddf349461f332f9007d9.jpg', '3c7a9bfa6c04f27b8bcf3f995ffb420c4160b090.jpg', '1616bc836d36f77a2b133d6f63f1f0aaa175ed78.png', 'e55fde11938e2b3f02a1d0cdb4c43c4799703112.png', '09fc502353d25a5c45c806e7966fa6b1dddd4c6b.jpeg', 'a87f9ad3a188809509494ac76b75cdaebd7cbcc5.jpeg', 'a87f9ad3a188809509494ac76b75cdaebd7cbcc5.jpeg', '3a5994b8b9a8e3c3c873f27737cbe171163e3412.jpeg', '351e2171f38d8a2ce42e204b20cda6ae547af523.jpeg', 'e0a11877c3eeadf127343e5c59860baab49f0848.png', 'e0a11877c3eeadf127343e5c59860baab49f0848.png', 'f52bd699474d4bf65f55b43cc405971b70a52abd.png', '95b5ff80fd180aa794ec66fa951db433c950621f.jpg', '95b5ff80fd180aa794ec66fa951db433c950621f.jpg', '459f7f9573c0a39ace49f52405aa58bd4cbe9978.png', '459f7f9573c0a39ace49f52405aa58bd4cbe9978.png', '459f7f9573c0a39ace49f52405aa58bd4cbe9978.png', '05fc7bd95031a06060e27a0971c93e6d99e171f2.png', '07aaddc3b112949ea5af30a4fc19b78a51dfae38.jpg', '04681da8d235f97d9047781d8b0d862139a80f55.jpg', '70cda931313ecf4949609daeb858d9975e534f3e.jpg', 'f9efd93d1ab469940938d20812f9da63e8cf0274.jpg', '8789609645f16dc392f6f6041c7c07bf5e1c382e.jpg', 'ff839e4f1a4385c1d312ddb1e6020283e2646e4b.jpg', '6d742fb2943e35dd0fc12978a0b34bef4d51ac0b.jpg', '1d70555e82654bec33c5ff51efbe80ef178481ad.jpg', '6f12311fe11a40a255c2cf4f42fb636ae045467b.jpg', '8006afa01e902a620cf116ea57dac75a79e815f4.jpg', '47888be79b1e5e19f38704d53997a0e4343d5913.jpg', 'edb8177005fe37f2257b56c93264a7f1a18958de.jpg', '82c5c2847e8030d9de788cebffb2e44a2e393c87.jpg', 'd9729894d4443ee59b15e9aac565bbaa80353dcf.jpg', 'c6d949d889ad32630cea08790948d7dfaf8b4023.jpg', '1b9592db92c013d6dd56212fe1dea9cd55cf0ced.jpg', '0804513bfde1c48d94656a7652ba7117300d88e2.jpg', '4cee3ea2690d9609288b9df6791b3ebf4f721f1a.jpg', 'f752a2f61e1c52eaee27de85077aa5a2faf6c39d.jpg', '53fd50b8de10dee9fc3a8c68311ccad0938645b8.jpg', 'af78c3ff409ffeba6c81bdce168f424fdd974256.jpg', 'f6960b9764ff2ae304ba8484386374a66a3fed99.jpg', '169b6ad8d11793a9979a4d5b11b9e8e302d7b9c4.jpg', 'eb40f9128fdbba1bebe83c1ca36f7a0af909331a.jpg', 'e6dcb6650150543c5d0aa8004c0b4f9d6968ec63.jpg', 'f2d1cb3686a43a4cca93638027ead4e950f91473.jpg', '497c691eaad1371819cb3e8d766f95bdb0235a09.jpg', '31136215d942ee6f81422ea3470aba3d34ef655d.jpg', '7a3b1e7a8563c5348aa79d2970f996f6fcb2c886.jpg', '8f07ad851921f103351da795bd03626185345171.jpg', 'ce90dc8c673117066c406da418322750d4628128.jpg', '03101a696f3103f6bd1eae1c6657827368a9ccf0.jpg', '384ad826e1d101af942434dbae342b62bc8b43e9.jpg', '384ad826e1d101af942434dbae342b62bc8b43e9.jpg', '384ad826e1d101af942434dbae342b62bc8b43e9.jpg', '3a8d75532eca657efc1e1b1ff079229078e8e42f.jpg', '3a8d75532eca657efc1e1b1ff079229078e8e42f.jpg', '5af1dd1715ca59b2ba18491ce5818f1e193a67d7.jpg', '7a9f5f78b549715c989bba40443f251653865d06.jpg', '992475434f2fa7fea65a0d94bfb1317b4d115356.jpg', 'ba0c5816c03768a05ba52763267111161218074a.jpg', 'c4cce8451b4b39488d927171c1168e93d7397487.jpg', 'd0fdfe04b297393fcd639c506c1c87812186ac0e.jpg', 'd0fdfe04b297393fcd639c506c1c87812186ac0e.jpg', 'd2470ea647bfee419b05349774d6b987074e4a13.jpg', '253c84c6aaf6732509064162b6f6b94d326ed5d6.jpg', '40702c13c942a50359c54a7af8e516e40ad21b04.jpg', 'a0999cd90009b97c835d5e842091fd37cccd0c71.jpg', '9036438a0d7e9bde6dbae8c4c31e5882c064e717.jpg', 'fdf8a21e5ee25afb2e59d1cb17d2a6c2155e6e91.jpg', 'deef5fa21f996a77a39a4fdda2d2292270c201f0.jpg', '12b75b17d8cec6668182ca56987840d7b16397f5.jpg', '22df84cd53956d0a9127858981babf56fe4adfd8.jpg', 'af54d8bf35d1525291036a03f3aa9e3afd890009.jpg', 'ede0f644e76dacc9c62b2f337a31481c712ee597.jpg', '1b2ba3a9b9710884304a1c9046f17472b20d1f0a.jpg', 'ca44316442f27db43d48cd87e712bda3686e8e29.jpg', 'e87f4f1a1e6a67fcd2919eedf2bee9fb916b44aa.jpg', '4ca6f9411927286c94af605be1875a722ceba87b.jpg', '8a44a92409272ae086275c82377444ebf6ea6901.jpg', 'ef9bd996f69ebc4a3d81b44c59d9c31bf5cc6bc5.jpg', '807431210f75d3053d5295cb4df917e055551006.jpg', '2f582fc7628e46d6cf5e0c9210c5e4436852dce3.jpg', '8740d0163a73db09619243011c79c12ad57b0fb7.jpg', '6b0f11ae3ff9b42f2ce70ed65938f817fde8653a.jpg', '3db7c53d505ec02a966e6636c35a0fb426430ea4.jpg', '75b42962bf95e3e2640fe3d4adc6ea1edda6499e.jpg', 'd39c3ac802480c7b60ee5cf95421eafe0e9dc198.jpg', '05af985bdac638ef812593c1ab275f7dd52eeae8.jpg', 'e4aa002f2b4f2915cd566fece316829a8d53dd6d.jpg', '4a1910b92eb61e14b3e1da647410edf0cf59386a.jpg', 'e585fe49292a81d798b6a4c4763d4e138eac2ab9.jpg', 'fd00fe4b13d237ee023bfaa3d97caa534c0dcd95.jpg', '602809600b717300f871a5e02c58d0b1d24e01dc.jpg', 'ea604338132b802a0ce92c93cb0024c2f0c1ca33.jpg', 'f689d394125b83d857d3389006e0aab16100e22e.jpg', '3823fdd6f0932c7016d0dcf40e8911e74a448784.jpg', 'fdc1d1d94ebb5719ea6e5806196262ba1ddde25e.jpg', '07851a6e9f2abd1136a999052e3ea67a268d6d41.jpg', '23e3632cbf9a8801f07eba700c0d6ed9af7cd521.jpg', 'fc5cfe3e9205fbb78366170b78d8805b1e52bdf4.jpg', 'caa7a07b00b7ae222f4a05e3e24af773806a0290.jpg', 'ecdbc241641f468923bcc229ffc4f120f0b3f201.jpg', 'f94cf19fd321710badc0a40120009ac193c4b4d4.jpg', '1223f9d5a73db9cd583267896cde03b60b9b82b6.jpg', '9e2ef9f48f6cd76714540f0fbc2fe8ce901c3304.jpg', '224e7641fca7fc651ab29f6e039be26b4c185c3a.jpg', '1485434989994b63abc03dbecbf71f43875e3bcc.jpg', '74f536f1071f9757644ff8dfcf68cadee79efd78.jpg', 'c587433ddf15d6b7d8feb322bc255a3d4870f05b.jpg', '0111cc5abba39068f43b01a3e1fb2b2b959c386d.jpg', '001bd04326aa29b380b7875e085347fb15405369.jpg', '77b3ad01b857cc56c23de701e25cbb81340b67da.jpg', '3b06f4bca85bfca25951e266a097c87ed3d8ed2d.png', '43702428387f202d60718568832b58373c23ff52.jpg', '7739bef20f61e6d24be4f2b08703dc3d67cc691f.jpg', '16735bd9c6ee50e9eae3140d163803bd4e368ec6.jpg', 'fc8e136bf90c6bc6f0f6ae6ba3fe7c87d2a58a5b.jpg', '7136e8cd778c0c76fe2a62fb9fd4c5e61b58729d.jpg', '28e89695b6225a0b18c8510d6fed240db7594f2a.jpg', '903eb0979120405ef3e6376517103121118ad04d.jpg', 'fffabe9e4755138d42517268c5e79a1bc64a5181.jpg', '0380e96956fbd1cd4b7b9e823027ed62323384e5.jpg', '2869aa98c1487a478959080752b6bdba9255cffb.jpg', 'dbec032af6a25b8bf3b3a6a8a429cbc06565f188.jpg', 'ecd0526a224a61aaafd59ec61be51ac97e070cf1.jpg', '2ab0e6c75c813a44458e2dd9a47413d986b86664.jpg', '4c667dbe7296395f3ec0297fe6c31c1efc9e213b.jpg', 'd73fc8d0aa0d0bc9647618e1b737182ac55ca374.jpg', '81f9884815d4014d6ca2861b82454279756b1d1f.jpg', '3e678ec5f54887c1b6b621419b5ae2e40c3f9080.jpg', '9b4a96d7432a185f1e0434d4a8f2c27d3b1c1403.jpg', '5f1f3540d3a15942e39e85e1ad05dcc463539427.jpg', '0e8ea7c777e7d4938274323213312e8096371396.png', '4cbb91b89f977d60c47546853a97ac3fc58bb457.png', '51e32105cf4c783762c31dd39f11d2c57f006fd2.png', '89b0424393e1f27d884705b1cc7a195ebff343de.png', '1bdb6bdaaaaced3bfc7d71cc13d07cd1a0b71531.png', '98e85f87c8eb0fa87c7b45297fae4620a21d2f1c.jpg', '98e85f87c8eb0fa87c7b45297fae4620a21d2f1c.jpg', '4f4f591ad36ce21076f21da04c114c561652112f.jpg', '8b1eb61297f93290eefca2727d50f3b379368ebc.gif', 'e2a9574251fcdb6a200b2b8e13f0efdb0333a2ae.jpg', 'ddfe7e760e3cca176e7560f909c2c87a3ad10291.png', '8dab6ec5217f1ebba994c9498e3cf15683913499.jpg', '6acec2a01be2feb6e9cd641316a7a2fc9b46a97d.jpg', '73b289e3b6ea0439f2e6944002f89eab50d892fe.png', '03ab1de7f8ea6553355ae7b704ab5e21a36c78c7.jpg', '60c016eda84bff381932d7a115a92a236a5cb790.png', '345a588452efdf7eb2c9d31917e91a6e99684e3c.jpg', '4bae37ae603e19480cced6071741d2c7fc546599.jpg', '3f26602834e102ce6457d54a95dcbcb54f861dbd.jpg', '9ca2cad8cd3219f567a6e99272ea1ab0e656e44e.jpg', '5540f19b48467c56c550c44dc724b0296bf4275d.jpg', '030d3c8b6a2f3b87ef571954378fe6829fcdd3af.png', '0c05af7b9111c163cf9ff1e9c9498682892892bb.jpg', '36a55bdc79bffa7284a5a8e20302dcd0ee074638.jpeg', '2be763570d21a8aa810ce06ac1adf2a31778566a.jpg', '86fe27f5ad553548a3063f57adbba2d42bff8684.jpg', '1aec3ddbaf3caa7f3ac726beb1be54cbcdf0e597.jpg', '1aec3ddbaf3caa7f3ac726beb1be54cbcdf0e597.jpg', '648aad814411724ccd426ef7f92d803ebe851baf.jpg', '648aad814411724ccd426ef7f92d803ebe851baf.jpg', 'd1b79296c689213782e0d83678ea5454c96fe7ac.jpg', '8948769b143480fb8e7ba07e2ea4aa7f358d037e.jpeg', '86fe27f5ad553548a3063f57adbba2d42bff8684.jpg', 'f1b5c24909621a23cd1695831dd2aaef24ae2998.jpeg', '54cca2332d3a5196a9c7901760bbb2147d4d90fb.jpeg', 'bd29abe7cf96504dd1b97a99943ccb95708a37d7.jpg', '36d6f9826931234395e7f1d4c6b428ebe96b01ca.jpg', 'bf31bf42c7215cffc4050503508cfed6d0510d02.jpg', '74427da205ceccb64a4e285915d93823678118a2.jpg', '74427da205ceccb64a4e285915d93823678118a2.jpg', 'e6562dc75045f665eed3063a6e4b50fa53da63cc.jpg', 'e6562dc75045f665eed3063a6e4b50fa53da63cc.jpg', 'e6562dc75045f665eed3063a6e4b50fa53da63cc.jpg', 'fe36b2172a93e64e6d10aef2a954a84d0eaa48c4.jpeg', '84c9521c5f9ec8c6d2a06435e48295817db54b65.jpeg', '55112ad490ab38f0e5b88ee2ed93629b71d6f54d.jpeg', 'c0cc8d1fa6aab980d3dfb04a16c7964e40ffd569.jpeg', '648aad814411724ccd426ef7f92d803ebe851baf.jpg', '36a55bdc79bffa7284a5a8e20302dcd0ee074638.jpeg', 'b995ec86ce7c551a685a09bf3c6c9b79dea695fe.jpeg', '8ae3779431376dd5fa5b1f08ff22b7d7b6c4589a.jpeg', '7455816cd8e253792535f35c48259fe1edecbfef.jpeg', 'b92427773ac996da9670d6b25bfa65ba7851e5b9.jpeg', 'a5e7d39a9a47469d17d4d2ccc707e90f3495702b.jpeg', 'e121c019deaa9776b68f3ee5e5c11ec46b6df34d.jpeg', 'b92427773ac996da9670d6b25bfa65ba7851e5b9.jpeg', '921891c94689db092e0b4ae685f887078413e209.jpg', '88c46a96a0f456695fd728fe9c12c091323eed7f.jpg', '88c46a96a0f456695fd728fe9c12c091323eed7f.jpg', '88c46a96a0f456695fd728fe9c12c091323eed7f.jpg', '88c46a96a0f456695fd728fe9c12c091323eed7f.jpg', '6399bc8c5fa351bc4390bb90319cf3e61b95d95d.jpg', '6399bc8c5fa351bc4390bb90319cf3e61b95d95d.jpg', '6399bc8c5fa351bc4390bb90319cf3e61b95d95d.jpg', 'b5ed05d9af0b675d86264570c09651a3851f2bce.jpeg', 'deb4115856171d8dd3b7595ab10595a262fef047.jpeg', 'deb4115856171d8dd3b7595ab10595a262fef047.jpeg', '1bd496522ea9599620a6b747af52f1e14daefe14.jpeg', '50f03c352e4d0055aea270716ee675bb0e1511de.jpeg', '0f7c73b2a34271f6a0cd9b2ed8473f2ebf6e9fe8.jpeg', '0f7c73b2a34271f6a0cd9b2ed8473f2ebf6e9fe8.jpeg', '253de7994bc75bda994129a1b5c8d314f55b24d8.jpeg', '69b27b6ec5eee310ed381a8859ea18a82b35dd31.jpeg', '81241907e6caf1efb3c5fea0a4954e82758c7e8c.jpeg', 'd1b79296c689213782e0d83678ea5454c96fe7ac.jpg', 'd1b79296c689213782e0d83678ea5454c96fe7ac.jpg', '0a19847119e9b6da00caecaf1cc890be1ca680ba.jpg', '18c8fd1121bb988545d6a558ce69ad6e9f76c8c8.jpeg', '0aecab1fa637040fd8eda24f35bc6dfd07b64a60.jpeg', '52607fb7db6104872fc730ad5615012217057ff3.jpeg', '7a88627181d5809870cc76aae2ee1a6276c757a0.jpeg', '76092de8f6440a1c3d20a83fce2cc039b7d95729.jpeg', 'b3c90f5fde100e48aea69199a17ed9c393b10051.png', 'f025900bedc7acbd5f4987fdd8d2157a8dbcad2a.png', '7adaf516ce62a322c111ac5322f67e18231aa027.png', '62330c069cc74c783c7ccf10c3719e356bb1d81c.png', '170d07e58aa5c5f5a0d8100f57d9d09a42215f4c.png', 'b88a1d7a7f3f99184e6020141fff19a3e9736534.png', 'b88a1d7a7f3f99184e6020141fff19a3e9736534.png', 'deac804a1ec6de26d9f64083d2b798b982777f24.png', '62330c069cc74c783c7ccf10c3719e356bb1d81c.png', 'f025900bedc7acbd5f4987fdd8d2157a8dbcad2a.png', '7adaf516ce62a322c111ac5322f67e18231aa027.png', '170d07e58aa5c5f5a0d8100f57d9d09a42215f4c.png', '927fc518e59891954bb8757fc9caf73f3a7f2c62.png', 'f1fcea5a13225809523655bdb30b58bf65c43788.png', '1dbf4c1ed00a9df65f0e0c5be0ba4958a19ff63c.png', '0590e93d82101a8b999e442f8ed43dd81f82f816.png', '6ff4421e3113bb284e10cc0b34ba2181bfd64cfc.png', 'f2d77a33e7fd301d6e4c7dd084c1768f374c6936.png', '70125e091515e2b1d33724f45313e75db536f6d2.png', '508655409e76699454e37705ff935c0b90b0e6f1.png', '9f9c42d58ff8065ed5fff1708137057187ae49a9.png', 'bbcce3d34c666d7ccf3a15458b6b9dd111bf09aa.png', 'c9a572064810a1d9b97d98dc208232360960f4ad.png', 'b19be908bece11ac8f57d7c36e97a1b645055dfe.png', '7f93e1c316aed7305eb5c3bf182ffa1db40ae9e3.png', 'a547cee092ded4c7491385f504b811e813d175f4.png', '34e0023eaf72abac51768f9edd8f5fd9a3ea973e.png', '085652ae5bfe36a22610d074dc98b67b961b6476.png', '96989e438ac1c8967f90dd1705add765ec49f2be.png', 'a547cee092ded4c7491385f504b811e813d175f4.png', 'a547cee092ded4c7491385f504b811e813d175f4.png', '34e0023eaf72abac51768f9edd8f5fd9a3ea973e.png', 'a9510c57ee7d401cca2211b3f5aba8a69c5ad0a3.png', '98a7043a2f76cbbf0f168cb12eba6be36bd67ff1.png', '21fdcf21971030d646d13c186c1dd1807394b69f.png', '9d1a2acdfbc4e449d0506b39fbccbacca7b32012.png', '633f744724a21dfef5a3dcaa5177ff351dbdd2dd.png', '4aeaab0851c20e7a1ed0c7e23b7bfc5c1711465c.png', '1a1a597cb623da300636c9d987f16ce95e578547.png', 'b89196c4b5a47d7d21d29458842985dddaac76cd.png', '1f2723995c63fc7c9cdca918f4ef105e676c630c.png', '3f693360662f3218fc44e4efa83a934ab87e38f2.png', '76134166bf2ede50d6fe225901bf9676365e2aa2.png', 'cf517712ab2ae03c201ca3358eda0551771a7450.png', '4aeaab0851c20e7a1ed0c7e23b7bfc5c1711465c.png', '051bf29d00f164e72a1ef7006f57df4d4a2468df.png', '633f744724a21dfef5a3dcaa5177ff351dbdd2dd.png', '48b5c43a6071220b39c5446cf83ea2f1e090332a.png', '328eabb772f289e8c9cc38c9549da002998e5883.png', '1a1a597cb623da300636c9d987f16ce95e578547.png', 'a4a8706db30dfbd4f840b801f1db553c597806f7.png', '79c5fbddbf6bb47542d0fb107806293ad0c774ef.png', '78bfe4771f601fdb056c697fcfb55f63d05af188.png', '225ffb6b0bda968f47ded8cd4b106ddc62b34221.png', '225ffb6b0bda968f47ded8cd4b106ddc62b34221.png', '021de4d931bfe9252a23ac4f94387a8d8e4380bf.png', '6f66d2070a3a33eafb0faf4c3dcb04c1d33baecd.png', 'f1e80959ee0a087f9986280806385863528ce52c.png', '72f40b3b0c75dd7710e4c4b67448b8209ecc3093.png', 'a4a8706db30dfbd4f840b801f1db553c597806f7.png', '79c5fbddbf6bb47542d0fb107806293ad0c774ef.png', 'e79a4a26fc81223631f46dc250fa8a6d1ea9dcd0.png', '021de4d931bfe9252a23ac4f94387a8d8e4380bf.png', 'f1e80959ee0a087f9986280806385863528ce52c.png', 'd27533e39a11f446c24ba82d3d8b6f61ab2428dc.png', '374bdae7ee6981075974c0a248e831d7eb7bf3f4.png', 'afb41c783210354c27f2406f2c78badd651f6470.png', 'd95e73acd0c2c425079ecb1d9dcac08920fd89e3.png', 'c372f9b55c5bdd0b6327e8c25af1360894289828.png', '33ea5be8d7640fed9a8446e5bd84860f962865cf.png', 'edf09a36f15a27169c5523e81268a2c960dadd34.png', '086d5aa259dc07c79987512782ec01e369c4d0e6.png', '410c95455616f33fd8161699d867ca7108716de9.png', '8917393d30c5224f31c59be4dd1b149fb13abba1.png', '739870ee542f116101209f2c4b9d74d4802e8dcd.png', '79c5fbddbf6bb47542d0fb107806293ad0c774ef.png', '225ffb6b0bda968f47ded8cd4b106ddc62b34221.png', '021de4d931bfe9252a23ac4f94387a8d8e4380bf.png', 'f1e80959ee0a087f9986280806385863528ce52c.png', 'a4a8706db30dfbd4f840b801f1db553c597806f7.png', '43637483b81fa288c6d907a50828a15c9fe1592e.png', 'eadd737038e58b2b6f8ccc9d58e6d9d429e1c0d9.png', '2d9b5351035d07ed5cb2370a489f6bcc852e7a99.png', '0eed42a6c31640f8aec8b077c9a3dc0007c86c5d.png', '692516bd7f76fcaa2b19240c51b31b96cb775a04.png', '2bf56731233aa40e8e1c8c1be1c9e61c75d9d301.png', 'd7ff9a4f4660bc3e80ec22d4eea9e1b9c6c8fe76.png', 'e4536e03cbcbd8d49a7e7175cff4fbbd7fb85c4e.png', '7d2252e6e702b8b63260334bb50c0c32e2b579db.png', 'f8e33658b5be4d17f60da5cfca04595d2f3c4e16.png', '66b8e095a6c1f03758895ce9db8696163fbd9676.png', '9364561d531eee93f5f8aa69b73e10c4e578df4a.png', 'b9d128c0da4edb2b3a0ba55219e350029633e1ce.png', 'eeff56ab72453563ce0fb6361a3190d567f20395.png', '55fbea2af3a08063352652572c7c5e68256ab7f4.png', 'b17cfb6a3270c6f41f66099462e495c841cf6ca9.png', 'e03ea0d05c382d03b24db03f1e7ebfbc2c6dee98.png', '678c052fb0b3b4d610042572bb343a958dda5c17.png', '9e042d5d0ee46f3c5a8ef341b091a797c63167a2.png', '217a03ebe070d6165604f74a1c80538fab0b54f0.png', 'c2f7e8a1c2d5224248b8d2dad49b2187a66b6647.png', 'db25a5b10ceee0359402798b5f6c1e6c06f42f43.png', 'ddc575ecc8e6eeafe12798b5b5eefe8e2c7daf48.png', '200ec2f5832def0cb916809cf2dfb9d17546c5f1.png', '90c5f2daccb5ca9d436e37e92c3d563574c1817c.png', '499da8efb49fbffa81c8a1a2c37307170f8e7d7c.png', 'd5ba74c0a50a5e66c0c5ea84694a8c23d214e7bd.png', '7fb1127e2dce4a79d7fdc0967d94cb690d5220af.png', '58c4b8b06d8647091c800a431a6f7526df175cd2.png', '9dbeebb2a3f8dba7087e267a6f59a9ba64cb8fda.png', '8818d5a465b716007b1b36cb3a09e88466f93300.png', '499da8efb49fbffa81c8a1a2c37307170f8e7d7c.png', '75b9aa5f030ea933118a723e7c7dbab5d3c0a43b.png', '0f29accfefd695128f407deb41adb405e1c81cc6.png', 'e1068a778c6815f047c210adc77181ce4eac55b8.png', 'cdbad2116a5e3103bf7e9366b7594c784fb1e674.png', '7232611613e68cbe5bf75bec0d161b0385d8a417.png', '0f29accfefd695128f407deb41adb405e1c81cc6.png', 'ad4abf7afe27f46c0d12a19c49530d593c7e5997.png', '6d27a81de649e4098b0d984a597c6ec64bba8933.png', '3a396f73d194b02bd92aebd578521083bbd39378.png', '012431a124cb6217796a60918b9906e8d5ee9945.png', '3a396f73d194b02bd92aebd578521083bbd39378.png', '1c6bffe2b1bd532d35772b168682618cc20d6a62.png', '39943f9c6b4421216389e24a77f1731ceb50aaf0.png', '04d23a23b3d15b1db37cd4d99e8cd673b6b184f0.png', 'fa2ee8e469d43a0fa7ee86932f0dea8ee5dc043e.png', 'bb33d6867d68c3ac48678ba4ae380287270548fc.png', 'cff02580688ba6730c701315e2586092813205dd.png', '8e8e8b5e68cc53f7a6e2ac0fac6f7e22efa3ee03.png', '01980e46367203795ba1df3f835a91c517449fef.png', 'c526e81abb28986218cd1f2e6c5b97993d4ca0b8.png', '7134cfe991f64fc3403ba8bf9f77ec303bcfc584.png', '01980e46367203795ba1df3f835a91c517449fef.png', '8e8e8b5e68cc53f7a6e2ac0fac6f7e22efa3ee03.png', 'a911e8b75bcf5548117634e345c149193185857e.png', '140599b2f606cd78484c07941d69fdcff3c1be68.png', '71c6b22fdef3f8840d3f01c7f6bbd019d0f2eb40.png', 'b5c91b4f7d7c23b7c64ed7ff557b44b1aba84966.png', 'b5c91b4f7d7c23b7c64ed7ff557b44b1aba84966.png', '391cc11623cf54dc52c677ce7514b076c9884b2b.png', '3f63b03c0ed1d8e71b20750f2a0f74a3242c312b.png', 'a61359c3ca75c1c8736a2b3f09dce96f97afb7bd.png', '4a13b8adfb6badfb484d2ff5ce8dadc388458768.png', 'a4075185723f7518a44c6b8f17fc6ada0b9e64e9.png', 'a61359c3ca75c1c8736a2b3f09dce96f97afb7bd.png', 'a4075185723f7518a44c6b8f17fc6ada0b9e64e9.png', '4a13b8adfb6badfb484d2ff5ce8dadc388458768.png', '0abe1a4fa0690cc3edd60ef5f461f898ecc65e33.png', 'cfd8af915b491fd292df90b080d516fffeec10f4.png', 'aaec1e9013138a38a7c351012e6e53e94624553e.png', '4cc8bfb357987f340b7070a97329816f5646fbe6.png', '426d083d53d856461e86a5f3c77e035e5bdca69c.png', '03dcb3b82f27431bb609b244c4be7c839a4d33ff.png', '4ff148e1e92737852d147d99bfa12af5ae2b9add.png', '90f86745a8089bde0b650bca88120db9de06a473.png', 'cace738746f2c85e4a4a5d5faee9776e13ae3fbc.png', 'd0f2df15737d3feeaeea4cf4ec640413c493a875.png', 'c390df0d5ed0b041fb0f13f9932e7fb36304a1c7.png', 'c599e439d6d70c9056d48931515740f81119c1a2.png', '72abebf791f804371ea5a4166d761bf006db41f4.png', '7b8a1048ca747ec7c58340d0b35c50df02667093.png', 'fb55e88e06205e247a726f19f461b45fb2c4f972.png', 'f48e2a481826e67cbc76b854794e76eaaf8f0f2b.png', '9ff9174bdeba79e6abdec5fb6861048f341b0443.png', '0d00d4bae55f38f6e7a3a0fabe1c908e7c0333d5.png', '0d00d4bae55f38f6e7a3a0fabe1c908e7c0333d5.png', '0d00d4bae55f38f6e7a3a0fabe1c908e7c0333d5.png', '0d00d4bae55f38f6e7a3a0fabe1c908e7c0333d5.png', 'f0c682294e04d5f146852cb276c0ec549f337f14.jpg', 'f0c682294e04d5f146852cb276c0ec549f337f14.jpg', '1e2ce908c2f5788907c2d97dc38be74c5d56e07f.jpg', '0596a4cbe34d536947019686acab70f23c186d3a.jpg', '0596a4cbe34d536947019686acab70f23c186d3a.jpg', 'f0812023490f8f5e6a12b541206d1f0f34cd01a7.png', '098223a2b23e68061d6ddd9fefa7b976f66a19de.png', '62038dc121e47db88eb2464a99f3b4e6a3c2db34.png', '0596a4cbe34d536947019686acab70f23c186d3a.jpg', '33c79bcec4dd796bc6d17d0bef6f6137d6be7990.jpg', '5a3355bd8bd96d50b56af9488d17b9a87df17ba8.jpg', '3d2e4511a8ca57be6a01194ecfddba13548fe303.png', '6371a151876e0901efd8dcef7d17be3ea1e4579b.jpg', 'caf7602f1da604345b59253f82b3bbee9a0456e1.jpg', 'e975036dc733002952225d83e737bb61e1eaa3e0.jpg', '7b78fb3443c74806d822a7b29a03227c149ad3d5.jpg', '8cf0539a49ab7b14bdc8949bfbdb6c37fc92dc64.jpg', '0264bc76596b857d7ef3c851ae730c97bb097525.jpg', '4c932733e7653ca516893e2d193335f4e49b3688.jpg', '6f136404a3d00f97b57769dc34deb1c08741233d.jpg', '030e467759b685bbe2efee7053d2d5df4d5e1aec.jpg', '413929d680bb9511f9f27f3ae04de13afc734463.jpg', '8cb550b8937802a94d774ca1b81ed6b621624a00.jpg', 'c675a0774221b54d58f89297e7d8d049cffce2cd.png', '35dbe249353cbc7874bb7bafabeeb6661efde189.png', 'e4b177b88e59978bd89dc5e7ef6543c2623e13b3.png', 'f6102035d8236517d85387fb5251eed373639b02.png', '47911bd762970cad77e277f443b1e08f3cdf9d0e.png', '74b75bca365519ad10cd5fc3ca5cacbf09b92fa4.png', '23f9cc5b8c511229b05e62d5c6d5811e0461f6eb.png', '6e0f499af6764564e3b663de834c147ae8c270c8.png', '6dc92919a94bf9c88bc43c06e37197e44679570d.png', 'd304d59135cf2d1310257b20eaa9d48ec414b12a.png', 'f6696920a842dcb161aba842d4889832155d65b6.png', '49c6fc9b06fd77326dfae7b047a7fe77b5b3564c.png', '2ff9d0b4e06a484e98de805bedafab01ca6dd3c9.jpg', '04b737fb4990166b2be41e74face4875ea3ec601.jpg', '074316a071abb54e9ac33dc5793053367c2d91dd.jpg', '4217fdc03e4f401dbd57ff5ac19b9b95964e4841.jpg', 'ef26160b8fa36334dd382108515afed5986b7140.jpg', '7218fe8fa64ad607f1fa38645f38e716254943a3.jpg', '62abd60023f6e7536ba4676db6704e34b14b53fc.jpg', '93e978e697de97f740beac0472e212721e341964.jpg', '5993cccff2f67157162346a6f2e921b8ca579b64.jpg', 'bf2190b6bb5677c0cc911e5ba9c795fae7188814.jpg', 'cb47a4fa2e0b7404606969cf851ac4988570339c.jpg', '5b714b0cde55f1a93f36531376d91530cd823a5a.jpg', 'ef92dc62680b650258a87d10cb59d7946aea0dc8.jpg', 'bc95ff82a22148247d7554569433e7425e77db82.jpg', '8caedc0dabf36f44539755501d0ff3c36e6addce.jpg', '07b5430649c2122722a29f5c6bb1896584b88526.jpg', '68bc3d479fa12d978baf0bebb0ad917ccf8141e3.jpg', '7fae8842c82fd918c357d79e47c83159f61056c8.jpg', '45033b76c824856bac35d98ab68cd4e42bbc1b80.jpg', 'f34a9747e559c8c482b904b832330b15444970b3.jpg', 'f914f14273badc5cdaef8c849a16f238fa90aa22.jpg', '0c74141b570fb4846cf4327258aedeaf166d0637.jpg', '1f6dd930e7b57d6e188db3b6df1624e42753b148.jpg', 'c97183b1a4e88428a30ce6368a054e14e62ddb3c.jpg', 'd451143225c86e4b5c65c0ea6aa2b7c59e1d22fc.jpg', '27e1e15f505217512a030c30ccd80531f4530783.jpg', 'bf89e28d3e25f56ce21233cb7837195cf7f91c02.jpg', 'c0d41313204f7896177c96d86edff82eb89c680b.jpg', '660833c93552da886b906db0b1bd3a6c41f7f51f.jpg', '018470cb83bbaccd70f5ac1a2ea14526d44e9741.jpg', 'f2c29a7c843e1b4e47af56e8b7c47210afeca10c.jpg', '0c771a47a23ad3c3dca5cbe164a43a3fa87f80fc.jpg', '7f27c89c1f2bfdb1db8951016dfa23402d4cc564.jpg', 'fea54d7b34dd5c72353c3176be57ce26def50bb4.jpg', 'f986fd028931e08b2b5ec9d11f18777d8a4b1a51.jpg', '86d4d9457e818db0f2819224d52b0ba72951c7c5.jpg', '273b2b4ee3889c0f13f7dd1dfecb4546074aa54d.jpg', '0d7fe145d436c121ad7ef3ca30dec41bfbd95b22.jpg', '378c05f5126123be09a853fbbc610ef765335089.jpg', 'dcbb2a1f597e04d855894a96c171df92740ac7c2.jpg', '02cba8616e198c971a7ff134ef8e148e988893b4.jpg', '385e7beeaeb4d3c7f233dd071c0a9985f572e8bc.jpg', '1242fc2c17cae7198d3b7f7e973247997d7ff0d3.jpg', '6571f9388a5fb3008d43a9ea10f8e4a8fdee5dd5.jpg', '89f8c6ebff13d952dc784a881b158f761794b908.jpg', '249f5660e1d8083df5884daa09ff98c8c34b7dba.jpg', '431b607b4728a1b3a06cc83a09791f538d8d6416.jpg', '940fa402a9e9220b1143755ae675c4f55696cae2.jpg', 'b10668eb86c3aea9d85990dd04d4407a5acb28b2.jpg', '8194a6f5d6ce7b310ff6be7c792f447cb01dad19.jpg', '7c654f54ba704e2aae1f3b16e081ed90fcd2a0d8.jpg', '910ca345682943473668832c803269305e1c1607.jpg', '6421c26d215bab7e7e3a4931f8d30dc678c7a672.jpg', '0e72eec324a82950b80b8e78273c18d1387f4873.jpg', '1f68a48ffbc7b137e99fbcbb11e9747ae799fe01.jpg', 'f29e18103611b917248ae78827f26552d3190be7.jpg', 'e14cec921e1599bf53f0ed994c9ebeee3f5a8245.jpg', '6c2e6ade4e6f5e90f6f1de07ba3d8742d2e2ee0c.jpg', '5e543acd5f41c0de0d61bea9d7cd97e5f519237a.jpg', '36be17518df0f46bd5f0675331c7830b440ce20a.jpg', '2536f93d043e8a5a2a2b1053114cb8f6b36feeda.jpg', 'e06e9ffaaaeba85505d764b0b352e3c4b92ea0fa.jpg', '05ae069a56ade222c801003a77ea84ee2e569f84.jpg', 'b1e6eca2ee35c80fa1eed0e81cefa02699cf4759.jpg', '18edbdd6ae27a0acfd5d824366120a5c042c1ad4.jpg', '1e4bd2e5e5ca66262309cb55c2821e04281b6247.jpg', 'e8a3b06db2740e74a8da410678abee5e60101d1a.jpg', 'aaee36f1a1747a3702e4aa2117b1a3660edb2c0f.jpg', '428521d980f664a46e6e140d103aee44e9b45a88.jpg', 'ab92b0b6b0a37acf1435dd2355f6d06b2ebbb547.jpg', 'ad0d2333064f5ad369937d9c96c9ad16d1e3cdce.jpg', 'eefe832115e3625f1fc34225bfa2cbd6455323bd.jpg', '0b08d5da6291f608414fb9625358603da33d0ac5.jpg', '0bc3f8c0823db70e811c12b3acf3c901e87de3f4.png', '617438cdefb041f72dc7a8cbb7d58fde8925eb95.jpg', 'ab08b4aafcb446c3a1a31003bd3ac949bb6c953f.jpg', '3b9ee0f3fc016d9ea732ba793ad0121b2acf2295.jpg', '5f620ccb295edfad126de96869eeb74cb74d5e4c.jpg', '3d67198407f98ed85dd5b647ec1a7fa25caa1644.jpg', 'fc08adc4a8c15557452cdf8fafc0e87c011959b8.jpg', '6292c8f72ee3106f9b2cbc0ef907b802ab7eb372.jpg', 'f7078c1846a98ca985380384fae0ab4ed65eb3ff.jpg', 'ede86a70de71e18ca182c2b02381b12107f61e0f.jpeg', '05fd4c0b05ae97af6d2fcad90807c4e60680b68d.png', '23f2147d2ef7593c480845a4e851e9beb480c4d0.png', 'c596eb3b9eb28dd0e4b8e2bb05c50e9e890df918.jpeg', 'fd1843ec1228d4eae3103eea9a1b1376a51f4318.png', '8e4142ba415ce9945e599a93333f073189c1c9c3.png', 'efc6c59334cd1b8a8d7f68270399151345450748.png', '6430e807cc459729c293961ebb31a3e9cf303c39.jpeg', 'f5a4b1a51dc25aa52877e518033ebfeb5b88a786.png', '751f5da1c62f5f08a21c35d9ce162bbc7c98d231.png', 'dbbd392357d250118c3f0a2964f5015ba183b6bc.png', '78bf4194f14a229170f71ed93181de9be8fa1af9.png', '22229ebcf05c04d4f61029a9f09425be3bcd41d5.jpeg', '3a58bd229be946b9d9fc1104e7d2b5e152897ed9.png', '9ec58c5f7e5d507f0c3442923f30a09271d70a1d.png', '99e3cfa367fe55767b37d2243693846fe7a0aac2.jpeg', '0bdabd8eebeb8b3902ac676cfddb300ddf6655c6.jpeg', '0bdabd8eebeb8b3902ac676cfddb300ddf6655c6.jpeg', 'b113e4190d42025ab0b7a95dc6b29f4b8b894f14.jpg', '7c910324bb991b800619ef4f7430a720fe9005d6.jpg', '181522e3590dcb03ce6e0444f1da4f5ef25cfb59.jpg', '7a0c9a6ab723628c4769096ba4f974a67b98e209.jpg', '69ec8db7ae07c423d7fa31844fb019232aa6f5b5.jpg', 'd87601a3684d3f6f8cc02d319daedb6050532927.jpg', '4ee7e51ebc543ab78abcf3717e5d2ba9c72e6880.jpg', '44f4b5ed481a11b7a2281281a86aec95c43ec1bc.jpg', '798e659ca86924c10946b41598c360e89691bfda.jpg', '29f5d7874e16af05ca0f6d9e390198fe46f42c45.jpg', 'b113e4190d42025ab0b7a95dc6b29f4b8b894f14.jpg', 'a346d2d9e521da0df2808f5f2d92ea232a351c38.jpg', '0edfa201802fe83387749378c522a4cb7bba7830.jpg', '26a76d573fd93c995c90c24de70ba955843cc61a.jpg', '1e1bf211baa848d5336a1ab2a80a8da469edc1b7.jpg', 'c580e224d81c73da44d70ae6762e80321d2df1b6.jpg', '234dca12e588d44d996ec0b582cd97e3397db03f.jpg', 'f47a8de374136965a34b5a82807e38b41a6bddfe.jpg', 'f256bd881f7717796e1f70ed9250454f09f49167.jpg', '7b7ac94d2183dbb20b91340ac237d833a2a049ae.jpg', '327f688ab25f89bc3e2df6af2bf9c52890313f50.jpg', '6532b96f69cbe6a2f3ae751f8da91518e85f73e1.jpg', '19695e9bffed93f74e7d633d240811ebf0eb4f86.jpg', '4712530ce4a382a70a646f2fe4d49fe212dd35e6.jpg', 'dae162e6741bfd1fb26661f639e71b09c2a73e2b.jpg', 'f611e08eebb7f3bbf15986a0b30adec3053c5527.jpg', '2e6df0088944af6cbcae6bfcf5c181c4ba997774.jpg', '2dec1492ea62ca01c217fbe0cf5689254087b59d.png', '52455aedb33cd17aa7f910edff31c211215d9779.jpg', 'fddcd572f40566e67d8765a1b26bdda957a870b1.jpg', 'b626dc4b77ecddcd83a1662588ae51039b04525c.png', '3a4ca7798e2c3b36ec51280c32d2a1781c0c2cdf.png', '2254a70be8db24d5ed4e855fd096b448823c53fe.png', '4fcd2412daee8b51faf5386ea004ff123df10873.png', '03f851d40b30b1a54f71262dc912f4f07e28261f.png', '7fe1a3825e1d0a2864d55153d0e8f5fdc274eaca.png', 'ff52b9e0bf4285ec0b5f7b1e136289594f213c29.jpg', '9f0ef455d3aeef642283b005137dc3edd29505d5.png', 'd4976095e34823c14dd4c97f27188dfa658a016b.png', 'e5059a8ad2e79f5ddebdfe7fc536b580c2d0f16f.png', '0d152e4701d8b36978fea14cb8ef30013e4c92e4.png', '183abfc64934a6ddfd6f1b42fb862ed1628ea1c5.svg', '429b811e059cf7b2cee42c429625a3c7ed924fd8.svg', '38a1fce8b2db6699d161c63faf47157c3df51ef3.svg', 'c2b8a1407c77ffe92baa92e69fcdd7260f8fad86.svg', '70abb6b280148211208d3d31a8069694f1d3cc0b.png', 'c54068cd2c55115d7af20c8a98d309bdd1a1710f.png', '43a19ca25476ca65b19239d32f640ba208317593.png', '770daa663efed09467208c93b872a46b095b816c.png', 'ef99a1e25cc2690ec4d624d613e863d34c4ff06f.png', 'b1b34862d15292de6d66fe00aab3682da19ce51f.png', '679e866cfabbc60312bc563d3b9968ad2b879864.jpg', '573049388d0c82756fc4c15db6f3c821ebfe1b63.svg', '71ac471f28bf55a11d7d7d43260229c4e908f55c.svg', '48c53d04046c8f9be78c240a72b4ee2a13fc5a41.png', '964036a4456b0171bc1d9a2728a8f2c9444eb09b.png', 'dc789c463344923359973e79935f1a8baa410f91.png', 'efab24d6f43e6a99ef74d9843ba9ef257422a250.png', '3b592fc37bf782b99c0c832ec85627cc6f9db729.svg', '1a0b5622f671611c0122f9a3eca1471cb34bc2dc.gif', '4fe2aaa4e5bd48c3b8822b2baa29aa091969edef.jpg', '6dc088bd612be72372614e605e6e580509a1c08a.png', 'aafa8d0b011443c71d13f42998167c1e48cb9cf9.jpg', 'c767a51110921cee7389b824b3575b9dffb311ef.jpg', 'd48436fa61665bb835d4dcf55c1109012e62ed9c.jpg', '6ee42659d9d29453fc7338345bae11c146ae1e8e.jpg', 'c701068e09e64cef1f888e9cc1c30401d602ec10.jpg', 'f685731568b74edadcbe1283ba483f7dfbca82c7.jpg', '01d875597e609498c64462213f321b3691cf143f.jpg', '05122cc323e7cee2071cc54b78a1618bf8536534.jpg', 'cf43eab8c98b30d310f3bd19961145afd8f35296.gif', '4a2a8f8ea2449d8e30dbaf9a800e7a0a81e4dd4b.jpg', 'e394b10a6f0be0908f1a05a344f19b51e76c090d.gif', 'f0a3f976b8064e983ea6ad15fbd17b77e1c5cc8c.jpg', '7958bdd557cf8046ac070fb0ffc1e0580b0564c8.jpg', 'fa7b37d8a296662626559f11d55ee729858acee7.jpg', '42d3fd1d4f11bc22a7d6f98d058eeacd4a3ca6ca.jpg', 'ff3d4558217db80ceaea39193cd18b9f05bfb8f6.jpg', '706d036d1410f360cc0b8765daf3a1863d04ab5e.gif', '32883b25a79f3294b9063a784a8bd8a18a87cda8.jpg', 'c93da96c8aa05ec4359c1cd5c65525ac02854d9b.png', 'c29f93dd506617d101bf18b3096ee8259633142b.png', 'c29f93dd506617d101bf18b3096ee8259633142b.png', '44a906d1e69ffac6891c2c7dc3b3e5db8d9a8f06.png', 'e11498224bccaf91091574b3bb4f1c0544ada9f5.png', '0925434e999bfbe3a7ef9ab334782269146caa16.png', 'e7c5f3f097fe555f30f15b74cc22186ee05dc9ec.png', 'a8caf8a7df74386e68b2ae3034ef6dcd55d82c1d.png', 'b00a51bbb1834609a2a61e63b8e18e42cd3564c3.png', '94995a589dfd9ed1e04060037865a1fe9e5630ff.png', 'c29f93dd506617d101bf18b3096ee8259633142b.png', 'd5d931bb3aadd17db8576ea032f7b23037560402.png', 'e7c5f3f097fe555f30f15b74cc22186ee05dc9ec.png', 'c29f93dd506617d101bf18b3096ee8259633142b.png', '44a906d1e69ffac6891c2c7dc3b3e5db8d9a8f06.png', 'e11498224bccaf91091574b3bb4f1c0544ada9f5.png', '0925434e999bfbe3a7ef9ab334782269146caa16.png', '44a906d1e69ffac6891c2c7dc3b3e5db8d9a8f06.png', 'e7c5f3f097fe555f30f15b74cc22186ee05dc9ec.png', '458b2074cc3aced9fee217b2bdf92916f073ec73.png', '5c170c3f8db9eaac189876d12871d91a5ef10edf.png', 'af3b670fed640967dc6fc355eab2e620d4df2d5c.png', '854f5c12778307dc96a24bc9f53881a1e9e15545.png', '4078e143aed65cbd58398b0214724dce1956facd.png', '0af6de12dc9598d0f906f7a1e32fe978a10a27d1.png', '1f45adea8ea56985ea321b570571308a84a5acc0.png', 'f67a39687572909ab5268d6e4aa4f1d3f0c98a63.png', '5673d5394732e6d7a53fdec0ad568bbd278db5d4.png', '829a91ebaebbe11bbbf26c90c918071b0ca6c4cc.png', '817946a550478a2ddd73cc40e23f98a9327d6fc7.png', '15c4221708dc184bbd512bb549e650a7dd6beac8.png', '5fa70e319ba61566b94de70d07c9b7e2c36bb1f3.png', 'aeb9626358631e54331bc465132467777a02fe45.png', 'bb5f88653fb9ef13165ab62ed233a15d013322b0.png', 'b1146ca22bdf34ced689e5e05ec274d2263d3312.png', '5621ac32a31905c6c19110f343d03bc232677ae2.png', 'bd947ea27590b2ac0a70121e3249dfe5e1a1b6bf.png', '7dc7bb5cae0edde5b91f5bb21c5fed6cbdba66db.png', 'ebb38a47b33be3b12a7cdd8a2cd8fa2f430ad0f4.png', '41c4f77fa86f5bea988f2772600bc65cdc2830f4.png', '76f3b38150d216b77253a069bb871cfe79fb5dc6.png', 'e06a666b90cc402bbec3eaa61d95861d4008ec7c.png', '88b1a595b0fe52de549deebb282ec12b148e0b59.png', 'd05b89a80d6dbaf9d5e79e587db9738a22493eae.png', '2c148e38af95f412c0089f707b16b9914b5620a9.png', '6ee14ae1368c05ffaadb52b3b10293794aeaed63.png', '322398ad90b2e0c73c94cfe0a498d5978e92dcc3.png', 'f16d2598910596dc64ba617e6aaa48f4cfde3d02.png', '4721b8c9daa8bb2953c3a35cff09d46ab7ff768c.png', '322398ad90b2e0c73c94cfe0a498d5978e92dcc3.png', '831e7d525500ef37407c19f0772fb9145d3a226e.png', '429eaf746b50dea67085d951e05badec89ac57aa.png', '322398ad90b2e0c73c94cfe0a498d5978e92dcc3.png', '6e826795a068ad9e5ce16e3da34157d488de50cf.png', 'b21102a00ae89c71025f20cc3318bd0cd2b03fc4.png', '322398ad90b2e0c73c94cfe0a498d5978e92dcc3.png', 'abc0a57541702e0e7283945f1b51229da2c2b7bf.png', '322398ad90b2e0c73c94cfe0a498d5978e92dcc3.png', '322398ad90b2e0c73c94cfe0a498d5978e92dcc3.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '4109d47650dab4948ac9e74775b760e5c374307b.png', '21eb1c3591844202dbcc1418cbe098a97a06efdf.png', '230da4a8bf3dc843c0360c272649cdeef1d7e8a9.png', '3b470a2d9f43e2ed4cfba45472391a64f6565a27.png', 'ad2b7f634fead415378ec6d24a2913860117f0a7.png', '3b470a2d9f43e2ed4cfba45472391a64f6565a27.png', 'ad2b7f634fead415378ec6d24a2913860117f0a7.png', 'd4f7b36c89b3ff2b5a004027308493beb16000b0.png', '2dfbcdfb47b3c8c7e19b3f2ca42e02a19e261299.png', 'd4f7b36c89b3ff2b5a004027308493beb16000b0.png', 'dda042f5e049a33c42b17bcdbab88137d5de32b3.png', '21eb1c3591844202dbcc1418cbe098a97a06efdf.png', 'c3191c08abeefa147daf833c8a4cc834c9783357.png', '52da4c0ee335f62558546b6534fbcc89bfed67d3.png', '3eb35d7a214ea7322f6a5e61defc3049e65a5509.png', '230da4a8bf3dc843c0360c272649cdeef1d7e8a9.png', '52da4c0ee335f62558546b6534fbcc89bfed67d3.png', '3eb35d7a214ea7322f6a5e61defc3049e65a5509.png', '3b470a2d9f43e2ed4cfba45472391a64f6565a27.png', 'd08030211f68b7524325d7337fc017ef5f6235fe.png', 'd4f7b36c89b3ff2b5a004027308493beb16000b0.png', 'ad2b7f634fead415378ec6d24a2913860117f0a7.png', '230da4a8bf3dc843c0360c272649cdeef1d7e8a9.png', 'dda042f5e049a33c42b17bcdbab88137d5de32b3.png', '4a13b2ba5d8eb136836082a9ad54a096f7d4d7f5.png', '230da4a8bf3dc843c0360c272649cdeef1d7e8a9.png', '230da4a8bf3dc843c0360c272649cdeef1d7e8a9.png', '21eb1c3591844202dbcc1418cbe098a97a06efdf.png', 'c3191c08abeefa147daf833c8a4cc834c9783357.png', '52da4c0ee335f62558546b6534fbcc89bfed67d3.png', '3eb35d7a214ea7322f6a5e61defc3049e65a5509.png', '21eb1c3591844202dbcc1418cbe098a97a06efdf.png', '52da4c0ee335f62558546b6534fbcc89bfed67d3.png', '152a4648542b7cc3adad5daa7a7b007fe6684e01.png', '2dfbcdfb47b3c8c7e19b3f2ca42e02a19e261299.png', '191e8c7e97c3fc852e7ccdfd4c8715f79b3f30c1.png', '2dfbcdfb47b3c8c7e19b3f2ca42e02a19e261299.png', '2dfbcdfb47b3c8c7e19b3f2ca42e02a19e261299.png', '2dfbcdfb47b3c8c7e19b3f2ca42e02a19e261299.png', '4fadb50b0f70b2f5fd16a9c2716aadfc33a99202.png', 'b16d5ad42c7eb011c146cf91aaaab3c2f7dae5a7.png', '5f66713ec3ef78601887c30e77cb02dcc7e345ed.png', '0252d4aa2cd15ac15f840fea9969453378e57c85.png', '596968647325adbb8b13e2f488507588087f3624.png', '5ff4a180b2374583c6a366144675e18bb770fca0.png', '5ff4a180b2374583c6a366144675e18bb770fca0.png', '084aebe4784a89fd4c782b7d60fa7b435b805a81.png', '05bd5f392c8479aff5f91a5f8fdbd5f1c028785a.png', '05bd5f392c8479aff5f91a5f8fdbd5f1c028785a.png', 'a6e9aaa710b63cc417611dfc07bd50a100b4dd6c.png', '1c97a32092aba340454dc430a3fbed0906ef7181.png', '7ba087c696a32687dba7096b0bb0ea04d33aa95c.png', '5ff4a180b2374583c6a366144675e18bb770fca0.png', '5ff4a180b2374583c6a366144675e18bb770fca0.png', '5ff4a180b2374583c6a366144675e18bb770fca0.png', '93b11ff9dbb10af23c92041e0e45561bd190cb42.png', '5eed6d83f2cad54d805f4ae1f5ed3fd0dc24f599.png', '75fe3656116ee2831a8574e049db4a3170124bff.png', '36ed1c5648b776d3a897bec83fb6e84a970a1f62.png', '5a2ed27d1f71f46a3f7261c9dae21b00a1e41d1a.png', 'acfb2875a237068d9cfcbe2b8549ce1fee07a24d.png', 'd1dc4b042958a2714f8fa4955fb2e3a8a1ee8509.png', '70bca4b634182cdf9301fd1052e816ef67a8394f.png', '7671017065f37668fba009112a4e31c6d2c26273.png', '772c979c79413aa00438f6d5d0ef04f703c5973d.png', 'd1dc4b042958a2714f8fa4955fb2e3a8a1ee8509.png', '132b27ca0d3cbe4f451b5840cb0c82818a78a914.png', '5a2ed27d1f71f46a3f7261c9dae21b00a1e41d1a.png', '70bca4b634182cdf9301fd1052e816ef67a8394f.png', '772c979c79413aa00438f6d5d0ef04f703c5973d.png', 'acfb2875a237068d9cfcbe2b8549ce1fee07a24d.png', '70bca4b634182cdf9301fd1052e816ef67a8394f.png', '132b27ca0d3cbe4f451b5840cb0c82818a78a914.png', '772c979c79413aa00438f6d5d0ef04f703c5973d.png', 'acfb2875a237068d9cfcbe2b8549ce1fee07a24d.png', 'd1dc4b042958a2714f8fa4955fb2e3a8a1ee8509.png', '5a2ed27d1f71f46a3f7261c9dae21b00a1e41d1a.png', '780ab24f3d29cc82766cbf035d2d336e1b37c397.png', '132b27ca0d3cbe4f451b5840cb0c82818a78a914.png', '70bca4b634182cdf9301fd1052e816ef67a8394f.png', '7671017065f37668fba009112a4e31c6d2c26273.png', '772c979c79413aa00438f6d5d0ef04f703c5973d.png', 'acfb2875a237068d9cfcbe2b8549ce1fee07a24d.png', 'd1dc4b042958a2714f8fa4955fb2e3a8a1ee8509.png', '70bca4b634182cdf9301fd1052e816ef67a8394f.png', 'acfb2875a237068d9cfcbe2b8549ce1fee07a24d.png', 'd1dc4b042958a2714f8fa4955fb2e3a8a1ee8509.png', '772c979c79413aa00438f6d5d0ef04f703c5973d.png', '772c979c79413aa00438f6d5d0ef04f703c5973d.png', '5a2ed27d1f71f46a3f7261c9dae21b00a1e41d1a.png', '7671017065f37668fba009112a4e31c6d2c26273.png', '07de62c944945352f0711678f8aa08f87072641e.jpg', '5a082c54d603c87e3f67683a045774a8ede737ea.jpg', '5a082c54d603c87e3f67683a045774a8ede737ea.jpg', 'f94185d745340897c9df3528672136b1330315e2.png', 'e2177598493ed693942c555c92836e24a9e1d84c.png', '7b737884b306a09289c99b278a8b46d7aa769e32.png', 'e2177598493ed693942c555c92836e24a9e1d84c.png', '72b75edd5b6e213e28bef0032d00d32dbff60c88.jpg', 'e2177598493ed693942c555c92836e24a9e1d84c.png', '83fc2be336fc313f5cc405770293ec69da65e54d.jpg', '38debcaf08a42429b785fc569c38cfa115129dbe.png', 'c9ab5c40324fb8328e41bae0ee64152a55cfcb11.jpg', '574c7cad8d77892377ca43b4bd82d70eb6f3e32b.jpg', '9bdef60cea87447b6e4ab4716710171d3fa3c29d.png', '60203b930d63eadfb73ecab117852ba760e741d9.png', '1b5dfd0c15dc3a206116e0d043a8dc50f3bf2997.png', 'ff957be152ee848290425368022a902155fe38eb.jpg', '2e68e09566dd5f2d02d641a5c59dd0478c384b98.jpg', '6eeb46d0a9d0bd8d39020b3d2805f3e2ebd485db.jpg', '9fbbe8296520d06b2ecebfbb98c067ee880d5fb2.jpg', 'a3ce4675eea4ece6ec46f893bd90dffd3887919d.jpg', 'a4dfd2c2e8dde487de47b8640496648a7d2a8276.jpg', 'dbf8a8c40262659df20fc58785636dad05d95136.jpg', 'f16e6d21343149880fcf7c817f64c56c3d116b1e.jpg', '40266a17543be969b63ebc17da2603e34ace8c7b.png', 'fb67b980644e378ba78533c80fd13fda5e55f6f9.png', '107eee5d493efe0132e72e9f121cf566f6a97c9f.png', '589e995c3b619474778088b2c84a2341c1d57539.png', 'b7ee926feb5af85f530daf45f93e5b1b07b9b22f.png', 'badc6e7eae095164ea59e70566e11d14673ba813.png', '1edff3955436ab1466e0e89e39ba86bd5250c7ab.png', '928f75283bffa431fa9bdd9e1d9327a38c9c04d5.png', '0708effe74afa785b162f33e9ee40e3d3f2d92de.png', '47c8a0fc93210750592a633209d3d2fa1e02b4c6.png', '3b83dfac1d3634196cab74a619aaaef9e2f9b688.png', '4806d800488cc0c66d44fe80e0d442054b93be16.png', '797a8dee5efccc08c2c797c10417d875f73544c5.png', '7f01eed11df4c0e5d1617c321a00514831b7bfb9.png', '431ad584830af45df4b782526638e8b650864a2d.png', '5e0d5c29e7ad599197920fc346ad9d5b4a48887e.png', 'c992b149a4dc61e93c4e5001e01948ce2a242329.png', '1347af3402894868c0ad7e65e7e1d1759368b964.png', '59fad48da254bb2a50e48bd745254e8f116ba306.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', 'a5708a6bc1c7fd117d5fadf599e965263a0e7b80.png', 'd7754039ab776c142991688052f25d3ef5b95be5.png', 'e9f27d355b71d9dc9415c850aeff6568c6a8fe5e.png', 'fbb0bbb7084a0a59c7eba777c51b4710e2f811d6.png', 'fab6e1af5adaca6dbcd9ff149fee277da78b933c.png', 'edc7fa8e43b456b6a88adb745cccbf663cfd4a05.png', '2ed0df51cbb47b029f2c111d972b156634120b15.png', '0ea97f8c8a305936b73e1e874ab8de888afac0a8.png', 'bea8994808a04e0a9f7b664a4c6ec4f9bf870788.png', 'b904be368a8ac17a2d1f1662f67591235042cc51.png', '47c8a0fc93210750592a633209d3d2fa1e02b4c6.png', '5a7edc4ef95e1ed6459411ac7cb60eeb65990ea3.png', '77af3b043b518110bbb1efe9bf4327b8fc7c9f0c.png', 'c4af1f6977b941ac79781e97b930c0fc6d421af0.png', '17299ab8710c17143a3ad362bb2b324ff492717b.png', '93004dfacfae975899b775c64b34f614466277f0.png', 'd286b18f20275d3d63ea5a0d76bcfe5aaee1a659.png', 'd1b34b7c50f8da7f2ebe864cf74ac2b79d67d0fb.png', '5e0d5c29e7ad599197920fc346ad9d5b4a48887e.png', 'c992b149a4dc61e93c4e5001e01948ce2a242329.png', '63dbd7604f584ed00c2938adb1272b633280e9ee.png', '71a0370be96fd11f14778e25ae3378b3dcd56003.png', '1128f99716dc394508073322fc524eb5fd188252.png', '86e835abe4158133f96a39629b655d56509fedc4.png', '0760cba7cb4723e56fbbc17629943bbf01d6dcf9.png', '54aa4b2b62ba6619f8d15a208232ba0c24339471.png', '7da9d55c7f64781b3acfa61cae15bdf0638caa28.png', 'b7c09c52f8fd1f1c850fa24b47844eaa1731b766.png', '9e53213ac4fa9d4d19f853f9cade1bc4c46601d2.png', '5e8adede78d3a3980e17d761131909f6c8114d4e.png', '01ff6fa562897740e07102f64cf8919433071c37.png', 'be25c7214d604843b43f0c6df80a271585e80f30.png', 'd9d7f913d3d7bf9ca33e3571b21b3a64db0a259b.png', '9d2233aee37b42e7cb584c407075c880d91f59df.png', 'b7c09c52f8fd1f1c850fa24b47844eaa1731b766.png', '828ac57a244a00cc21d5b02a401f0752ef387dab.png', '828ac57a244a00cc21d5b02a401f0752ef387dab.png', '828ac57a244a00cc21d5b02a401f0752ef387dab.png', '828ac57a244a00cc21d5b02a401f0752ef387dab.png', '828ac57a244a00cc21d5b02a401f0752ef387dab.png', '01ff6fa562897740e07102f64cf8919433071c37.png', '5e8adede78d3a3980e17d761131909f6c8114d4e.png', '5f7e9049fd652629b3994ede90e776435a583f22.png', '54aa4b2b62ba6619f8d15a208232ba0c24339471.png', 'a8437b97ed132b3e6f54d7bd45ce7f455773259f.png', '7da9d55c7f64781b3acfa61cae15bdf0638caa28.png', '0760cba7cb4723e56fbbc17629943bbf01d6dcf9.png', 'd9d7f913d3d7bf9ca33e3571b21b3a64db0a259b.png', '9e53213ac4fa9d4d19f853f9cade1bc4c46601d2.png', '49d70d7ec126dddfdf1acad2943a4f1fd5671577.png', 'b8fb20a59e081d2fdfef759a2c44bb09270a0717.png', '1d5710c0370e98f28323fc39d3c05afd0bf19b2a.png', '947db9323975cf00f5f40a0e799abda3b4a7adeb.png', 'ced397ec72481ee18286ab089ac3adacb76645fa.png', 'ec6d6fac030d9bc129dc6b6b26f25266f859b1b0.png', '5a0b712fba3060b63fc925fbff4ff9b42ccc8a24.png', 'f45d19e16735ece938d3b9343a07ff06657f1a1f.png', 'd5c49f83ee26124b1738642539d2bb664df1fbe7.png', 'ec6d6fac030d9bc129dc6b6b26f25266f859b1b0.png', 'ec6d6fac030d9bc129dc6b6b26f25266f859b1b0.png', '1d5710c0370e98f28323fc39d3c05afd0bf19b2a.png', '5a0b712fba3060b63fc925fbff4ff9b42ccc8a24.png', '5a0b712fba3060b63fc925fbff4ff9b42ccc8a24.png', '947db9323975cf00f5f40a0e799abda3b4a7adeb.png', '5a0b712fba3060b63fc925fbff4ff9b42ccc8a24.png', 'd5c49f83ee26124b1738642539d2bb664df1fbe7.png', '49d70d7ec126dddfdf1acad2943a4f1fd5671577.png', 'ec6d6fac030d9bc129dc6b6b26f25266f859b1b0.png', 'ced397ec72481ee18286ab089ac3adacb76645fa.png', 'b8fb20a59e081d2fdfef759a2c44bb09270a0717.png', 'f45d19e16735ece938d3b9343a07ff06657f1a1f.png', '947db9323975cf00f5f40a0e799abda3b4a7adeb.png', 'b78f7a3fe05d3a975d2b3fe5eb5899ea8f6c9707.jpg', '40d30303c4739a00011cd517f34a083685f365f8.jpg', '21c375dcf74515af9d27af2121cfc83184cc0d5d.jpg', 'b78f7a3fe05d3a975d2b3fe5eb5899ea8f6c9707.jpg', 'c624cc0e935590a816a29fab5d7c81e3e11e1c81.jpg', 'b78f7a3fe05d3a975d2b3fe5eb5899ea8f6c9707.jpg', 'c624cc0e935590a816a29fab5d7c81e3e11e1c81.jpg', 'ac04cd804074d29951aaf818d6c56073ae886c23.jpg', 'ac04cd804074d29951aaf818d6c56073ae886c23.jpg', 'a472acd65cff585a0375776b0288f170e35eb75a.png', 'e6cb85aa0bebdf4f137362c623bf6b5c0664f4e4.png', '1c987b58f807c92aa92ef4412a79e8875f7de970.png', 'd269d1602b3f5f3fa04915042710ea9cc1dba8d0.png', '25ece29d4e7dc9788250e6074d8e610357dcbd2d.png', 'b61925807f30652a13cea7970cfd4cd7964fe27c.png', '040d680ad6223c46f3aece650bc3cb4ab22f90da.png', 'e7a91fb417e1ca6c1edee6f3c3e8bcac426de500.png', 'd9d778f5800e4eac0fd3f8f71a4e491c8cd9ade0.png', 'dea3a5047f3b1383c231ae64b07f57fd5a097aa0.png', 'a3897abca71778a5224630f06b18a01890625498.png', 'a9eee764f0f182e8f9e26fd9154ec13e93b1490e.png', '19b3c38c0f119e1d4030e9a2737f0155fb2a680e.png', 'e6cb85aa0bebdf4f137362c623bf6b5c0664f4e4.png', '298264e43b881f3fd79924a08844cdbfe55abd19.png', '4a680c51d021ed2c06e9c5affb351e2dab0961c6.png', '25ece29d4e7dc9788250e6074d8e610357dcbd2d.png', 'e7a91fb417e1ca6c1edee6f3c3e8bcac426de500.png', 'a472acd65cff585a0375776b0288f170e35eb75a.png', '1c987b58f807c92aa92ef4412a79e8875f7de970.png', 'b61925807f30652a13cea7970cfd4cd7964fe27c.png', '3e1162c95b2ebb6fab32b86ed68a5671e6eeed65.png', '332924ec4a1d5f50586510ebb2ed2db339ef236a.png', '26660a2a5d27caa083c9c345c6f29721407bbba2.png', '2fe16272669916de0c5b68dbfe8ccf44f03a2da3.png', 'c88939b5a8265ffa190f60fcb353e30c3cef70a2.png', '5a1457d582052960f66cc7498817a9d283ce7832.png', 'ebf38ea037debf2fa59f9840b9864056bcde730c.png', 'fae6ce417e6d4987e7775cd216606976f39ca4b5.png', '38095c3a04b250c9e62751f5977e1929500b9a94.png', '542ee652e58613af9fe08664a849bd62cc12a1f9.png', '7d2a4d54b61701977d2763a458f9328863b186e6.png', '85d4c52797070e67f6d338a2de24b0237720d99f.png', '0ab6b67295943d1638dab94a71fc593a6d867060.png', 'fa645883e2a3e9276a3515f46048b814791b04e3.png', '9ef6103a6316187f7e80ba9aa8733a848fcaf856.png', 'bed9d2c2a96bbeec25c974ab3e6762857e7c0023.png', 'c35f1276da5564a4acee27b69e2f989b396dca3f.png', 'bc88a48c78b017f9d6bccd611bc1e7a7302d9e06.png', 'd56fde094a84bf2e658d1e7c04a254d7c0996b52.jpg', '671c24fc5b59b66d3ed6a5ed16ff01a673933aae.jpg', 'c01cc8d6f856afebb043669fc81502d72578c145.jpg', '7f677253f4c350e24efe2f8ef02615f3d382ebc2.jpg', '1edb26f475828082e8ebf439406138839ce14704.jpg', '1df10fe6a8f040a43fc5f0874200c024297d063d.jpg', 'b98ff6eed56f47adbaf7ed65db8770aa3b5c8c26.png', 'c8a8090b4f0218f35892cc27295ea10547c75eeb.png', '25aa2f950fbbde399b0ab754a80901f9d7ff675f.png', '2ab76335a97dde91e63866866f653fbb0a62659d.png', '3e3d05c53e615796e6e3b2b66b7d75cf51ce0799.png', '46881239901df5da0c6211bda483164a75975da6.png', '4975f4dddd89b06618e8745f88d9c59363f9a961.png', '6204524ff4ac064c3c84f892f1da6580a8bb8c3b.png', '85c0e280fdd77be85470bb70dfe2346bc3c92f48.png', '93a3784cb8a5ec5040dceaf849f81fa49f34d49e.png', '95de8f2dad6a4d3ae17f4175e728370be3b56f5d.png', 'ac89ac8ca6a6e983b3b66e575af072ae4ef63b29.png', 'e949ed45b334979e64fa391c0d15cdaedc1844c3.png', 'eb89dc0230e2c8d9690e0b5af9b773f9e2ba7289.png', 'fbaa287b667a8927a6da494d93129f7a7c4b4d3d.png', '82a78eea5f4de76a5efafc3831420bb7762882cc.png', '8e518475587bc83767c72b49ff094e5870c3edc3.png', 'd47dd729727c7224a813fb318ea26ab564101dc0.png', '31ced71c255cd71862b994de90f32eeee2f34905.png', '382dacf41488d9356131f02b17829e37a8940e20.png', '884fa0e99a3d27bb001bbba669d031475763005d.png', 'bdd628ca3178f62fee661e79d763264afdcccb5b.png', '67ef2122561d5a960318977e940d0d7cf08f5069.png', 'f87bcf93cca18c9002d69990faa4f2e380c27de6.png', '604a22acfd23911f89eeabb1986c4ffc64d2f1f1.png', '85c0e280fdd77be85470bb70dfe2346bc3c92f48.png', 'c8a8090b4f0218f35892cc27295ea10547c75eeb.png', '46881239901df5da0c6211bda483164a75975da6.png', 'ac89ac8ca6a6e983b3b66e575af072ae4ef63b29.png', 'b98ff6eed56f47adbaf7ed65db8770aa3b5c8c26.png', '2ab76335a97dde91e63866866f653fbb0a62659d.png', '95de8f2dad6a4d3ae17f4175e728370be3b56f5d.png', '81d8167e495fcfa439f8027b51a364505a4de940.png', 'a742275c92712a599d5aa3c44a4b3d722b7fd7b3.png', '422ea66524b728af1e0b01b191261d773ef33000.png', '7c250639821d46d4b052179bad6fea24aebfd364.png', 'c1a0a055dbb5f149c36c3d7c24e7de2a82edd4eb.png', 'a747a4c22eea3844e5de210b044a5e5f268ad286.png', 'e6da509a69a9e4c6ad132b46bd21519a91f6faaf.png', '6ca16dd397d3ecc380e676687fb29d6a6eecd36e.png', '7e05ad124205aa8fec76d8dbcc9950c65f83211e.png', '7e05ad124205aa8fec76d8dbcc9950c65f83211e.png', '41c32ef7bfc321fecf69bbd08296a999c75c5dff.png', 'cabdfe35ef63ec13172d25ece68bbe959aadf11b.png', 'cabdfe35ef63ec13172d25ece68bbe959aadf11b.png', '515e4d280c6ae6ea926639b0056c81ded169a2b6.png', 'a827acfbe30043fc05153301c69c7151fee2d1b5.png', '4183f716cf72c894bc7c7af3395b8fa278ce5f08.png', '7a9f878b1d533098d98b946c641493b8ed45b1aa.png', '42f2902b7263a462cb4490e019152442cb330a5e.png', '55aafda9e0d1cf78e454ddbb53cd21590ebf41a4.png', '36a18e4dfe523c112f785fa7df2737e82cedaa9e.png', 'a827acfbe30043fc05153301c69c7151fee2d1b5.png', '2fdbecb21eb2922203b3d581e26a0884ee1ac33f.png', '94c4289a39ed81202e087a90b8cbce1087291e7b.png', '651bb523f9946c1b768b0a56d22971643bbbf005.png', 'd02f3686df7629c185af44b1b44db9d84068d3dc.png', '21047f4b201cf70dc39a31afc35107b3d8e27c3b.png', 'addc27aa8bd2a341fdfa513c5d2bf41f4de76b55.png', '1ffceecb3ceff7788ee8e4e5596f1c1af25b7bd9.png', '97d89c786fac6db7b088f1c4f4a8eb6e96098a13.png', '0af73fdd5b7d797084a8b4ea1c4d9cdaaf4c2c0f.png', 'd2ec2576881a5a12dde03f10e111c14364200723.png', 'd02f3686df7629c185af44b1b44db9d84068d3dc.png', '21047f4b201cf70dc39a31afc35107b3d8e27c3b.png', 'b4bb834ff025f2dc8dad31dc09ba27ce4be4a853.png', '2f306d4daba894464c9b1e80b8485853bbc2e57c.png', '573b53f7271a8c1c4135203f0db213326319e21a.png', '80fdba89d7530dbd18808d21a2714894cec86a0f.png', 'afb6fe2990839a9ef6c806f08fc2f54f70083bb8.png', 'b93c8c2e892280403a06eef0e549ef9bdf0ccfeb.png', '25e6d24dc9a7888b40566c6ce45640becb89bd0d.png', '2bdf9bce95b11bac3a8a279a49b2c620ff5526c6.png', '12031b64aabe9c2c9981848a366b31548b0fec01.png', '381e61c3876d99071d939ba31494836354ec91a5.png', '6d799cbc83a98305860c8cc98d4f696d2ce51606.png', 'e2b966cb0c8bf8fc914b21b6c63c219ebc683f42.png', '3e6d190577b77fb83522e998de1baa7ca0a666c1.png', 'afb6fe2990839a9ef6c806f08fc2f54f70083bb8.png', '80fdba89d7530dbd18808d21a2714894cec86a0f.png', '2bdf9bce95b11bac3a8a279a49b2c620ff5526c6.png', 'd673c679274688d223997926275fa8b48554c34f.png', 'e9e3f328609254c8cf223f2733bc48944bd95939.png', '1367c8e9144ea02de9ef3568dd41672f58ceb1a6.png', '8b26c351be1cfa93d0bd5b89c7d3111dd67ff597.png', '25e6d24dc9a7888b40566c6ce45640becb89bd0d.png', '7e05ad124205aa8fec76d8dbcc9950c65f83211e.png', '9f9505df4a5ac9874440826cda06f7fe749672e6.png', '04dc7e859ae6851b2346870fb0521845c6161fa2.png', '00862cc6549217d17e78fe56c8b7884df557ca04.png', 'ce375e1a2ba69e648eb5fee0732039e49a70faad.png', '2972c24b48ea68185fc8f4c8a5e29e1c8685f3dc.png', 'ce375e1a2ba69e648eb5fee0732039e49a70faad.png', 'd9e1016bde4a8864cac555b9e2f4b79b36990c41.png', 'ec305e6623a70d6218f768792fbced8a4eaa4c97.png', '4e8e002138ce7d6afef024a70c07458031750da0.png', 'ec305e6623a70d6218f768792fbced8a4eaa4c97.png', '55a393bb92fb9c4af6cc364ed86594c45d0f3ae9.png', 'bb9bf74ef08319204cd37bdff0f4fa77a5107883.png', 'c879cbcf24960d9d6a8b717c63c77478162ff6bf.png', '12d6328dd4fc0ae13f64dbe853d6399bec3224e7.png', '8558cc64a9281bea47215a16ef60947caf8b31a2.png', 'ec305e6623a70d6218f768792fbced8a4eaa4c97.png', '12d6328dd4fc0ae13f64dbe853d6399bec3224e7.png', '8558cc64a9281bea47215a16ef60947caf8b31a2.png', '12d6328dd4fc0ae13f64dbe853d6399bec3224e7.png', '55a393bb92fb9c4af6cc364ed86594c45d0f3ae9.png', 'bb9bf74ef08319204cd37bdff0f4fa77a5107883.png', 'c879cbcf24960d9d6a8b717c63c77478162ff6bf.png', '4e8e002138ce7d6afef024a70c07458031750da0.png', 'ec305e6623a70d6218f768792fbced8a4eaa4c97.png', '8558cc64a9281bea47215a16ef60947caf8b31a2.png', 'ec305e6623a70d6218f768792fbced8a4eaa4c97.png', '55a393bb92fb9c4af6cc364ed86594c45d0f3ae9.png', 'c879cbcf24960d9d6a8b717c63c77478162ff6bf.png', '8558cc64a9281bea47215a16ef60947caf8b31a2.png', 'd9e1016bde4a8864cac555b9e2f4b79b36990c41.png', 'ec305e6623a70d6218f768792fbced8a4eaa4c97.png', '96fc874584e6ffddb3c3f0102a717e109fbc5fff.svg', 'a3acc8b138283bddf6b7fdee93dbffbedbe2952f.svg', '36b2b34be89c0136a6d99e3984e5e159285d6059.svg', '5620bb84d8b410f9f638ef88deb34553203ba9ef.svg', '756519dc10ca31327d4f4582567e513733c64bdb.svg', '36b2b34be89c0136a6d99e3984e5e159285d6059.svg', '5620bb84d8b410f9f638ef88deb34553203ba9ef.svg', '756519dc10ca31327d4f4582567e513733c64bdb.svg', 'a3acc8b138283bddf6b7fdee93dbffbedbe2952f.svg', '45340ccfc329197224f3a2c23cd1e63e91a966b2.svg', 'eaea1d543f3b7d36194c71dff53642f26cddc5f2.svg', '32c7a573e9e963b06b7f54b4b0bb1a4b0f270032.svg', '1f097d47a513b1391dc6a1c87f6239ff94ed4655.svg', 'b632b283f86f47717c95ae57466ecd8b5a22cf2a.svg', '73c34b786758d6ec9af543d0bef0239e5a0424e5.svg', 'c16669e48ca32ef35df9118489958cebdb5fe395.svg', '3fc9704cf3e0bc535dbb6797930248c0d572ab77.svg', '3f2dd92ab263448279402ef4fdf77b6875d67b15.svg', '812def0b4f304b81ae45e26e66b16312aa146f35.svg', 'bb512ee137c57bc36028e1d36f22b3e109be05b2.svg', '96455e8c2cadfa77dabb70b0e4375595138faaa8.svg', '7a1b528d31199e7c974858379e371e288af3c776.svg', '410e6a1c87e65d9c817b45470e44492006dce7db.svg', '0b53470eb5c0f4c6dc4dd12b4ad458ad1e2b7b09.svg', '2f6a7e329ef0b0a66db8e59c62a163f5aca46e55.svg', '5fcbd164f89dce424323b7fa8aff14b860b979a6.svg', '047f06b9847a2f81ba8b126e7cf5cd13636308d4.svg', '46b42d6876c7606fb45468c7f25f4edd53a5f627.svg', '53b154a1a5cdd2b0cea7f6762ff65f828f88747e.svg', '1d13efcc037886d0f0ce519e09128cefbf391e14.png', '0ae4ed07ef7a2508f717454da5c142670a5fe5b9.png', '0ae4ed07ef7a2508f717454da5c142670a5fe5b9.png', 'ad02bad9aae1115c2fe4b253c9c2cb35a34f9d85.png', 'fea6150ec835b7bdad8b7c829adc6101f83f6763.jpg', '59ba2f44a1124aa6ba04fe93b106f5691b6efd56.jpg', '41882b1e35751ab95099d85422ac155b79e1a95f.jpg', 'c93da96c8aa05ec4359c1cd5c65525ac02854d9b.png', 'df7eb2b6785098a59e3c1602ecdbae5053b0ef8a.png', 'e053bd3044a9ebcf28eaaa1e38b03b55c90481fe.png']
-    pool = multiprocessing.pool.ThreadPool(50)
-    pool.map(imager, hashes)
+    download(read_manifest(manifest), 'images')
+
+
+def main():
+    global folder, rate_limit, use_pack
+    parser = argparse.ArgumentParser(description='Download images, image generation scripts or label data.')
+    parser.add_argument('work', choices=['images', 'scripts', 'labels'],
+                        help='what to download')
+    parser.add_argument('--manifest', type=str, default=None,
+                        help='hash manifest file (default: manifests/images.txt or manifests/scripts.txt, '
+                        'labels: hashes of the downloaded scripts)')
+    parser.add_argument('--folder', type=str, default=None,
+                        help='download folder (default: ' + folder + ')')
+    parser.add_argument('--plan', action='store_true',
+                        help='print the number of present and missing files per shard, download nothing')
+    parser.add_argument('--verify', action='store_true',
+                        help='check the present files against their recorded size and content hash, '
+                        'remove the bad ones, download nothing')
+    parser.add_argument('--adopt', action='store_true',
+                        help='record the present files without a download record as ok when they pass the check '
+                        'of --verify, download nothing (the others are downloaded again)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='also fetch the present files again when changed (If-None-Match with the recorded ETag)')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='max requests per second (default: no limit)')
+    parser.add_argument('--pack', action='store_true',
+                        help='store the scripts and labels in the pack of the download folder (see pack.py)')
+    args = parser.parse_args()
+
+    if args.folder is not None:
+        folder = os.path.join(args.folder, '')
+    rate_limit = args.rate
+    use_pack = args.pack
+
+    if args.manifest is not None:
+        hashes = read_manifest(args.manifest)
+    elif args.work == 'images':
+        hashes = read_manifest(images_manifest)
+    elif args.work == 'scripts':
+        hashes = read_manifest(scripts_manifest)
+    else:
+        hashes = label_hashes()
+
+    if args.plan:
+        print_plan(hashes, args.work)
+    elif args.verify:
+        verify(hashes, args.work)
+    elif args.adopt:
+        adopt(hashes, args.work)
+    else:
+        download(hashes, args.work, args.refresh)
 
 
-work_images()
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+import http.server
+import urllib.request
+import multiprocessing.pool
+
+import fetcher
+
+
+# Benchmark of the downloader engines against a local HTTP stand-in
+# server: the thread pool with urllib.request.urlretrieve (the former
+# downloader) and the asyncio engine with keep-alive (fetcher.py).
+# The server can delay each new connection (a TLS handshake stand-in)
+# and each response (latency), and inject faults: 503 responses (S3
+# SlowDown), connections reset without a response and truncated bodies.
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """ Answer any GET with a body of the configured size.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        time.sleep(self.server.connect_delay)
+        http.server.BaseHTTPRequestHandler.setup(self)
+
+    def do_GET(self):
+        time.sleep(self.server.response_delay)
+        if self.path.endswith('/missing'):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        fault = self.server.random.random()
+        if fault < self.server.error_rate:
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        fault -= self.server.error_rate
+        if fault < self.server.reset_rate:
+            self.close_connection = True
+            return
+        fault -= self.server.reset_rate
+        body = self.server.body
+        if fault < self.server.truncate_rate:
+            self.close_connection = True
+            body = body[:len(body) // 2]
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    # the default listen backlog (5) drops concurrent connects
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def start_server(body_size, connect_delay, response_delay, error_rate=0.0, reset_rate=0.0, truncate_rate=0.0,
+                 seed=0):
+    """ Start the stand-in server in a thread. Returns the server.
+    The rates are the fractions of requests answered with a fault.
+    """
+    server = StandInServer(('127.0.0.1', 0), StandInHandler)
+    server.body = os.urandom(body_size)
+    server.connect_delay = connect_delay
+    server.response_delay = response_delay
+    server.error_rate = error_rate
+    server.reset_rate = reset_rate
+    server.truncate_rate = truncate_rate
+    server.random = random.Random(seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def thread_pool_download(jobs, threads):
+    """ The former downloader: urlretrieve per file in a thread pool.
+    """
+    def retrieve(job):
+        (link, filename) = job
+        try:
+            urllib.request.urlretrieve(link, filename)
+        except urllib.error.HTTPError:
+            pass
+
+    pool = multiprocessing.pool.ThreadPool(threads)
+    pool.map(retrieve, jobs)
+    pool.close()
+
+
+def asyncio_download(jobs, threads, **options):
+    """ The asyncio engine, same concurrency. Prints the status counters.
+    """
+    stat = fetcher.download_all(jobs, concurrency=threads, host_connections=threads, **options)
+    print('{:12} status {}, {} retries, {} failed'.format(
+        '', sorted(stat['status'].items(), key=str), stat['retries'], len(stat['failed'])))
+
+
+def measure(name, func, base_url, nb_files, threads):
+    """ Download nb_files into a new directory. Prints files per second.
+    """
+    folder = tempfile.mkdtemp(prefix='download_bench_')
+    try:
+        jobs = [(base_url + '/{:040x}.png'.format(i), os.path.join(folder, '{:040x}.png'.format(i)))
+                for i in range(nb_files)]
+        start = time.perf_counter()
+        func(jobs, threads)
+        elapsed = time.perf_counter() - start
+        nb_done = len(os.listdir(folder))
+        print('{:12} {:6} files in {:7.3f} sec, {:8.1f} files/sec'.format(
+            name, nb_done, elapsed, nb_done / elapsed))
+    finally:
+        shutil.rmtree(folder)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the downloader engines.')
+    parser.add_argument('--files', type=int, default=2000, help='number of files')
+    parser.add_argument('--size', type=int, default=16384, help='file size in bytes')
+    parser.add_argument('--threads', type=int, default=50, help='concurrency')
+    parser.add_argument('--connect-delay', type=float, default=0.02,
+                        help='server delay of a new connection in seconds')
+    parser.add_argument('--response-delay', type=float, default=0.005,
+                        help='server delay of a response in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of requests answered with 503')
+    parser.add_argument('--reset-rate', type=float, default=0.0,
+                        help='fraction of requests whose connection is closed without a response')
+    parser.add_argument('--truncate-rate', type=float, default=0.0,
+                        help='fraction of responses whose body is cut in half')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='asyncio engine: max requests per second')
+    parser.add_argument('--backoff', type=float, default=0.05,
+                        help='asyncio engine: seconds before the first retry')
+    parser.add_argument('--progress', type=float, default=None,
+                        help='asyncio engine: seconds between throughput lines')
+    parser.add_argument('--skip-thread-pool', action='store_true',
+                        help='measure the asyncio engine only')
+    args = parser.parse_args()
+
+    server = start_server(args.size, args.connect_delay, args.response_delay,
+                          args.error_rate, args.reset_rate, args.truncate_rate)
+    base_url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+    print('{} files of {} bytes, concurrency {}, connect delay {} sec, response delay {} sec'.format(
+        args.files, args.size, args.threads, args.connect_delay, args.response_delay))
+    if args.error_rate or args.reset_rate or args.truncate_rate:
+        print('faults: {} errors, {} resets, {} truncated'.format(args.error_rate, args.reset_rate, args.truncate_rate))
+
+    if not args.skip_thread_pool:
+        measure('thread pool', thread_pool_download, base_url, args.files, args.threads)
+    measure('asyncio', lambda jobs, threads: asyncio_download(
+        jobs, threads, rate=args.rate, backoff=args.backoff, progress=args.progress), base_url, args.files, args.threads)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
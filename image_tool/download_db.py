@@ -0,0 +1,114 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+
+
+# Record of the downloaded files in a SQLite database in the download
+# folder: url, size, ETag and status per file. A file on the disk without
+# an ok record (an interrupted, a bad or an unrecorded download) is
+# downloaded again unless the adopt pass records it, the ETag makes a
+# conditional re-fetch, and the verify pass checks the files against their
+# size and the content hash of their name.
+
+DB_NAME = 'downloads.sqlite'
+
+# file status
+OK = 'ok'
+FAILED = 'failed'
+BAD = 'bad'
+
+# number of records per transaction
+COMMIT_SIZE = 500
+
+# a file named by the sha1 hex digest of its content, e.g. images
+hash_name = re.compile(r'^([0-9a-f]{40})(\.[A-Za-z0-9]+)?$')
+
+
+class DownloadDB(object):
+    """ Download records keyed by file name.
+    """
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS files ('
+                          'filename TEXT PRIMARY KEY, url TEXT, size INTEGER, etag TEXT, '
+                          'status TEXT, reason TEXT, updated REAL)')
+        self.nb_pending = 0
+
+    def record(self, filename, url, status, size=None, etag=None, reason=None):
+        """ Insert or replace the record of a file.
+        """
+        self.conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)',
+                          (filename, url, size, etag, status, reason, time.time()))
+        self.nb_pending += 1
+        if self.nb_pending >= COMMIT_SIZE:
+            self.commit()
+
+    def get(self, filename):
+        """ Get (url, size, etag, status) of a file, None when not recorded.
+        """
+        return self.conn.execute('SELECT url, size, etag, status FROM files WHERE filename = ?',
+                                 (filename,)).fetchone()
+
+    def filenames(self, status):
+        """ Get the set of file names with a status.
+        """
+        return {row[0] for row in self.conn.execute('SELECT filename FROM files WHERE status = ?', (status,))}
+
+    def sizes(self):
+        """ Get {filename: size} of the ok files.
+        """
+        return dict(self.conn.execute('SELECT filename, size FROM files WHERE status = ? AND size IS NOT NULL',
+                                      (OK,)))
+
+    def etags(self):
+        """ Get {filename: etag} of the ok files with an ETag.
+        """
+        return dict(self.conn.execute('SELECT filename, etag FROM files WHERE status = ? AND etag IS NOT NULL',
+                                      (OK,)))
+
+    def commit(self):
+        self.conn.commit()
+        self.nb_pending = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def content_hash(filename):
+    """ Get the sha1 hex digest a file is named by, None when the name is not one.
+    """
+    match = hash_name.match(os.path.basename(filename.replace('\\', '/')))
+    return match.group(1) if match else None
+
+
+def check_file(filename, size=None, check_hash=False):
+    """ Check a downloaded file against its recorded size and, with check_hash,
+    the content hash of its name. Returns None when fine, or the reason.
+    """
+    try:
+        actual_size = os.path.getsize(filename)
+    except OSError as e:
+        return str(e)
+    if actual_size == 0:
+        return 'empty file'
+    if size is not None and actual_size != size:
+        return 'size {} instead of {}'.format(actual_size, size)
+
+    expected = content_hash(filename) if check_hash else None
+    if expected is not None:
+        digest = hashlib.sha1()
+        with open(filename, 'rb') as infile:
+            for chunk in iter(lambda: infile.read(1 << 20), b''):
+                digest.update(chunk)
+        if digest.hexdigest() != expected:
+            return 'content hash ' + digest.hexdigest()
+    return None
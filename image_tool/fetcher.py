@@ -0,0 +1,428 @@
+import os
+import ssl
+import time
+import heapq
+import random
+import asyncio
+import urllib.parse
+
+
+# HTTP client of the downloader: asyncio, keep-alive connections reused
+# per host, bounded number of concurrent downloads and streaming writes.
+# Requests can be rate limited (token bucket), transient errors are
+# retried with exponential backoff, and a throughput line is printed
+# periodically. Standard library only.
+
+# default number of concurrent downloads
+CONCURRENCY = 50
+
+# default max number of connections to one host
+HOST_CONNECTIONS = 50
+
+# read size of a response body
+CHUNK_SIZE = 1 << 16
+
+# seconds to wait for a connection or a read
+TIMEOUT = 60
+
+USER_AGENT = 'KAScripts-image_tool'
+
+# default number of retries of a transient error
+RETRIES = 5
+
+# seconds before the first retry, doubled each retry, and the max
+BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+# status of a throttled or failing server, retried
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# transient network errors, retried. A local file error is not.
+RETRY_ERRORS = (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError)
+
+
+class HTTPStatusError(Exception):
+    """ Non 200 response status.
+    """
+    def __init__(self, status):
+        Exception.__init__(self, 'HTTP status {}'.format(status))
+        self.status = status
+
+
+class Connection(object):
+    """ One keep-alive HTTP/1.1 connection.
+    """
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.nb_request = 0
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool(object):
+    """ Idle keep-alive connections per (scheme, host, port).
+    """
+    def __init__(self, host_connections, timeout):
+        self.host_connections = host_connections
+        self.timeout = timeout
+        self.idle = {}
+        self.semaphores = {}
+        self.ssl_context = ssl.create_default_context()
+        self.nb_open = 0
+
+    def semaphore(self, key):
+        if key not in self.semaphores:
+            self.semaphores[key] = asyncio.Semaphore(self.host_connections)
+        return self.semaphores[key]
+
+    async def acquire(self, key):
+        """ Get an idle connection of the host, or open a new one.
+        The caller holds the host semaphore.
+        """
+        idle = self.idle.get(key, [])
+        while idle:
+            conn = idle.pop()
+            if not conn.reader.at_eof():
+                return conn
+            conn.close()
+
+        (scheme, host, port) = key
+        ssl_context = self.ssl_context if scheme == 'https' else None
+        (reader, writer) = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context, limit=CHUNK_SIZE),
+            self.timeout)
+        self.nb_open += 1
+        return Connection(reader, writer)
+
+    def release(self, key, conn, reusable):
+        if reusable:
+            self.idle.setdefault(key, []).append(conn)
+        else:
+            conn.close()
+
+    def close(self):
+        for idle in self.idle.values():
+            for conn in idle:
+                conn.close()
+        self.idle = {}
+
+
+async def read_headers(reader, timeout):
+    """ Read the status line and the headers.
+    Returns (status, header dict with lower case names).
+    """
+    line = await asyncio.wait_for(reader.readline(), timeout)
+    if not line:
+        raise ConnectionResetError('connection closed')
+    parts = line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise ConnectionError('bad status line: {!r}'.format(line))
+    status = int(parts[1])
+
+    headers = {}
+    while True:
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        if line in (b'\r\n', b'\n', b''):
+            break
+        (name, _, value) = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return (status, headers)
+
+
+async def read_body(reader, headers, out_file, timeout):
+    """ Stream a response body into out_file (None discards it).
+    Returns True when the connection can be reused.
+    """
+    async def copy(size):
+        while size > 0:
+            chunk = await asyncio.wait_for(reader.read(min(size, CHUNK_SIZE)), timeout)
+            if not chunk:
+                raise ConnectionResetError('connection closed in the body')
+            if out_file is not None:
+                out_file.write(chunk)
+            size -= len(chunk)
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            size = int(line.split(b';')[0].strip(), 16)
+            if size == 0:
+                # trailers
+                while (await asyncio.wait_for(reader.readline(), timeout)) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            await copy(size)
+            await asyncio.wait_for(reader.readline(), timeout)
+    elif 'content-length' in headers:
+        await copy(int(headers['content-length']))
+    else:
+        # until the server closes the connection
+        while True:
+            chunk = await asyncio.wait_for(reader.read(CHUNK_SIZE), timeout)
+            if not chunk:
+                return False
+            if out_file is not None:
+                out_file.write(chunk)
+
+    return headers.get('connection', '').lower() != 'close'
+
+
+async def get(pool, url, filename, etag=None):
+    """ Download url into filename through a pooled connection.
+    The body is written into filename.part and renamed when complete.
+    With an etag, the request is conditional (If-None-Match) and a 304
+    response keeps the file.
+    A stale keep-alive connection is retried once on a new connection.
+    Returns (status, size, etag).
+    """
+    parsed = urllib.parse.urlsplit(url)
+    port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    key = (parsed.scheme, parsed.hostname, port)
+    target = parsed.path or '/'
+    if parsed.query:
+        target += '?' + parsed.query
+    condition = 'If-None-Match: {}\r\n'.format(etag) if etag else ''
+    request = ('GET {} HTTP/1.1\r\nHost: {}\r\nUser-Agent: {}\r\n{}'
+               'Accept-Encoding: identity\r\nConnection: keep-alive\r\n\r\n').format(
+                   target, parsed.netloc, USER_AGENT, condition).encode('latin-1')
+
+    async with pool.semaphore(key):
+        for attempt in range(2):
+            conn = await pool.acquire(key)
+            is_reused = conn.nb_request > 0
+            conn.nb_request += 1
+            reusable = False
+            try:
+                conn.writer.write(request)
+                await conn.writer.drain()
+                (status, headers) = await read_headers(conn.reader, pool.timeout)
+                if status == 304 and etag:
+                    # no body
+                    reusable = headers.get('connection', '').lower() != 'close'
+                    return (status, None, etag)
+                if status != 200:
+                    reusable = await read_body(conn.reader, headers, None, pool.timeout)
+                    raise HTTPStatusError(status)
+                part = filename + '.part'
+                try:
+                    with open(part, 'wb') as out_file:
+                        reusable = await read_body(conn.reader, headers, out_file, pool.timeout)
+                        size = out_file.tell()
+                    os.replace(part, filename)
+                except BaseException:
+                    if os.path.isfile(part):
+                        os.remove(part)
+                    raise
+                return (status, size, headers.get('etag'))
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if is_reused and attempt == 0:
+                    continue
+                raise
+            finally:
+                pool.release(key, conn, reusable)
+
+
+def new_stat():
+    """ Get an empty stat dict of download_all.
+    """
+    return {'ok': 0, 'not_modified': 0, 'failed': [], 'connections': 0,
+            'status': {}, 'retries': 0, 'bytes': 0}
+
+
+def count_status(stat, status):
+    """ Count a response status or an error name.
+    """
+    stat['status'][status] = stat['status'].get(status, 0) + 1
+
+
+def error_name(error):
+    """ Get the status counter name of a request error.
+    """
+    if isinstance(error, HTTPStatusError):
+        return error.status
+    if isinstance(error, asyncio.TimeoutError):
+        return 'timeout'
+    return type(error).__name__
+
+
+class TokenBucket(object):
+    """ Rate limit: rate requests per second, bursts up to burst requests.
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = max(burst or rate, 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    async def take(self):
+        """ Wait for a token.
+        """
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def next_job(jobs):
+    """ Get the next job of an iterator or an asyncio.Queue, None at the end.
+    A queue ends with None, which is put back for the other workers.
+    """
+    if not isinstance(jobs, asyncio.Queue):
+        return next(jobs, None)
+    job = await jobs.get()
+    if job is None:
+        jobs.put_nowait(None)
+    return job
+
+
+class Scheduler(object):
+    """ Jobs for the workers: a due retry first, then a new job.
+    The retries wait in a priority queue ordered by due time.
+    """
+    def __init__(self, jobs, rate, retries, backoff):
+        self.jobs = jobs if isinstance(jobs, asyncio.Queue) else iter(jobs)
+        self.bucket = TokenBucket(rate) if rate else None
+        self.retries = retries
+        self.backoff = backoff
+        self.retry_queue = []
+        self.nb_scheduled = 0
+        self.is_exhausted = False
+        self.in_flight = 0
+
+    async def next(self):
+        """ Get (job, attempt) to run, None when all is done.
+        """
+        job = await self.wait()
+        if job is not None and self.bucket is not None:
+            await self.bucket.take()
+        return job
+
+    async def wait(self):
+        while True:
+            delay = self.retry_queue[0][0] - time.monotonic() if self.retry_queue else None
+            if delay is not None and delay <= 0:
+                (due, nb, job, attempt) = heapq.heappop(self.retry_queue)
+                return (job, attempt)
+            if not self.is_exhausted:
+                try:
+                    job = await asyncio.wait_for(next_job(self.jobs), delay)
+                except asyncio.TimeoutError:
+                    continue
+                if job is not None:
+                    return (job, 0)
+                self.is_exhausted = True
+            elif delay is not None:
+                await asyncio.sleep(delay)
+            else:
+                return None
+
+    def retry(self, job, attempt):
+        """ Schedule a retry with exponential backoff and jitter.
+        False when the job has no retry left.
+        """
+        if attempt >= self.retries:
+            return False
+        delay = min(self.backoff * (2 ** attempt), MAX_BACKOFF) * random.uniform(0.5, 1.0)
+        self.nb_scheduled += 1
+        heapq.heappush(self.retry_queue, (time.monotonic() + delay, self.nb_scheduled, job, attempt + 1))
+        return True
+
+
+async def print_progress(scheduler, stat, interval):
+    """ Print a throughput line every interval seconds.
+    """
+    start = time.monotonic()
+    last = (start, 0, 0)
+    while True:
+        await asyncio.sleep(interval)
+        now = time.monotonic()
+        nb_files = stat['ok'] + stat['not_modified']
+        (last_time, last_files, last_bytes) = last
+        print("{:7.1f} s: {} files, {:.1f} files/s, {:.2f} MB/s, {} in flight, {} retries waiting, {} failed".format(
+            now - start, nb_files, (nb_files - last_files) / (now - last_time),
+            (stat['bytes'] - last_bytes) / (now - last_time) / 1e6,
+            scheduler.in_flight, len(scheduler.retry_queue), len(stat['failed'])), flush=True)
+        last = (now, nb_files, stat['bytes'])
+
+
+async def run(jobs, concurrency, host_connections, timeout, done, stat,
+              rate=None, retries=RETRIES, backoff=BACKOFF, progress=None):
+    """ Download all jobs with concurrency workers. jobs is an iterable or
+    an asyncio.Queue fed while downloading (ends with None).
+    rate limits the requests per second, a transient error (timeout,
+    connection error, RETRY_STATUS) is retried up to retries times, and
+    a throughput line is printed every progress seconds.
+    """
+    pool = ConnectionPool(host_connections, timeout)
+    scheduler = Scheduler(jobs, rate, retries, backoff)
+
+    async def worker():
+        while True:
+            scheduled = await scheduler.next()
+            if scheduled is None:
+                break
+            (job, attempt) = scheduled
+            (url, filename) = job[:2]
+            etag = job[2] if len(job) > 2 else None
+            scheduler.in_flight += 1
+            try:
+                (status, size, etag) = await get(pool, url, filename, etag)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, HTTPStatusError) as e:
+                count_status(stat, error_name(e))
+                if isinstance(e, HTTPStatusError):
+                    (is_transient, reason) = (e.status in RETRY_STATUS, e.status)
+                else:
+                    (is_transient, reason) = (isinstance(e, RETRY_ERRORS), str(e) or type(e).__name__)
+                if is_transient and scheduler.retry(job, attempt):
+                    stat['retries'] += 1
+                else:
+                    stat['failed'].append((url, filename, reason))
+                continue
+            finally:
+                scheduler.in_flight -= 1
+            count_status(stat, status)
+            if done is not None:
+                try:
+                    done(url, filename, status, size, etag)
+                except Exception as e:
+                    # e.g. the record or the pack write failed, the other downloads go on
+                    count_status(stat, error_name(e))
+                    stat['failed'].append((url, filename, str(e) or type(e).__name__))
+                    continue
+            if status == 304:
+                stat['not_modified'] += 1
+            else:
+                stat['ok'] += 1
+                stat['bytes'] += size
+
+    progress_task = asyncio.ensure_future(print_progress(scheduler, stat, progress)) if progress else None
+    try:
+        await asyncio.gather(*[worker() for i in range(concurrency)])
+    finally:
+        if progress_task is not None:
+            progress_task.cancel()
+        pool.close()
+        stat['connections'] = pool.nb_open
+
+
+def download_all(jobs, concurrency=CONCURRENCY, host_connections=HOST_CONNECTIONS, timeout=TIMEOUT, done=None,
+                 rate=None, retries=RETRIES, backoff=BACKOFF, progress=None):
+    """ Download (url, filename) or (url, filename, etag) jobs. jobs can be
+    a lazy iterable. done(url, filename, status, size, etag) is called in
+    the event loop after each download or 304 response, an exception of
+    done fails that job only. See run for the
+    rate limit, retry and progress options.
+    Returns a stat dict: ok and not_modified counts, failed list of
+    (url, filename, reason), the number of opened connections, counts
+    per status (or error name), number of retries and downloaded bytes.
+    """
+    stat = new_stat()
+    asyncio.run(run(jobs, concurrency, host_connections, timeout, done, stat,
+                    rate, retries, backoff, progress))
+    return stat
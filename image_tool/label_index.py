@@ -0,0 +1,142 @@
+import os
+import json
+import sqlite3
+import argparse
+import multiprocessing
+
+import pack
+
+
+# Index of the labels of all graphie images: hash -> label list in one
+# SQLite table, built once from the JSON data files (and the pack) by
+# parallel workers. searcher.get_labels reads it instead of opening and
+# parsing a data file per image reference.
+
+INDEX_NAME = 'labels.index'
+
+DATA_SUFFIX = '-data.json'
+
+# number of index rows per transaction
+COMMIT_SIZE = 5000
+
+
+def parse_labels(content):
+    """ Get the labels of JSON image data. The data is wrapped in a
+    JavaScript call: 48 characters before the JSON and 2 after it.
+    """
+    labels = []
+    data = json.loads(content[48:-2])
+    for item in data['labels']:
+        if 'content' in item:
+            label = item['content']
+            if label:
+                labels.append(str(label))
+    return labels
+
+
+def index_content(item):
+    """ Worker: get (hash, labels, error) of (file name, content bytes).
+    """
+    (name, content) = item
+    try:
+        return (name[:-len(DATA_SUFFIX)], parse_labels(content.decode('utf-8')), None)
+    except Exception as err:
+        return (name[:-len(DATA_SUFFIX)], [], str(err) or type(err).__name__)
+
+
+def index_file(filename):
+    """ Worker: get (hash, labels, error) of a data file.
+    """
+    with open(filename, 'rb') as infile:
+        return index_content((os.path.basename(filename), infile.read()))
+
+
+class LabelIndex(object):
+    """ Read access to the label index.
+    """
+    def __init__(self, path):
+        self.conn = sqlite3.connect('file:{}?mode=ro'.format(path), uri=True)
+
+    def get(self, image_hash):
+        """ Get the label list of a hash, None when not indexed.
+        """
+        row = self.conn.execute('SELECT labels FROM labels WHERE hash = ?', (image_hash,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self):
+        self.conn.close()
+
+
+def data_files(path):
+    """ Get all the JSON data files under a folder.
+    """
+    files = []
+    for root, dirnames, filenames in os.walk(path):
+        for filename in filenames:
+            if filename.endswith(DATA_SUFFIX):
+                files.append(os.path.join(root, filename))
+    return files
+
+
+def packed_data(pack_file):
+    """ Get (file name, content) of the packed JSON data files lazily.
+    """
+    if not os.path.isfile(pack_file):
+        return
+    with pack.Pack(pack_file, readonly=True) as graphie_pack:
+        for name in sorted(graphie_pack.names(DATA_SUFFIX)):
+            yield (name, graphie_pack.get(name))
+
+
+def build(index_file_name, json_folder, pack_file, processes=None):
+    """ Index the labels of the data files of json_folder and pack_file with a
+    process pool. The index is written next to the old one and replaces it.
+    A packed file overrides a file of the same hash in the folder.
+    A file failing to parse is not indexed, its lookup reads the file again.
+    Returns (number of indexed hashes, number of errors).
+    """
+    part = index_file_name + '.part'
+    if os.path.isfile(part):
+        os.remove(part)
+    conn = sqlite3.connect(part)
+    conn.execute('CREATE TABLE labels (hash TEXT PRIMARY KEY, labels TEXT) WITHOUT ROWID')
+
+    nb_rows = 0
+    nb_errors = 0
+    with multiprocessing.Pool(processes) as pool:
+        results = [pool.imap_unordered(index_file, data_files(json_folder), chunksize=256),
+                   pool.imap_unordered(index_content, packed_data(pack_file), chunksize=256)]
+        for result in results:
+            for (image_hash, labels, error) in result:
+                if error is not None:
+                    nb_errors += 1
+                    print("\tERROR: Can't get labels from JSON data for:", image_hash, error)
+                    # also drop the row of an overridden folder file
+                    conn.execute('DELETE FROM labels WHERE hash = ?', (image_hash,))
+                    continue
+                conn.execute('INSERT OR REPLACE INTO labels VALUES (?, ?)', (image_hash, json.dumps(labels)))
+                nb_rows += 1
+                if nb_rows % COMMIT_SIZE == 0:
+                    conn.commit()
+    conn.commit()
+    nb_hashes = conn.execute('SELECT COUNT(*) FROM labels').fetchone()[0]
+    conn.close()
+    os.replace(part, index_file_name)
+    return (nb_hashes, nb_errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the label index of the graphie JSON data files.')
+    parser.add_argument('--folder', type=str, default='C:\\Workspace\\Khan\\Images\\',
+                        help='image folder with the json folder and the pack (default: %(default)s)')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='number of worker processes (default: number of CPUs)')
+    args = parser.parse_args()
+
+    folder = os.path.join(args.folder, '')
+    (nb_hashes, nb_errors) = build(folder + INDEX_NAME, folder + 'json', folder + pack.PACK_NAME, args.processes)
+    print("Indexed labels of {} images, {} errors".format(nb_hashes, nb_errors))
+
+
+if __name__ == '__main__':
+    main()
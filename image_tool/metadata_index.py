@@ -0,0 +1,87 @@
+import os
+import json
+import sqlite3
+import argparse
+
+
+# Index of the content metadata of the images: hash -> (content type,
+# content id, item id) in one SQLite table, converted once from the
+# exercise and article JSON maps. searcher opens it on the first
+# get_metadata call instead of loading both JSON files at import.
+
+INDEX_NAME = 'metadata.index'
+
+EXERCISES_NAME = 'graphie_image_shas.json'
+ARTICLES_NAME = 'graphie_image_shas_in_articles.json'
+
+
+def is_stale(index_file, source_files):
+    """ True when the index is missing or older than a source file.
+    """
+    if not os.path.isfile(index_file):
+        return True
+    index_mtime = os.path.getmtime(index_file)
+    return any(os.path.getmtime(source) > index_mtime for source in source_files)
+
+
+def build(index_file, exercises_file, articles_file):
+    """ Convert the exercise and article maps into the index. An exercise
+    hash wins over an article hash, as in the former lookup.
+    Returns the number of indexed hashes.
+    """
+    part = index_file + '.part'
+    if os.path.isfile(part):
+        os.remove(part)
+    conn = sqlite3.connect(part)
+    conn.execute('CREATE TABLE metadata (hash TEXT PRIMARY KEY, content_type TEXT, content_id TEXT, item_id TEXT) '
+                 'WITHOUT ROWID')
+
+    with open(articles_file, 'r') as content:
+        articles = json.loads(content.read())
+    conn.executemany('INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)',
+                     ((image_hash, 'articles', slug, '') for (image_hash, slug) in articles.items()))
+    del articles
+
+    with open(exercises_file, 'r') as content:
+        exercises = json.loads(content.read())
+    conn.executemany('INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)',
+                     ((image_hash, 'exercise', item['exerciseSlug'], item['itemId'])
+                      for (image_hash, item) in exercises.items()))
+    del exercises
+
+    conn.commit()
+    nb_hashes = conn.execute('SELECT COUNT(*) FROM metadata').fetchone()[0]
+    conn.close()
+    os.replace(part, index_file)
+    return nb_hashes
+
+
+class MetadataIndex(object):
+    """ Read access to the metadata index.
+    """
+    def __init__(self, path):
+        self.conn = sqlite3.connect('file:{}?mode=ro'.format(path), uri=True)
+
+    def get(self, image_hash):
+        """ Get (content type, content id, item id) of a hash, None when not indexed.
+        """
+        return self.conn.execute('SELECT content_type, content_id, item_id FROM metadata WHERE hash = ?',
+                                 (image_hash,)).fetchone()
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the metadata index of the image hashes.')
+    parser.add_argument('--folder', type=str, default='C:\\Workspace\\Khan\\Images\\',
+                        help='image folder with the JSON maps (default: %(default)s)')
+    args = parser.parse_args()
+
+    folder = os.path.join(args.folder, '')
+    nb_hashes = build(folder + INDEX_NAME, folder + EXERCISES_NAME, folder + ARTICLES_NAME)
+    print("Indexed metadata of {} images".format(nb_hashes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+import os
+import sys
+import sqlite3
+import argparse
+
+
+# Pack of the graphie files: one SQLite database of blobs keyed by file
+# name (<hash>.js, <hash>-data.json) instead of one small file each under
+# js\<h>\ and json\<h>\. The downloader can write into it (--pack), the
+# searcher reads from it when it exists, and the import command packs
+# existing folders.
+
+PACK_NAME = 'graphie.pack'
+
+# file name endings of the packed files
+PACK_SUFFIXES = ('.js', '-data.json')
+
+# number of files per transaction
+COMMIT_SIZE = 1000
+
+
+class Pack(object):
+    """ Files by name in a SQLite database.
+    """
+    def __init__(self, path, readonly=False):
+        if readonly:
+            self.conn = sqlite3.connect('file:{}?mode=ro'.format(path), uri=True)
+        else:
+            self.conn = sqlite3.connect(path)
+            self.conn.execute('CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, data BLOB) WITHOUT ROWID')
+        self.nb_pending = 0
+
+    def put(self, name, data):
+        """ Add or replace a file.
+        """
+        self.conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?)', (name, data))
+        self.nb_pending += 1
+        if self.nb_pending >= COMMIT_SIZE:
+            self.commit()
+
+    def get(self, name):
+        """ Get the content of a file, None when not packed.
+        """
+        row = self.conn.execute('SELECT data FROM files WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def names(self, suffix=''):
+        """ Get the set of packed file names ending with suffix.
+        """
+        return {name for (name,) in self.conn.execute('SELECT name FROM files') if name.endswith(suffix)}
+
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+    def commit(self):
+        self.conn.commit()
+        self.nb_pending = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def import_folder(pack, path, remove=False):
+    """ Pack all graphie files under a folder, e.g. js\\ or json\\.
+    With remove, the packed files are deleted. Returns the number of files.
+    """
+    nb_files = 0
+    for root, dirnames, filenames in os.walk(path):
+        for filename in filenames:
+            if not filename.endswith(PACK_SUFFIXES):
+                continue
+            full_name = os.path.join(root, filename)
+            with open(full_name, 'rb') as infile:
+                pack.put(filename, infile.read())
+            nb_files += 1
+    pack.commit()
+
+    if remove:
+        for root, dirnames, filenames in os.walk(path):
+            for filename in filenames:
+                if filename.endswith(PACK_SUFFIXES):
+                    os.remove(os.path.join(root, filename))
+    return nb_files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack of the graphie JavaScript and label data files.')
+    parser.add_argument('pack', help='pack file, e.g. C:\\Workspace\\Khan\\Images\\' + PACK_NAME)
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_parser = commands.add_parser('import', help='pack the files of folders')
+    import_parser.add_argument('folders', nargs='+', help='folders to pack, e.g. the js and json folders')
+    import_parser.add_argument('--remove', action='store_true', help='delete the packed files')
+    get_parser = commands.add_parser('get', help='write a packed file to stdout')
+    get_parser.add_argument('name', help='file name, e.g. <hash>.js')
+    commands.add_parser('count', help='print the number of packed files')
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        with Pack(args.pack) as pack:
+            for path in args.folders:
+                print("{}: {} files".format(path, import_folder(pack, path, args.remove)))
+    elif args.command == 'get':
+        with Pack(args.pack, readonly=True) as pack:
+            data = pack.get(args.name)
+        if data is None:
+            print("ERROR: {} is not packed".format(args.name))
+            sys.exit(1)
+        sys.stdout.buffer.write(data)
+    else:
+        with Pack(args.pack, readonly=True) as pack:
+            print(pack.count())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import os
+import asyncio
+import argparse
+
+import fetcher
+import searcher
+import donwloader
+import download_db
+
+
+# XLIFF scan and download in one run: searcher.graphie_entry streams the
+# image references it finds into a bounded queue (see searcher.image_sink)
+# and the download workers of fetcher.py consume it while the scan goes
+# on. Repeated references and files already downloaded are skipped.
+
+# max number of found files waiting for a download
+QUEUE_SIZE = 1000
+
+
+def host_works(host):
+    """ Get the downloader works of an image reference host.
+    A graphie has a generation script and label data, an image is one file.
+    """
+    if 'ka-perseus-graphie' in host:
+        return ['scripts', 'labels']
+    if 'ka-perseus-images' in host:
+        return ['images']
+    return []
+
+
+async def scan_and_fetch(names, graphies, queue_size, recorded, packed, hashed, to_pack, done, stat):
+    """ Scan the XLIFF files in a thread, download the found files meanwhile.
+    recorded is the set of file names recorded as ok, a file without an ok
+    record is downloaded again. packed is the set of packed file names, None without a pack.
+    The file names to check by content hash or to pack are added to hashed and to_pack.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(queue_size)
+    seen = set()
+    listings = {}
+
+    def put(job):
+        # blocks the scan while the queue is full
+        asyncio.run_coroutine_threadsafe(queue.put(job), loop).result()
+
+    def sink(host, image_hash, ext):
+        for work in host_works(host):
+            name = image_hash + '.' + ext if work == 'images' and ext else image_hash
+            if (work, name) in seen:
+                continue
+            seen.add((work, name))
+
+            path = donwloader.shard_folder(work, name)
+            is_packed = packed is not None and work in donwloader.packed_works
+            if is_packed:
+                listed = packed
+            else:
+                if path not in listings:
+                    listings[path] = donwloader.list_shard(path)
+                listed = listings[path]
+            (link, filename) = donwloader.job(work, name)
+            if (listed is not None and donwloader.works[work][2].format(name) in listed and
+                    (is_packed or filename in recorded)):
+                continue
+
+            donwloader.make_folder(path)
+            if work in donwloader.hashed_works:
+                hashed.add(filename)
+            if is_packed:
+                to_pack.add(filename)
+            put((link, filename))
+
+    def scan():
+        searcher.image_sink = sink
+        try:
+            for name in names:
+                print(name)
+                searcher.graphie_xliff(name, graphies)
+        finally:
+            searcher.image_sink = None
+            put(None)
+
+    scanner = loop.run_in_executor(None, scan)
+    await fetcher.run(queue, fetcher.CONCURRENCY, fetcher.HOST_CONNECTIONS, fetcher.TIMEOUT, done, stat,
+                      rate=donwloader.rate_limit, progress=donwloader.progress_interval)
+    await scanner
+
+
+def scan_and_download(names=searcher.xliffs, queue_size=QUEUE_SIZE):
+    """ Generate the report of XLIFF files and download the referenced
+    images, scripts and label data at the same time.
+    Labels of files downloaded in this run are not in the report yet.
+    """
+    graphies = []
+    hashed = set()
+    to_pack = set()
+    bad = []
+    stat = fetcher.new_stat()
+    with donwloader.open_db() as db, donwloader.open_pack('scripts') as work_pack:
+        store = donwloader.packer(work_pack, lambda filename: filename in to_pack) if work_pack else None
+        done = donwloader.recorder(db, lambda filename: filename in hashed, bad, store)
+        asyncio.run(scan_and_fetch(names, graphies, queue_size, db.filenames(download_db.OK),
+                                   work_pack.names() if work_pack else None, hashed, to_pack, done, stat))
+        donwloader.report(db, stat, bad, "Graphie")
+    searcher.save_graphies(graphies)
+    return graphies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scan XLIFF files for image references and download them meanwhile.')
+    parser.add_argument('names', nargs='*', default=searcher.xliffs,
+                        help='XLIFF JSON files (default: the four priority files)')
+    parser.add_argument('--queue-size', type=int, default=QUEUE_SIZE,
+                        help='max number of found files waiting for a download')
+    parser.add_argument('--folder', type=str, default=None,
+                        help='download folder (default: ' + donwloader.folder + ')')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='max requests per second (default: no limit)')
+    parser.add_argument('--pack', action='store_true',
+                        help='store the scripts and labels in the pack of the download folder (see pack.py)')
+    args = parser.parse_args()
+
+    if args.folder is not None:
+        donwloader.folder = os.path.join(args.folder, '')
+    donwloader.rate_limit = args.rate
+    donwloader.use_pack = args.pack
+
+    scan_and_download(args.names, args.queue_size)
+
+
+if __name__ == '__main__':
+    main()
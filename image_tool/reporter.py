@@ -6,6 +6,11 @@ import polib
 import codecs
 import fileinput
 
+# shared math span scan of crowdin_tool. Run with the repository root
+# on the module path, e.g. python -m image_tool.reporter from the root
+# or PYTHONPATH=<root> python reporter.py in the XLIFF folder.
+from crowdin_tool import mathspan
+
 
 # folder where XLIFF files are located
 folder = '.\\'
@@ -48,13 +53,16 @@ bracket2x = re.compile(r"\\\\\$",re.MULTILINE|re.DOTALL)
 
 def graphie_entry(graphies, filename, file_id, source, dest, id=None, ident=None):
     """ Generate a single report line if issue with odd number of bucks is found.
+    Bucks are counted by the math span scan (escaped, \\\$ and {...} bucks
+    excluded), the string is only rewritten for the report line.
     """
-    bracketless = bracket1x.sub("{...}", source);
-    bracketless = bracket2x.sub("€", bracketless);
+    info = mathspan.get_math_info(source)
 
     # if there is and odd number of bucks, we have an issue!
-    bucks = bracketless.count("$")
+    bucks = len(info.dollar_list) - info.nb_brace_dollar - info.nb_odd_esc_dollar
     if bucks % 2 == 1:
+        bracketless = bracket1x.sub("{...}", source);
+        bracketless = bracket2x.sub("€", bracketless);
         line = "{}\t{}\t{}\t{}\t{}".format(file_id, id, ident, bucks, bracketless)
         graphies.append(line)
         print(line)
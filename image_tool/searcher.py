@@ -4,7 +4,14 @@ import sys
 import json
 import polib
 import codecs
+import argparse
+import functools
 import fileinput
+import multiprocessing
+
+import pack
+import label_index
+import metadata_index
 
 
 folder = "C:\\Users\\Igor\\Downloads\\Khan\\khan-sr\\"
@@ -64,12 +71,43 @@ def absolutes_html(filename, msgids):
                 msgids.append("-----------\n")
 
 
-# load mapping data from image hash to content slug
+# mapping data from image hash to content slug, converted into the
+# metadata index and opened on first use (see metadata_index.py)
 root = 'C:\\Workspace\\Khan\\Images\\'
-with open(root + 'graphie_image_shas.json', 'r') as content:
-    exercises = json.loads(content.read())
-with open(root + 'graphie_image_shas_in_articles.json', 'r') as content:
-    articles = json.loads(content.read())
+metadata_sources = [root + metadata_index.EXERCISES_NAME, root + metadata_index.ARTICLES_NAME]
+metadata_index_file = root + metadata_index.INDEX_NAME
+metadata_db = None
+
+
+# pack of the graphie files, read instead of the files when it exists (see pack.py)
+pack_file = root + pack.PACK_NAME
+graphie_pack = None
+
+
+def get_pack():
+    """ Open the pack of the graphie files once, None when there is none.
+    """
+    global graphie_pack
+    if graphie_pack is None and os.path.isfile(pack_file):
+        graphie_pack = pack.Pack(pack_file, readonly=True)
+    return graphie_pack
+
+
+# label index of all images, used when it exists (see label_index.py)
+label_index_file = root + label_index.INDEX_NAME
+label_db = None
+
+# number of hashes whose labels are kept in memory
+label_cache_size = 65536
+
+
+def get_label_index():
+    """ Open the label index once, None when there is none.
+    """
+    global label_db
+    if label_db is None and os.path.isfile(label_index_file):
+        label_db = label_index.LabelIndex(label_index_file)
+    return label_db
 
 
 def get_json_file(hash):
@@ -80,38 +118,67 @@ def get_json_file(hash):
     return filename if os.path.isfile(filename) else None
 
 
+def read_json_data(hash):
+    """ Read the JSON image data of a given hash from the pack, or from its file.
+    None when there is no data.
+    """
+    graphie_pack = get_pack()
+    if graphie_pack is not None:
+        data = graphie_pack.get(hash + '-data.json')
+        if data is not None:
+            return data.decode('utf-8')
+
+    filename = get_json_file(hash)
+    if filename is None:
+        return None
+    with open(filename, 'r') as fin:
+        return fin.read()
+
+
+def prepare_metadata_index():
+    """ Convert the JSON maps into the metadata index when it is missing or
+    older than them.
+    """
+    if metadata_index.is_stale(metadata_index_file, metadata_sources):
+        metadata_index.build(metadata_index_file, *metadata_sources)
+
+
+def get_metadata_index():
+    """ Open the metadata index once (see prepare_metadata_index).
+    """
+    global metadata_db
+    if metadata_db is None:
+        prepare_metadata_index()
+        metadata_db = metadata_index.MetadataIndex(metadata_index_file)
+    return metadata_db
+
+
 def get_metadata(hash):
     """ Obtain content metadata like slug and item id for given hash.
     """
-    if hash in exercises:
-        return ('exercise', exercises[hash]['exerciseSlug'], exercises[hash]['itemId'])
-    elif hash in articles:
-        return ('articles', articles[hash], '')
-    else:
-        return ('', '', '')
+    metadata = get_metadata_index().get(hash)
+    return metadata if metadata is not None else ('', '', '')
 
 
+@functools.lru_cache(maxsize=label_cache_size)
 def get_labels(hash):
     """ Extract labels used for an image of a given hash.
-    Data is located in JSON data files available for each image.
+    They are looked up in the label index, else the JSON data file (or the
+    pack) of the image is read. The results are cached.
     """
-    filename = "C:\\Workspace\\Khan\\Images\\json\\{}\\{}-data.json"
-    filename = filename.format(hash[0], hash)
-    if not os.path.isfile(filename):
-        return ('?', [])
-    labels = []
+    index = get_label_index()
+    labels = index.get(hash) if index is not None else None
+    if labels is not None:
+        return ('yes' if labels else 'no', labels)
 
+    labels = []
     try:
-        with open(filename, 'r') as fin:
-            content = fin.read()[48:-2]
-            data = json.loads(content)
-            for item in data['labels']:
-                if 'content' in item:
-                    label = item['content']
-                    if label:
-                        labels.append(str(label))
+        content = read_json_data(hash)
+        if content is None:
+            return ('?', [])
+        labels = label_index.parse_labels(content)
     except Exception as err:
-        print("\tERROR: Can't get labels from JSON file for:", filename, err, sys.exc_info()[0] )
+        print("\tERROR: Can't get labels from JSON data for:", hash, err, sys.exc_info()[0] )
 
     return ('yes' if labels else 'no', labels)
 
@@ -129,8 +196,8 @@ def graphie_po(filename, graphies):
 
 
 
-def graphie_xliff(filename, graphies):
-    """ Find image references in XLIFF files.
+def xliff_units(filename):
+    """ Read the trans-units of an XLIFF file: (file original, file id, unit).
     """
     folder = 'C:\\Users\\Igor\\Downloads\\Khan\\khan-xliff\\'
     filename = folder + filename
@@ -143,14 +210,27 @@ def graphie_xliff(filename, graphies):
         if isinstance(units, dict):
             units = [units]
         for unit in units:
-            if 'source' not in unit or not unit['source']:
-                continue
-            if not isinstance(unit['source']['$'], str):
-                continue
-            try:
-                graphie_entry(graphies, file['@original'], file['@id'], unit['source']['$'], unit['target']['$'], unit['@id'], unit['@identifier'])
-            except Exception as e:
-                print('\tERROR Something: ', unit, '\n', str(e))
+            yield (file['@original'], file['@id'], unit)
+
+
+def graphie_unit(graphies, original, file_id, unit):
+    """ Find image references in an XLIFF trans-unit.
+    """
+    if 'source' not in unit or not unit['source']:
+        return
+    if not isinstance(unit['source']['$'], str):
+        return
+    try:
+        graphie_entry(graphies, original, file_id, unit['source']['$'], unit['target']['$'], unit['@id'], unit['@identifier'])
+    except Exception as e:
+        print('\tERROR Something: ', unit, '\n', str(e))
+
+
+def graphie_xliff(filename, graphies):
+    """ Find image references in XLIFF files.
+    """
+    for (original, file_id, unit) in xliff_units(filename):
+        graphie_unit(graphies, original, file_id, unit)
 
 
 
@@ -161,6 +241,10 @@ linkx = re.compile(r"\s*(.*?)://(.*?)/([^\.\s]*)\.?([^\s]+)?",re.MULTILINE|re.DO
 # collect strings with erroneous image references, e.g. with spaces in markup
 spaced = []
 
+# when set, called with (host, hash, extension) of each image reference found,
+# e.g. to download the images while scanning (see pipeline.py)
+image_sink = None
+
 
 def graphie_entry(graphies, filename, file_id, source, dest, id=None, ident=None):
     """ Prepares one or more report items for given string.
@@ -197,6 +281,9 @@ def graphie_entry(graphies, filename, file_id, source, dest, id=None, ident=None
         if len(hash) != 40:
             continue
 
+        if image_sink is not None:
+            image_sink(link.groups()[1], hash, link.groups()[3])
+
         # start preparing content for report
         links = "\t".join([e if e else '' for e in link.groups()])
         desc = match[0].strip(' \t\n\r').replace("\n", "\\n").replace("\r", "")
@@ -250,9 +337,82 @@ def work_errors():
         out_file.writelines(msgids)
 
 
-def work_pos():
+# number of XLIFF trans-units per task of a parallel scan
+chunk_size = 2000
+
+
+def chunks(items, size):
+    """ Split an iterable into lists of size items.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def scan_units(units):
+    """ Worker of a parallel scan: report lines and erroneous references
+    of a chunk of XLIFF trans-units.
+    """
+    graphies = []
+    start = len(spaced)
+    for (original, file_id, unit) in units:
+        graphie_unit(graphies, original, file_id, unit)
+    found = spaced[start:]
+    del spaced[start:]
+    return (graphies, found)
+
+
+def scan_po(filename):
+    """ Worker of a parallel scan: report lines and erroneous references
+    of a PO file.
+    """
+    print(filename)
+    graphies = []
+    start = len(spaced)
+    graphie_po(filename, graphies)
+    found = spaced[start:]
+    del spaced[start:]
+    return (graphies, found)
+
+
+def init_worker():
+    """ Open the indexes and the pack again in a worker process, a
+    database connection is not shared with the parent.
+    """
+    global metadata_db, label_db, graphie_pack
+    metadata_db = None
+    label_db = None
+    graphie_pack = None
+    get_labels.cache_clear()
+
+
+def scan_parallel(scan, tasks, processes):
+    """ Run scan on the tasks in a process pool. The report lines and the
+    erroneous references are merged in the task order, as a serial scan.
+    """
+    prepare_metadata_index()
+
+    graphies = []
+    with multiprocessing.Pool(processes, initializer=init_worker) as pool:
+        for (lines, found) in pool.imap(scan, tasks):
+            graphies.extend(lines)
+            spaced.extend(found)
+    return graphies
+
+
+def work_pos(processes=1):
     """ Generate report for PO files.
+    With more than one process, the files are scanned in parallel.
     """
+    if processes > 1:
+        save_graphies(scan_parallel(scan_po, get_matches(), processes))
+        return
+
     graphies = []
     for match in get_matches():
         print(match)
@@ -260,14 +420,27 @@ def work_pos():
     save_graphies(graphies)
 
 
-def work_xliffs():
+# XLIFF files of the report
+xliffs = [
+    '1_high_priority_platform.xliff.json',
+    '2_high_priority_content.xliff.json',
+    '3_medium_priority.xliff.json',
+    '4_low_priority.xliff.json',
+]
+
+
+def work_xliffs(processes=1):
     """ Generate report for XLIFF files.
+    With more than one process, chunks of trans-units are scanned in
+    parallel while the next file is read.
     """
-    graphies = []
-    graphie_xliff('1_high_priority_platform.xliff.json', graphies)
-    graphie_xliff('2_high_priority_content.xliff.json', graphies)
-    graphie_xliff('3_medium_priority.xliff.json', graphies)
-    graphie_xliff('4_low_priority.xliff.json', graphies)
+    if processes > 1:
+        units = (unit for name in xliffs for unit in xliff_units(name))
+        graphies = scan_parallel(scan_units, chunks(units, chunk_size), processes)
+    else:
+        graphies = []
+        for name in xliffs:
+            graphie_xliff(name, graphies)
     save_graphies(graphies)
     print('===========================================')
     for item in spaced:
@@ -282,4 +455,15 @@ def save_graphies(graphies):
         out_file.writelines( lines )
 
 
-work_xliffs()
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate the image reference report.')
+    parser.add_argument('work', nargs='?', choices=['xliffs', 'pos'], default='xliffs',
+                        help='files to scan (default: %(default)s)')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='number of scan processes (default: 1, no parallel scan)')
+    args = parser.parse_args()
+
+    if args.work == 'pos':
+        work_pos(args.processes)
+    else:
+        work_xliffs(args.processes)